@@ -0,0 +1,310 @@
+"""
+백테스트 엔진 벤치마크.
+
+합성 일봉(기본 5,040행 ≈ 20년)에서 전략별로 변경 전 봉 단위 루프 구현과
+strategies 패키지(backtest_engine: 불리언 신호 배열 + forward-fill 상태 기계 + NumPy 수익률)를
+비교합니다. 여러 시드(보합·결측 봉 포함)와 설정 프리셋(short/middle/long)에서
+매수일·매도일·수익률이 완전히 같은지 확인한 뒤, 전략별 중앙값 시간을 출력합니다.
+지표는 두 구현 모두 같은 indicators 캐시에서 꺼내므로 시간은 사실상 신호 → 거래 목록 단계입니다.
+
+    python benchmarks/bench_backtest_engine.py --rows 5040 --repeat 5
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "modules"))
+
+import numpy as np
+import pandas as pd
+
+import indicators
+import strategies
+from config import default_config
+from market_trend_manager import MACD_WEIGHT, MA_WEIGHT, BB_WEIGHT, RSI_WEIGHT
+from market_trend_manager import STRONG_BUY_THRESHOLD, BUY_THRESHOLD, SELL_THRESHOLD, STRONG_SELL_THRESHOLD
+from stock_score import calculate_ichimoku
+
+COMMISSION = 0.001
+SLIPPAGE = 0.0005
+
+
+def _make_frame(rows, seed=0, ties=False, gaps=False):
+    """일봉 형태의 합성 OHLCV. ties: 가격 보합 구간, gaps: 결측 봉 포함."""
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range("2005-01-03", periods=rows)
+    close = 50 * np.cumprod(1 + rng.normal(0.0003, 0.015, rows))
+    if ties:
+        close = np.round(close, 0)
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.008, rows))
+    df = pd.DataFrame({"Open": open_, "High": np.maximum(open_, close) * (1 + spread),
+                       "Low": np.minimum(open_, close) * (1 - spread), "Close": close,
+                       "Volume": rng.integers(1e5, 1e7, rows).astype(float)}, index=idx)
+    if gaps:
+        df.iloc[rng.choice(rows, rows // 200, replace=False), :4] = np.nan
+    return df
+
+
+def _params(preset):
+    p = default_config["current"] if preset == "current" else default_config["settings"][preset]
+    return strategies.make_params(p)
+
+
+# ============================================================
+# 지표 준비 (두 구현 공통)
+# ============================================================
+
+def _prepare(name, data, p):
+    close = data['Close']
+    if name == "macd_rsi":
+        macd, signal, _ = indicators.macd(close, p["macd"]["short"], p["macd"]["long"], p["macd"]["signal"])
+        return dict(macd=macd, signal=signal, rsi=indicators.rsi(close, p["rsi"]["period"]))
+    if name.startswith("bollinger"):
+        upper, lower, _ = indicators.bollinger(close, p["bollinger"]["period"], p["bollinger"]["std_dev_multiplier"])
+        frame = data.assign(UpperBand=upper, LowerBand=lower).dropna(subset=['LowerBand', 'UpperBand'])
+        return dict(frame=frame, rebound=name.endswith("rebound"))
+    if name == "ma_cross":
+        return dict(short=indicators.sma(close, p["ma_cross"]["short"]),
+                    long=indicators.sma(close, p["ma_cross"]["long"]))
+    if name.startswith("momentum_signal"):
+        upper, lower, _ = indicators.bollinger(close, p["bollinger"]["period"], p["bollinger"]["std_dev_multiplier"])
+        macd, signal, _ = indicators.macd(close, p["macd"]["short"], p["macd"]["long"], p["macd"]["signal"])
+        return dict(rsi=indicators.rsi(close, p["rsi"]["period"], min_periods=1), upper=upper, lower=lower,
+                    macd=macd, signal=signal, short=indicators.sma(close, p["ma_cross"]["short"]),
+                    long=indicators.sma(close, p["ma_cross"]["long"]), rebound=name.endswith("rebound"))
+    if name == "momentum_return_ma":
+        window = p["momentum_return"]["return_window"]
+        return dict(window=window, ret=close / close.shift(window) - 1,
+                    short=indicators.sma(close, p["ma_cross"]["short"]),
+                    long=indicators.sma(close, p["ma_cross"]["long"]))
+    if name == "ichimoku":
+        ich = calculate_ichimoku(data, tenkan=9, kijun=26, senkou_b=52)
+        return dict(tenkan=ich['tenkan_sen'], kijun=ich['kijun_sen'], sa=ich['senkou_a'], sb=ich['senkou_b'])
+    raise ValueError(name)
+
+
+# ============================================================
+# 변경 전 구현 (backtest_popup의 봉 단위 루프)
+# ============================================================
+
+def _legacy_profit(exit_price, entry_price):
+    if entry_price > 0:
+        raw_return = (exit_price - entry_price) / entry_price
+        return raw_return - (COMMISSION * 2) - (SLIPPAGE * 2)
+    return 0.0
+
+
+def _legacy_loop(data, buy_signal, sell_signal, start=0):
+    """_run_ma_cross / _run_bollinger(터치) / _run_momentum_signal 공통 루프."""
+    in_position = False
+    entry_price = 0
+    buy_dates, sell_dates, profits = [], [], []
+    for i in range(start, len(data)):
+        if not in_position and buy_signal[i]:
+            in_position = True
+            entry_price = data['Close'].iloc[i]
+            buy_dates.append(data.index[i])
+        elif in_position and sell_signal[i]:
+            profits.append(_legacy_profit(data['Close'].iloc[i], entry_price))
+            sell_dates.append(data.index[i])
+            in_position = False
+    if in_position:
+        profits.append(_legacy_profit(data['Close'].iloc[-1], entry_price))
+    return buy_dates, sell_dates, profits
+
+
+def _legacy(name, data, p, ind):
+    if name == "macd_rsi":
+        macd, signal, rsi = ind["macd"], ind["signal"], ind["rsi"]
+        lower, upper = p["rsi"]["lower"], p["rsi"]["upper"]
+        in_position, entry_price = False, 0
+        buy_dates, sell_dates, profits = [], [], []
+        for i in range(1, len(data)):
+            prev_macd, prev_signal = macd.iloc[i - 1], signal.iloc[i - 1]
+            curr_macd, curr_signal = macd.iloc[i], signal.iloc[i]
+            rsi_val = rsi.iloc[i]
+            if not in_position and prev_macd < prev_signal and curr_macd > curr_signal and rsi_val < lower:
+                entry_price = data["Close"].iloc[i]
+                buy_dates.append(data.index[i])
+                in_position = True
+            elif in_position and (curr_macd < curr_signal or rsi_val > upper):
+                profits.append(_legacy_profit(data["Close"].iloc[i], entry_price))
+                sell_dates.append(data.index[i])
+                in_position = False
+        if in_position:
+            profits.append(_legacy_profit(data["Close"].iloc[-1], entry_price))
+        return buy_dates, sell_dates, profits
+
+    if name.startswith("bollinger"):
+        data = ind["frame"]
+        if not ind["rebound"]:
+            return _legacy_loop(data, (data['Close'] < data['LowerBand']).to_numpy(),
+                                (data['Close'] > data['UpperBand']).to_numpy())
+        in_position, entry_price = False, 0
+        buy_dates, sell_dates, profits = [], [], []
+        for i in range(len(data) - 2):
+            if not in_position:
+                if data['Close'].iloc[i] < data['LowerBand'].iloc[i]:
+                    if data['Close'].iloc[i + 1] > data['Close'].iloc[i]:
+                        in_position = True
+                        entry_price = data['Close'].iloc[i + 1]
+                        buy_dates.append(data.index[i + 1])
+            else:
+                if data['Close'].iloc[i] > data['UpperBand'].iloc[i]:
+                    if data['Close'].iloc[i + 1] < data['Close'].iloc[i]:
+                        profits.append(_legacy_profit(data['Close'].iloc[i + 1], entry_price))
+                        sell_dates.append(data.index[i + 1])
+                        in_position = False
+        if in_position:
+            profits.append(_legacy_profit(data['Close'].iloc[-1], entry_price))
+        return buy_dates, sell_dates, profits
+
+    if name == "ma_cross":
+        return _legacy_loop(data, (ind["short"] > ind["long"]).to_numpy(), (ind["short"] < ind["long"]).to_numpy())
+
+    if name.startswith("momentum_signal"):
+        close_arr, lower_arr, upper_arr = data['Close'].values, ind["lower"].values, ind["upper"].values
+        macd_signal_arr = np.where(ind["macd"] > ind["signal"], "BUY", "SELL")
+        ma_signal_arr = np.where(ind["short"] > ind["long"], "BUY", "SELL")
+        bb_signal_arr = np.full(len(data), "HOLD", dtype=object)
+        if ind["rebound"]:
+            for i in range(len(data) - 1):
+                if close_arr[i] < lower_arr[i]:
+                    if close_arr[i + 1] > close_arr[i]:
+                        bb_signal_arr[i] = "BUY"
+                elif close_arr[i] > upper_arr[i]:
+                    if close_arr[i + 1] < close_arr[i]:
+                        bb_signal_arr[i] = "SELL"
+        else:
+            bb_signal_arr = np.where(close_arr < lower_arr, "BUY", np.where(close_arr > upper_arr, "SELL", "HOLD"))
+        rsi = ind["rsi"]
+        rsi_signal_arr = np.where(rsi < p["rsi"]["lower"], "BUY", np.where(rsi > p["rsi"]["upper"], "SELL", "HOLD"))
+        scores = np.zeros(len(data))
+        scores += np.where(macd_signal_arr == "BUY", MACD_WEIGHT, np.where(macd_signal_arr == "SELL", -MACD_WEIGHT, 0))
+        scores += np.where(ma_signal_arr == "BUY", MA_WEIGHT, np.where(ma_signal_arr == "SELL", -MA_WEIGHT, 0))
+        scores += np.where(bb_signal_arr == "BUY", BB_WEIGHT, np.where(bb_signal_arr == "SELL", -BB_WEIGHT, 0))
+        scores += np.where(rsi_signal_arr == "BUY", RSI_WEIGHT, np.where(rsi_signal_arr == "SELL", -RSI_WEIGHT, 0))
+        combined = np.where(scores >= STRONG_BUY_THRESHOLD, "STRONG BUY",
+                   np.where(scores >= BUY_THRESHOLD, "BUY",
+                   np.where(scores <= STRONG_SELL_THRESHOLD, "STRONG SELL",
+                   np.where(scores <= SELL_THRESHOLD, "SELL", "HOLD"))))
+        return _legacy_loop(data, [c in ("BUY", "STRONG BUY") for c in combined],
+                            [c in ("SELL", "STRONG SELL") for c in combined])
+
+    if name == "momentum_return_ma":
+        threshold = p["momentum_return"]["threshold"]
+        in_position, entry_price = False, 0
+        buy_dates, sell_dates, profits = [], [], []
+        for i in range(ind["window"], len(data)):
+            ret, s_ma, l_ma = ind["ret"].iloc[i], ind["short"].iloc[i], ind["long"].iloc[i]
+            if not in_position and ret >= threshold and s_ma > l_ma:
+                in_position = True
+                entry_price = data['Close'].iloc[i]
+                buy_dates.append(data.index[i])
+            elif in_position and (s_ma < l_ma or ret < 0):
+                profits.append(_legacy_profit(data['Close'].iloc[i], entry_price))
+                sell_dates.append(data.index[i])
+                in_position = False
+        if in_position:
+            profits.append(_legacy_profit(data['Close'].iloc[-1], entry_price))
+        return buy_dates, sell_dates, profits
+
+    if name == "ichimoku":
+        tenkan, kijun, sa_s, sb_s = ind["tenkan"], ind["kijun"], ind["sa"], ind["sb"]
+        in_position, entry_price = False, 0
+        buy_dates, sell_dates, profits = [], [], []
+        for i in range(1, len(data)):
+            tenkan_now, kijun_now = tenkan.iloc[i], kijun.iloc[i]
+            tenkan_prev, kijun_prev = tenkan.iloc[i - 1], kijun.iloc[i - 1]
+            close_now = data['Close'].iloc[i]
+            if pd.isna(tenkan_now) or pd.isna(kijun_now):
+                continue
+            sa = sa_s.iloc[i] if not pd.isna(sa_s.iloc[i]) else 0
+            sb = sb_s.iloc[i] if not pd.isna(sb_s.iloc[i]) else 0
+            cloud_top = max(sa, sb)
+            if not in_position:
+                if tenkan_prev <= kijun_prev and tenkan_now > kijun_now and close_now > cloud_top:
+                    in_position = True
+                    entry_price = close_now
+                    buy_dates.append(data.index[i])
+            else:
+                if tenkan_prev >= kijun_prev and tenkan_now < kijun_now:
+                    profits.append(_legacy_profit(close_now, entry_price))
+                    sell_dates.append(data.index[i])
+                    in_position = False
+        if in_position:
+            profits.append(_legacy_profit(data['Close'].iloc[-1], entry_price))
+        return buy_dates, sell_dates, profits
+    raise ValueError(name)
+
+
+# ============================================================
+# 현재 구현 (strategies 패키지 → backtest_engine)
+# ============================================================
+
+def _current(name, data, p):
+    params = dict(p, commission_rate=COMMISSION, slippage_pct=SLIPPAGE)
+    params["bollinger"] = dict(p["bollinger"], use_rebound=name.endswith("rebound"))
+    return strategies.run(name.replace("_rebound", ""), data, params)[:3]
+
+
+STRATEGIES = ["macd_rsi", "bollinger", "bollinger_rebound", "ma_cross", "momentum_signal",
+              "momentum_signal_rebound", "momentum_return_ma", "ichimoku"]
+
+
+def _timed(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5040)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    # 변경 전 루프와 거래 목록 비교 (보합/결측, 프리셋별 파라미터)
+    checked = trades = 0
+    for seed, ties, gaps in [(0, False, False), (1, True, False), (2, False, True), (3, True, True)]:
+        df = _make_frame(args.rows, seed, ties, gaps)
+        for preset in ("current", "short", "middle", "long"):
+            p = _params(preset)
+            for name in STRATEGIES:
+                ind = _prepare(name, df, p)
+                old = _legacy(name, df, p, ind)
+                new = _current(name, df, p)
+                assert old[0] == new[0] and old[1] == new[1], f"{name} dates differ (seed={seed}, {preset})"
+                # 결측 봉에서 청산하면 수익률이 NaN (양쪽 모두) → NaN끼리 같은 것으로 비교
+                assert np.array_equal(old[2], new[2], equal_nan=True), f"{name} profits differ (seed={seed}, {preset})"
+                checked += 1
+                trades += len(old[2])
+    print(f"identical trade lists: {checked} runs, {trades:,} trades")
+
+    df = _make_frame(args.rows)
+    p = _params("current")
+    print(f"rows: {args.rows:,} (~{args.rows / 252:.0f}y daily), repeat: {args.repeat} (median per run)")
+    print(f"{'strategy':24} {'current':>10} {'legacy':>10} {'speedup':>8} {'trades':>7}")
+    total_new = total_old = 0.0
+    for name in STRATEGIES:
+        ind = _prepare(name, df, p)
+        t_new = _timed(lambda: _current(name, df, p), args.repeat)
+        t_old = _timed(lambda: _legacy(name, df, p, ind), max(1, args.repeat // 2))
+        total_new += t_new
+        total_old += t_old
+        n_trades = len(_current(name, df, p)[2])
+        print(f"{name:24} {t_new * 1e3:>8.2f}ms {t_old * 1e3:>8.2f}ms {t_old / t_new:>7.1f}x {n_trades:>7}")
+    print(f"{'all strategies':24} {total_new * 1e3:>8.2f}ms {total_old * 1e3:>8.2f}ms {total_old / total_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+data_cache 동시 읽기 스트레스 벤치마크.
+
+임시 DB에 합성 시세를 채운 뒤, 스레드 수를 늘려가며 서로 다른 종목에 대한
+캐시 히트(get_cached_history) 처리량을 측정합니다. 네트워크는 사용하지 않습니다.
+
+    python benchmarks/bench_cache_concurrency.py --tickers 200 --rows 500
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "modules"))
+
+import numpy as np
+import pandas as pd
+
+import data_cache
+
+
+def _seed(tickers, rows, interval):
+    """합성 OHLCV를 캐시에 저장."""
+    conn = data_cache._ensure_conn()
+    idx = pd.date_range("2015-01-01", periods=rows, freq="D", tz="UTC")
+    rng = np.random.default_rng(0)
+    for t in tickers:
+        close = 100 * np.cumprod(1 + rng.normal(0, 0.01, rows))
+        df = pd.DataFrame({"Open": close, "High": close * 1.01, "Low": close * 0.99,
+                           "Close": close, "Volume": rng.integers(1e5, 1e6, rows).astype(float)},
+                          index=idx)
+        with data_cache._write_lock:
+            data_cache._store_data(conn, t, interval, df, "max")
+
+
+def _run(tickers, threads, reads, interval):
+    """threads개 스레드로 reads회 캐시 히트 조회, 초당 조회 수 반환."""
+    work = [tickers[i % len(tickers)] for i in range(reads)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda t: data_cache.get_cached_history(t, period="max", interval=interval,
+                                                              ttl=1e9), work))
+    return reads / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--threads", default="1,2,4,8,16")
+    args = parser.parse_args()
+
+    data_cache._DB_PATH = os.path.join(tempfile.mkdtemp(), "bench_cache.db")
+    interval = "1d"
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+    _seed(tickers, args.rows, interval)
+
+    base = None
+    print(f"{'threads':>8} {'reads/s':>10} {'speedup':>8}")
+    for n in [int(x) for x in args.threads.split(",")]:
+        rate = _run(tickers, n, args.reads, interval)
+        base = base or rate
+        print(f"{n:>8} {rate:>10.0f} {rate / base:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
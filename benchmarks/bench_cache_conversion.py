@@ -0,0 +1,91 @@
+"""
+data_cache DataFrame <-> SQLite row 변환 벤치마크.
+
+기존 iterrows/dict 기반 변환과 현재 컬럼 단위 NumPy 변환을
+같은 합성 프레임(기본 100,000행)에서 비교하고, 왕복 결과가 같은지도 확인합니다.
+
+    python benchmarks/bench_cache_conversion.py --rows 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "modules"))
+
+import numpy as np
+import pandas as pd
+
+import data_cache
+
+
+def _legacy_df_to_rows(df, ticker, interval):
+    """변경 전 구현 (iterrows + 셀 단위 pd.notna, 텍스트 날짜)."""
+    rows = []
+    for idx, row in df.iterrows():
+        rows.append((
+            ticker, interval, str(idx),
+            float(row["Open"]) if pd.notna(row["Open"]) else None,
+            float(row["High"]) if pd.notna(row["High"]) else None,
+            float(row["Low"]) if pd.notna(row["Low"]) else None,
+            float(row["Close"]) if pd.notna(row["Close"]) else None,
+            float(row["Volume"]) if pd.notna(row["Volume"]) else 0,
+        ))
+    return rows
+
+
+def _legacy_rows_to_df(rows):
+    """변경 전 구현 (dict 리스트 + 날짜 문자열 재파싱)."""
+    data = [{"Date": r[2], "Open": r[3], "High": r[4], "Low": r[5],
+             "Close": r[6], "Volume": r[7]} for r in rows]
+    df = pd.DataFrame(data)
+    df["Date"] = pd.to_datetime(df["Date"], utc=True)
+    return df.set_index("Date").sort_index()
+
+
+def _make_frame(rows):
+    """5분봉 형태의 합성 OHLCV (일부 NaN 포함)."""
+    rng = np.random.default_rng(0)
+    idx = pd.date_range("2020-01-01 09:30", periods=rows, freq="5min", tz="America/New_York")
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.001, rows))
+    df = pd.DataFrame({"Open": close, "High": close * 1.001, "Low": close * 0.999,
+                       "Close": close, "Volume": rng.integers(1e3, 1e5, rows).astype(float)},
+                      index=idx)
+    df.iloc[::997, 0] = np.nan
+    return df
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    df = _make_frame(args.rows)
+
+    legacy_rows, t_legacy_w = _timed(_legacy_df_to_rows, df, "BENCH", "5m")
+    legacy_df, t_legacy_r = _timed(_legacy_rows_to_df, legacy_rows)
+
+    rows, t_new_w = _timed(data_cache._df_to_rows, df, "BENCH", "5m")
+    # _load_cached는 (ts, open, high, low, close, volume)만 조회
+    new_df, t_new_r = _timed(data_cache._rows_to_df, [r[2:] for r in rows])
+
+    # pandas 버전에 따라 문자열 파싱 결과의 시간 단위(ns/us)만 다를 수 있음
+    pd.testing.assert_frame_equal(new_df, legacy_df, check_names=False, check_freq=False,
+                                  check_index_type=False)
+
+    print(f"rows: {args.rows:,}")
+    print(f"{'':12} {'legacy':>10} {'numpy':>10} {'speedup':>8}")
+    print(f"{'df->rows':12} {t_legacy_w:>9.3f}s {t_new_w:>9.3f}s {t_legacy_w / t_new_w:>7.1f}x")
+    print(f"{'rows->df':12} {t_legacy_r:>9.3f}s {t_new_r:>9.3f}s {t_legacy_r / t_new_r:>7.1f}x")
+    print("round-trip: identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+증분 지표 엔진 검증 + 벤치마크.
+
+합성 OHLCV에 봉을 하나씩 추가하며 (마지막 봉은 장중처럼 한 번 수정한 뒤 확정)
+stock_score.calculate_indicators의 증분 경로와 일괄 경로 결과가 같은지 매 단계 비교하고,
+갱신 1회당 소요 시간을 측정합니다. --window를 주면 구간 시작도 함께 밀려 나갑니다.
+
+    python benchmarks/bench_incremental_indicators.py --bars 2000 --steps 300
+    python benchmarks/bench_incremental_indicators.py --bars 2000 --steps 300 --window 1500
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "modules"))
+
+import numpy as np
+import pandas as pd
+
+import stock_score
+from incremental_indicators import IndicatorEngine
+
+_SCALARS = ("rsi", "ma_short", "ma_long", "macd", "macd_signal", "atr")
+_SIGNALS = ("adx", "vwap", "obv", "stochastic", "ichimoku")
+
+
+def _make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2020-01-01 09:30", periods=rows, freq="5min", tz="America/New_York")
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.002, rows))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.001, rows))
+    return pd.DataFrame({"Open": open_, "High": np.maximum(open_, close) * (1 + spread),
+                         "Low": np.minimum(open_, close) * (1 - spread), "Close": close,
+                         "Volume": rng.integers(1e3, 1e5, rows).astype(float)}, index=idx)
+
+
+def _close(a, b, tol):
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(_close(x, y, tol) for x, y in zip(a, b))
+    if a is None or b is None or isinstance(a, str) or isinstance(b, str):
+        return a == b
+    if math.isnan(a) or math.isnan(b):
+        return math.isnan(a) and math.isnan(b)
+    return abs(a - b) <= tol * max(1.0, abs(a), abs(b))
+
+
+def _compare(inc, batch, tol):
+    diffs = []
+    for k in _SCALARS + ("bb_upper", "bb_lower"):
+        if not _close(inc[k], batch[k], tol):
+            diffs.append((k, inc[k], batch[k]))
+    for k in _SIGNALS:
+        if inc[k] != batch[k] and not _close(inc[k], batch[k], tol):
+            diffs.append((k, inc[k], batch[k]))
+    return diffs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bars", type=int, default=2000)
+    parser.add_argument("--steps", type=int, default=300)
+    parser.add_argument("--window", type=int, default=0, help="구간 길이 (0 = 시작 고정)")
+    parser.add_argument("--tol", type=float, default=1e-7)
+    args = parser.parse_args()
+
+    full = _make_frame(args.bars + args.steps)
+    engine = IndicatorEngine()
+    stock_score.get_engine = lambda: engine  # 전역 엔진 대신 측정용 엔진
+
+    t_inc = t_batch = 0.0
+    mismatches = 0
+    for step in range(args.steps):
+        end = args.bars + step
+        start = max(0, end - args.window) if args.window else 0
+        # 장중: 마지막 봉이 바뀐 상태로 한 번, 확정 값으로 한 번 조회
+        for revise in (True, False):
+            df = full.iloc[start:end + 1].copy()
+            if revise:
+                df.iloc[-1, df.columns.get_loc("Close")] *= 1.001
+                df.iloc[-1, df.columns.get_loc("High")] = df.iloc[-1][["High", "Close"]].max()
+
+            t0 = time.perf_counter()
+            inc = stock_score.calculate_indicators(df, key=("BENCH", "5m"))
+            t_inc += time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            batch = stock_score.calculate_indicators(df)
+            t_batch += time.perf_counter() - t0
+
+            diffs = _compare(inc, batch, args.tol)
+            if diffs:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"step {step} revise={revise}: {diffs}")
+
+    updates = args.steps * 2
+    print(f"bars: {args.bars:,} (+{args.steps} steps, window={args.window or 'growing'})")
+    print(f"engine: {engine.stats}")
+    print(f"{'':12} {'per update':>12}")
+    print(f"{'batch':12} {t_batch / updates * 1e3:>10.2f}ms")
+    print(f"{'incremental':12} {t_inc / updates * 1e3:>10.2f}ms  ({t_batch / t_inc:.1f}x)")
+    print(f"mismatches: {mismatches}/{updates}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
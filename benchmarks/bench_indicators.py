@@ -0,0 +1,169 @@
+"""
+stock_score 지표 함수 마이크로 벤치마크.
+
+합성 5분봉(기본 2,300행 ≈ 30일)에서 stock_score의 모든 지표 함수를 반복 실행하여
+호출 1회당 중앙값 시간을 출력합니다 (지표 캐시는 매번 비우고 측정). OBV/ADX는 변경 전
+Python 루프 구현과도 비교하고, 보합·결측이 섞인 여러 프레임에서 결과가 같은지 확인합니다.
+마지막으로 실시간 테이블 + 백테스트 전략 비교가 같은 데이터에서 지표를 요청하는 흐름을
+공용 지표 캐시 없이/있이 비교합니다.
+
+    python benchmarks/bench_indicators.py --rows 2300 --repeat 20
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "modules"))
+
+import numpy as np
+import pandas as pd
+
+import indicators
+import stock_score
+
+
+def _legacy_obv(historical_data):
+    """변경 전 구현 (iloc 루프로 OBV 누적)."""
+    if 'Volume' not in historical_data.columns or len(historical_data) < 10:
+        return ""
+    close = historical_data['Close']
+    volume = historical_data['Volume']
+    obv = pd.Series(0.0, index=close.index)
+    for i in range(1, len(close)):
+        if close.iloc[i] > close.iloc[i - 1]:
+            obv.iloc[i] = obv.iloc[i - 1] + volume.iloc[i]
+        elif close.iloc[i] < close.iloc[i - 1]:
+            obv.iloc[i] = obv.iloc[i - 1] - volume.iloc[i]
+        else:
+            obv.iloc[i] = obv.iloc[i - 1]
+    obv_ma = obv.rolling(10).mean()
+    if pd.isna(obv_ma.iloc[-1]):
+        return ""
+    return stock_score._obv_signal(obv.iloc[-1], obv_ma.iloc[-1], close.iloc[-1] > close.iloc[-10])
+
+
+def _legacy_adx(historical_data, period=14):
+    """변경 전 구현 (iloc 루프로 +DM/-DM 결정)."""
+    high = historical_data['High']
+    low = historical_data['Low']
+    if len(historical_data) < period * 2:
+        return None, ""
+    plus_dm_final = pd.Series(0.0, index=high.index)
+    minus_dm_final = pd.Series(0.0, index=high.index)
+    for i in range(1, len(high)):
+        up = high.iloc[i] - high.iloc[i-1]
+        down = low.iloc[i-1] - low.iloc[i]
+        if up > down and up > 0:
+            plus_dm_final.iloc[i] = up
+        if down > up and down > 0:
+            minus_dm_final.iloc[i] = down
+    atr = stock_score.calculate_atr(historical_data, period)
+    plus_di = 100 * (plus_dm_final.rolling(window=period).mean() / atr)
+    minus_di = 100 * (minus_dm_final.rolling(window=period).mean() / atr)
+    dx = (abs(plus_di - minus_di) / (plus_di + minus_di)) * 100
+    adx = dx.rolling(window=period).mean()
+    return stock_score._adx_signal(adx.iloc[-1])
+
+
+def _make_frame(rows, seed=0, ties=False, gaps=False):
+    """5분봉 형태의 합성 OHLCV. ties: 가격 보합 구간, gaps: 결측 봉 포함."""
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2020-01-01 09:30", periods=rows, freq="5min", tz="America/New_York")
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.002, rows))
+    if ties:
+        close = np.round(close, 1)
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.001, rows))
+    df = pd.DataFrame({"Open": open_, "High": np.maximum(open_, close) * (1 + spread),
+                       "Low": np.minimum(open_, close) * (1 - spread), "Close": close,
+                       "Volume": rng.integers(1e3, 1e5, rows).astype(float)}, index=idx)
+    if gaps:
+        df.iloc[rows // 3, :4] = np.nan
+    return df
+
+
+def _consumers(df):
+    """한 종목에 대한 지표 소비자들: 실시간 일괄 계산 + 다이버전스 + 백테스트 전략 비교."""
+    stock_score.calculate_indicators(df)
+    stock_score.detect_divergence(df)
+    # 전략 비교는 전략마다 data.copy()를 넘김
+    for _ in ("macd_rsi", "bollinger", "ma_cross", "momentum_signal", "momentum_return_ma"):
+        close = df.copy()['Close']
+        indicators.macd(close, 12, 26, 9)
+        indicators.rsi(close, 14)
+        indicators.rsi(close, 14, min_periods=1)
+        indicators.bollinger(close, 20, 2.0)
+        indicators.sma(close, 5)
+        indicators.sma(close, 20)
+
+
+def _timed(func, df, repeat):
+    times = []
+    for _ in range(repeat):
+        indicators.clear_cache()
+        start = time.perf_counter()
+        func(df)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2300)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    # 변경 전 구현과 결과 비교 (보합/결측 포함)
+    for seed, ties, gaps in [(0, False, False), (1, True, False), (2, False, True), (3, True, True)]:
+        df = _make_frame(args.rows, seed, ties, gaps)
+        assert stock_score.calculate_obv(df) == _legacy_obv(df), f"OBV mismatch (seed={seed})"
+        assert stock_score.calculate_adx(df) == _legacy_adx(df), f"ADX mismatch (seed={seed})"
+
+    df = _make_frame(args.rows)
+    suite = [
+        ("moving_average", lambda d: stock_score.calculate_moving_average(d, 20)),
+        ("rsi", stock_score.calculate_rsi),
+        ("macd", stock_score.calculate_macd),
+        ("atr", stock_score.calculate_atr),
+        ("bollinger_bands", stock_score.calculate_bollinger_bands),
+        ("divergence", stock_score.detect_divergence),
+        ("vwap", stock_score.calculate_vwap),
+        ("obv", stock_score.calculate_obv),
+        ("stochastic", stock_score.calculate_stochastic),
+        ("ichimoku", stock_score.calculate_ichimoku),
+        ("adx", stock_score.calculate_adx),
+        ("all (batch)", stock_score.calculate_indicators),
+    ]
+    legacy = {"obv": _legacy_obv, "adx": _legacy_adx}
+
+    print(f"rows: {args.rows:,}, repeat: {args.repeat} (median per call)")
+    print(f"{'indicator':16} {'current':>10} {'legacy':>10} {'speedup':>8}")
+    for name, func in suite:
+        t = _timed(func, df, args.repeat)
+        if name in legacy:
+            t_old = _timed(legacy[name], df, max(1, args.repeat // 5))
+            print(f"{name:16} {t * 1e3:>8.2f}ms {t_old * 1e3:>8.2f}ms {t_old / t:>7.1f}x")
+        else:
+            print(f"{name:16} {t * 1e3:>8.2f}ms")
+    print("OBV/ADX: identical to legacy loops")
+
+    # 캐시 없이 (소비자마다 각자 계산) vs 빈 캐시에서 시작한 한 번의 흐름 (같은 지표는 한 번만 계산)
+    memoize = indicators._memoize
+    indicators._memoize = lambda name, params, sources, compute: compute()
+    t_plain = _timed(_consumers, df, args.repeat)
+    indicators._memoize = memoize
+    t_shared = _timed(_consumers, df, args.repeat)
+    print(f"{'consumers':16} {t_shared * 1e3:>8.2f}ms {t_plain * 1e3:>8.2f}ms {t_plain / t_shared:>7.1f}x"
+          f"  (shared cache vs none)")
+    indicators.clear_cache()
+    _consumers(df)
+    print(f"indicator cache after one pass: {indicators.cache_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+파라미터 스윕 벤치마크.
+
+합성 일봉(기본 2,520행 ≈ 10년)에서 전략 파라미터 조합을 실행합니다.
+변경 전 방식 (한 스레드에서 셀마다 파라미터 deepcopy 후 실행)과 param_sweep
+(현재 스레드 / 공유 메모리 + 프로세스 풀)을 비교해 조합별 수익률이 같은지 확인한 뒤
+전체 시간, 초당 조합 수, 첫 부분 결과까지의 시간(히트맵 첫 갱신)을 출력합니다.
+프로세스 풀 시간에는 작업 프로세스 시작(spawn) 비용이 포함됩니다.
+
+    python benchmarks/bench_param_sweep.py --strategy ma_cross --combos 1000 --workers 0
+"""
+
+import argparse
+import copy
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "modules"))
+
+import numpy as np
+import pandas as pd
+
+import param_sweep
+import strategies
+from config import default_config
+
+# --combos에 맞춰 늘리는 1,000+ 조합 공간 (기본 격자보다 촘촘함)
+WIDE_GRIDS = {
+    "ma_cross": {"ma_cross.short": list(range(2, 62)), "ma_cross.long": list(range(20, 420, 5))},
+    "bollinger": {"bollinger.period": list(range(5, 65)),
+                  "bollinger.std_dev_multiplier": [round(1.0 + 0.1 * k, 1) for k in range(26)],
+                  "bollinger.use_rebound": [False, True]},
+    "macd_rsi": {"rsi.lower": list(range(10, 46)), "rsi.upper": list(range(55, 91)),
+                 "rsi.period": [7, 9, 14, 21, 28]},
+    "momentum_return_ma": {"ma_cross.short": list(range(5, 55, 5)), "ma_cross.long": list(range(20, 420, 20)),
+                           "momentum_return.return_window": [10, 20, 40, 60, 120, 250],
+                           "momentum_return.threshold": [0.0, 0.05, 0.1, 0.2]},
+}
+
+
+def _make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range("2015-01-02", periods=rows)
+    close = 50 * np.cumprod(1 + rng.normal(0.0003, 0.015, rows))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.008, rows))
+    return pd.DataFrame({"Open": open_, "High": np.maximum(open_, close) * (1 + spread),
+                         "Low": np.minimum(open_, close) * (1 - spread), "Close": close,
+                         "Volume": rng.integers(1e5, 1e7, rows).astype(float)}, index=idx)
+
+
+def _legacy_sweep(method, data, base_params, names, combos):
+    """변경 전: 셀마다 파라미터 전체 deepcopy, 한 스레드에서 순서대로."""
+    results = np.full(len(combos), np.nan)
+    for k, combo in enumerate(combos):
+        params = copy.deepcopy(base_params)
+        for name, value in zip(names, combo):
+            section, key = name.split(".", 1)
+            params[section][key] = value
+        if not param_sweep.is_valid(params):
+            continue
+        try:
+            profs = strategies.run(method, data, params).profits
+        except Exception:
+            continue
+        results[k] = (1 + pd.Series(profs)).prod() * 100 - 100 if profs else 0
+    return results
+
+
+def _timed_sweep(method, data, params, names, combos, workers):
+    first = []
+    start = time.perf_counter()
+    result = param_sweep.sweep(method, data, params, names, combos, workers=workers,
+                               on_chunk=lambda *_: first or first.append(time.perf_counter() - start))
+    return result, time.perf_counter() - start, first[0] if first else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--strategy", default="ma_cross", choices=sorted(WIDE_GRIDS))
+    parser.add_argument("--rows", type=int, default=2520)
+    parser.add_argument("--combos", type=int, default=1000, help="무작위 조합 수 (0 = 공간 전체)")
+    parser.add_argument("--workers", type=int, default=0, help="프로세스 수 (0 = 자동)")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    data = _make_frame(args.rows)
+    params = strategies.make_params(default_config["current"], default_config["backtest"])
+    axes = WIDE_GRIDS[args.strategy]
+    names = list(axes)
+    combos = (param_sweep.random_samples(axes, args.combos, seed=0) if args.combos
+              else param_sweep.grid(axes))
+    workers = args.workers or param_sweep._auto_workers()
+    print(f"{args.strategy}: {len(combos):,} combos ({len(names)}-D, space {param_sweep.grid_size(axes):,}), "
+          f"rows {args.rows:,}, cpu {os.cpu_count()}")
+
+    start = time.perf_counter()
+    legacy = _legacy_sweep(args.strategy, data, params, names, combos)
+    t_legacy = time.perf_counter() - start
+
+    serial, t_serial, first_serial = _timed_sweep(args.strategy, data, params, names, combos, 1)
+    # 코어가 하나면 자동 설정은 현재 스레드 실행과 같으므로 프로세스 2개로 풀 경로를 확인
+    workers = max(workers, 2)
+    pooled, t_pool, first_pool = _timed_sweep(args.strategy, data, params, names, combos, workers)
+    assert np.allclose(legacy, serial.returns, equal_nan=True), "in-thread sweep differs from legacy"
+    assert np.array_equal(serial.returns, pooled.returns, equal_nan=True), "process pool differs from in-thread"
+    print(f"identical returns: {len(combos):,} combos ({int(np.isnan(legacy).sum())} skipped by constraints)")
+
+    print(f"{'mode':28} {'total':>9} {'combos/s':>10} {'first chunk':>12}")
+    for label, total, first in [("legacy (deepcopy, serial)", t_legacy, t_legacy),
+                                ("param_sweep in-thread", t_serial, first_serial),
+                                (f"param_sweep {workers} processes", t_pool, first_pool)]:
+        print(f"{label:28} {total:>8.2f}s {len(combos) / total:>10,.0f} {first:>11.2f}s")
+
+    best = int(np.nanargmax(pooled.returns))
+    print(f"best: {dict(zip(names, combos[best]))} → {pooled.returns[best]:.1f}% ({pooled.trades[best]} trades)")
+
+
+if __name__ == "__main__":
+    main()
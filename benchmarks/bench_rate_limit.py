@@ -0,0 +1,175 @@
+"""
+요청 제한 미들웨어 시뮬레이션.
+
+초당 허용량을 넘으면 429를 돌려주는 가짜 서버에 여러 스레드가 동시에 요청합니다.
+변경 전 방식 (호출부마다 1·2·4초 고정 백오프 재시도)과 rate_limit.RequestGuard
+(공용 토큰 버킷 + 지터 백오프 + 서킷 브레이커)를 비교해 429 응답 수, 최종 실패 수,
+소요 시간과 가드 통계(대기/제한/재시도)를 출력합니다. 지연은 --scale 배로 줄여 실행합니다.
+이어서 yfinance 1.x처럼 레이트 리밋을 예외 대신 로그 + 빈 결과로 알리는 가짜 yf.download로
+YFinanceProvider 일괄 다운로드를 돌려, 변경 전 검사(전역 shared._ERRORS)와 호출별 판정의
+throttled/retries 통계와 빈 결과로 끝난 배치 수를 비교합니다. 네트워크는 사용하지 않습니다.
+
+    python benchmarks/bench_rate_limit.py --requests 200 --workers 16 --server-rps 20 --batches 60
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "modules"))
+
+import pandas as pd
+
+from data_provider import YFinanceProvider
+from rate_limit import RateLimitedError, RequestGuard, is_rate_limit_error
+
+
+class _FakeServer:
+    """최근 1초 동안 rps개를 넘는 요청에 429 (ConnectionError)로 응답."""
+
+    def __init__(self, rps):
+        self.rps = rps
+        self._times = deque()
+        self._lock = threading.Lock()
+        self.served = 0
+        self.rejected = 0
+
+    def get(self, symbol):
+        with self._lock:
+            now = time.monotonic()
+            while self._times and now - self._times[0] > 1.0:
+                self._times.popleft()
+            if len(self._times) >= self.rps:
+                self.rejected += 1
+                raise ConnectionError("HTTP Error 429: Too Many Requests")
+            self._times.append(now)
+            self.served += 1
+        return symbol
+
+
+class _FakeYFinance:
+    """yfinance 1.x 다운로드 흉내: 한도를 넘은 배치는 종목별 오류를 로그로만 남기고 빈 DataFrame 반환.
+
+    shared._ERRORS는 1.x처럼 항상 비어 있음.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self.shared = type("shared", (), {"_ERRORS": {}})
+        self.empty_batches = 0
+
+    def download(self, tickers, **kwargs):
+        symbols = tickers.split() if isinstance(tickers, str) else list(tickers)
+        try:
+            self.server.get(symbols[0])
+        except ConnectionError:
+            self.empty_batches += 1
+            logging.getLogger("yfinance").error(
+                f"{[s.upper() for s in symbols]}: YFRateLimitError('Too Many Requests. "
+                f"Rate limited. Try after a while.')")
+            return pd.DataFrame()
+        idx = pd.date_range("2024-01-02", periods=5, freq="D")
+        return pd.concat({s: pd.DataFrame({"Close": 1.0, "Volume": 1.0}, index=idx) for s in symbols},
+                         axis=1)
+
+
+class _LegacyProvider(YFinanceProvider):
+    """변경 전 검사: 결과가 비었을 때 전역 shared._ERRORS에 레이트 리밋이 있으면 예외."""
+
+    def download(self, tickers, **kwargs):
+        symbols = tickers.split() if isinstance(tickers, str) else list(tickers)
+
+        def _call():
+            df = self._yf.download(tickers, **kwargs)
+            errors = getattr(getattr(self._yf, "shared", None), "_ERRORS", None) or {}
+            if any(is_rate_limit_error(Exception(str(m))) for m in errors.values()) and df.empty:
+                raise RateLimitedError("Rate limited")
+            return df
+        return self._guard.call(_call, cost=max(1, len(symbols)), name=f"download({len(symbols)})")
+
+
+def _run_batches(provider, n_batches, batch_size, workers):
+    """배치 다운로드를 동시에 실행하고 빈 결과로 끝난 배치 수를 반환."""
+    def _one(k):
+        try:
+            return provider.download([f"T{k}_{i}" for i in range(batch_size)], group_by="ticker")
+        except ConnectionError:
+            return pd.DataFrame()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return sum(df.empty for df in pool.map(_one, range(n_batches)))
+
+
+def _legacy_call(func, *args, base_delay=1.0, max_retries=3):
+    """변경 전 구현 (_retry_api_call / _retry_download: 고정 지수 백오프, 호출부별 독립)."""
+    last_error = None
+    for attempt in range(max_retries):
+        try:
+            return func(*args)
+        except (ConnectionError, TimeoutError, OSError) as e:
+            last_error = e
+            if attempt < max_retries - 1:
+                time.sleep(base_delay * (2 ** attempt))
+    raise last_error
+
+
+def _run(call, n_requests, workers):
+    failures = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(call, f"T{i}") for i in range(n_requests)]
+        for f in futures:
+            try:
+                f.result()
+            except ConnectionError:
+                failures += 1
+    return failures, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--server-rps", type=int, default=20, help="가짜 서버의 초당 허용 요청 수")
+    parser.add_argument("--scale", type=float, default=0.1, help="백오프 지연 배율 (1 = 실제 설정값)")
+    parser.add_argument("--batches", type=int, default=60, help="일괄 다운로드 배치 수")
+    parser.add_argument("--batch-size", type=int, default=50)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    logging.getLogger("yfinance").addHandler(logging.NullHandler())   # 가짜 yfinance 오류 로그는 출력하지 않음
+
+    print(f"requests: {args.requests}, workers: {args.workers}, server: {args.server_rps} req/s")
+    print(f"{'mode':8} {'429s':>6} {'failed':>7} {'time':>8}")
+
+    server = _FakeServer(args.server_rps)
+    failed, elapsed = _run(lambda s: _legacy_call(server.get, s, base_delay=args.scale),
+                           args.requests, args.workers)
+    print(f"{'legacy':8} {server.rejected:>6} {failed:>7} {elapsed:>7.2f}s")
+
+    server = _FakeServer(args.server_rps)
+    guard = RequestGuard(requests_per_sec=args.server_rps * 0.9, burst=args.server_rps // 2,
+                         base_delay_sec=args.scale, max_delay_sec=30 * args.scale,
+                         breaker_reset_sec=60 * args.scale)
+    failed, elapsed = _run(lambda s: guard.call(server.get, s, name=s), args.requests, args.workers)
+    print(f"{'guard':8} {server.rejected:>6} {failed:>7} {elapsed:>7.2f}s")
+    print(f"guard stats: {guard.stats} (breaker: {guard.breaker.state})")
+
+    # 일괄 다운로드: 레이트 리밋이 예외 없이 빈 결과로 오는 경우
+    print(f"\nbatch downloads: {args.batches} × {args.batch_size} tickers, workers: {args.workers}")
+    print(f"{'check':10} {'429s':>6} {'empty':>6} {'throttled':>10} {'retries':>8}")
+    for label, cls in [("legacy", _LegacyProvider), ("per-call", YFinanceProvider)]:
+        fake = _FakeYFinance(_FakeServer(args.server_rps))
+        guard = RequestGuard(requests_per_sec=1000, burst=1000, base_delay_sec=args.scale,
+                             max_delay_sec=30 * args.scale, breaker_reset_sec=60 * args.scale)
+        empty = _run_batches(cls(guard=guard, yf=fake), args.batches, args.batch_size, args.workers)
+        print(f"{label:10} {fake.empty_batches:>6} {empty:>6} {guard.stats['throttled']:>10} "
+              f"{guard.stats['retries']:>8}")
+    print("(empty = batches that ended with no data; legacy never sees the rate limit, so nothing is retried)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+워치리스트 새로고침 확장성 벤치마크.
+
+합성 시세 공급자(요청마다 지연을 흉내냄)와 임시 캐시로 새로고침 파이프라인을
+워치리스트 크기별로 실행하여 전체 소요 시간과 단계별 시간을 비교합니다.
+첫 주기(콜드 캐시)와 두 번째 주기(웜 캐시)를 모두 측정합니다. 네트워크는 사용하지 않습니다.
+
+    python benchmarks/bench_refresh_scaling.py --sizes 20,100,500 --latency-ms 50
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "modules"))
+
+import config
+import data_cache
+import data_provider
+from async_fetch import AsyncFetchCore
+from refresh_pipeline import RefreshPipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="20,100,500")
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--htf", action="store_true", help="멀티 타임프레임 확인 켜기 (종목별 추가 요청)")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    config.config["current"]["multi_timeframe_enabled"] = args.htf
+    data_provider.set_provider(data_provider.SyntheticProvider(seed=0, latency_ms=args.latency_ms))
+    data_cache._DB_PATH = os.path.join(tempfile.mkdtemp(), "bench_refresh.db")
+    core = AsyncFetchCore(args.concurrency)
+    pipeline = RefreshPipeline(core=core)
+
+    print(f"{'tickers':>8} {'cycle':>6} {'total':>8} {'prefetch':>9} {'fetch*':>8} {'compute*':>9}")
+    for n in [int(x) for x in args.sizes.split(",")]:
+        # 크기마다 다른 종목명을 써서 이전 측정의 캐시를 재사용하지 않음
+        tickers = [f"B{n}_{i:04d}" for i in range(n)]
+        for cycle in ("cold", "warm"):
+            pipeline.run(tickers)
+            t = pipeline.last_timings
+            print(f"{n:>8} {cycle:>6} {t['total']:>7.2f}s {t['prefetch']:>8.2f}s "
+                  f"{t['fetch']:>7.2f}s {t['compute']:>8.2f}s")
+    print("* fetch/compute는 종목별 소요 시간의 합 (동시 실행으로 전체 시간보다 클 수 있음)")
+
+    pipeline.shutdown()
+    core.shutdown()
+
+
+if __name__ == "__main__":
+    main()
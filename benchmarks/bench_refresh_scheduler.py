@@ -0,0 +1,84 @@
+"""
+적응형 새로고침 스케줄러 시뮬레이션.
+
+가상 시계로 워치리스트 크기별 1시간 정규장을 돌려, 분당 실제 갱신 수가 예산을 넘지 않는지와
+종목 유형(신호 중 / 보통 / 조용함 / 보유)별 평균 갱신 간격을 출력합니다.
+--fail-window를 주면 해당 구간(초) 동안 모든 갱신이 실패한 것으로 처리해 백오프를 확인합니다.
+네트워크는 사용하지 않습니다.
+
+    python benchmarks/bench_refresh_scheduler.py --sizes 20,100,500 --rpm 120
+    python benchmarks/bench_refresh_scheduler.py --sizes 500 --rpm 120 --fail-window 1800,1900
+"""
+
+import argparse
+import logging
+import os
+import sys
+from collections import namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "modules"))
+
+from refresh_scheduler import RefreshScheduler
+
+_Record = namedtuple("_Record", ["ticker", "momentum_signal", "rsi_signal", "rate"])
+
+# 종목 유형: 앞 10%는 신호 중, 다음 40%는 조용함, 나머지는 보통, 마지막 하나는 보유
+_KINDS = {
+    "active": lambda i, n: i < n // 10,
+    "quiet": lambda i, n: n // 10 <= i < n // 2,
+    "normal": lambda i, n: n // 2 <= i < n - 1,
+    "held": lambda i, n: i == n - 1,
+}
+
+
+def _record(ticker, i, n):
+    if _KINDS["active"](i, n):
+        return _Record(ticker, "매수", "50.00%", "1.00%")
+    if _KINDS["quiet"](i, n):
+        return _Record(ticker, "관망", "50.00%", "0.10%")
+    return _Record(ticker, "관망", "50.00%", "1.20%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="20,100,500")
+    parser.add_argument("--rpm", type=float, default=120, help="분당 종목 갱신 예산 (0 = 무제한)")
+    parser.add_argument("--seconds", type=int, default=3600)
+    parser.add_argument("--fail-window", default="", help="실패 구간 시작,끝 (초)")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    fail_from, fail_to = (int(x) for x in args.fail_window.split(",")) if args.fail_window else (-1, -1)
+
+    print(f"budget: {args.rpm:g}/min, simulated: {args.seconds}s regular session")
+    print(f"{'tickers':>8} {'per min':>8} " + " ".join(f"{k + ' int':>11}" for k in _KINDS)
+          + f" {'backoffs':>9}")
+    for n in [int(x) for x in args.sizes.split(",")]:
+        clock = [0.0]
+        scheduler = RefreshScheduler(requests_per_minute=args.rpm, session_func=lambda: "정규장",
+                                     clock=lambda: clock[0])
+        tickers = [f"S{i:04d}" for i in range(n)]
+        index = {t: i for i, t in enumerate(tickers)}
+        scheduler.sync(tickers)
+        counts = dict.fromkeys(tickers, 0)
+        for second in range(args.seconds):
+            clock[0] = float(second)
+            batch = scheduler.due()
+            if not batch:
+                continue
+            for t in batch:
+                counts[t] += 1
+            failed = fail_from <= second < fail_to
+            results = [] if failed else [_record(t, index[t], n) for t in batch]
+            scheduler.record_results(batch, results, held=[tickers[-1]])
+
+        cells = []
+        for kind, match in _KINDS.items():
+            members = [t for t in tickers if match(index[t], n)]
+            refreshes = sum(counts[t] for t in members)
+            cells.append(f"{args.seconds * len(members) / refreshes:>10.0f}s" if refreshes else f"{'-':>11}")
+        per_min = sum(counts.values()) / (args.seconds / 60)
+        print(f"{n:>8} {per_min:>8.1f} " + " ".join(cells) + f" {scheduler.stats['backoffs']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+횡단면(유니버스) 백테스트 벤치마크.
+
+합성 일봉 유니버스(기본 500종목 × 2,520행 ≈ S&P 500 10년, 상장일/마지막 봉이 종목마다 다름)에서
+종목마다 strategies.run을 한 번씩 부르는 방식과 universe_backtest (2차원 패널에서 모든 종목 신호를
+한 번에 계산)를 비교합니다. 종목별 누적 수익률·거래 수가 같은지 확인한 뒤 패널 생성 시간과
+전략별 시간을 출력합니다. 시세는 메모리에서 만들므로 다운로드/캐시 시간은 포함하지 않습니다.
+
+    python benchmarks/bench_universe_backtest.py --tickers 500 --rows 2520
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "modules"))
+
+import numpy as np
+import pandas as pd
+
+import indicators
+import strategies
+import universe_backtest
+from config import default_config
+
+
+def _make_universe(n_tickers, rows, seed=0):
+    """종목마다 다른 추세/변동성의 합성 일봉 (일부는 늦게 상장하거나 일찍 끝남)."""
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range("2015-01-02", periods=rows, tz="UTC")
+    histories = {}
+    for k in range(n_tickers):
+        close = 50 * np.cumprod(1 + rng.normal(rng.normal(0.0003, 0.0003), rng.uniform(0.01, 0.03), rows))
+        open_ = np.concatenate([[close[0]], close[:-1]])
+        spread = np.abs(rng.normal(0, 0.008, rows))
+        df = pd.DataFrame({"Open": open_, "High": np.maximum(open_, close) * (1 + spread),
+                           "Low": np.minimum(open_, close) * (1 - spread), "Close": close,
+                           "Volume": rng.integers(1e5, 1e7, rows).astype(float)}, index=idx)
+        first = int(rng.integers(0, rows // 2)) if k % 7 == 0 else 0
+        last = rows - (int(rng.integers(1, rows // 4)) if k % 11 == 0 else 0)
+        histories[f"T{k:03d}"] = df.iloc[first:last]
+    return histories
+
+
+def _legacy_per_ticker(name, histories, params):
+    """변경 전: 종목마다 단일 종목 전략을 한 번씩 실행."""
+    out = {}
+    for ticker, df in histories.items():
+        try:
+            profits = strategies.run(name, df, params).profits
+        except strategies.InsufficientDataError:
+            profits = []
+        out[ticker] = (strategies.total_return(profits), len(profits))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=2520)
+    parser.add_argument("--skip-legacy", action="store_true", help="종목별 실행 비교 생략")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    histories = _make_universe(args.tickers, args.rows)
+    params = strategies.make_params(default_config["current"], default_config["backtest"])
+
+    start = time.perf_counter()
+    panel = universe_backtest.build_panel(histories)
+    t_panel = time.perf_counter() - start
+    print(f"universe: {args.tickers} tickers × {args.rows:,} rows, panel built in {t_panel:.2f}s")
+    print(f"{'strategy':20} {'panel':>9} {'per-ticker':>11} {'speedup':>8} {'trades':>8}")
+
+    total_new = total_old = 0.0
+    for name in universe_backtest.PANEL_SIGNALS:
+        indicators.clear_cache()
+        start = time.perf_counter()
+        table = universe_backtest.run(name, panel, params)
+        t_new = time.perf_counter() - start
+        total_new += t_new
+        if args.skip_legacy:
+            print(f"{name:20} {t_new:>8.2f}s {'-':>11} {'-':>8} {int(table['trades'].sum()):>8,}")
+            continue
+
+        indicators.clear_cache()
+        start = time.perf_counter()
+        legacy = _legacy_per_ticker(name, histories, params)
+        t_old = time.perf_counter() - start
+        total_old += t_old
+        for ticker, (ret, n_trades) in legacy.items():
+            row = table.loc[ticker]
+            assert row["trades"] == n_trades and np.isclose(row["total_return"], ret), f"{name} {ticker} differs"
+        print(f"{name:20} {t_new:>8.2f}s {t_old:>10.2f}s {t_old / t_new:>7.1f}x {int(table['trades'].sum()):>8,}")
+
+    if total_old:
+        print(f"{'all strategies':20} {total_new:>8.2f}s {total_old:>10.2f}s {total_old / total_new:>7.1f}x "
+              f"(identical per-ticker returns and trade counts)")
+    top = table.head(5)
+    print(f"top 5 ({name}): " + ", ".join(f"{t} {r.total_return * 100:+.1f}%" for t, r in top.iterrows()))
+
+
+if __name__ == "__main__":
+    main()
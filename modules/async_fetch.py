@@ -0,0 +1,122 @@
+"""
+asyncio 기반 조회 코어.
+
+전용 스레드 하나에서 이벤트 루프를 돌리며, 수백 개의 종목 조회를 코루틴으로 동시에 진행합니다.
+- 동시 요청 수는 asyncio.Semaphore(max_concurrency)로 제한 (허가는 실행기 작업이 실제로 끝날 때 반환)
+- 공급자(yfinance 등)의 블로킹 호출은 같은 크기의 연결 풀 전용 실행기에서 수행
+  (요청 하나당 스레드 하나를 점유하되, 스케줄링/타임아웃/취소는 이벤트 루프가 담당)
+- 다른 스레드(새로고침 스레드, Tk 메인 스레드)에서는 submit()/run()으로 코루틴을 넘김
+
+Tk 메인 루프로 결과를 돌려줄 때는 ui_components.TkBridge를 사용합니다.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 32
+
+_core = None
+_core_lock = threading.Lock()
+
+
+class AsyncFetchCore:
+    """백그라운드 이벤트 루프 + 동시성 제한 + 블로킹 호출용 연결 풀."""
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix="async-fetch-io")
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self._executor)
+        self._semaphore = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, name="async-fetch",
+                                        daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        # Semaphore는 자신이 쓰일 루프 안에서 생성
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def submit(self, coro):
+        """다른 스레드에서 코루틴을 예약하고 concurrent.futures.Future를 반환."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro, timeout: float = None):
+        """다른 스레드에서 코루틴을 실행하고 결과를 기다림 (루프 스레드에서 호출 금지)."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("AsyncFetchCore.run() called from the event loop thread")
+        return self.submit(coro).result(timeout)
+
+    async def call(self, func, *args, timeout: float = None):
+        """블로킹 함수를 동시성 제한 안에서 연결 풀 실행기로 호출 (코루틴).
+
+        타임아웃/취소로 기다림을 그만둬도 실행기 스레드의 호출은 계속 돌기 때문에, 허가는 그 호출이
+        끝날 때 돌려줌 (시간 초과가 쌓여도 실제 동시 요청이 max_concurrency를 넘지 않도록).
+        """
+        await self._semaphore.acquire()
+        try:
+            job = self._executor.submit(func, *args)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        job.add_done_callback(self._release_permit)
+        future = asyncio.wrap_future(job, loop=self._loop)
+        if timeout:
+            return await asyncio.wait_for(future, timeout)
+        return await future
+
+    def _release_permit(self, _job):
+        # 실행기 스레드에서 호출될 수 있으므로 루프 스레드로 넘겨 반환
+        try:
+            self._loop.call_soon_threadsafe(self._semaphore.release)
+        except RuntimeError:
+            pass  # 종료 중 (루프가 이미 닫힘)
+
+    async def map(self, func, items, timeout: float = None, return_exceptions: bool = True):
+        """items 각각에 func를 동시 호출 (동시성 제한 적용), 입력 순서대로 결과 반환."""
+        return await asyncio.gather(*(self.call(func, item, timeout=timeout) for item in items),
+                                    return_exceptions=return_exceptions)
+
+    def shutdown(self, timeout: float = 5):
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_core() -> AsyncFetchCore:
+    """프로세스 공용 조회 코어 (config "refresh.max_concurrency", 최초 호출 시 생성)."""
+    global _core
+    with _core_lock:
+        if _core is None:
+            try:
+                limit = config.config.get("refresh", {}).get("max_concurrency")
+            except Exception:
+                limit = None
+            _core = AsyncFetchCore(limit or DEFAULT_MAX_CONCURRENCY)
+            logger.info(f"[ASYNC] Fetch core started (max_concurrency={_core.max_concurrency})")
+        return _core
+
+
+def shutdown_core(timeout: float = 5):
+    global _core
+    with _core_lock:
+        if _core is not None:
+            _core.shutdown(timeout)
+            _core = None
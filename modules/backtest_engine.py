@@ -0,0 +1,288 @@
+"""
+벡터화 백테스트 엔진.
+
+전략별 매수/매도 조건을 봉 단위 불리언 배열로 만들고, 배열 연산만으로 거래 목록을 만듭니다.
+- 신호: 지표 시리즈(NumPy 배열)를 비교해 진입(entries)/청산(exits) 배열 생성
+- 상태 기계: 진입=1, 청산=0 표시를 앞으로 채워(forward-fill) 보유 상태를 구하고,
+  0→1 전환을 매수, 1→0 전환을 매도로 봄 (보유 중 진입 신호, 미보유 중 청산 신호는 무시)
+- 수익률: 매수/매도 가격 배열로 한 번에 계산 (왕복 수수료 + 슬리피지 차감)
+
+기존 백테스트 팝업의 봉 단위 루프(`if not in_position and 진입 ... elif in_position and 청산`)와
+같은 거래 목록을 만듭니다. 마지막까지 보유 중이면 마지막 종가로 수익률만 계산하고
+매도일은 남기지 않습니다.
+
+Tk와 config에 의존하지 않아 다른 스레드/프로세스에서도 그대로 쓸 수 있습니다.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+# 봉 위치(정수 인덱스) 기준 거래 목록. profits는 청산된 거래 + (있으면) 미청산 포지션 순
+Trades = namedtuple('Trades', ['buy_idx', 'sell_idx', 'profits'])
+
+
+def _values(series) -> np.ndarray:
+    """Series/배열 → float64 NumPy 배열."""
+    return np.asarray(series, dtype=np.float64)
+
+
+def _prev(values: np.ndarray) -> np.ndarray:
+    """한 봉 전 값 (첫 봉은 NaN → 비교 결과 False)."""
+    out = np.empty_like(values)
+    out[:1] = np.nan
+    out[1:] = values[:-1]
+    return out
+
+
+# ============================================================
+# 상태 기계 / 수익률
+# ============================================================
+
+def _alternate(entries: np.ndarray, exits: np.ndarray):
+    """진입/청산이 같은 봉에 겹칠 때의 처리: 거래마다 다음 신호를 이분 탐색.
+
+    미보유 상태면 그 봉에서 매수, 보유 상태면 그 봉에서 매도하는 루프 동작과 같음.
+    """
+    entry_idx = np.flatnonzero(entries)
+    exit_idx = np.flatnonzero(exits)
+    buys, sells = [], []
+    pos = 0
+    while True:
+        k = np.searchsorted(entry_idx, pos, side='left')
+        if k == len(entry_idx):
+            break
+        buy = entry_idx[k]
+        buys.append(buy)
+        k = np.searchsorted(exit_idx, buy, side='right')
+        if k == len(exit_idx):
+            break
+        sells.append(exit_idx[k])
+        pos = exit_idx[k] + 1
+    return np.asarray(buys, dtype=np.intp), np.asarray(sells, dtype=np.intp)
+
+
+def signals_to_positions(entries, exits):
+    """진입/청산 불리언 배열 → (매수 봉 위치, 매도 봉 위치).
+
+    매도 위치는 매수 위치보다 하나 적을 수 있음 (마지막 포지션 미청산).
+    """
+    entries = np.asarray(entries, dtype=bool)
+    exits = np.asarray(exits, dtype=bool)
+    n = len(entries)
+    if n == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    if np.any(entries & exits):
+        return _alternate(entries, exits)
+
+    # 진입=1 / 청산=0 / 나머지=직전 상태 (forward-fill)
+    marker = np.full(n, np.nan)
+    marker[exits] = 0.0
+    marker[entries] = 1.0
+    last = np.where(np.isnan(marker), 0, np.arange(n))
+    np.maximum.accumulate(last, out=last)
+    state = np.nan_to_num(marker[last], nan=0.0)
+    change = np.diff(state, prepend=0.0)
+    return np.flatnonzero(change > 0), np.flatnonzero(change < 0)
+
+
+def trade_returns(entry_prices, exit_prices, commission: float = 0.0, slippage: float = 0.0) -> np.ndarray:
+    """거래별 수익률 (왕복 수수료 + 슬리피지 차감, 진입가가 0 이하/결측이면 0)."""
+    entry = _values(entry_prices)
+    exit_ = _values(exit_prices)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        raw = (exit_ - entry) / entry
+        return np.where(entry > 0, raw - (commission * 2) - (slippage * 2), 0.0)
+
+
+def run_trades(close, entries, exits, commission: float = 0.0, slippage: float = 0.0,
+               fill_offset: int = 0) -> Trades:
+    """신호 배열 → 거래 목록 (봉 위치 기준).
+
+    fill_offset: 신호 봉 다음 봉에서 체결하는 전략(볼린저 반등)은 1
+    """
+    price = _values(close)
+    buys, sells = signals_to_positions(entries, exits)
+    buys = buys + fill_offset
+    sells = sells + fill_offset
+    exit_prices = price[sells]
+    if len(buys) > len(sells) and len(price):
+        exit_prices = np.append(exit_prices, price[-1])
+    profits = trade_returns(price[buys], exit_prices, commission, slippage)
+    return Trades(buys, sells, profits)
+
+
+# ============================================================
+# 횡단면 (봉 × 종목 2차원 배열, 열마다 위 함수들과 같은 거래)
+# ============================================================
+
+# 종목 열 기준 거래 목록 (열 → 봉 순 정렬). sell_row는 미청산 포지션이면 -1
+PanelTrades = namedtuple('PanelTrades', ['col', 'buy_row', 'sell_row', 'profits'])
+
+
+def signals_to_state(entries, exits) -> np.ndarray:
+    """2차원 진입/청산 → 보유 상태 (1.0 / 0.0, 매수 봉부터 매도 봉 직전까지 1).
+
+    forward-fill은 열마다 독립이라 전체를 한 번에 처리하고,
+    진입/청산이 같은 봉에 겹친 열만 signals_to_positions로 따로 계산.
+    """
+    entries = np.asarray(entries, dtype=bool)
+    exits = np.asarray(exits, dtype=bool)
+    n = entries.shape[0]
+    marker = np.full(entries.shape, np.nan)
+    marker[exits] = 0.0
+    marker[entries] = 1.0
+    last = np.where(np.isnan(marker), 0, np.arange(n)[:, None])
+    np.maximum.accumulate(last, axis=0, out=last)
+    state = np.nan_to_num(np.take_along_axis(marker, last, axis=0), nan=0.0)
+    for j in np.flatnonzero(np.any(entries & exits, axis=0)):
+        buys, sells = _alternate(entries[:, j], exits[:, j])
+        state[:, j] = 0.0
+        for k, buy in enumerate(buys):
+            state[buy:sells[k] if k < len(sells) else n, j] = 1.0
+    return state
+
+
+def panel_trades(close, state, last_row, commission: float = 0.0, slippage: float = 0.0,
+                 fill_offset: int = 0) -> PanelTrades:
+    """보유 상태 → 모든 열의 거래 (run_trades와 같은 수익률).
+
+    last_row: 열마다 마지막 유효 봉 위치 (미청산 포지션을 그 봉 종가로 평가)
+    """
+    price = _values(close)
+    change = np.diff(state, axis=0, prepend=0.0)
+    buy_col, buy_row = np.nonzero(change.T > 0)
+    sell_col, sell_row = np.nonzero(change.T < 0)
+    open_col = np.flatnonzero(state[-1] > 0) if len(state) else np.empty(0, dtype=np.intp)
+    # 미청산 포지션에 마지막 유효 봉 매도를 붙인 뒤 (열, 봉) 순으로 정렬하면 매수와 1:1로 맞음
+    exit_col = np.concatenate([sell_col, open_col])
+    exit_row = np.concatenate([sell_row + fill_offset, np.asarray(last_row)[open_col]])
+    is_open = np.concatenate([np.zeros(len(sell_col), dtype=bool), np.ones(len(open_col), dtype=bool)])
+    order = np.lexsort((exit_row, exit_col))
+    exit_col, exit_row, is_open = exit_col[order], exit_row[order], is_open[order]
+    buy_row = buy_row + fill_offset
+    profits = trade_returns(price[buy_row, buy_col], price[exit_row, exit_col], commission, slippage)
+    return PanelTrades(buy_col, buy_row, np.where(is_open, -1, exit_row), profits)
+
+
+def trade_lists(index, trades: Trades):
+    """Trades → (매수일 리스트, 매도일 리스트, 수익률 리스트) — 팝업 결과 표시 형식."""
+    return list(index[trades.buy_idx]), list(index[trades.sell_idx]), trades.profits.tolist()
+
+
+# ============================================================
+# 전략별 신호 (입력은 같은 길이의 지표 시리즈/배열)
+# ============================================================
+
+def macd_cross_signals(macd, signal):
+    """MACD가 시그널 선을 상향/하향 돌파한 봉."""
+    m, s = _values(macd), _values(signal)
+    pm, ps = _prev(m), _prev(s)
+    return (pm < ps) & (m > s), (pm > ps) & (m < s)
+
+
+def threshold_signals(values, lower: float, upper: float):
+    """값이 lower 미만이면 매수, 아니고 upper 초과면 매도 (첫 봉 제외)."""
+    v = _values(values)
+    buy = v < lower
+    sell = (v > upper) & ~buy
+    buy[:1] = sell[:1] = False
+    return buy, sell
+
+
+def macd_rsi_signals(macd, signal, rsi, lower: float, upper: float):
+    """진입: MACD 상향 돌파 + RSI < lower, 청산: MACD < 시그널 또는 RSI > upper (첫 봉 제외)."""
+    m, s, r = _values(macd), _values(signal), _values(rsi)
+    entries = (_prev(m) < _prev(s)) & (m > s) & (r < lower)
+    exits = (m < s) | (r > upper)
+    entries[:1] = exits[:1] = False
+    return entries, exits
+
+
+def bollinger_signals(close, upper_band, lower_band, use_rebound: bool):
+    """볼린저 밴드 신호.
+
+    터치: 종가 < 하단이면 진입, 종가 > 상단이면 청산 (같은 봉 체결)
+    반등: 하단 아래에서 다음 봉이 오르면 진입, 상단 위에서 다음 봉이 내리면 청산
+          (신호 봉 다음 봉에 체결 → run_trades(fill_offset=1), 마지막 두 봉은 신호 없음)
+    """
+    c, up, low = _values(close), _values(upper_band), _values(lower_band)
+    if not use_rebound:
+        return c < low, c > up
+    n = len(c)
+    entries = np.zeros(c.shape, dtype=bool)
+    exits = np.zeros(c.shape, dtype=bool)
+    if n >= 3:
+        cur, nxt = c[:n - 2], c[1:n - 1]
+        entries[:n - 2] = (cur < low[:n - 2]) & (nxt > cur)
+        exits[:n - 2] = (cur > up[:n - 2]) & (nxt < cur)
+    return entries, exits
+
+
+def ma_cross_signals(short_ma, long_ma):
+    """단기 이동평균 > 장기면 진입, < 이면 청산."""
+    s, l = _values(short_ma), _values(long_ma)
+    return s > l, s < l
+
+
+def momentum_scores(close, rsi, upper_band, lower_band, macd, signal, short_ma, long_ma,
+                    rsi_lower: float, rsi_upper: float, use_rebound: bool, weights, thresholds):
+    """종합 모멘텀 점수 → (진입, 청산).
+
+    weights: (MACD, MA, BB, RSI) 가중치, thresholds: (강력 매수, 매수, 매도, 강력 매도) 기준
+    MACD/MA는 매수가 아니면 매도로 (결측 포함), BB/RSI는 조건 밖이면 0점.
+    """
+    macd_w, ma_w, bb_w, rsi_w = weights
+    strong_buy, buy, sell, strong_sell = thresholds
+    c, up, low = _values(close), _values(upper_band), _values(lower_band)
+    r = _values(rsi)
+
+    if use_rebound:
+        # 반등 확인은 다음 봉이 필요해 마지막 봉은 HOLD
+        nxt = np.concatenate([c[1:], np.full_like(c[:1], np.nan)])
+        bb_buy = (c < low) & (nxt > c)
+        bb_sell = ~(c < low) & (c > up) & (nxt < c)
+    else:
+        bb_buy = c < low
+        bb_sell = ~bb_buy & (c > up)
+    rsi_buy = r < rsi_lower
+    rsi_sell = ~rsi_buy & (r > rsi_upper)
+
+    scores = np.zeros(c.shape)
+    scores += np.where(_values(macd) > _values(signal), macd_w, -macd_w)
+    scores += np.where(_values(short_ma) > _values(long_ma), ma_w, -ma_w)
+    scores += np.where(bb_buy, bb_w, np.where(bb_sell, -bb_w, 0))
+    scores += np.where(rsi_buy, rsi_w, np.where(rsi_sell, -rsi_w, 0))
+
+    entries = (scores >= strong_buy) | (scores >= buy)
+    exits = ~entries & ((scores <= strong_sell) | (scores <= sell))
+    return entries, exits
+
+
+def momentum_return_signals(returns, short_ma, long_ma, threshold: float, start: int):
+    """진입: 수익률 >= threshold 이고 단기 MA > 장기, 청산: 단기 MA < 장기 또는 수익률 < 0.
+
+    start: 수익률 계산 창 (그 전 봉은 신호 없음)
+    """
+    ret, s, l = _values(returns), _values(short_ma), _values(long_ma)
+    entries = (ret >= threshold) & (s > l)
+    exits = (s < l) | (ret < 0)
+    entries[:start] = exits[:start] = False
+    return entries, exits
+
+
+def ichimoku_signals(close, tenkan, kijun, senkou_a, senkou_b):
+    """진입: 전환선이 기준선을 상향 돌파 + 종가가 구름 위, 청산: 전환선이 기준선을 하향 돌파.
+
+    구름 경계가 결측이면 0으로 보고, 전환선/기준선이 결측인 봉은 건너뜀 (첫 봉 제외).
+    """
+    c, t, k = _values(close), _values(tenkan), _values(kijun)
+    pt, pk = _prev(t), _prev(k)
+    cloud_top = np.maximum(np.nan_to_num(_values(senkou_a), nan=0.0),
+                           np.nan_to_num(_values(senkou_b), nan=0.0))
+    valid = ~np.isnan(t) & ~np.isnan(k)
+    entries = valid & (pt <= pk) & (t > k) & (c > cloud_top)
+    exits = valid & (pt >= pk) & (t < k)
+    entries[:1] = exits[:1] = False
+    return entries, exits
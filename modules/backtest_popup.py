@@ -12,7 +12,6 @@ import matplotlib.ticker as ticker
 from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
-import yfinance as yf
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from fundamental_score import safe_get_float, calculate_valuation_score, calculate_factor_score, calculate_piotroski_fscore
@@ -24,6 +23,13 @@ except ImportError:
     _has_calendar = False
 
 import config
+import indicators
+import monte_carlo
+import param_sweep
+import strategies
+import universe_backtest
+from data_provider import get_provider
+from stock_universe import get_universe, get_universe_names
 from help_texts import STRATEGY_HELP, BACKTEST_INPUT_HELP, CHART_HELP, RESULT_HELP
 from ui_components import Tooltip, HelpTooltip
 
@@ -63,13 +69,12 @@ STRATEGY_DESCRIPTIONS = {
     "momentum_return_ma": "모멘텀 수익률 + MA 교차",
 }
 
-# Phase 7-2: API retry
-MAX_RETRIES = 3
-RETRY_BASE_DELAY = 1
-
 
 def _retry_download(ticker_symbol, start, end):
-    """yf.download with retry logic. Uses SQLite cache when available."""
+    """yf.download via SQLite cache when available.
+
+    재시도/요청 제한은 공급자의 rate_limit.RequestGuard가 담당한다.
+    """
     # Try cache first
     try:
         from data_cache import get_cached_history
@@ -81,31 +86,7 @@ def _retry_download(ticker_symbol, start, end):
     except Exception as e:
         logging.warning(f"[BACKTEST] Cache fallback: {e}")
 
-    last_error = None
-    for attempt in range(MAX_RETRIES):
-        try:
-            data = yf.download(ticker_symbol, start=start, end=end)
-            return data
-        except (ConnectionError, TimeoutError, OSError) as e:
-            last_error = e
-            if attempt < MAX_RETRIES - 1:
-                delay = RETRY_BASE_DELAY * (2 ** attempt)
-                logging.warning(f"[BACKTEST] Download retry {attempt + 1} for {ticker_symbol}: {e}")
-                time.sleep(delay)
-    raise last_error
-
-
-def calculate_rsi_for_backtest(series, period=14):
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
-
-    avg_gain = gain.rolling(window=period, min_periods=1).mean()
-    avg_loss = loss.rolling(window=period, min_periods=1).mean()
-
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    return get_provider().download(ticker_symbol, start=start, end=end)
 
 
 def _get_commission_rate():
@@ -325,17 +306,8 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
 
     # --- Plot functions ---
 
-    # 비교/민감도 실행 중 개별 전략 차트 팝업 억제 플래그
-    _suppress_chart = [False]
-
     def _create_graph_popup(fig, title, help_text=""):
         """차트를 result_container 안에 임베딩."""
-        if _suppress_chart[0]:
-            try:
-                plt.close(fig)
-            except Exception:
-                pass
-            return None
         # matplotlib 기본 figure manager 창이 뜨지 않도록 제거 (FigureCanvasTkAgg로 직접 임베딩)
         try:
             plt.close(fig)
@@ -486,7 +458,7 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
             if len(close_series) >= 2:
                 spy_start = close_series.index[0].strftime('%Y-%m-%d')
                 spy_end = close_series.index[-1].strftime('%Y-%m-%d')
-                spy_data = yf.download("SPY", start=spy_start, end=spy_end)
+                spy_data = get_provider().download("SPY", start=spy_start, end=spy_end)
                 if isinstance(spy_data.columns, pd.MultiIndex):
                     spy_data.columns = spy_data.columns.get_level_values(0)
                 if not spy_data.empty and len(spy_data) >= 2:
@@ -667,41 +639,23 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
         except Exception as e:
             logging.warning(f"[BACKTEST] Holdings comparison error: {e}")
 
-    def _show_monte_carlo(profits, close_series):
-        """몬테카를로 시뮬레이션 — 거래 수익률을 부트스트랩하여 전략 신뢰구간 추정."""
-        if not profits or len(profits) < 3:
+    def _show_monte_carlo(profits, mc):
+        """몬테카를로 시뮬레이션 결과 — 거래 수익률 부트스트랩(monte_carlo.bootstrap)으로 추정한 신뢰구간."""
+        if mc is None:
             return
 
-        n_simulations = 1000
-        n_trades = len(profits)
-        profits_arr = np.array(profits)
-
-        # 부트스트랩: 거래 수익률을 복원추출하여 N번 시뮬레이션
-        sim_returns = np.zeros(n_simulations)
-        sim_mdds = np.zeros(n_simulations)
-        for i in range(n_simulations):
-            sampled = np.random.choice(profits_arr, size=n_trades, replace=True)
-            # 누적 수익률
-            equity = np.cumprod(1 + sampled)
-            sim_returns[i] = equity[-1] - 1
-            # MDD
-            peak = np.maximum.accumulate(equity)
-            dd = (equity - peak) / peak
-            sim_mdds[i] = dd.min()
-
-        # 통계 계산
-        mean_return = np.mean(sim_returns)
-        median_return = np.median(sim_returns)
-        ci_5 = np.percentile(sim_returns, 5)
-        ci_25 = np.percentile(sim_returns, 25)
-        ci_75 = np.percentile(sim_returns, 75)
-        ci_95 = np.percentile(sim_returns, 95)
-        prob_loss = np.mean(sim_returns < 0) * 100
-        avg_mdd = np.mean(sim_mdds)
+        stats = monte_carlo.summarize(mc)
+        sim_returns, sim_mdds = mc.total_returns, mc.mdds
+        mean_return = stats["mean_return"]
+        median_return = stats["median_return"]
+        ci_5, ci_25, ci_75, ci_95 = stats["ci_5"], stats["ci_25"], stats["ci_75"], stats["ci_95"]
+        prob_loss = stats["prob_loss"]
+        avg_mdd = stats["avg_mdd"]
 
         # 결과 프레임
-        mc_frame = tk.LabelFrame(result_container, text="몬테카를로 시뮬레이션 (1,000회)",
-                                  font=("Arial", 10, "bold"))
+        title = f"몬테카를로 시뮬레이션 ({stats['n_sims']:,}회"
+        title += f", 블록 {mc.block_size}거래)" if mc.block_size > 1 else ")"
+        mc_frame = tk.LabelFrame(result_container, text=title, font=("Arial", 10, "bold"))
         mc_frame.pack(fill=tk.X, padx=10, pady=5)
 
         mc_rows = [
@@ -711,6 +665,7 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
             ("50% 신뢰구간", f"{ci_25:.2%} ~ {ci_75:.2%}"),
             ("손실 확률", f"{prob_loss:.1f}%"),
             ("평균 MDD", f"{avg_mdd:.2%}"),
+            ("MDD 하위 5%", f"{stats['mdd_5']:.2%}"),
         ]
         for label_text, value_text in mc_rows:
             row_frame = tk.Frame(mc_frame)
@@ -844,8 +799,8 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
         ax1.plot(data["Close"], label="주가", color="black")
         ma_s = config.config["current"]["ma_cross"]["short"]
         ma_l = config.config["current"]["ma_cross"]["long"]
-        ax1.plot(data["Close"].rolling(window=ma_s).mean(), label=f'MA({ma_s})', linestyle="--", color="blue")
-        ax1.plot(data["Close"].rolling(window=ma_l).mean(), label=f'MA({ma_l})', linestyle="--", color="orange")
+        ax1.plot(indicators.sma(data["Close"], ma_s), label=f'MA({ma_s})', linestyle="--", color="blue")
+        ax1.plot(indicators.sma(data["Close"], ma_l), label=f'MA({ma_l})', linestyle="--", color="orange")
 
         first_buy = True
         for date in buy_dates:
@@ -971,366 +926,84 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
         return fig, f"{ticker_name} 모멘텀 백테스트", CHART_HELP.get("momentum_signal", "")
 
     # Phase 8-1: Strategy functions split from run_backtest
+    # 전략 계산은 strategies 패키지 (헤드리스), 여기서는 현재 설정으로 실행하고 차트/알림만 담당
+
+    def _strategy_params():
+        return strategies.make_params(config.config["current"], config.config.get("backtest", {}))
+
+    def _log_total_return(tag, profits):
+        if profits:
+            logging.info(f"[{tag}] Total return: {strategies.total_return(profits):.2%}")
+        else:
+            logging.info(f"[{tag}] No trades")
+
+    def _notify_no_trades(show, title, message):
+        popup.after(0, lambda: show(title, message))
 
     def _run_macd(data, close_prices):
-        macd_short = close_prices.ewm(span=config.config["current"]["macd"]["short"], adjust=False).mean()
-        macd_long = close_prices.ewm(span=config.config["current"]["macd"]["long"], adjust=False).mean()
-        macd_line = macd_short - macd_long
-        signal_line = macd_line.ewm(span=config.config["current"]["macd"]["signal"], adjust=False).mean()
-
-        buy_signals = []
-        sell_signals = []
-
-        for i in range(1, len(macd_line)):
-            macd_prev = macd_line.iloc[i - 1].item()
-            macd_now = macd_line.iloc[i].item()
-            signal_prev = signal_line.iloc[i - 1].item()
-            signal_now = signal_line.iloc[i].item()
-
-            if macd_prev < signal_prev and macd_now > signal_now:
-                buy_signals.append(i)
-            elif macd_prev > signal_prev and macd_now < signal_now:
-                sell_signals.append(i)
-
-        chart_info = plot_macd_backtest(stock_display, close_prices, macd_line, signal_line, buy_signals, sell_signals)
+        res = strategies.macd(data, _strategy_params())
+        buy_signals, sell_signals = res.signals
+        chart_info = plot_macd_backtest(stock_display, close_prices, res.frame['MACD'], res.frame['Signal'],
+                                        buy_signals, sell_signals)
         return [], [], [], chart_info
 
     def _run_rsi(data, close_prices):
-        period = config.config["current"]["rsi"]['period']
-        rsi = calculate_rsi_for_backtest(close_prices, period)
-
-        buy_signals = []
-        sell_signals = []
-        lower = config.config["current"]["rsi"]['lower']
-        upper = config.config["current"]["rsi"]['upper']
-        for i in range(1, len(rsi)):
-            if rsi.iloc[i].item() < lower:
-                buy_signals.append(i)
-            elif rsi.iloc[i].item() > upper:
-                sell_signals.append(i)
-
-        chart_info = plot_rsi_backtest(stock_display, close_prices, rsi, buy_signals, sell_signals)
+        res = strategies.rsi(data, _strategy_params())
+        buy_signals, sell_signals = res.signals
+        chart_info = plot_rsi_backtest(stock_display, close_prices, res.frame['RSI'], buy_signals, sell_signals)
         return [], [], [], chart_info
 
     def _run_macd_rsi(data, close_prices):
-        macd_conf = config.config["current"]["macd"]
-        rsi_period = config.config["current"]["rsi"]['period']
-
-        short_ema = data["Close"].ewm(span=macd_conf["short"], adjust=False).mean()
-        long_ema = data["Close"].ewm(span=macd_conf["long"], adjust=False).mean()
-        macd = short_ema - long_ema
-        signal = macd.ewm(span=macd_conf["signal"], adjust=False).mean()
-
-        delta = data["Close"].diff()
-        gain = delta.clip(lower=0).rolling(window=rsi_period).mean()
-        loss = -delta.clip(upper=0).rolling(window=rsi_period).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-
-        data["MACD"] = macd
-        data["Signal"] = signal
-        data["RSI"] = rsi
-
-        in_position = False
-        entry_price = 0
-        buy_dates, sell_dates, profits = [], [], []
-
-        lower = config.config["current"]["rsi"]['lower']
-        upper = config.config["current"]["rsi"]['upper']
-        for i in range(1, len(data)):
-            prev_macd, prev_signal = macd.iloc[i - 1], signal.iloc[i - 1]
-            curr_macd, curr_signal = macd.iloc[i], signal.iloc[i]
-            rsi_val = rsi.iloc[i]
-
-            if not in_position and prev_macd < prev_signal and curr_macd > curr_signal and rsi_val < lower:
-                entry_price = data["Close"].iloc[i]
-                buy_dates.append(data.index[i])
-                in_position = True
-            elif in_position and (curr_macd < curr_signal or rsi_val > upper):
-                exit_price = data["Close"].iloc[i]
-                profits.append(_safe_division(exit_price, entry_price))
-                sell_dates.append(data.index[i])
-                in_position = False
-
-        if in_position:
-            exit_price = data["Close"].iloc[-1]
-            profits.append(_safe_division(exit_price, entry_price))
-
+        res = strategies.macd_rsi(data, _strategy_params())
+        _log_total_return("MACD+RSI", res.profits)
         chart_info = None
-        if profits:
-            total_return = (1 + pd.Series(profits)).prod() - 1
-            logging.info(f"[MACD+RSI] Total return: {total_return:.2%}")
-            chart_info = plot_macd_rsi_backtest(data, buy_dates, sell_dates, stock_display)
+        if res.profits:
+            chart_info = plot_macd_rsi_backtest(res.frame, res.buy_dates, res.sell_dates, stock_display)
         else:
-            if not _suppress_chart[0]:
-                popup.after(0, lambda: messagebox.showinfo("알림", f"[{ticker_symbol}] MACD+RSI 전략으로 거래 없음"))
-
-        return buy_dates, sell_dates, profits, chart_info
+            _notify_no_trades(messagebox.showinfo, "알림", f"[{ticker_symbol}] MACD+RSI 전략으로 거래 없음")
+        return res.buy_dates, res.sell_dates, res.profits, chart_info
 
     def _run_bollinger(data, close_prices):
-        window = config.config["current"]["bollinger"]["period"]
-        num_std = config.config["current"]["bollinger"]["std_dev_multiplier"]
-
-        ma = close_prices.rolling(window=window).mean()
-        std = close_prices.rolling(window=window).std()
-        upper_band = ma + (std * num_std)
-        lower_band = ma - (std * num_std)
-
-        data['MA'] = ma
-        data['STD'] = std
-        data['UpperBand'] = upper_band
-        data['LowerBand'] = lower_band
-
-        expected_cols = ['LowerBand', 'UpperBand']
-        if all(col in data.columns for col in expected_cols):
-            data = data.dropna(subset=expected_cols)
-        else:
-            logging.error(f"[BACKTEST] Missing columns: {expected_cols}, found: {data.columns.tolist()}")
-            return [], [], [], None
-
-        use_rebound = config.config["current"]["bollinger"]["use_rebound"]
-        buy_dates = []
-        sell_dates = []
-        in_position = False
-        entry_price = 0
-        profits = []
-
-        if use_rebound:
-            for i in range(len(data) - 2):
-                if not in_position:
-                    if data['Close'].iloc[i] < data['LowerBand'].iloc[i]:
-                        if data['Close'].iloc[i + 1] > data['Close'].iloc[i]:
-                            in_position = True
-                            entry_price = data['Close'].iloc[i + 1]
-                            buy_dates.append(data.index[i + 1])
-                else:
-                    if data['Close'].iloc[i] > data['UpperBand'].iloc[i]:
-                        if data['Close'].iloc[i + 1] < data['Close'].iloc[i]:
-                            exit_price = data['Close'].iloc[i + 1]
-                            profits.append(_safe_division(exit_price, entry_price))
-                            sell_dates.append(data.index[i + 1])
-                            in_position = False
-            if in_position:
-                exit_price = data['Close'].iloc[-1]
-                profits.append(_safe_division(exit_price, entry_price))
-        else:
-            buy_signal = data['Close'] < data['LowerBand']
-            sell_signal = data['Close'] > data['UpperBand']
-
-            for i in range(len(data)):
-                if not in_position and buy_signal.iloc[i]:
-                    in_position = True
-                    entry_price = data['Close'].iloc[i]
-                    buy_dates.append(data.index[i])
-                elif in_position and sell_signal.iloc[i]:
-                    exit_price = data['Close'].iloc[i]
-                    profits.append(_safe_division(exit_price, entry_price))
-                    sell_dates.append(data.index[i])
-                    in_position = False
-            if in_position:
-                exit_price = data['Close'].iloc[-1]
-                profits.append(_safe_division(exit_price, entry_price))
-
+        res = strategies.bollinger(data, _strategy_params())
+        _log_total_return("Bollinger", res.profits)
         chart_info = None
-        if profits:
-            total_return = (1 + pd.Series(profits)).prod() - 1
-            logging.info(f"[Bollinger] Total return: {total_return:.2%}")
-            chart_info = plot_bollinger(data, buy_dates, sell_dates, stock_display)
+        if res.profits:
+            chart_info = plot_bollinger(res.frame, res.buy_dates, res.sell_dates, stock_display)
         else:
-            logging.info("[Bollinger] No trades")
-            if not _suppress_chart[0]:
-                popup.after(0, lambda: messagebox.showerror("데이터 없음", "[볼린저 밴드]를 확인할 수 없습니다. 기간을 더 늘려주세요."))
-
-        return buy_dates, sell_dates, profits, chart_info
+            _notify_no_trades(messagebox.showerror, "데이터 없음",
+                              "[볼린저 밴드]를 확인할 수 없습니다. 기간을 더 늘려주세요.")
+        return res.buy_dates, res.sell_dates, res.profits, chart_info
 
     def _run_ma_cross(data, close_prices):
-        short_window = config.config["current"]["ma_cross"]["short"]
-        long_window = config.config["current"]["ma_cross"]["long"]
-
-        short_ma = data['Close'].rolling(window=short_window).mean()
-        long_ma = data['Close'].rolling(window=long_window).mean()
-
-        data['Short_MA'] = short_ma
-        data['Long_MA'] = long_ma
-
-        buy_signal = short_ma > long_ma
-        sell_signal = short_ma < long_ma
-
-        in_position = False
-        entry_price = 0
-        profits = []
-        buy_dates = []
-        sell_dates = []
-
-        for i in range(len(data)):
-            if not in_position and buy_signal.iloc[i]:
-                in_position = True
-                entry_price = data['Close'].iloc[i]
-                buy_dates.append(data.index[i])
-            elif in_position and sell_signal.iloc[i]:
-                exit_price = data['Close'].iloc[i]
-                profits.append(_safe_division(exit_price, entry_price))
-                sell_dates.append(data.index[i])
-                in_position = False
-
-        if in_position:
-            exit_price = data['Close'].iloc[-1]
-            profits.append(_safe_division(exit_price, entry_price))
-
+        res = strategies.ma_cross(data, _strategy_params())
+        _log_total_return("MA Cross", res.profits)
         chart_info = None
-        if profits:
-            total_return = (1 + pd.Series(profits)).prod() - 1
-            logging.info(f"[MA Cross] Total return: {total_return:.2%}")
-            chart_info = plot_ma_cross(data, buy_dates, sell_dates, stock_display)
+        if res.profits:
+            chart_info = plot_ma_cross(res.frame, res.buy_dates, res.sell_dates, stock_display)
         else:
-            if not _suppress_chart[0]:
-                popup.after(0, lambda: messagebox.showerror("데이터 없음", "[이동평균 교차]를 확인할 수 없습니다. 기간을 더 늘려주세요."))
-
-        return buy_dates, sell_dates, profits, chart_info
+            _notify_no_trades(messagebox.showerror, "데이터 없음",
+                              "[이동평균 교차]를 확인할 수 없습니다. 기간을 더 늘려주세요.")
+        return res.buy_dates, res.sell_dates, res.profits, chart_info
 
     def _run_momentum_signal(data, close_prices):
-        macd_short_span = config.config['current']['macd']['short']
-        macd_long_span = config.config['current']['macd']['long']
-        macd_signal_span = config.config['current']['macd']['signal']
-        rsi_period = config.config['current']['rsi']['period']
-        bb_period = config.config['current']['bollinger']['period']
-        bb_num_std = config.config['current']['bollinger']['std_dev_multiplier']
-        use_rebound = config.config['current']['bollinger']['use_rebound']
-        rsi_lower = config.config['current']['rsi']['lower']
-        rsi_upper = config.config['current']['rsi']['upper']
-
-        # Phase 7-3: Calculate indicators once
-        rsi = calculate_rsi_for_backtest(data['Close'], period=rsi_period)
-        rolling_mean = data['Close'].rolling(window=bb_period).mean()
-        rolling_std = data['Close'].rolling(window=bb_period).std()
-        upper_band = rolling_mean + (rolling_std * bb_num_std)
-        lower_band = rolling_mean - (rolling_std * bb_num_std)
-
-        ema_short = data['Close'].ewm(span=macd_short_span, adjust=False).mean()
-        ema_long = data['Close'].ewm(span=macd_long_span, adjust=False).mean()
-        macd = ema_short - ema_long
-        signal = macd.ewm(span=macd_signal_span, adjust=False).mean()
-
-        short_ma = data['Close'].rolling(window=config.config['current']['ma_cross']['short']).mean()
-        long_ma = data['Close'].rolling(window=config.config['current']['ma_cross']['long']).mean()
-
-        # Phase 7-3: Use numpy for signal generation
-        macd_signal_arr = np.where(macd > signal, "BUY", "SELL")
-        ma_signal_arr = np.where(short_ma > long_ma, "BUY", "SELL")
-
-        # Bollinger signal
-        close_arr = data['Close'].values
-        lower_arr = lower_band.values
-        upper_arr = upper_band.values
-        bb_signal_arr = np.full(len(data), "HOLD", dtype=object)
-
-        if use_rebound:
-            for i in range(len(data) - 1):
-                if close_arr[i] < lower_arr[i]:
-                    if close_arr[i + 1] > close_arr[i]:
-                        bb_signal_arr[i] = "BUY"
-                elif close_arr[i] > upper_arr[i]:
-                    if close_arr[i + 1] < close_arr[i]:
-                        bb_signal_arr[i] = "SELL"
-        else:
-            bb_signal_arr = np.where(close_arr < lower_arr, "BUY",
-                                     np.where(close_arr > upper_arr, "SELL", "HOLD"))
-
-        rsi_signal_arr = np.where(rsi < rsi_lower, "BUY",
-                                   np.where(rsi > rsi_upper, "SELL", "HOLD"))
-
-        # Combined signal using numpy scoring
-        from market_trend_manager import MACD_WEIGHT, MA_WEIGHT, BB_WEIGHT, RSI_WEIGHT
-        from market_trend_manager import STRONG_BUY_THRESHOLD, BUY_THRESHOLD, SELL_THRESHOLD, STRONG_SELL_THRESHOLD
-
-        scores = np.zeros(len(data))
-        scores += np.where(macd_signal_arr == "BUY", MACD_WEIGHT, np.where(macd_signal_arr == "SELL", -MACD_WEIGHT, 0))
-        scores += np.where(ma_signal_arr == "BUY", MA_WEIGHT, np.where(ma_signal_arr == "SELL", -MA_WEIGHT, 0))
-        scores += np.where(bb_signal_arr == "BUY", BB_WEIGHT, np.where(bb_signal_arr == "SELL", -BB_WEIGHT, 0))
-        scores += np.where(rsi_signal_arr == "BUY", RSI_WEIGHT, np.where(rsi_signal_arr == "SELL", -RSI_WEIGHT, 0))
-
-        combined = np.where(scores >= STRONG_BUY_THRESHOLD, "STRONG BUY",
-                   np.where(scores >= BUY_THRESHOLD, "BUY",
-                   np.where(scores <= STRONG_SELL_THRESHOLD, "STRONG SELL",
-                   np.where(scores <= SELL_THRESHOLD, "SELL", "HOLD"))))
-
-        in_position = False
-        entry_price = 0
-        profits = []
-        buy_dates = []
-        sell_dates = []
-
-        for i in range(len(data)):
-            sig = combined[i]
-            if not in_position and sig in ("BUY", "STRONG BUY"):
-                in_position = True
-                entry_price = data['Close'].iloc[i]
-                buy_dates.append(data.index[i])
-            elif in_position and sig in ("SELL", "STRONG SELL"):
-                exit_price = data['Close'].iloc[i]
-                profits.append(_safe_division(exit_price, entry_price))
-                sell_dates.append(data.index[i])
-                in_position = False
-
-        if in_position:
-            exit_price = data['Close'].iloc[-1]
-            profits.append(_safe_division(exit_price, entry_price))
-
-        if profits:
-            total_return = (1 + pd.Series(profits)).prod() - 1
-            logging.info(f"[Momentum] Total return: {total_return:.2%}")
-        else:
-            logging.info("[Momentum] No trades")
-
-        chart_info = plot_momentum_with_indicators(data, short_ma, long_ma, upper_band, lower_band, buy_dates, sell_dates,
-                                                    rsi, macd, signal, stock_display)
-        return buy_dates, sell_dates, profits, chart_info
+        res = strategies.momentum_signal(data, _strategy_params())
+        _log_total_return("Momentum", res.profits)
+        f = res.frame
+        chart_info = plot_momentum_with_indicators(f, f['Short_MA'], f['Long_MA'], f['UpperBand'], f['LowerBand'],
+                                                    res.buy_dates, res.sell_dates, f['RSI'], f['MACD'],
+                                                    f['Signal'], stock_display)
+        return res.buy_dates, res.sell_dates, res.profits, chart_info
 
     def _run_momentum_return_ma(data, close_prices):
-        short_window = config.config['current']['ma_cross']['short']
-        long_window = config.config['current']['ma_cross']['long']
-        return_window = config.config['current']['momentum_return']['return_window']
-        return_threshold = config.config['current']['momentum_return']['threshold']
-
-        data['Short_MA'] = data['Close'].rolling(window=short_window).mean()
-        data['Long_MA'] = data['Close'].rolling(window=long_window).mean()
-        data['Return'] = data['Close'] / data['Close'].shift(return_window) - 1
-
-        buy_dates = []
-        sell_dates = []
-        in_position = False
-        entry_price = 0
-        profits = []
-
-        for i in range(return_window, len(data)):
-            ret = data['Return'].iloc[i]
-            s_ma = data['Short_MA'].iloc[i]
-            l_ma = data['Long_MA'].iloc[i]
-
-            if not in_position and ret >= return_threshold and s_ma > l_ma:
-                in_position = True
-                entry_price = data['Close'].iloc[i]
-                buy_dates.append(data.index[i])
-            elif in_position and (s_ma < l_ma or ret < 0):
-                exit_price = data['Close'].iloc[i]
-                profits.append(_safe_division(exit_price, entry_price))
-                sell_dates.append(data.index[i])
-                in_position = False
-
-        if in_position:
-            exit_price = data['Close'].iloc[-1]
-            profits.append(_safe_division(exit_price, entry_price))
-
+        res = strategies.momentum_return_ma(data, _strategy_params())
+        _log_total_return("Momentum Return + MA", res.profits)
         chart_info = None
-        if profits:
-            total_return = (1 + pd.Series(profits)).prod() - 1
-            logging.info(f"[Momentum Return + MA] Total return: {total_return:.2%}")
-            chart_info = plot_ma_cross(data, buy_dates, sell_dates, stock_display, chart_key="momentum_return_ma")
+        if res.profits:
+            chart_info = plot_ma_cross(res.frame, res.buy_dates, res.sell_dates, stock_display,
+                                       chart_key="momentum_return_ma")
         else:
-            if not _suppress_chart[0]:
-                popup.after(0, lambda: messagebox.showerror("데이터 없음", "[모멘텀 수익률 + MA 교차] 거래 없음"))
-
-        return buy_dates, sell_dates, profits, chart_info
+            _notify_no_trades(messagebox.showerror, "데이터 없음", "[모멘텀 수익률 + MA 교차] 거래 없음")
+        return res.buy_dates, res.sell_dates, res.profits, chart_info
 
     def plot_ichimoku(data, buy_dates, sell_dates, ticker_name):
         """Ichimoku Cloud 차트 렌더링."""
@@ -1363,67 +1036,19 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
 
     def _run_ichimoku(data, close_prices):
         """일목균형표 전략: 전환선/기준선 교차 + 구름 돌파."""
-        from stock_score import calculate_ichimoku as _calc_ichimoku
-        ichimoku = _calc_ichimoku(data, tenkan=9, kijun=26, senkou_b=52)
-        if ichimoku is None:
-            if not _suppress_chart[0]:
-                popup.after(0, lambda: messagebox.showerror("데이터 없음", "일목균형표 계산에 충분한 데이터가 없습니다.\n기간을 늘려주세요."))
+        try:
+            res = strategies.ichimoku(data, _strategy_params())
+        except strategies.InsufficientDataError:
+            _notify_no_trades(messagebox.showerror, "데이터 없음",
+                              "일목균형표 계산에 충분한 데이터가 없습니다.\n기간을 늘려주세요.")
             return [], [], [], None
-
-        data['Tenkan'] = ichimoku['tenkan_sen']
-        data['Kijun'] = ichimoku['kijun_sen']
-        data['Senkou_A'] = ichimoku['senkou_a']
-        data['Senkou_B'] = ichimoku['senkou_b']
-
-        buy_dates = []
-        sell_dates = []
-        in_position = False
-        entry_price = 0
-        profits = []
-
-        for i in range(1, len(data)):
-            tenkan_now = data['Tenkan'].iloc[i]
-            kijun_now = data['Kijun'].iloc[i]
-            tenkan_prev = data['Tenkan'].iloc[i - 1]
-            kijun_prev = data['Kijun'].iloc[i - 1]
-            close_now = data['Close'].iloc[i]
-
-            if pd.isna(tenkan_now) or pd.isna(kijun_now):
-                continue
-
-            # Cloud boundaries at current position
-            sa = data['Senkou_A'].iloc[i] if not pd.isna(data['Senkou_A'].iloc[i]) else 0
-            sb = data['Senkou_B'].iloc[i] if not pd.isna(data['Senkou_B'].iloc[i]) else 0
-            cloud_top = max(sa, sb)
-
-            if not in_position:
-                # Buy: Tenkan crosses above Kijun AND price above cloud
-                if tenkan_prev <= kijun_prev and tenkan_now > kijun_now and close_now > cloud_top:
-                    in_position = True
-                    entry_price = close_now
-                    buy_dates.append(data.index[i])
-            else:
-                # Sell: Tenkan crosses below Kijun
-                if tenkan_prev >= kijun_prev and tenkan_now < kijun_now:
-                    exit_price = close_now
-                    profits.append(_safe_division(exit_price, entry_price))
-                    sell_dates.append(data.index[i])
-                    in_position = False
-
-        if in_position:
-            exit_price = data['Close'].iloc[-1]
-            profits.append(_safe_division(exit_price, entry_price))
-
+        _log_total_return("Ichimoku", res.profits)
         chart_info = None
-        if profits:
-            total_return = (1 + pd.Series(profits)).prod() - 1
-            logging.info(f"[Ichimoku] Total return: {total_return:.2%}")
-            chart_info = plot_ichimoku(data, buy_dates, sell_dates, stock_display)
+        if res.profits:
+            chart_info = plot_ichimoku(res.frame, res.buy_dates, res.sell_dates, stock_display)
         else:
-            if not _suppress_chart[0]:
-                popup.after(0, lambda: messagebox.showerror("데이터 없음", "[일목균형표] 거래 없음. 기간을 늘려주세요."))
-
-        return buy_dates, sell_dates, profits, chart_info
+            _notify_no_trades(messagebox.showerror, "데이터 없음", "[일목균형표] 거래 없음. 기간을 늘려주세요.")
+        return res.buy_dates, res.sell_dates, res.profits, chart_info
 
     # Phase 8-1: Strategy dispatch dictionary
     strategy_dispatch = {
@@ -1620,13 +1245,13 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
     def _compute_regime_mask(start_str, end_str):
         """SPY 기반 시장 레짐 마스크를 계산. True=상승장/횡보, False=하락장."""
         try:
-            spy = yf.download("SPY", start=start_str, end=end_str)
+            spy = get_provider().download("SPY", start=start_str, end=end_str)
             if isinstance(spy.columns, pd.MultiIndex):
                 spy.columns = spy.columns.get_level_values(0)
             if spy.empty:
                 return None
-            ma20 = spy['Close'].rolling(20).mean()
-            ma60 = spy['Close'].rolling(60).mean()
+            ma20 = indicators.sma(spy['Close'], 20)
+            ma60 = indicators.sma(spy['Close'], 60)
             # True = 상승/횡보(매수 허용), False = 하락(매수 억제)
             regime = ma20 >= ma60 * 0.99
             return regime
@@ -1839,13 +1464,25 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
                 adjusted_profits = [p * s for p, s in zip(profits, sizes)]
                 profits = adjusted_profits
 
+            # 몬테카를로는 작업 스레드에서 미리 계산 (시뮬레이션 수가 크면 수 초)
+            mc = None
+            if profits and len(profits) >= 3:
+                bt_conf = config.config.get("backtest", {})
+                try:
+                    mc = monte_carlo.bootstrap(profits, n_sims=int(bt_conf.get("mc_simulations", 10000)),
+                                               seed=bt_conf.get("mc_seed"),
+                                               block_size=int(bt_conf.get("mc_block_size", 1)),
+                                               workers=int(bt_conf.get("sweep_workers", 0) or 0))
+                except ValueError as e:
+                    logging.warning(f"[MONTECARLO] Skipped: {e}")
+
             # UI 업데이트를 메인 스레드로 위임
             def _update_ui(profits=profits, buy_dates=buy_dates, sell_dates=sell_dates,
                            close_prices=close_prices, stoploss=stoploss, trailing=trailing,
-                           use_regime=use_regime, pos_sizing=pos_sizing, chart_info=chart_info):
+                           use_regime=use_regime, pos_sizing=pos_sizing, chart_info=chart_info, mc=mc):
                 _clear_result_area()
                 # 차트를 result_container에 임베딩
-                if chart_info and not _suppress_chart[0]:
+                if chart_info:
                     fig, title, help_text = chart_info
                     _create_graph_popup(fig, title, help_text)
                 if profits:
@@ -1870,7 +1507,7 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
                     # 보유 종목이면 보유 vs 전략 비교 표시
                     _show_holdings_comparison(profits, buy_dates, sell_dates, close_prices)
                     # 몬테카를로 시뮬레이션
-                    _show_monte_carlo(profits, close_prices)
+                    _show_monte_carlo(profits, mc)
                 # 스크롤 영역 갱신 및 결과 위치로 자동 스크롤
                 _scroll_inner.update_idletasks()
                 _scroll_canvas.configure(scrollregion=_scroll_canvas.bbox("all"))
@@ -1948,7 +1585,7 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
 
     def _load_indicators():
         try:
-            info = yf.Ticker(ticker_symbol).info
+            info = get_provider().ticker(ticker_symbol).info
         except Exception:
             info = None
 
@@ -2522,18 +2159,13 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
 
                 close_prices = data['Close']
                 results = {}
-                # 비교 실행 중 개별 전략 차트 팝업 억제
-                _suppress_chart[0] = True
-                # 거래가 있는 전략만 비교 (macd, rsi는 시각화 전용이라 제외)
-                compare_strategies = ["macd_rsi", "bollinger", "ma_cross", "momentum_signal", "momentum_return_ma", "ichimoku"]
+                # 거래가 있는 전략만 비교 (macd, rsi는 시각화 전용이라 제외), 차트 없이 계산만
+                compare_strategies = strategies.TRADING_STRATEGIES
+                params = _strategy_params()
                 for strat_key in compare_strategies:
-                    handler = strategy_dispatch.get(strat_key)
-                    if not handler:
-                        continue
                     try:
-                        data_copy = data.copy()
-                        _result = handler(data_copy, close_prices.copy())
-                        bd, sd, profs = _result[0], _result[1], _result[2]
+                        _result = strategies.run(strat_key, data, params)
+                        bd, sd, profs = _result.buy_dates, _result.sell_dates, _result.profits
                         if profs:
                             p_series = pd.Series(profs)
                             total_ret = (1 + p_series).prod() - 1
@@ -2563,8 +2195,6 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
                     except Exception as e:
                         logging.warning(f"[COMPARE] {strat_key} failed: {e}")
 
-                _suppress_chart[0] = False
-
                 def _show_compare():
                     search_btn.config(state=tk.NORMAL)
                     if not results:
@@ -2670,7 +2300,6 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
 
                 popup.after(0, _show_compare)
             except Exception as e:
-                _suppress_chart[0] = False
                 logging.error(f"[COMPARE] Error: {e}")
                 popup.after(0, lambda: search_btn.config(state=tk.NORMAL))
 
@@ -2679,14 +2308,89 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
     analysis_menu.add_command(label="모든 전략 비교", command=_compare_all_strategies)
 
     def _run_sensitivity_analysis():
-        """현재 전략의 핵심 파라미터를 그리드 탐색하여 수익률 히트맵 표시."""
+        """현재 전략의 파라미터 공간(param_sweep.DEFAULT_GRIDS)을 스윕하여 수익률 히트맵 표시.
+
+        조합은 작업 프로세스에서 실행되고, 끝난 묶음이 도착할 때마다 히트맵을 다시 그림.
+        """
         method = _get_method_key()
         parsed = _parse_period()
         if parsed is None:
             return
         start_str, end_str = parsed
 
+        axes = param_sweep.DEFAULT_GRIDS.get(method)
+        if not axes:
+            messagebox.showinfo("알림", f"{STRATEGY_DISPLAY_NAMES.get(method, method)} 전략은 민감도 분석을 지원하지 않습니다.")
+            return
+
+        bt_conf = config.config.get("backtest", {})
+        workers = int(bt_conf.get("sweep_workers", 0) or 0)
+        samples = int(bt_conf.get("sweep_samples", 0) or 0)
+        names = list(axes)
+        combos = param_sweep.random_samples(axes, samples, seed=0) if samples else param_sweep.grid(axes)
+        base_params = _strategy_params()
+        name = STRATEGY_DISPLAY_NAMES.get(method, method)
+        row_key, col_key = names[0].split(".", 1)[1], names[1].split(".", 1)[1]
+        extra = ", ".join(n.split(".", 1)[1] for n in names[2:])
+
         search_btn.config(state=tk.DISABLED)
+        cancel = threading.Event()
+        popup.bind("<Destroy>", lambda e: cancel.set() if e.widget == popup else None, add="+")
+        heat = {}
+
+        def _draw_heatmap(values, done):
+            """지금까지 끝난 조합으로 히트맵 갱신 (첫 호출에서 결과 영역 생성)."""
+            if cancel.is_set():
+                return
+            if not heat:
+                _clear_result_area()
+                fig = Figure(figsize=(8, 6))
+                open_figures.append(fig)
+                heat_frame = tk.LabelFrame(result_container, text="파라미터 민감도 히트맵",
+                                           font=("Arial", 10, "bold"))
+                heat_frame.pack(fill=tk.X, padx=10, pady=5)
+                canvas = FigureCanvasTkAgg(fig, master=heat_frame)
+                canvas.get_tk_widget().configure(height=int(fig.get_size_inches()[1] * fig.get_dpi()))
+                canvas.get_tk_widget().pack(fill=tk.X)
+                tk.Button(heat_frame, text="PNG 저장", command=lambda f=fig: _save_fig_png(f)).pack(pady=3)
+                heat.update(fig=fig, canvas=canvas)
+
+                _scroll_inner.update_idletasks()
+                _scroll_canvas.configure(scrollregion=_scroll_canvas.bbox("all"))
+                _scroll_canvas.yview_moveto(
+                    result_container.winfo_y() / max(_scroll_inner.winfo_reqheight(), 1))
+
+            rows, cols, matrix = param_sweep.heatmap(names, combos, values)
+            fig = heat["fig"]
+            fig.clear()
+            ax = fig.add_subplot(111)
+            im = ax.imshow(matrix, cmap='RdYlGn', aspect='auto')
+            ax.set_xticks(range(len(cols)))
+            ax.set_yticks(range(len(rows)))
+            ax.set_xticklabels([str(v) for v in cols], fontsize=8, rotation=45 if len(cols) > 10 else 0)
+            ax.set_yticklabels([str(v) for v in rows], fontsize=8)
+            ax.set_xlabel(col_key)
+            ax.set_ylabel(row_key)
+
+            # 칸이 많으면 숫자는 생략 (색과 컬러바로 판독)
+            if matrix.size <= 100:
+                for i in range(len(rows)):
+                    for j in range(len(cols)):
+                        val = matrix[i, j]
+                        if not np.isnan(val):
+                            color = "white" if abs(val) > 15 else "black"
+                            ax.text(j, i, f"{val:.1f}%", ha="center", va="center",
+                                    fontsize=8, color=color, fontweight="bold")
+
+            fig.colorbar(im, ax=ax, label="수익률 (%)")
+            title = f"{stock_display} {name} 파라미터 민감도"
+            if extra:
+                title += f"\n(칸마다 {extra} 중 최고값)"
+            if done < len(combos):
+                title += f"  [{done}/{len(combos)}]"
+            ax.set_title(title, fontsize=12, fontweight="bold")
+            fig.tight_layout()
+            heat["canvas"].draw_idle()
 
         def _run():
             try:
@@ -2697,141 +2401,184 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
                     data = data.droplevel(0, axis=0)
                 if data.empty:
                     popup.after(0, lambda: messagebox.showerror("오류", "데이터가 없습니다."))
+                    popup.after(0, lambda: search_btn.config(state=tk.NORMAL))
                     return
 
-                # 전략별 파라미터 그리드 정의
-                param_grids = {
-                    "rsi": {"lower": [20, 25, 30, 35], "upper": [65, 70, 75, 80]},
-                    "macd_rsi": {"lower": [20, 25, 30, 35], "upper": [65, 70, 75, 80]},
-                    "ma_cross": {"short": [5, 10, 15, 20], "long": [20, 50, 100, 200]},
-                    "bollinger": {"period": [10, 15, 20, 30], "std_dev_multiplier": [1.5, 2.0, 2.5, 3.0]},
-                    "momentum_signal": {"lower": [20, 25, 30, 35], "upper": [65, 70, 75, 80]},
-                    "momentum_return_ma": {"short": [5, 10, 15, 20], "long": [20, 50, 100, 200]},
-                }
-                grid = param_grids.get(method)
-                if not grid:
-                    popup.after(0, lambda: messagebox.showinfo("알림",
-                        f"{STRATEGY_DISPLAY_NAMES.get(method, method)} 전략은 민감도 분석을 지원하지 않습니다."))
+                values = np.full(len(combos), np.nan)
+                last_draw = [0.0]
+
+                def _on_chunk(chunk, done, total):
+                    values[chunk.start:chunk.start + len(chunk.returns)] = chunk.returns
+                    # 부분 결과는 최대 0.3초마다 한 번만 UI로 보냄 (마지막은 _finish에서)
+                    if done < total and time.monotonic() - last_draw[0] >= 0.3 and not cancel.is_set():
+                        last_draw[0] = time.monotonic()
+                        popup.after(0, _draw_heatmap, values.copy(), done)
+
+                started = time.monotonic()
+                result = param_sweep.sweep(method, data, base_params, names, combos,
+                                           workers=workers, on_chunk=_on_chunk, cancel=cancel)
+                if cancel.is_set():
                     return
+                logging.info(f"[SENSITIVITY] {method}: {len(combos)} combos in "
+                             f"{time.monotonic() - started:.1f}s")
 
-                import copy as _copy
-                keys = list(grid.keys())
-                vals1 = grid[keys[0]]
-                vals2 = grid[keys[1]]
-                results_grid = np.zeros((len(vals1), len(vals2)))
-
-                # 민감도 분석 중 개별 전략 차트 팝업 억제
-                _suppress_chart[0] = True
-
-                for i, v1 in enumerate(vals1):
-                    for j, v2 in enumerate(vals2):
-                        # MA 교차: short >= long 이면 skip
-                        if keys[0] == "short" and keys[1] == "long" and v1 >= v2:
-                            results_grid[i, j] = np.nan
-                            continue
-                        # RSI: lower >= upper 이면 skip
-                        if keys[0] == "lower" and keys[1] == "upper" and v1 >= v2:
-                            results_grid[i, j] = np.nan
-                            continue
-
-                        saved = _copy.deepcopy(config.config["current"])
-                        try:
-                            # 파라미터 설정
-                            if method in ("rsi", "macd_rsi", "momentum_signal"):
-                                config.config["current"]["rsi"][keys[0]] = v1
-                                config.config["current"]["rsi"][keys[1]] = v2
-                            elif method in ("ma_cross", "momentum_return_ma"):
-                                config.config["current"]["ma_cross"][keys[0]] = v1
-                                config.config["current"]["ma_cross"][keys[1]] = v2
-                            elif method == "bollinger":
-                                config.config["current"]["bollinger"][keys[0]] = v1
-                                config.config["current"]["bollinger"][keys[1]] = v2
-
-                            handler = strategy_dispatch.get(method)
-                            if handler:
-                                data_copy = data.copy()
-                                _res = handler(data_copy, data['Close'].copy())
-                                _, _, profs = _res[0], _res[1], _res[2]
-                                if profs:
-                                    total_ret = (1 + pd.Series(profs)).prod() - 1
-                                    results_grid[i, j] = total_ret * 100
-                                else:
-                                    results_grid[i, j] = 0
-                            else:
-                                results_grid[i, j] = np.nan
-                        except Exception:
-                            results_grid[i, j] = np.nan
-                        finally:
-                            for k, v in saved.items():
-                                config.config["current"][k] = v
-
-                _suppress_chart[0] = False
-
-                def _show_heatmap():
+                def _finish():
                     search_btn.config(state=tk.NORMAL)
-                    fig = Figure(figsize=(8, 6)); ax = fig.add_subplot(111)
-                    im = ax.imshow(results_grid, cmap='RdYlGn', aspect='auto')
-                    ax.set_xticks(range(len(vals2)))
-                    ax.set_yticks(range(len(vals1)))
-                    ax.set_xticklabels([str(v) for v in vals2])
-                    ax.set_yticklabels([str(v) for v in vals1])
-                    ax.set_xlabel(keys[1])
-                    ax.set_ylabel(keys[0])
-
-                    for i in range(len(vals1)):
-                        for j in range(len(vals2)):
-                            val = results_grid[i, j]
-                            if not np.isnan(val):
-                                color = "white" if abs(val) > 15 else "black"
-                                ax.text(j, i, f"{val:.1f}%", ha="center", va="center",
-                                        fontsize=8, color=color, fontweight="bold")
-
-                    fig.colorbar(im, ax=ax, label="수익률 (%)")
-                    name = STRATEGY_DISPLAY_NAMES.get(method, method)
-                    ax.set_title(f"{stock_display} {name} 파라미터 민감도", fontsize=12, fontweight="bold")
-                    fig.tight_layout()
-                    # 히트맵을 result_container 안에 임베딩
-                    _clear_result_area()
-                    try:
-                        plt.close(fig)
-                    except Exception:
-                        pass
-                    open_figures.append(fig)
-                    heat_frame = tk.LabelFrame(result_container, text="파라미터 민감도 히트맵",
-                                               font=("Arial", 10, "bold"))
-                    heat_frame.pack(fill=tk.X, padx=10, pady=5)
-                    canvas = FigureCanvasTkAgg(fig, master=heat_frame)
-                    fig_w, fig_h = fig.get_size_inches()
-                    dpi = fig.get_dpi()
-                    canvas.get_tk_widget().configure(height=int(fig_h * dpi))
-                    canvas.get_tk_widget().pack(fill=tk.X)
-                    canvas.draw()
-                    tk.Button(heat_frame, text="PNG 저장",
-                              command=lambda f=fig: _save_fig_png(f)).pack(pady=3)
+                    _draw_heatmap(result.returns, len(combos))
 
-                    # 스크롤 영역 갱신
-                    _scroll_inner.update_idletasks()
-                    _scroll_canvas.configure(scrollregion=_scroll_canvas.bbox("all"))
-                    _scroll_canvas.yview_moveto(
-                        result_container.winfo_y() / max(_scroll_inner.winfo_reqheight(), 1))
-
-                popup.after(0, _show_heatmap)
+                popup.after(0, _finish)
             except Exception as e:
-                _suppress_chart[0] = False
                 logging.error(f"[SENSITIVITY] Error: {e}")
-                popup.after(0, lambda: search_btn.config(state=tk.NORMAL))
+                if not cancel.is_set():
+                    popup.after(0, lambda: search_btn.config(state=tk.NORMAL))
 
         threading.Thread(target=_run, daemon=True).start()
 
     analysis_menu.add_command(label="민감도 분석", command=_run_sensitivity_analysis)
 
-    # 기술 차트
-    def _open_tech_chart():
-        import stock_monitor_gui
-        stock_monitor_gui.show_technical_chart(stock_display)
+    def _run_universe_backtest():
+        """현재 전략/파라미터를 유니버스(또는 워치리스트) 전체 종목에 실행하여 순위 표 표시."""
+        method = _get_method_key()
+        if method not in universe_backtest.PANEL_SIGNALS:
+            messagebox.showinfo("알림", f"{STRATEGY_DISPLAY_NAMES.get(method, method)} 전략은 거래를 만들지 않아 "
+                                      "유니버스 백테스트를 지원하지 않습니다.")
+            return
+        parsed = _parse_period()
+        if parsed is None:
+            return
+        start_str, end_str = parsed
+        name = STRATEGY_DISPLAY_NAMES.get(method, method)
+
+        win = tk.Toplevel(popup)
+        win.title(f"유니버스 백테스트 - {name}")
+        win.geometry("900x650")
+        win.transient(popup)
+
+        top = tk.Frame(win)
+        top.pack(fill=tk.X, padx=10, pady=6)
+        tk.Label(top, text="유니버스:").pack(side=tk.LEFT)
+        universe_names = (["워치리스트"] if app_state is not None else []) + get_universe_names()
+        universe_var = tk.StringVar(value=config.config.get("backtest", {}).get("universe", "S&P 500"))
+        if universe_var.get() not in universe_names:
+            universe_var.set(universe_names[0])
+        ttk.Combobox(top, textvariable=universe_var, values=universe_names, state="readonly",
+                     width=16).pack(side=tk.LEFT, padx=5)
+        run_btn = tk.Button(top, text="실행")
+        run_btn.pack(side=tk.LEFT, padx=5)
+        csv_btn = tk.Button(top, text="CSV 저장", state=tk.DISABLED)
+        csv_btn.pack(side=tk.LEFT, padx=5)
+        status_label = tk.Label(top, text=f"{name} | {start_str} ~ {end_str}", fg="#444444")
+        status_label.pack(side=tk.LEFT, padx=10)
+
+        tree_frame = tk.Frame(win)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        columns = ("순위", "티커", "수익률%", "샤프", "MDD%", "승률%", "거래수", "보유 수익률%")
+        tree = ttk.Treeview(tree_frame, columns=columns, show="headings")
+        for col in columns:
+            tree.heading(col, text=col, command=lambda c=col: _sort_universe(c, col_reverse.get(c, False)))
+            tree.column(col, width=90 if col != "티커" else 100, anchor="center")
+        tree_scroll = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=tree_scroll.set)
+        tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(fill=tk.BOTH, expand=True)
+        col_reverse = {}
+        result = {}
+        closed = threading.Event()
+        win.bind("<Destroy>", lambda e: closed.set() if e.widget == win else None)
+
+        def _post(func, *args):
+            """작업 스레드 → UI (창이 닫혔으면 버림)."""
+            if not closed.is_set():
+                win.after(0, func, *args)
+
+        def _sort_universe(col, reverse):
+            data = [(tree.set(k, col), k) for k in tree.get_children("")]
+            try:
+                data.sort(key=lambda t: float(t[0]), reverse=reverse)
+            except ValueError:
+                data.sort(key=lambda t: t[0], reverse=reverse)
+            for i, (_, k) in enumerate(data):
+                tree.move(k, "", i)
+            col_reverse[col] = not reverse
+
+        def _open_ticker(event):
+            item = tree.focus()
+            if item:
+                open_backtest_popup(tree.set(item, "티커"), on_search_callback, app_state)
+
+        tree.bind("<Double-1>", _open_ticker)
+
+        def _save_csv():
+            table = result.get("table")
+            if table is None:
+                return
+            path = filedialog.asksaveasfilename(
+                defaultextension=".csv", filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                initialfile=f"universe_{method}.csv", parent=win)
+            if path:
+                table.to_csv(path, encoding="utf-8-sig")
+                messagebox.showinfo("저장 완료", f"결과가 저장되었습니다:\n{path}", parent=win)
+
+        csv_btn.config(command=_save_csv)
+
+        def _set_status(text):
+            if not closed.is_set():
+                status_label.config(text=text)
+
+        def _show_table(table, elapsed):
+            if closed.is_set():
+                return
+            run_btn.config(state=tk.NORMAL)
+            tree.delete(*tree.get_children())
+            for rank, (ticker, r) in enumerate(table.iterrows(), 1):
+                tree.insert("", tk.END, values=(
+                    rank, ticker, f"{r.total_return * 100:.1f}", f"{r.sharpe:.2f}", f"{r.mdd * 100:.1f}",
+                    f"{r.win_rate * 100:.0f}", int(r.trades), f"{r.buy_hold * 100:.1f}"))
+            csv_btn.config(state=tk.NORMAL if len(table) else tk.DISABLED)
+            positive = int((table["total_return"] > 0).sum())
+            _set_status(f"{name} | {len(table)}종목, 수익 {positive}종목, "
+                        f"중앙값 {table['total_return'].median() * 100:.1f}% ({elapsed:.1f}초)")
+
+        def _run(universe):
+            if universe == "워치리스트":
+                with app_state.watchlist_lock:
+                    tickers = list(app_state.watchlist)
+            else:
+                tickers = get_universe(universe)
+            params = _strategy_params()
+            risk_free = config.get_risk_free_rate()
+            started = time.monotonic()
+            try:
+                panel = universe_backtest.load_panel(
+                    tickers, start_str, end_str,
+                    on_progress=lambda done, total: _post(_set_status, f"시세 불러오는 중... {done}/{total}"))
+                _post(_set_status, f"{panel.close.shape[1]}종목 백테스트 중...")
+                table = universe_backtest.run(method, panel, params, risk_free=risk_free)
+                result["table"] = table
+                logging.info(f"[UNIVERSE] {method} on {universe}: {len(table)}/{len(tickers)} tickers "
+                             f"in {time.monotonic() - started:.1f}s")
+                _post(_show_table, table, time.monotonic() - started)
+            except Exception as e:
+                logging.error(f"[UNIVERSE] Error: {e}")
+                _post(lambda e=e: (run_btn.config(state=tk.NORMAL), _set_status(f"오류: {e}")))
+
+        def _start():
+            universe = universe_var.get()
+            config.config["backtest"]["universe"] = universe
+            config.save_config(config.get_config())
+            run_btn.config(state=tk.DISABLED)
+            csv_btn.config(state=tk.DISABLED)
+            threading.Thread(target=_run, args=(universe,), daemon=True).start()
+
+        run_btn.config(command=_start)
+
+    analysis_menu.add_command(label="유니버스 백테스트", command=_run_universe_backtest)
 
-    analysis_menu.add_separator()
-    analysis_menu.add_command(label="기술 차트", command=_open_tech_chart)
+    # 기술 차트 (메인 스크립트를 다시 import하지 않도록 main()에서 등록한 콜백 사용)
+    show_chart = getattr(app_state, 'show_technical_chart', None)
+    if show_chart:
+        analysis_menu.add_separator()
+        analysis_menu.add_command(label="기술 차트", command=lambda: show_chart(stock_display))
 
     # ── 종목 뉴스 버튼 ──
     def open_ticker_news_popup():
@@ -3041,8 +2788,8 @@ def open_backtest_popup(stock, on_search_callback=None, app_state=None):
 
             if hasattr(app_state, 'save_watchlist') and app_state.save_watchlist:
                 app_state.save_watchlist()
-            if hasattr(app_state, 'refresh_table_once') and app_state.refresh_table_once:
-                app_state.refresh_table_once()
+            if hasattr(app_state, 'refresh_table') and app_state.refresh_table:
+                app_state.refresh_table()
             _update_watchlist_btn()
 
         watchlist_btn.config(command=_toggle_watchlist)
@@ -0,0 +1,248 @@
+"""
+컬럼형 시세 저장소 (memory-mapped NumPy 세그먼트).
+
+data_cache의 선택형 백엔드입니다 (config.json: "cache": {"backend": "columnar"}).
+(ticker, interval)마다 디렉토리를 두고, 시각(int64 epoch ns)과 OHLCV(float64 n×5)를
+세그먼트별 .npy 파일로 저장하며 index.json이 현재 유효한 세그먼트 목록을 가리킵니다.
+
+- 로드: np.load(mmap_mode="c")로 매핑하여 세그먼트가 하나면 복사 없이 DataFrame 생성
+- 쓰기: 마지막 시각 이후 봉만 들어오면 새 세그먼트를 추가 (append-only 델타)
+        겹치는 봉이 있거나 세그먼트가 많아지면 병합하여 새 세그먼트 하나로 재작성
+- 기존 세그먼트 파일은 덮어쓰지 않음 (Windows에서 매핑된 파일 교체 불가 대응)
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# 세그먼트가 이 개수를 넘으면 다음 쓰기에서 하나로 병합
+MAX_SEGMENTS = 16
+
+_INDEX_FILE = "index.json"
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9._^=-]")
+
+
+def _epoch_ns(index) -> np.ndarray:
+    """DatetimeIndex를 UTC epoch 나노초 int64 배열로 변환 (tz-naive는 UTC로 간주)."""
+    index = pd.DatetimeIndex(index)
+    if index.tz is None:
+        index = index.tz_localize("UTC")
+    return index.as_unit("ns").asi8
+
+
+class ColumnarPriceStore:
+    """(ticker, interval)별 memory-mapped .npy 세그먼트 저장소.
+
+    동시성 제어는 호출자(data_cache의 키 락/쓰기 락)가 담당한다.
+    conn 인자는 SQLite 백엔드와 같은 인터페이스를 위해 받기만 한다.
+    """
+
+    name = "columnar"
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    # ---------- 경로 / 인덱스 ----------
+
+    def _key_dir(self, ticker: str, interval: str) -> str:
+        return os.path.join(self.root, _SAFE_NAME.sub("_", interval),
+                            _SAFE_NAME.sub("_", ticker))
+
+    @staticmethod
+    def _read_index(key_dir: str) -> dict:
+        try:
+            with open(os.path.join(key_dir, _INDEX_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"segments": [], "next_id": 0}
+
+    @staticmethod
+    def _write_index(key_dir: str, index: dict):
+        """index.json 원자적 교체."""
+        fd, tmp_path = tempfile.mkstemp(dir=key_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, os.path.join(key_dir, _INDEX_FILE))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _segment_paths(key_dir: str, seg_id: int):
+        base = os.path.join(key_dir, f"{seg_id:06d}")
+        return base + ".ts.npy", base + ".ohlcv.npy"
+
+    def _load_arrays(self, key_dir: str, index: dict):
+        """현재 세그먼트를 매핑하여 (ts, ohlcv) 반환. 세그먼트가 여러 개면 이어 붙인다."""
+        ts_parts, value_parts = [], []
+        for seg in index["segments"]:
+            ts_path, ohlcv_path = self._segment_paths(key_dir, seg["id"])
+            ts_parts.append(np.load(ts_path, mmap_mode="c"))
+            value_parts.append(np.load(ohlcv_path, mmap_mode="c"))
+        if not ts_parts:
+            return np.empty(0, dtype=np.int64), np.empty((0, 5), dtype=np.float64)
+        if len(ts_parts) == 1:
+            return ts_parts[0], value_parts[0]
+        return np.concatenate(ts_parts), np.concatenate(value_parts)
+
+    def _remove_unused(self, key_dir: str, index: dict):
+        """인덱스에 없는 세그먼트 파일 정리 (매핑 중이라 실패하면 다음 기회에)."""
+        live = {f"{seg['id']:06d}" for seg in index["segments"]}
+        for name in os.listdir(key_dir):
+            if name.endswith(".npy") and name.split(".")[0] not in live:
+                try:
+                    os.remove(os.path.join(key_dir, name))
+                except OSError:
+                    pass
+
+    # ---------- 백엔드 인터페이스 ----------
+
+    def write(self, conn, ticker: str, interval: str, df: pd.DataFrame) -> bool:
+        """df의 봉을 업서트. 기존 마지막 봉 이후만 있으면 세그먼트 추가."""
+        if df.empty or not set(OHLCV_COLUMNS).issubset(set(df.columns)):
+            return False
+
+        ts = _epoch_ns(df.index)
+        values = df[OHLCV_COLUMNS].to_numpy(dtype=np.float64, copy=True)
+        values[:, 4] = np.nan_to_num(values[:, 4], nan=0.0)
+        order = np.argsort(ts, kind="stable")
+        ts, values = ts[order], values[order]
+
+        key_dir = self._key_dir(ticker, interval)
+        os.makedirs(key_dir, exist_ok=True)
+        index = self._read_index(key_dir)
+        segments = index["segments"]
+
+        if segments and (ts[0] <= segments[-1]["last"] or len(segments) >= MAX_SEGMENTS):
+            # 겹침 또는 세그먼트 과다 → 기존 + 신규 병합 후 단일 세그먼트로 재작성
+            old_ts, old_values = self._load_arrays(key_dir, index)
+            all_ts = np.concatenate([old_ts, ts])
+            all_values = np.concatenate([old_values, values])
+            # 같은 시각은 나중(신규) 값 우선
+            rev_unique = np.unique(all_ts[::-1], return_index=True)[1]
+            keep = len(all_ts) - 1 - rev_unique
+            ts, values = all_ts[keep], all_values[keep]
+            segments = []
+
+        seg_id = index["next_id"]
+        ts_path, ohlcv_path = self._segment_paths(key_dir, seg_id)
+        np.save(ts_path, np.ascontiguousarray(ts))
+        np.save(ohlcv_path, np.ascontiguousarray(values))
+        segments.append({"id": seg_id, "rows": int(len(ts)),
+                         "first": int(ts[0]), "last": int(ts[-1])})
+        index = {"segments": segments, "next_id": seg_id + 1}
+        self._write_index(key_dir, index)
+        self._remove_unused(key_dir, index)
+        return True
+
+    def load(self, conn, ticker: str, interval: str,
+             start_ns: int = None, end_ns: int = None) -> pd.DataFrame:
+        """저장된 봉을 yfinance 호환 DataFrame으로 반환 (단일 세그먼트는 zero-copy).
+
+        start_ns/end_ns가 주어지면 정렬된 시각 배열을 이진 탐색해 구간만 잘라낸다.
+        """
+        key_dir = self._key_dir(ticker, interval)
+        index = self._read_index(key_dir)
+        segments = [seg for seg in index["segments"]
+                    if (start_ns is None or seg["last"] >= start_ns)
+                    and (end_ns is None or seg["first"] <= end_ns)]
+        if not segments:
+            return pd.DataFrame()
+        try:
+            ts, values = self._load_arrays(key_dir, {"segments": segments})
+        except (OSError, ValueError) as e:
+            logger.warning(f"[COLUMNAR] Failed to load {ticker} ({interval}): {e}")
+            return pd.DataFrame()
+        lo = 0 if start_ns is None else int(np.searchsorted(ts, start_ns, side="left"))
+        hi = len(ts) if end_ns is None else int(np.searchsorted(ts, end_ns, side="right"))
+        ts, values = ts[lo:hi], values[lo:hi]
+        if len(ts) == 0:
+            return pd.DataFrame()
+        dt_index = pd.DatetimeIndex(ts.view("datetime64[ns]"), name="Date").tz_localize("UTC")
+        return pd.DataFrame(values, index=dt_index, columns=OHLCV_COLUMNS, copy=False)
+
+    def trim(self, conn, ticker: str, interval: str, before_ns: int) -> int:
+        """before_ns 이전 봉 삭제 (해당 봉이 있을 때만 단일 세그먼트로 재작성), 삭제한 행 수 반환."""
+        key_dir = self._key_dir(ticker, interval)
+        index = self._read_index(key_dir)
+        segments = index["segments"]
+        if not segments or segments[0]["first"] >= before_ns:
+            return 0
+        ts, values = self._load_arrays(key_dir, index)
+        lo = int(np.searchsorted(ts, before_ns, side="left"))
+        ts, values = ts[lo:], values[lo:]
+        segments = []
+        seg_id = index["next_id"]
+        if len(ts):
+            ts_path, ohlcv_path = self._segment_paths(key_dir, seg_id)
+            np.save(ts_path, np.ascontiguousarray(ts))
+            np.save(ohlcv_path, np.ascontiguousarray(values))
+            segments.append({"id": seg_id, "rows": int(len(ts)),
+                             "first": int(ts[0]), "last": int(ts[-1])})
+        index = {"segments": segments, "next_id": seg_id + 1}
+        self._write_index(key_dir, index)
+        self._remove_unused(key_dir, index)
+        return lo
+
+    def delete(self, conn, ticker: str = None, interval: str = None) -> int:
+        """전체/종목/(종목, 인터벌) 단위 삭제, 삭제한 행 수 반환."""
+        if ticker is None:
+            targets = [os.path.join(self.root, d) for d in os.listdir(self.root)]
+        elif interval is None:
+            name = _SAFE_NAME.sub("_", ticker)
+            targets = [os.path.join(self.root, d, name) for d in os.listdir(self.root)]
+        else:
+            targets = [self._key_dir(ticker, interval)]
+        removed = 0
+        for path in targets:
+            if os.path.isdir(path):
+                removed += self._count_rows(path)
+                shutil.rmtree(path, ignore_errors=True)
+        return removed
+
+    def _count_rows(self, path: str) -> int:
+        """키 디렉토리(또는 인터벌 디렉토리 전체)의 행 수."""
+        if os.path.exists(os.path.join(path, _INDEX_FILE)):
+            return sum(seg["rows"] for seg in self._read_index(path)["segments"])
+        return sum(self._count_rows(os.path.join(path, d)) for d in os.listdir(path)
+                   if os.path.isdir(os.path.join(path, d)))
+
+    def file_bytes(self) -> int:
+        """저장소 디렉토리의 전체 파일 크기."""
+        total = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                try:
+                    total += os.path.getsize(os.path.join(dirpath, name))
+                except OSError:
+                    pass
+        return total
+
+    def stats(self, conn) -> tuple:
+        """(캐시된 종목 수, 총 행 수)."""
+        tickers = set()
+        total_rows = 0
+        for interval_dir in os.listdir(self.root):
+            interval_path = os.path.join(self.root, interval_dir)
+            if not os.path.isdir(interval_path):
+                continue
+            for ticker_dir in os.listdir(interval_path):
+                rows = sum(seg["rows"] for seg in
+                           self._read_index(os.path.join(interval_path, ticker_dir))["segments"])
+                if rows:
+                    tickers.add(ticker_dir)
+                    total_rows += rows
+        return len(tickers), total_rows
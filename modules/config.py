@@ -78,6 +78,48 @@ default_config = {
         "walk_forward_train_ratio": 0.7,
         "commission_rate": 0.001,
         "slippage_pct": 0.0005,
+        "sweep_workers": 0,   # 민감도 분석/대규모 몬테카를로 작업 프로세스 수 (0 = 자동: 코어 수, 최대 8 / 1 = 프로세스 풀 끔)
+        "sweep_samples": 0,   # 민감도 분석 무작위 조합 수 (0 = 전체 격자)
+        "universe": "S&P 500",  # 유니버스 백테스트 마지막 선택 (유니버스 이름 또는 "워치리스트")
+        "mc_simulations": 10000,  # 몬테카를로 시뮬레이션 수 (100 ~ 1,000,000)
+        "mc_block_size": 1,       # 블록 부트스트랩 길이 (1 = 거래별 독립 복원추출)
+        "mc_seed": None,          # 몬테카를로 시드 (None = 매번 새로, 정수 = 재현 가능)
+    },
+    "cache": {
+        "backend": "sqlite",  # 시세 캐시 저장소: "sqlite" 또는 "columnar" (.npy 세그먼트)
+        # 인터벌별 봉 보존 기간 (일, 0 = 무제한)
+        "retention_days": {"1m": 7, "2m": 30, "5m": 60, "15m": 60, "30m": 60,
+                           "90m": 60, "60m": 365, "1h": 365},
+        "idle_days": 90,                  # 이 기간 동안 조회되지 않은 종목/인터벌 삭제 (0 = 끔)
+        "max_size_mb": 1024,              # 캐시 전체 용량 한도, 초과 시 LRU 순 삭제 (0 = 무제한)
+        "maintenance_interval_sec": 900,  # 백그라운드 정리 주기
+        "htf_ttl_sec": {"1d": 3600, "1wk": 21600},  # 멀티 타임프레임 상위 봉 재사용 시간 (초)
+    },
+    "data_provider": {
+        "name": "yfinance",        # 시세/정보 공급자: "yfinance", "replay" (녹화 파일 재생), "synthetic" (합성 시세)
+        "replay_dir": "replay_data",  # replay 공급자가 읽을 녹화 디렉토리
+        "latency_ms": 0,           # replay/synthetic 응답 지연 (부하 테스트용)
+        "seed": 0,                 # synthetic 시드
+    },
+    "refresh": {
+        "max_concurrency": 32,     # async 조회 코어의 동시 요청 수 (fetch/prefetch 단계)
+        "compute_workers": 0,      # compute 단계 (지표 계산) 스레드 수, 0 = 자동 (코어 수, 최대 4)
+        "fetch_timeout_sec": 30,   # 종목별 fetch 단계 제한 시간
+        "prefetch_timeout_sec": 120,  # prefetch 단계 일괄 조회(히스토리/시세/실적일) 각각의 제한 시간
+        "adaptive": True,          # 종목별 적응형 갱신 주기 (False = 모든 종목 세션 기본 주기)
+        "requests_per_minute": 120,  # 분당 종목 갱신 예산 (0 = 무제한)
+        "session_interval_sec": {"regular": 60, "pre": 120, "after": 120, "closed": 1800},
+        "min_interval_sec": 15,    # 종목별 갱신 주기 하한
+        "max_interval_sec": 3600,  # 종목별 갱신 주기 상한 (실패 백오프는 별도로 곱해짐)
+    },
+    "rate_limit": {
+        "requests_per_sec": 8.0,   # 외부 시세 요청 토큰 보충 속도 (프로세스 전체 공용)
+        "burst": 32,               # 한 번에 보낼 수 있는 최대 요청 수
+        "max_retries": 3,          # 레이트 리밋/네트워크 오류 재시도 횟수
+        "base_delay_sec": 1.0,     # 재시도 백오프 기본 지연 (지수 증가 + 지터)
+        "max_delay_sec": 30.0,     # 재시도 백오프 상한
+        "breaker_failures": 8,     # 연속 실패가 이 수에 이르면 요청 차단
+        "breaker_reset_sec": 60.0,  # 차단 유지 시간 (이후 한 건 시험 요청)
     },
     "screener": {
         "last_universe": "S&P 500",
@@ -305,8 +347,8 @@ def get_risk_free_rate():
         if _risk_free_rate is not None and (now - _risk_free_rate_time) < _RISK_FREE_CACHE_SECONDS:
             return _risk_free_rate
     try:
-        import yfinance as yf
-        tnx = yf.Ticker("^TNX")
+        from data_provider import get_provider
+        tnx = get_provider().ticker("^TNX")
         hist = tnx.history(period="5d")
         if not hist.empty:
             rate = float(hist['Close'].iloc[-1]) / 100.0  # ^TNX is in percentage
@@ -5,15 +5,19 @@ yfinance 호출을 캐싱하여 네트워크 요청을 최소화합니다.
 캐시 히트 시 저장된 데이터를 반환하고, 미스 또는 만료 시 델타 업데이트를 수행합니다.
 """
 
+import contextlib
 import json
 import os
+import re
 import sqlite3
 import threading
 import time
 import logging
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
+
+from data_provider import get_provider
 
 logger = logging.getLogger(__name__)
 
@@ -28,18 +32,49 @@ DEFAULT_TTL_DAILY = 3600        # 일봉 이상 (1d, 1wk, 1mo): 1시간
 # 인트라데이 인터벌 목록
 _INTRADAY_INTERVALS = {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"}
 
-# 스레드 안전을 위한 락
-_db_lock = threading.Lock()
+# yfinance 인트라데이 조회 가능 기간 (일): 이보다 오래된 봉은 캐시에서 정리
+_INTRADAY_LOOKBACK_DAYS = {"1m": 30, "2m": 60, "5m": 60, "15m": 60, "30m": 60,
+                           "90m": 60, "60m": 730, "1h": 730}
+# 한 번의 요청으로 받을 수 있는 최대 기간 (일): 델타 구간이 더 길면 전체 다운로드
+_INTRADAY_MAX_REQUEST_DAYS = {"1m": 7}
+
+# 스키마 버전 (PRAGMA user_version)
+# 1: price_cache.ts를 UTC epoch 나노초 정수로 저장 (이전: date 텍스트)
+# 2: auto_vacuum=INCREMENTAL (기존 DB는 한 번의 전체 VACUUM으로 전환)
+_SCHEMA_VERSION = 2
+
+_OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# 쓰기 직렬화 락: SQLite는 writer가 하나뿐이므로 프로세스 내 쓰기만 줄 세운다.
+# 읽기는 스레드별 WAL 연결로 락 없이 병렬 수행된다.
+_write_lock = threading.Lock()
+
+# (ticker, interval) 키별 스트라이프 락: 같은 키의 메타/시세 읽기가
+# 다른 스레드의 쓰기와 섞이지 않게 하면서, 다른 키끼리는 서로 막지 않는다.
+_LOCK_STRIPES = 64
+_stripe_locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
 
 # 캐시 통계
 _stats = {
     "hits": 0,
     "misses": 0,
     "delta_updates": 0,
+    "batch_downloads": 0,
     "errors": 0,
+    "quote_hits": 0,      # TTL 안의 시세 캐시 사용 수
+    "quote_batches": 0,   # 시세 일괄 조회 요청 수
+    "coalesced": 0,       # 진행 중인 다운로드를 기다려 결과를 공유한 요청 수
+    "evictions": 0,       # 통째로 제거된 (ticker, interval) 키 수
+    "evicted_rows": 0,    # 보존 기간/LRU/용량 정리로 삭제된 봉 수
+    "htf_hits": 0,        # TTL 안의 상위 타임프레임 히스토리 재사용 수
+    "htf_resampled": 0,   # 캐시된 하위 봉을 리샘플해 만든 상위 타임프레임 히스토리 수
 }
 _stats_lock = threading.Lock()
 
+# (ticker, interval) -> 마지막 조회 시각. 조회 경로에서 쓰기 락 없이 기록하고
+# 유지보수 스레드가 cache_access 테이블로 옮긴다.
+_access_times = {}
+
 
 def _get_ttl(interval: str) -> float:
     """인터벌에 따른 TTL 반환."""
@@ -48,21 +83,100 @@ def _get_ttl(interval: str) -> float:
     return DEFAULT_TTL_DAILY
 
 
-def _get_connection() -> sqlite3.Connection:
-    """SQLite 연결 생성 및 테이블 초기화."""
-    conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
-    conn.execute("PRAGMA journal_mode=WAL")
+def _period_start_ns(interval: str, period: str) -> int:
+    """인트라데이 period("30d", "1mo" 등)의 시작 시각 (epoch ns). 일봉 이상/해석 불가면 None."""
+    if interval not in _INTRADAY_INTERVALS or not period:
+        return None
+    match = re.fullmatch(r"(\d+)(d|wk|mo|y)", period)
+    if match is None:
+        return None
+    n, unit = int(match.group(1)), match.group(2)
+    offset = {"d": pd.DateOffset(days=n), "wk": pd.DateOffset(weeks=n),
+              "mo": pd.DateOffset(months=n), "y": pd.DateOffset(years=n)}[unit]
+    return (pd.Timestamp.now(tz="UTC") - offset).value
+
+
+def _delta_start(last_ts: pd.Timestamp, interval: str):
+    """마지막 캐시 봉 기준 델타 다운로드 시작점.
+
+    일봉 이상: 다음 날짜 문자열 (오늘 이후면 None = 이미 최신)
+    인트라데이: 마지막 봉 시각 그대로 (아직 형성 중인 마지막 봉을 새 값으로 교체),
+               한 번에 받을 수 없을 만큼 오래됐으면 None 대신 False (전체 다운로드)
+    """
+    now = pd.Timestamp.now(tz="UTC")
+    if interval in _INTRADAY_INTERVALS:
+        max_days = _INTRADAY_MAX_REQUEST_DAYS.get(
+            interval, _INTRADAY_LOOKBACK_DAYS.get(interval, 60))
+        if now - last_ts >= pd.Timedelta(days=max_days):
+            return False
+        return last_ts
+    delta_start = (last_ts + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    return delta_start if delta_start < now.strftime("%Y-%m-%d") else None
+
+
+def _delta_kwargs(delta_start, interval: str) -> dict:
+    """_delta_start 결과로 yf.download 기간 인자 구성."""
+    if isinstance(delta_start, pd.Timestamp):
+        # 인트라데이: end 생략 = 현재 시각까지
+        return {"start": delta_start.to_pydatetime()}
+    return {"start": delta_start,
+            "end": pd.Timestamp.now(tz="UTC").strftime("%Y-%m-%d")}
+
+
+def _key_lock(ticker: str, interval: str) -> threading.Lock:
+    """(ticker, interval) 키에 대응하는 스트라이프 락 반환."""
+    return _stripe_locks[hash((ticker, interval)) % _LOCK_STRIPES]
+
+
+@contextlib.contextmanager
+def _key_locks(keys):
+    """여러 키의 스트라이프 락을 인덱스 순서대로 획득 (교착 방지)."""
+    stripes = sorted({hash(key) % _LOCK_STRIPES for key in keys})
+    for i in stripes:
+        _stripe_locks[i].acquire()
+    try:
+        yield
+    finally:
+        for i in reversed(stripes):
+            _stripe_locks[i].release()
+
+
+def _convert_auto_vacuum(conn: sqlite3.Connection) -> bool:
+    """auto_vacuum=INCREMENTAL 전환 (기존 DB는 전체 VACUUM 한 번, 새 DB는 이미 적용됨).
+
+    DB 크기에 비례해 오래 걸릴 수 있으므로 연결 초기화(마이그레이션) 때만 실행하고,
+    주기 유지보수는 incremental_vacuum + 체크포인트만 한다. 실패하면 False (다음 시작 때 다시 시도).
+    """
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+        return True
+    started = time.perf_counter()
+    try:
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("VACUUM")
+    except sqlite3.Error as e:
+        logger.warning(f"[CACHE] auto_vacuum conversion skipped: {e}")
+        return False
+    logger.info(f"[CACHE] Converted to incremental auto_vacuum in {time.perf_counter() - started:.1f}s")
+    return True
+
+
+def _create_tables(conn: sqlite3.Connection):
+    """캐시 테이블 생성 + 스키마 마이그레이션. 이전 스키마의 시세 캐시는 버리고 새로 받는다."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < 1:
+        conn.execute("DROP TABLE IF EXISTS price_cache")
+        conn.execute("DROP TABLE IF EXISTS cache_meta")
     conn.execute("""
         CREATE TABLE IF NOT EXISTS price_cache (
             ticker TEXT,
             interval TEXT,
-            date TEXT,
+            ts INTEGER,
             open REAL,
             high REAL,
             low REAL,
             close REAL,
             volume REAL,
-            PRIMARY KEY (ticker, interval, date)
+            PRIMARY KEY (ticker, interval, ts)
         )
     """)
     conn.execute("""
@@ -74,6 +188,33 @@ def _get_connection() -> sqlite3.Connection:
             PRIMARY KEY (ticker, interval)
         )
     """)
+    # LRU 정리용 마지막 조회 시각
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS cache_access (
+            ticker TEXT,
+            interval TEXT,
+            last_accessed REAL,
+            PRIMARY KEY (ticker, interval)
+        )
+    """)
+    # (ticker, interval)별로 빈틈없이 받아 둔 시각 구간 [start_ts, end_ts] (epoch ns)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS cache_ranges (
+            ticker TEXT,
+            interval TEXT,
+            start_ts INTEGER,
+            end_ts INTEGER,
+            PRIMARY KEY (ticker, interval, start_ts)
+        )
+    """)
+    # 다음 실적 발표일 (YYYY-MM-DD, 미정이면 NULL)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS earnings_cache (
+            ticker TEXT PRIMARY KEY,
+            earnings_date TEXT,
+            last_updated REAL
+        )
+    """)
     conn.execute("""
         CREATE TABLE IF NOT EXISTS fundamental_cache (
             ticker TEXT PRIMARY KEY,
@@ -82,22 +223,43 @@ def _get_connection() -> sqlite3.Connection:
         )
     """)
     conn.commit()
+    if version < _SCHEMA_VERSION and _convert_auto_vacuum(conn):
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        conn.commit()
+
+
+# 스키마는 프로세스당 한 번만 생성
+_schema_ready = False
+
+
+def _get_connection() -> sqlite3.Connection:
+    """SQLite 연결 생성 (WAL 모드) 및 최초 1회 테이블 초기화."""
+    global _schema_ready
+    conn = sqlite3.connect(_DB_PATH, timeout=30)
+    # 새 DB 파일에만 적용됨 (기존 DB는 _create_tables의 마이그레이션에서 VACUUM으로 전환)
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if not _schema_ready:
+        # 마이그레이션이 끝날 때까지 다른 스레드의 첫 연결/쓰기도 여기서 기다림
+        with _write_lock:
+            if not _schema_ready:
+                _create_tables(conn)
+                _schema_ready = True
     return conn
 
 
-# 모듈 레벨 연결 (lazy init)
-_conn: sqlite3.Connection = None
-_conn_init_lock = threading.Lock()
+# 스레드별 연결 (lazy init) — 읽기가 서로 다른 연결에서 병렬로 진행됨
+_local = threading.local()
 
 
 def _ensure_conn() -> sqlite3.Connection:
-    """연결이 없으면 생성."""
-    global _conn
-    if _conn is None:
-        with _conn_init_lock:
-            if _conn is None:
-                _conn = _get_connection()
-    return _conn
+    """현재 스레드 전용 연결 반환 (없으면 생성)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _get_connection()
+        _local.conn = conn
+    return conn
 
 
 def _flatten_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -129,81 +291,267 @@ def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _to_utc_index(df: pd.DataFrame) -> pd.DataFrame:
+    """다운로드 결과 인덱스를 캐시(_rows_to_df)와 같은 UTC로 맞춤 (tz-naive는 UTC로 간주)."""
+    if isinstance(df.index, pd.DatetimeIndex):
+        if df.index.tz is None:
+            df.index = df.index.tz_localize("UTC")
+        else:
+            df.index = df.index.tz_convert("UTC")
+    return df
+
+
+def _to_epoch_ns(value) -> int:
+    """날짜 문자열/datetime을 UTC epoch 나노초로 변환 (tz-naive는 UTC로 간주)."""
+    ts = pd.Timestamp(value)
+    if ts.tz is None:
+        ts = ts.tz_localize("UTC")
+    return ts.as_unit("ns").value
+
+
+def _index_to_epoch_ns(index) -> np.ndarray:
+    """DatetimeIndex를 UTC epoch 나노초 int64 배열로 변환 (tz-naive는 UTC로 간주)."""
+    index = pd.DatetimeIndex(index)
+    if index.tz is None:
+        index = index.tz_localize("UTC")
+    return index.as_unit("ns").asi8
+
+
 def _df_to_rows(df: pd.DataFrame, ticker: str, interval: str) -> list:
-    """DataFrame을 SQLite INSERT용 row 리스트로 변환."""
-    rows = []
-    required = {"Open", "High", "Low", "Close", "Volume"}
-    if not required.issubset(set(df.columns)):
-        return rows
-    for idx, row in df.iterrows():
-        date_str = str(idx)
-        rows.append((
-            ticker, interval, date_str,
-            float(row["Open"]) if pd.notna(row["Open"]) else None,
-            float(row["High"]) if pd.notna(row["High"]) else None,
-            float(row["Low"]) if pd.notna(row["Low"]) else None,
-            float(row["Close"]) if pd.notna(row["Close"]) else None,
-            float(row["Volume"]) if pd.notna(row["Volume"]) else 0,
-        ))
-    return rows
+    """DataFrame을 SQLite INSERT용 row 리스트로 변환 (컬럼 단위 NumPy 변환)."""
+    if not set(_OHLCV_COLUMNS).issubset(set(df.columns)) or df.empty:
+        return []
+    ts = _index_to_epoch_ns(df.index).tolist()
+    # NaN 가격은 sqlite3가 NULL로 저장, 거래량 결측은 0
+    prices = df[["Open", "High", "Low", "Close"]].to_numpy(dtype=np.float64).T.tolist()
+    volume = np.nan_to_num(df["Volume"].to_numpy(dtype=np.float64), nan=0.0).tolist()
+    n = len(ts)
+    return list(zip([ticker] * n, [interval] * n, ts, *prices, volume))
 
 
 def _rows_to_df(rows: list) -> pd.DataFrame:
-    """SQLite row 리스트를 yfinance 호환 DataFrame으로 변환."""
+    """SQLite row 리스트 (ts, open, high, low, close, volume)를
+    yfinance 호환 DataFrame으로 변환 (ts 오름차순 가정)."""
     if not rows:
         return pd.DataFrame()
 
-    data = []
-    for row in rows:
-        # row: (ticker, interval, date, open, high, low, close, volume)
-        data.append({
-            "Date": row[2],
-            "Open": row[3],
-            "High": row[4],
-            "Low": row[5],
-            "Close": row[6],
-            "Volume": row[7],
-        })
-
-    df = pd.DataFrame(data)
-    df["Date"] = pd.to_datetime(df["Date"], utc=True)
-    df = df.set_index("Date")
-    df = df.sort_index()
-    return df
+    columns = list(zip(*rows))
+    index = pd.DatetimeIndex(np.array(columns[0], dtype=np.int64).view("datetime64[ns]"),
+                             name="Date").tz_localize("UTC")
+    # None(NULL)은 float64 변환 시 NaN이 됨
+    data = {name: np.array(col, dtype=np.float64)
+            for name, col in zip(_OHLCV_COLUMNS, columns[1:])}
+    return pd.DataFrame(data, index=index)
+
+
+# ============================================================
+# 시세 저장 백엔드 (config.json "cache": {"backend": "sqlite" | "columnar"})
+# 메타/펀더멘털은 항상 SQLite, 시세 행만 백엔드가 저장
+# ============================================================
+
+class _SQLitePriceStore:
+    """price_cache 테이블 기반 행 저장소 (기본 백엔드)."""
+
+    name = "sqlite"
+
+    def write(self, conn: sqlite3.Connection, ticker: str, interval: str,
+              df: pd.DataFrame) -> bool:
+        rows = _df_to_rows(df, ticker, interval)
+        if not rows:
+            return False
+        conn.executemany("""
+            INSERT OR REPLACE INTO price_cache
+                (ticker, interval, ts, open, high, low, close, volume)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        return True
+
+    def load(self, conn: sqlite3.Connection, ticker: str, interval: str,
+             start_ns: int = None, end_ns: int = None) -> pd.DataFrame:
+        # 기간 조건은 기본키 (ticker, interval, ts) 인덱스 범위 검색으로 처리
+        sql = """
+            SELECT ts, open, high, low, close, volume
+            FROM price_cache
+            WHERE ticker = ? AND interval = ?"""
+        params = [ticker, interval]
+        if start_ns is not None:
+            sql += " AND ts >= ?"
+            params.append(start_ns)
+        if end_ns is not None:
+            sql += " AND ts <= ?"
+            params.append(end_ns)
+        cursor = conn.execute(sql + " ORDER BY ts", params)
+        return _rows_to_df(cursor.fetchall())
+
+    def delete(self, conn: sqlite3.Connection, ticker: str = None,
+               interval: str = None) -> int:
+        """전체/종목/(종목, 인터벌) 단위 삭제, 삭제한 행 수 반환."""
+        if ticker is None:
+            return conn.execute("DELETE FROM price_cache").rowcount
+        if interval is None:
+            return conn.execute(
+                "DELETE FROM price_cache WHERE ticker = ?", (ticker,)).rowcount
+        return conn.execute(
+            "DELETE FROM price_cache WHERE ticker = ? AND interval = ?",
+            (ticker, interval)).rowcount
+
+    def file_bytes(self) -> int:
+        """DB 밖에 저장한 시세 파일 크기 (이 백엔드는 모두 DB 안이므로 0)."""
+        return 0
+
+    def trim(self, conn: sqlite3.Connection, ticker: str, interval: str,
+             before_ns: int) -> int:
+        """before_ns 이전 봉 삭제, 삭제한 행 수 반환."""
+        return conn.execute(
+            "DELETE FROM price_cache WHERE ticker = ? AND interval = ? AND ts < ?",
+            (ticker, interval, before_ns)).rowcount
+
+    def stats(self, conn: sqlite3.Connection) -> tuple:
+        """(캐시된 종목 수, 총 행 수)."""
+        return conn.execute(
+            "SELECT COUNT(DISTINCT ticker), COUNT(*) FROM price_cache").fetchone()
+
+
+_store = None
+_store_init_lock = threading.Lock()
+
+
+def _create_store(backend: str):
+    """백엔드 이름으로 저장소 생성. 알 수 없는 값이면 SQLite."""
+    if backend == "columnar":
+        from columnar_store import ColumnarPriceStore
+        return ColumnarPriceStore(os.path.join(_DB_DIR, "price_store"))
+    if backend != "sqlite":
+        logger.warning(f"[CACHE] Unknown backend '{backend}', using sqlite")
+    return _SQLitePriceStore()
+
+
+def _cache_config() -> dict:
+    """config.json의 "cache" 섹션 (설정을 읽을 수 없으면 빈 dict)."""
+    try:
+        import config
+        return config.config.get("cache", {}) or {}
+    except Exception:
+        return {}
+
+
+def _get_store():
+    """config.json의 cache.backend에 따른 시세 저장소 (lazy init)."""
+    global _store
+    if _store is None:
+        with _store_init_lock:
+            if _store is None:
+                _store = _create_store(_cache_config().get("backend", "sqlite"))
+                logger.info(f"[CACHE] Price store backend: {_store.name}")
+    return _store
+
+
+def _write_data(conn: sqlite3.Connection, ticker: str, interval: str,
+                df: pd.DataFrame, period: str = None, covered: tuple = None,
+                update_meta: bool = True) -> bool:
+    """DataFrame을 시세 저장소/cache_meta에 기록 (커밋하지 않음).
+
+    covered: 이번 다운로드로 빈틈없이 채워진 구간 (start_ns, end_ns).
+             None이면 period 다운로드로 보고 첫 봉부터 현재까지로 기록.
+    update_meta: False면 period 캐시의 TTL 메타는 건드리지 않음 (기간 조회용).
+    """
+    if not _get_store().write(conn, ticker, interval, df):
+        return False
+
+    if covered is None:
+        bounds = _index_to_epoch_ns(df.index[[0, -1]])
+        covered = (int(bounds[0]), max(int(bounds[1]), time.time_ns()))
+    _add_coverage(conn, ticker, interval, *covered)
+
+    if update_meta:
+        conn.execute("""
+            INSERT OR REPLACE INTO cache_meta (ticker, interval, last_updated, period)
+            VALUES (?, ?, ?, ?)
+        """, (ticker, interval, time.time(), period or ""))
+    return True
 
 
 def _store_data(conn: sqlite3.Connection, ticker: str, interval: str,
                 df: pd.DataFrame, period: str = None):
     """DataFrame을 SQLite에 저장 (UPSERT)."""
-    rows = _df_to_rows(df, ticker, interval)
-    if not rows:
-        return
+    if _write_data(conn, ticker, interval, df, period):
+        conn.commit()
 
-    conn.executemany("""
-        INSERT OR REPLACE INTO price_cache
-            (ticker, interval, date, open, high, low, close, volume)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, rows)
 
-    conn.execute("""
-        INSERT OR REPLACE INTO cache_meta (ticker, interval, last_updated, period)
-        VALUES (?, ?, ?, ?)
-    """, (ticker, interval, time.time(), period or ""))
-
-    conn.commit()
+def _load_cached(conn: sqlite3.Connection, ticker: str, interval: str,
+                 start_ns: int = None, end_ns: int = None) -> pd.DataFrame:
+    """시세 저장소에서 캐시된 데이터 로드 (start_ns/end_ns는 저장소 쪽에서 필터링)."""
+    return _get_store().load(conn, ticker, interval, start_ns, end_ns)
 
 
-def _load_cached(conn: sqlite3.Connection, ticker: str,
-                 interval: str) -> pd.DataFrame:
-    """SQLite에서 캐시된 데이터 로드."""
+def _get_coverage(conn: sqlite3.Connection, ticker: str, interval: str) -> list:
+    """받아 둔 구간 목록 [(start_ns, end_ns), ...] (시작 시각 순)."""
     cursor = conn.execute("""
-        SELECT ticker, interval, date, open, high, low, close, volume
-        FROM price_cache
+        SELECT start_ts, end_ts FROM cache_ranges
         WHERE ticker = ? AND interval = ?
-        ORDER BY date
+        ORDER BY start_ts
     """, (ticker, interval))
-    rows = cursor.fetchall()
-    return _rows_to_df(rows)
+    return cursor.fetchall()
+
+
+def _add_coverage(conn: sqlite3.Connection, ticker: str, interval: str,
+                  start_ns: int, end_ns: int):
+    """구간을 추가하고 겹치거나 맞닿은 구간은 하나로 병합 (커밋하지 않음)."""
+    merged = []
+    for s, e in sorted(_get_coverage(conn, ticker, interval) + [(start_ns, end_ns)]):
+        if merged and s <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], e)
+        else:
+            merged.append([s, e])
+    conn.execute("DELETE FROM cache_ranges WHERE ticker = ? AND interval = ?",
+                 (ticker, interval))
+    conn.executemany("""
+        INSERT INTO cache_ranges (ticker, interval, start_ts, end_ts)
+        VALUES (?, ?, ?, ?)
+    """, [(ticker, interval, s, e) for s, e in merged])
+
+
+def _find_gaps(covered: list, start_ns: int, end_ns: int) -> list:
+    """[start_ns, end_ns] 중 covered 구간으로 덮이지 않은 부분 목록."""
+    gaps = []
+    cursor = start_ns
+    for s, e in covered:
+        if e < cursor:
+            continue
+        if s > end_ns:
+            break
+        if s > cursor:
+            gaps.append((cursor, s))
+        cursor = max(cursor, e)
+        if cursor >= end_ns:
+            break
+    if cursor < end_ns:
+        gaps.append((cursor, end_ns))
+    return gaps
+
+
+def _trim_lookback(conn: sqlite3.Connection, ticker: str, interval: str):
+    """yfinance 인트라데이 조회 가능 기간보다 오래된 봉/구간 정리 (커밋하지 않음)."""
+    days = _INTRADAY_LOOKBACK_DAYS.get(interval)
+    if days is None:
+        return
+    _trim_before(conn, ticker, interval,
+                 (pd.Timestamp.now(tz="UTC") - pd.Timedelta(days=days)).value)
+
+
+def _trim_before(conn: sqlite3.Connection, ticker: str, interval: str,
+                 cutoff: int) -> int:
+    """cutoff(epoch ns) 이전 봉과 받은 구간 기록 삭제 (커밋하지 않음), 삭제한 봉 수 반환."""
+    removed = _get_store().trim(conn, ticker, interval, cutoff)
+    conn.execute("""
+        DELETE FROM cache_ranges
+        WHERE ticker = ? AND interval = ? AND end_ts < ?
+    """, (ticker, interval, cutoff))
+    conn.execute("""
+        UPDATE cache_ranges SET start_ts = ?
+        WHERE ticker = ? AND interval = ? AND start_ts < ?
+    """, (cutoff, ticker, interval, cutoff))
+    return removed
 
 
 def _get_meta(conn: sqlite3.Connection, ticker: str,
@@ -230,9 +578,89 @@ def _is_fresh(meta: dict, interval: str, ttl: float = None) -> bool:
     return age < ttl
 
 
-def _increment_stat(key: str):
+def _increment_stat(key: str, amount: int = 1):
     with _stats_lock:
-        _stats[key] = _stats.get(key, 0) + 1
+        _stats[key] = _stats.get(key, 0) + amount
+
+
+def _record_access(ticker: str, interval: str):
+    """LRU용 조회 시각 기록 (dict 대입이라 락 불필요)."""
+    _access_times[(ticker, interval)] = time.time()
+
+
+# ============================================================
+# Single-flight: 같은 (ticker, interval, 기간) 동시 미스는 다운로드 한 번을 공유
+# ============================================================
+
+class _Flight:
+    """진행 중인 다운로드 하나. 선두 스레드가 끝내면 done이 set된다."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _flight_key(ticker: str, interval: str, period: str, start=None, end=None) -> tuple:
+    """single-flight 키. 기간 조회는 period 대신 start/end로 구분."""
+    if start is not None:
+        return (ticker, interval, None, str(start), None if end is None else str(end))
+    return (ticker, interval, period, None, None if end is None else str(end))
+
+
+def _claim_flight(key: tuple):
+    """(flight, 선두 여부). 선두면 반드시 _finish_flight를 호출해야 한다."""
+    with _inflight_lock:
+        flight = _inflight.get(key)
+        if flight is not None:
+            return flight, False
+        flight = _inflight[key] = _Flight()
+        return flight, True
+
+
+def _finish_flight(key: tuple, flight: _Flight, result=None, error=None):
+    """결과를 기록하고 대기 중인 스레드를 깨움."""
+    flight.result = result
+    flight.error = error
+    with _inflight_lock:
+        if _inflight.get(key) is flight:
+            del _inflight[key]
+    flight.done.set()
+
+
+def _wait_flight(flight: _Flight) -> pd.DataFrame:
+    """선두 스레드의 결과를 기다려 사본 반환 (실패 시 None)."""
+    _increment_stat("coalesced")
+    flight.done.wait()
+    if flight.error is not None or flight.result is None:
+        return None
+    # 호출자가 지표 컬럼을 추가하는 등 수정할 수 있으므로 공유 프레임은 복사
+    return flight.result.copy()
+
+
+def _single_flight(key: tuple, fetch):
+    """key에 대해 fetch()를 한 번만 실행하고 동시 호출자는 그 결과를 공유."""
+    flight, leader = _claim_flight(key)
+    if not leader:
+        result = _wait_flight(flight)
+        if result is not None:
+            return result
+        # 선두가 실패했으면 직접 시도
+        return fetch()
+
+    try:
+        result = fetch()
+    except BaseException as e:
+        _finish_flight(key, flight, error=e)
+        raise
+    _finish_flight(key, flight, result=result)
+    return result
 
 
 def get_cached_history(ticker: str, period: str = None, interval: str = None,
@@ -243,6 +671,10 @@ def get_cached_history(ticker: str, period: str = None, interval: str = None,
     캐시 히트 시 저장된 DataFrame을 반환하고,
     만료 또는 미스 시 yfinance에서 다운로드하여 캐시에 저장 후 반환합니다.
     델타 업데이트: 기존 캐시가 있으면 마지막 날짜 이후 데이터만 추가 다운로드.
+    인트라데이는 마지막 봉부터 다시 받아 형성 중이던 봉을 교체하고,
+    yfinance 조회 가능 기간보다 오래된 봉은 정리하며 period 구간만 반환합니다.
+    start가 주어지면 기간 조회: 이미 받아 둔 구간을 제외한 빈 구간만 받고,
+    저장소에서 해당 기간만 읽어 반환합니다.
 
     Parameters
     ----------
@@ -266,105 +698,121 @@ def get_cached_history(ticker: str, period: str = None, interval: str = None,
     """
     if interval is None:
         interval = "1d"
+    _record_access(ticker, interval)
+
+    flight_key = _flight_key(ticker, interval, period, start, end)
+    if start is not None:
+        return _single_flight(
+            flight_key, lambda: _get_range_history(ticker, interval, start, end, ttl))
+
+    cached_df = _load_fresh(ticker, period, interval, end, ttl)
+    if cached_df is not None:
+        return cached_df
 
+    # 캐시 미스 또는 만료 - 같은 키를 받는 중인 스레드가 있으면 그 결과를 공유
+    return _single_flight(
+        flight_key, lambda: _download_history(ticker, period, interval, end, ttl))
+
+
+def _load_fresh(ticker: str, period: str, interval: str, end,
+                ttl: float = None) -> pd.DataFrame:
+    """캐시가 신선하면 저장된 DataFrame, 아니면 None."""
     conn = _ensure_conn()
+    start_ns = _period_start_ns(interval, period)
+    end_ns = _to_epoch_ns(end) if end is not None else None
 
-    with _db_lock:
+    with _key_lock(ticker, interval):
         meta = _get_meta(conn, ticker, interval)
-
-        # 캐시가 신선하면 바로 반환
         if _is_fresh(meta, interval, ttl):
-            cached_df = _load_cached(conn, ticker, interval)
+            cached_df = _load_cached(conn, ticker, interval, start_ns, end_ns)
             if not cached_df.empty:
                 logger.debug(f"[CACHE HIT] {ticker} ({interval}) - "
                              f"age: {time.time() - meta['last_updated']:.0f}s")
                 _increment_stat("hits")
+                return cached_df
+    return None
 
-                # start/end 필터링
-                if start is not None:
-                    start_ts = pd.Timestamp(start, tz="UTC")
-                    cached_df = cached_df[cached_df.index >= start_ts]
-                if end is not None:
-                    end_ts = pd.Timestamp(end, tz="UTC")
-                    cached_df = cached_df[cached_df.index <= end_ts]
 
-                return cached_df
+def _download_history(ticker: str, period: str, interval: str, end,
+                      ttl: float = None) -> pd.DataFrame:
+    """캐시 미스/만료 시 델타 또는 전체 다운로드 후 저장 (single-flight 선두 스레드만 실행)."""
+    # 대기 중 다른 스레드의 다운로드가 끝나 이미 신선해졌을 수 있음
+    cached_df = _load_fresh(ticker, period, interval, end, ttl)
+    if cached_df is not None:
+        return cached_df
+
+    conn = _ensure_conn()
+    key_lock = _key_lock(ticker, interval)
+    start_ns = _period_start_ns(interval, period)
+    end_ns = _to_epoch_ns(end) if end is not None else None
+    with key_lock:
+        meta = _get_meta(conn, ticker, interval)
 
-    # 캐시 미스 또는 만료 - yfinance에서 다운로드
     logger.debug(f"[CACHE MISS] {ticker} ({interval}) - downloading...")
     _increment_stat("misses")
 
     try:
         # 델타 업데이트 시도: 기존 캐시가 있고 period 모드인 경우
         existing_df = pd.DataFrame()
-        if meta is not None and start is None and end is None and period is not None:
-            with _db_lock:
+        if meta is not None and end is None and period is not None:
+            with key_lock:
                 existing_df = _load_cached(conn, ticker, interval)
 
-        if not existing_df.empty and interval not in _INTRADAY_INTERVALS:
-            # 마지막 캐시 날짜부터 델타 다운로드
-            last_date = existing_df.index[-1]
-            delta_start = (last_date + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
-            today = pd.Timestamp.now(tz="UTC").strftime("%Y-%m-%d")
+        delta_start = None
+        if not existing_df.empty:
+            delta_start = _delta_start(existing_df.index[-1], interval)
 
-            if delta_start < today:
+        if not existing_df.empty and delta_start is not False:
+            # 마지막 캐시 봉 이후(인트라데이는 마지막 봉 포함) 델타 다운로드
+            if delta_start is not None:
                 logger.debug(f"[DELTA UPDATE] {ticker} ({interval}) "
                              f"from {delta_start}")
                 _increment_stat("delta_updates")
 
                 try:
-                    delta_df = yf.download(
-                        ticker, start=delta_start, end=today,
-                        interval=interval, progress=False
+                    delta_df = get_provider().download(
+                        ticker, interval=interval, progress=False,
+                        **_delta_kwargs(delta_start, interval)
                     )
                     delta_df = _flatten_columns(delta_df)
-                    delta_df = _normalize_columns(delta_df)
+                    delta_df = _to_utc_index(_normalize_columns(delta_df))
 
                     if not delta_df.empty:
-                        # 기존 + 델타 병합
+                        # 기존 + 델타 병합 (같은 시각은 델타 값 우선)
                         merged = pd.concat([existing_df, delta_df])
                         merged = merged[~merged.index.duplicated(keep="last")]
                         merged = merged.sort_index()
 
-                        with _db_lock:
-                            _store_data(conn, ticker, interval, merged, period)
+                        # 저장소는 업서트이므로 델타 봉만 기록
+                        with key_lock, _write_lock:
+                            _write_data(conn, ticker, interval, delta_df, period)
+                            _trim_lookback(conn, ticker, interval)
+                            conn.commit()
                         result = merged
                     else:
                         # 새 데이터 없음, 메타만 갱신
-                        with _db_lock:
-                            conn.execute("""
-                                INSERT OR REPLACE INTO cache_meta
-                                    (ticker, interval, last_updated, period)
-                                VALUES (?, ?, ?, ?)
-                            """, (ticker, interval, time.time(), period or ""))
+                        with key_lock, _write_lock:
+                            _touch_meta(conn, ticker, interval, period)
                             conn.commit()
                         result = existing_df
                 except Exception as e:
                     logger.warning(f"[DELTA FAIL] {ticker}: {e}, full download")
-                    result = _full_download(ticker, period, interval,
-                                            start, end, conn)
+                    result = _full_download(ticker, period, interval, conn)
             else:
                 # 이미 최신, 메타만 갱신
-                with _db_lock:
-                    conn.execute("""
-                        INSERT OR REPLACE INTO cache_meta
-                            (ticker, interval, last_updated, period)
-                        VALUES (?, ?, ?, ?)
-                    """, (ticker, interval, time.time(), period or ""))
+                with key_lock, _write_lock:
+                    _touch_meta(conn, ticker, interval, period)
                     conn.commit()
                 result = existing_df
         else:
             # 전체 다운로드
-            result = _full_download(ticker, period, interval, start, end, conn)
+            result = _full_download(ticker, period, interval, conn)
 
-        # start/end 필터링
-        if not result.empty:
-            if start is not None:
-                start_ts = pd.Timestamp(start, tz="UTC")
-                result = result[result.index >= start_ts]
-            if end is not None:
-                end_ts = pd.Timestamp(end, tz="UTC")
-                result = result[result.index <= end_ts]
+        # period 시작(인트라데이) / end 필터링
+        if not result.empty and start_ns is not None:
+            result = result[result.index >= pd.Timestamp(start_ns, tz="UTC")]
+        if not result.empty and end_ns is not None:
+            result = result[result.index <= pd.Timestamp(end_ns, tz="UTC")]
 
         return result
 
@@ -372,7 +820,7 @@ def get_cached_history(ticker: str, period: str = None, interval: str = None,
         logger.error(f"[CACHE ERROR] {ticker}: {e}")
         _increment_stat("errors")
         # 캐시에 뭐라도 있으면 반환
-        with _db_lock:
+        with key_lock:
             fallback = _load_cached(conn, ticker, interval)
         if not fallback.empty:
             logger.info(f"[CACHE FALLBACK] Returning stale data for {ticker}")
@@ -380,36 +828,285 @@ def get_cached_history(ticker: str, period: str = None, interval: str = None,
         return pd.DataFrame()
 
 
-def _full_download(ticker: str, period: str, interval: str,
-                   start, end, conn: sqlite3.Connection) -> pd.DataFrame:
-    """yfinance에서 전체 데이터 다운로드 후 캐시에 저장."""
-    kwargs = {"progress": False}
-
-    if start is not None and end is not None:
-        kwargs["start"] = str(start)
-        kwargs["end"] = str(end)
-    elif start is not None:
-        kwargs["start"] = str(start)
-    elif period is not None:
-        kwargs["period"] = period
+def _get_range_history(ticker: str, interval: str, start, end,
+                       ttl: float = None) -> pd.DataFrame:
+    """기간 조회: 받아 둔 구간(cache_ranges)에 없는 빈 구간만 다운로드 후
+    저장소에서 [start, end] 범위만 읽어 반환."""
+    conn = _ensure_conn()
+    key_lock = _key_lock(ticker, interval)
+    if ttl is None:
+        ttl = _get_ttl(interval)
+
+    now_ns = time.time_ns()
+    start_ns = _to_epoch_ns(start)
+    end_ns = _to_epoch_ns(end) if end is not None else now_ns
+    fetch_end = min(end_ns, now_ns)
+
+    with key_lock:
+        covered = _get_coverage(conn, ticker, interval)
+    gaps = _find_gaps(covered, start_ns, fetch_end) if start_ns < fetch_end else []
+    # 앞쪽이 받아져 있고 현재 시각 쪽 꼬리만 TTL 이내로 비어 있으면 아직 신선함
+    gaps = [(g0, g1) for g0, g1 in gaps
+            if not (g0 > start_ns and g1 == now_ns and now_ns - g0 < ttl * 1e9)]
+
+    if not gaps:
+        _increment_stat("hits")
     else:
-        kwargs["period"] = "1mo"
+        _increment_stat("misses")
+    day = pd.Timedelta(days=1)
+    for g0, g1 in gaps:
+        # yfinance는 날짜 단위 start/end(end 미포함)로 받으므로 바깥쪽으로 맞춤
+        dl_start = pd.Timestamp(g0, tz="UTC").floor("D")
+        dl_end = pd.Timestamp(g1, tz="UTC").floor("D") + day
+        logger.debug(f"[RANGE GAP] {ticker} ({interval}) "
+                     f"{dl_start:%Y-%m-%d} ~ {dl_end:%Y-%m-%d}")
+        try:
+            df = get_provider().download(ticker, start=dl_start.strftime("%Y-%m-%d"),
+                                         end=dl_end.strftime("%Y-%m-%d"),
+                                         interval=interval, progress=False)
+            df = _to_utc_index(_normalize_columns(_flatten_columns(df)))
+        except Exception as e:
+            logger.warning(f"[RANGE FAIL] {ticker} ({interval}): {e}")
+            _increment_stat("errors")
+            break
+        covered_range = (dl_start.value, min(dl_end.value, now_ns))
+        with key_lock, _write_lock:
+            if not df.empty:
+                _write_data(conn, ticker, interval, df, covered=covered_range,
+                            update_meta=False)
+            else:
+                # 휴장 구간 등 봉이 없는 구간도 받은 것으로 기록
+                _add_coverage(conn, ticker, interval, *covered_range)
+            conn.commit()
 
-    kwargs["interval"] = interval
+    with key_lock:
+        return _load_cached(conn, ticker, interval, start_ns, end_ns)
 
-    df = yf.download(ticker, **kwargs)
+
+def _full_download(ticker: str, period: str, interval: str,
+                   conn: sqlite3.Connection) -> pd.DataFrame:
+    """yfinance에서 period 전체 데이터 다운로드 후 캐시에 저장."""
+    df = get_provider().download(ticker, period=period or "1mo", interval=interval,
+                                 progress=False)
     df = _flatten_columns(df)
-    df = _normalize_columns(df)
+    df = _to_utc_index(_normalize_columns(df))
 
     if df.empty:
         return df
 
-    with _db_lock:
-        _store_data(conn, ticker, interval, df, period)
+    with _key_lock(ticker, interval), _write_lock:
+        if _write_data(conn, ticker, interval, df, period):
+            _trim_lookback(conn, ticker, interval)
+        conn.commit()
 
     return df
 
 
+def _touch_meta(conn: sqlite3.Connection, ticker: str, interval: str,
+                period: str = None):
+    """새 데이터 없이 메타의 갱신 시각만 현재로 설정 (커밋하지 않음)."""
+    conn.execute("""
+        INSERT OR REPLACE INTO cache_meta
+            (ticker, interval, last_updated, period)
+        VALUES (?, ?, ?, ?)
+    """, (ticker, interval, time.time(), period or ""))
+
+
+def _split_batch(df: pd.DataFrame, ticker: str, n_tickers: int) -> pd.DataFrame:
+    """다중 종목 yf.download 결과에서 한 종목의 OHLCV만 분리."""
+    if df is None or df.empty:
+        return pd.DataFrame()
+    if isinstance(df.columns, pd.MultiIndex):
+        if ticker in df.columns.get_level_values(0):
+            sub = df[ticker]
+        elif ticker in df.columns.get_level_values(1):
+            sub = df.xs(ticker, axis=1, level=1)
+        else:
+            return pd.DataFrame()
+    elif n_tickers == 1:
+        sub = df
+    else:
+        return pd.DataFrame()
+    # 캐시(_rows_to_df)와 같은 UTC 인덱스로 맞춰야 병합 가능
+    sub = _to_utc_index(_normalize_columns(sub.copy()))
+    # 종목별 거래일이 달라 생긴 빈 행 제거
+    return sub.dropna(how="all")
+
+
+def get_cached_history_batch(tickers, period: str = None, interval: str = None,
+                             ttl: float = None) -> dict:
+    """
+    여러 종목의 히스토리를 한 번에 캐시에서 조회/갱신합니다.
+
+    만료된 종목만 골라 델타 시작일별로 묶은 뒤, 그룹마다 한 번의
+    다중 종목 yf.download로 받아 종목별로 분리하고 단일 트랜잭션으로 저장합니다.
+
+    Parameters
+    ----------
+    tickers : list of str
+        종목 티커 목록
+    period : str, optional
+        yfinance period (예: "30d", "1y"). None이면 "1mo"
+    interval : str, optional
+        yfinance interval. 기본값 "1d"
+    ttl : float, optional
+        캐시 TTL (초). None이면 인터벌에 따라 자동 결정.
+
+    Returns
+    -------
+    dict
+        {ticker: DataFrame} — 데이터가 없는 종목은 빈 DataFrame
+    """
+    if interval is None:
+        interval = "1d"
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+    for ticker in tickers:
+        _record_access(ticker, interval)
+
+    conn = _ensure_conn()
+    results = {}
+    existing = {}
+    groups = {}   # delta_start(None=전체 다운로드) -> [tickers]
+    up_to_date = []
+    start_ns = _period_start_ns(interval, period)
+
+    for ticker in tickers:
+        with _key_lock(ticker, interval):
+            meta = _get_meta(conn, ticker, interval)
+            if _is_fresh(meta, interval, ttl):
+                cached_df = _load_cached(conn, ticker, interval, start_ns)
+                if not cached_df.empty:
+                    _increment_stat("hits")
+                    results[ticker] = cached_df
+                    continue
+
+            _increment_stat("misses")
+            cached_df = pd.DataFrame()
+            if meta is not None and period is not None:
+                cached_df = _load_cached(conn, ticker, interval)
+
+        delta_start = False
+        if not cached_df.empty:
+            delta_start = _delta_start(cached_df.index[-1], interval)
+        if delta_start is False:
+            groups.setdefault(None, []).append(ticker)
+            continue
+
+        existing[ticker] = cached_df
+        if delta_start is not None:
+            # 같은 시장 종목은 마지막 봉 시각이 같아 한 그룹으로 묶인다
+            groups.setdefault(delta_start, []).append(ticker)
+        else:
+            up_to_date.append(ticker)
+            results[ticker] = cached_df
+
+    if up_to_date:
+        # 이미 최신, 메타만 갱신
+        with _key_locks([(t, interval) for t in up_to_date]), _write_lock:
+            for ticker in up_to_date:
+                _touch_meta(conn, ticker, interval, period)
+            conn.commit()
+
+    # 다른 스레드가 같은 종목을 이미 받는 중이면 그 결과를 기다림 (single-flight)
+    owned = {}     # flight key -> (ticker, flight)
+    waiting = {}   # ticker -> flight
+    for delta_start in list(groups):
+        mine = []
+        for ticker in groups[delta_start]:
+            key = _flight_key(ticker, interval, period)
+            flight, leader = _claim_flight(key)
+            if leader:
+                owned[key] = (ticker, flight)
+                mine.append(ticker)
+            else:
+                waiting[ticker] = flight
+        if mine:
+            groups[delta_start] = mine
+        else:
+            del groups[delta_start]
+
+    try:
+        _download_groups(conn, groups, existing, results, period, interval)
+
+        # 다운로드 실패 종목은 캐시에 남은 데이터라도 반환
+        missing = [t for t in tickers if t not in results and t not in waiting]
+        for ticker in missing:
+            with _key_lock(ticker, interval):
+                results[ticker] = _load_cached(conn, ticker, interval, start_ns)
+
+        # 인트라데이는 요청 period 구간만 반환
+        if start_ns is not None:
+            start_ts = pd.Timestamp(start_ns, tz="UTC")
+            results = {t: df[df.index >= start_ts] if not df.empty else df
+                       for t, df in results.items()}
+    finally:
+        for key, (ticker, flight) in owned.items():
+            _finish_flight(key, flight, result=results.get(ticker))
+
+    for ticker, flight in waiting.items():
+        df = _wait_flight(flight)
+        if df is None:
+            with _key_lock(ticker, interval):
+                df = _load_cached(conn, ticker, interval, start_ns)
+        results[ticker] = df
+
+    return {t: results[t] for t in tickers}
+
+
+def _download_groups(conn: sqlite3.Connection, groups: dict, existing: dict,
+                     results: dict, period: str, interval: str):
+    """delta_start별 종목 그룹을 한 번씩 yf.download 후 저장, results에 병합 결과 기록."""
+    for delta_start, group in groups.items():
+        kwargs = {"interval": interval, "progress": False,
+                  "group_by": "ticker", "threads": True}
+        if delta_start is None:
+            kwargs["period"] = period or "1mo"
+        else:
+            kwargs.update(_delta_kwargs(delta_start, interval))
+
+        logger.debug(f"[BATCH DOWNLOAD] {len(group)} tickers ({interval}) "
+                     f"{'full' if delta_start is None else f'from {delta_start}'}")
+        _increment_stat("batch_downloads")
+        failed = False
+        try:
+            batch_df = get_provider().download(group, **kwargs)
+        except Exception as e:
+            logger.warning(f"[BATCH FAIL] {len(group)} tickers ({interval}): {e}")
+            _increment_stat("errors")
+            batch_df = pd.DataFrame()
+            failed = True
+
+        to_store = {}
+        for ticker in group:
+            part = _split_batch(batch_df, ticker, len(group))
+            prev = existing.get(ticker)
+            if delta_start is not None:
+                _increment_stat("delta_updates")
+            if not part.empty:
+                # 저장소는 업서트이므로 새로 받은 봉만 기록
+                to_store[ticker] = part
+            if not part.empty and prev is not None:
+                merged = pd.concat([prev, part])
+                merged = merged[~merged.index.duplicated(keep="last")]
+                part = merged.sort_index()
+            if not part.empty:
+                results[ticker] = part
+            elif prev is not None:
+                results[ticker] = prev
+
+        with _key_locks([(t, interval) for t in group]), _write_lock:
+            for ticker in group:
+                if ticker in to_store:
+                    _write_data(conn, ticker, interval, to_store[ticker], period)
+                    _trim_lookback(conn, ticker, interval)
+                elif ticker in existing and not failed:
+                    # 델타 구간에 새 봉 없음, 메타만 갱신
+                    _touch_meta(conn, ticker, interval, period)
+            conn.commit()
+
+
 def clear_cache(ticker: str = None):
     """
     캐시를 삭제합니다.
@@ -421,20 +1118,178 @@ def clear_cache(ticker: str = None):
     """
     conn = _ensure_conn()
 
-    with _db_lock:
+    with _write_lock:
+        _get_store().delete(conn, ticker)
         if ticker is None:
-            conn.execute("DELETE FROM price_cache")
-            conn.execute("DELETE FROM cache_meta")
+            for table in ("cache_meta", "cache_ranges", "cache_access"):
+                conn.execute(f"DELETE FROM {table}")
+            _access_times.clear()
+            with _htf_lock:
+                _htf.clear()
             logger.info("[CACHE] All cache cleared")
         else:
-            conn.execute(
-                "DELETE FROM price_cache WHERE ticker = ?", (ticker,))
-            conn.execute(
-                "DELETE FROM cache_meta WHERE ticker = ?", (ticker,))
+            for table in ("cache_meta", "cache_ranges", "cache_access"):
+                conn.execute(f"DELETE FROM {table} WHERE ticker = ?", (ticker,))
+            for key in [k for k in list(_access_times) if k[0] == ticker]:
+                _access_times.pop(key, None)
+            with _htf_lock:
+                for key in [k for k in list(_htf) if k[0] == ticker]:
+                    _htf.pop(key, None)
             logger.info(f"[CACHE] Cache cleared for {ticker}")
         conn.commit()
 
 
+# ============================================================
+# 보존 정책 / 유지보수 (config.json "cache": retention_days, idle_days,
+# max_size_mb, maintenance_interval_sec)
+# ============================================================
+
+_maintenance_thread = None
+_maintenance_stop = threading.Event()
+
+
+def _evict_key(conn: sqlite3.Connection, ticker: str, interval: str) -> int:
+    """(ticker, interval) 키의 봉/메타/구간/조회 기록 삭제 (커밋하지 않음)."""
+    removed = _get_store().delete(conn, ticker, interval)
+    for table in ("cache_meta", "cache_ranges", "cache_access"):
+        conn.execute(f"DELETE FROM {table} WHERE ticker = ? AND interval = ?",
+                     (ticker, interval))
+    _access_times.pop((ticker, interval), None)
+    return removed
+
+
+def _cache_size_bytes(conn: sqlite3.Connection) -> int:
+    """실사용 DB 페이지 크기 + DB 밖 시세 파일 크기 (빈 페이지 제외)."""
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    pages = conn.execute("PRAGMA page_count").fetchone()[0]
+    free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    return (pages - free) * page_size + _get_store().file_bytes()
+
+
+def _lru_keys(conn: sqlite3.Connection) -> list:
+    """캐시된 모든 키를 오래 조회되지 않은 순으로 [(last_accessed, ticker, interval)]."""
+    cursor = conn.execute("""
+        SELECT k.ticker, k.interval,
+               COALESCE(a.last_accessed, m.last_updated, 0)
+        FROM (SELECT ticker, interval FROM cache_meta
+              UNION SELECT ticker, interval FROM cache_ranges) k
+        LEFT JOIN cache_access a
+               ON a.ticker = k.ticker AND a.interval = k.interval
+        LEFT JOIN cache_meta m
+               ON m.ticker = k.ticker AND m.interval = k.interval
+        ORDER BY 3
+    """)
+    return [(row[2], row[0], row[1]) for row in cursor.fetchall()]
+
+
+def run_maintenance() -> dict:
+    """
+    캐시 보존 정책을 한 번 적용합니다.
+
+    1) 메모리의 조회 시각을 cache_access에 반영
+    2) 인터벌별 보존 기간(retention_days)보다 오래된 봉 삭제
+    3) idle_days 동안 조회되지 않은 키 삭제
+    4) 전체 크기가 max_size_mb를 넘으면 가장 오래 조회되지 않은 키부터 삭제 (LRU)
+    5) incremental vacuum + WAL 체크포인트
+
+    키 단위로 락을 잡고 커밋하므로 조회/다운로드를 오래 막지 않습니다.
+
+    Returns
+    -------
+    dict
+        evictions, evicted_rows, size_mb
+    """
+    cache_cfg = _cache_config()
+    retention = cache_cfg.get("retention_days", {}) or {}
+    idle_days = cache_cfg.get("idle_days", 0) or 0
+    max_bytes = (cache_cfg.get("max_size_mb", 0) or 0) * 1024 * 1024
+
+    conn = _ensure_conn()
+    now = time.time()
+    evictions = 0
+    evicted_rows = 0
+
+    # 1) 조회 시각 반영
+    accessed = list(_access_times.items())
+    if accessed:
+        with _write_lock:
+            conn.executemany("""
+                INSERT OR REPLACE INTO cache_access (ticker, interval, last_accessed)
+                VALUES (?, ?, ?)
+            """, [(t, i, ts) for (t, i), ts in accessed])
+            conn.commit()
+
+    keys = _lru_keys(conn)
+
+    # 2) 인터벌별 보존 기간
+    for _, ticker, interval in keys:
+        days = retention.get(interval)
+        if not days:
+            continue
+        cutoff = int((now - days * 86400) * 1e9)
+        with _key_lock(ticker, interval), _write_lock:
+            evicted_rows += _trim_before(conn, ticker, interval, cutoff)
+            conn.commit()
+
+    # 3) 장기 미조회 키 / 4) 용량 초과 시 LRU 순 삭제
+    # keys는 조회 시각 오름차순이므로 미조회도 아니고 용량도 괜찮으면 이후 키는 볼 필요 없음
+    for last_accessed, ticker, interval in keys:
+        idle = idle_days and now - last_accessed > idle_days * 86400
+        if not idle and (not max_bytes or _cache_size_bytes(conn) <= max_bytes):
+            break
+        with _key_lock(ticker, interval), _write_lock:
+            evicted_rows += _evict_key(conn, ticker, interval)
+            conn.commit()
+        evictions += 1
+        logger.debug(f"[CACHE EVICT] {ticker} ({interval}) "
+                     f"{'idle' if idle else 'size budget'}")
+
+    # 5) 빈 페이지 반환 + WAL 정리 (전체 VACUUM은 하지 않음: auto_vacuum 전환은 연결 초기화 때)
+    with _write_lock:
+        try:
+            conn.execute("PRAGMA incremental_vacuum(2000)")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            logger.warning(f"[CACHE] Vacuum/checkpoint skipped: {e}")
+
+    if evictions or evicted_rows:
+        _increment_stat("evictions", evictions)
+        _increment_stat("evicted_rows", evicted_rows)
+        logger.info(f"[CACHE] Maintenance: {evictions} keys evicted, "
+                    f"{evicted_rows} rows removed")
+    return {"evictions": evictions, "evicted_rows": evicted_rows,
+            "size_mb": _cache_size_bytes(conn) / (1024 * 1024)}
+
+
+def _maintenance_loop(interval_sec: float):
+    while not _maintenance_stop.wait(interval_sec):
+        try:
+            run_maintenance()
+        except Exception as e:
+            logger.warning(f"[CACHE] Maintenance failed: {e}")
+
+
+def start_maintenance(interval_sec: float = None):
+    """백그라운드 유지보수 스레드 시작 (이미 실행 중이면 무시)."""
+    global _maintenance_thread
+    if _maintenance_thread is not None and _maintenance_thread.is_alive():
+        return
+    if interval_sec is None:
+        interval_sec = _cache_config().get("maintenance_interval_sec", 900)
+    _maintenance_stop.clear()
+    _maintenance_thread = threading.Thread(
+        target=_maintenance_loop, args=(interval_sec,),
+        name="cache-maintenance", daemon=True)
+    _maintenance_thread.start()
+
+
+def stop_maintenance(timeout: float = 5):
+    """유지보수 스레드 종료 요청 후 대기."""
+    _maintenance_stop.set()
+    if _maintenance_thread is not None:
+        _maintenance_thread.join(timeout=timeout)
+
+
 # ============================================================
 # 펀더멘털 캐시 (yfinance Ticker.info)
 # ============================================================
@@ -447,11 +1302,10 @@ def get_cached_fundamental(ticker: str, ttl: float = None) -> dict:
     if ttl is None:
         ttl = FUNDAMENTAL_TTL
     conn = _ensure_conn()
-    with _db_lock:
-        cursor = conn.execute(
-            "SELECT info_json, last_updated FROM fundamental_cache WHERE ticker = ?",
-            (ticker,))
-        row = cursor.fetchone()
+    cursor = conn.execute(
+        "SELECT info_json, last_updated FROM fundamental_cache WHERE ticker = ?",
+        (ticker,))
+    row = cursor.fetchone()
     if row is None:
         return None
     age = time.time() - row[1]
@@ -471,7 +1325,7 @@ def store_fundamental(ticker: str, info: dict):
     except (TypeError, ValueError) as e:
         logger.warning(f"[CACHE] Failed to serialize fundamental for {ticker}: {e}")
         return
-    with _db_lock:
+    with _write_lock:
         conn.execute("""
             INSERT OR REPLACE INTO fundamental_cache (ticker, info_json, last_updated)
             VALUES (?, ?, ?)
@@ -487,7 +1341,7 @@ def get_cached_fundamental_or_fetch(ticker: str, ttl: float = None) -> dict:
         return cached
     _increment_stat("misses")
     try:
-        info = yf.Ticker(ticker).info
+        info = get_provider().info(ticker)
         if info and info.get("quoteType") != "NONE":
             store_fundamental(ticker, info)
             return info
@@ -497,6 +1351,284 @@ def get_cached_fundamental_or_fetch(ticker: str, ttl: float = None) -> dict:
     return {}
 
 
+# ============================================================
+# 실적 발표일 캐시 (Ticker.calendar, 하루 TTL)
+# ============================================================
+
+EARNINGS_TTL = 86400  # 24시간
+
+
+def _parse_earnings_date(cal):
+    """yfinance calendar(dict 또는 DataFrame)에서 다음 실적 발표일 "YYYY-MM-DD" 추출."""
+    if cal is None:
+        return None
+    if isinstance(cal, dict):
+        dates = cal.get("Earnings Date")
+        earn_date = dates[0] if isinstance(dates, (list, tuple)) and dates else dates
+    elif hasattr(cal, "columns"):
+        if "Earnings Date" in cal.columns:
+            earn_date = cal["Earnings Date"].iloc[0]
+        elif len(cal) > 0 and cal.shape[1] > 0:
+            earn_date = cal.iloc[0, 0]
+        else:
+            earn_date = None
+    else:
+        return None
+    if earn_date is None:
+        return None
+    try:
+        return pd.Timestamp(earn_date).strftime("%Y-%m-%d")
+    except (ValueError, TypeError):
+        return None
+
+
+def _fetch_earnings_date(ticker: str):
+    """공급자에서 실적 발표일 조회. 실패 시 예외 전파."""
+    return _parse_earnings_date(get_provider().calendar(ticker))
+
+
+def _store_earnings(conn: sqlite3.Connection, rows: list):
+    """[(ticker, earnings_date)] 저장."""
+    now = time.time()
+    with _write_lock:
+        conn.executemany("""
+            INSERT OR REPLACE INTO earnings_cache (ticker, earnings_date, last_updated)
+            VALUES (?, ?, ?)
+        """, [(t, d, now) for t, d in rows])
+        conn.commit()
+
+
+def _stale_earnings(conn: sqlite3.Connection, tickers: list, ttl: float) -> list:
+    """캐시에 없거나 TTL이 지났거나 발표일이 이미 지난 종목."""
+    today = time.strftime("%Y-%m-%d")
+    fresh = set()
+    for i in range(0, len(tickers), 500):
+        chunk = tickers[i:i + 500]
+        cursor = conn.execute(f"""
+            SELECT ticker, earnings_date, last_updated FROM earnings_cache
+            WHERE ticker IN ({",".join("?" * len(chunk))})
+        """, chunk)
+        for ticker, earn_date, updated in cursor.fetchall():
+            if time.time() - updated < ttl and (earn_date is None or earn_date >= today):
+                fresh.add(ticker)
+    return [t for t in tickers if t not in fresh]
+
+
+def get_earnings_date(ticker: str, ttl: float = None, fetch: bool = True):
+    """
+    다음 실적 발표일 "YYYY-MM-DD"를 반환합니다 (미정/조회 실패 시 None).
+
+    fetch=False면 캐시만 조회하고 네트워크를 사용하지 않습니다.
+    """
+    if ttl is None:
+        ttl = EARNINGS_TTL
+    conn = _ensure_conn()
+    row = conn.execute(
+        "SELECT earnings_date FROM earnings_cache WHERE ticker = ?", (ticker,)).fetchone()
+    if not fetch or not _stale_earnings(conn, [ticker], ttl):
+        return row[0] if row else None
+    try:
+        earn_date = _fetch_earnings_date(ticker)
+    except Exception as e:
+        logger.warning(f"[CACHE] Failed to fetch earnings date for {ticker}: {e}")
+        _increment_stat("errors")
+        return row[0] if row else None
+    _store_earnings(conn, [(ticker, earn_date)])
+    return earn_date
+
+
+def prefetch_earnings(tickers, ttl: float = None, max_workers: int = 8):
+    """만료된 종목의 실적 발표일을 병렬 조회하여 한 트랜잭션으로 저장 (시작 시 워치리스트 전체)."""
+    if ttl is None:
+        ttl = EARNINGS_TTL
+    conn = _ensure_conn()
+    stale = _stale_earnings(conn, list(dict.fromkeys(tickers)), ttl)
+    if not stale:
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _fetch(ticker):
+        try:
+            return ticker, _fetch_earnings_date(ticker), True
+        except Exception as e:
+            logger.debug(f"[CACHE] Earnings prefetch failed for {ticker}: {e}")
+            return ticker, None, False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        fetched = list(pool.map(_fetch, stale))
+    rows = [(t, d) for t, d, ok in fetched if ok]
+    if rows:
+        _store_earnings(conn, rows)
+    logger.info(f"[CACHE] Earnings dates prefetched: {len(rows)}/{len(stale)}")
+
+
+# ============================================================
+# 시세 캐시 (현재가/등락률/거래량, 짧은 TTL 메모리 캐시)
+# 무거운 Ticker.info 대신 일봉 일괄 요청으로 여러 종목을 한 번에 갱신
+# ============================================================
+
+QUOTE_TTL = 30  # 초 (60초 갱신 주기마다 새 시세)
+
+_quotes = {}   # ticker -> (fetched_at, prepost, quote)
+_quotes_lock = threading.Lock()
+
+
+def get_quotes(tickers, ttl: float = None, prepost: bool = False) -> dict:
+    """
+    여러 종목의 시세를 반환합니다. TTL이 지난 종목만 한 번에 모아 조회합니다.
+
+    Parameters
+    ----------
+    tickers : list[str]
+        종목 티커 목록
+    ttl : float, optional
+        시세 TTL (초). None이면 QUOTE_TTL.
+    prepost : bool
+        프리장/애프터장 가격 포함 여부 (장외 시간 lastPrice)
+
+    Returns
+    -------
+    dict
+        {ticker: {"lastPrice", "regularMarketPrice", "previousClose",
+                  "changePercent", "volume"}} — 조회 실패 종목은 빠짐
+    """
+    if ttl is None:
+        ttl = QUOTE_TTL
+    tickers = list(dict.fromkeys(tickers))
+    now = time.time()
+    result = {}
+    stale = []
+    with _quotes_lock:
+        for ticker in tickers:
+            entry = _quotes.get(ticker)
+            if entry is not None and now - entry[0] < ttl and entry[1] == prepost:
+                result[ticker] = entry[2]
+            else:
+                stale.append(ticker)
+    _increment_stat("quote_hits", len(result))
+    if not stale:
+        return result
+
+    _increment_stat("quote_batches")
+    try:
+        fetched = get_provider().quotes(stale, prepost=prepost)
+    except Exception as e:
+        logger.warning(f"[CACHE] Quote batch failed ({len(stale)} tickers): {e}")
+        _increment_stat("errors")
+        fetched = {}
+
+    now = time.time()
+    with _quotes_lock:
+        for ticker in stale:
+            if ticker in fetched:
+                _quotes[ticker] = (now, prepost, fetched[ticker])
+                result[ticker] = fetched[ticker]
+            elif ticker in _quotes:
+                # 조회 실패 시 이전 시세라도 반환
+                result[ticker] = _quotes[ticker][2]
+    return result
+
+
+def get_quote(ticker: str, ttl: float = None, prepost: bool = False) -> dict:
+    """한 종목 시세 (없으면 빈 dict)."""
+    return get_quotes([ticker], ttl, prepost).get(ticker, {})
+
+
+# ============================================================
+# 상위 타임프레임 히스토리 (멀티 타임프레임 확인용)
+# 주봉/일봉을 따로 받지 않고 캐시된 하위 봉을 리샘플, 결과는 인터벌별 TTL 동안 재사용
+# ============================================================
+
+DEFAULT_HTF_TTL = {"1d": 3600, "1wk": 21600}  # 초 (config "cache.htf_ttl_sec"로 변경)
+
+# 인터벌 → resample 규칙 (주봉은 yfinance와 같이 월요일 시작, 월요일 날짜로 표시)
+_RESAMPLE_RULES = {"1d": ("1D", "left"), "1wk": ("W-MON", "left")}
+_RESAMPLE_AGG = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+
+# 리샘플 원본으로 쓸 수 있는 인터벌 (대상보다 짧거나 같은 봉)
+_RESAMPLE_SOURCES = {"1d": _INTRADAY_INTERVALS | {"1d"}, "1wk": _INTRADAY_INTERVALS | {"1d", "5d", "1wk"}}
+
+_htf = {}   # (ticker, interval, period) -> (built_at, DataFrame)
+_htf_lock = threading.Lock()
+
+
+def _htf_ttl(interval: str) -> float:
+    ttl = (_cache_config().get("htf_ttl_sec") or {}).get(interval)
+    return ttl if ttl is not None else DEFAULT_HTF_TTL.get(interval, DEFAULT_TTL_DAILY)
+
+
+def resample_ohlcv(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """OHLCV를 상위 인터벌("1d", "1wk")로 리샘플 (UTC 날짜 경계, 거래 없는 구간 제외)."""
+    rule, label = _RESAMPLE_RULES[interval]
+    agg = {col: how for col, how in _RESAMPLE_AGG.items() if col in df.columns}
+    out = df.resample(rule, label=label, closed="left").agg(agg)
+    return out.dropna(subset=["Close"])
+
+
+def get_higher_timeframe_history(ticker: str, interval: str, period: str,
+                                 base: pd.DataFrame = None, base_interval: str = None,
+                                 min_bars: int = 20, ttl: float = None) -> pd.DataFrame:
+    """
+    상위 타임프레임 히스토리를 반환합니다.
+
+    TTL(인터벌별, 주봉은 기본 6시간) 안에서는 이전 결과의 복사본을 쓰고, 만료 시 아래 순서로
+    봉이 min_bars개 이상 나오는 첫 방법을 사용합니다.
+    1. base(이미 조회한 하위 봉)를 리샘플 — 추가 다운로드 없음
+    2. 주봉: 캐시된 일봉을 리샘플
+    3. 해당 인터벌을 캐시를 통해 직접 조회
+
+    Parameters
+    ----------
+    ticker : str
+        종목 티커 심볼
+    interval : str
+        상위 인터벌 ("1d" 또는 "1wk")
+    period : str
+        조회 기간 (예: "3mo", "2y")
+    base : pd.DataFrame, optional
+        같은 종목의 이미 조회한 히스토리 (새로고침 중인 테이블 데이터)
+    base_interval : str, optional
+        base의 인터벌
+    min_bars : int
+        결과로 인정할 최소 봉 수
+    ttl : float, optional
+        결과 재사용 시간 (초). None이면 config "cache.htf_ttl_sec" 또는 DEFAULT_HTF_TTL.
+
+    Returns
+    -------
+    pd.DataFrame
+        상위 인터벌 OHLCV (실패 시 빈 DataFrame)
+    """
+    if ttl is None:
+        ttl = _htf_ttl(interval)
+    key = (ticker, interval, period)
+    with _htf_lock:
+        entry = _htf.get(key)
+    if entry is not None and time.time() - entry[0] < ttl:
+        _increment_stat("htf_hits")
+        return entry[1].copy()
+
+    result = None
+    sources = _RESAMPLE_SOURCES.get(interval, ())
+    if base is not None and not base.empty and base_interval in sources:
+        result = resample_ohlcv(base, interval) if base_interval != interval else base
+    if (result is None or len(result) < min_bars) and interval == "1wk":
+        daily = get_cached_history(ticker, period=period, interval="1d")
+        if not daily.empty:
+            result = resample_ohlcv(daily, interval)
+    if result is not None and len(result) >= min_bars:
+        _increment_stat("htf_resampled")
+    else:
+        result = get_cached_history(ticker, period=period, interval=interval, ttl=ttl)
+
+    if not result.empty:
+        # 보관본은 따로 복사 (호출자가 결과나 base를 수정해도 TTL 동안 재사용하는 봉이 바뀌지 않도록)
+        with _htf_lock:
+            _htf[key] = (time.time(), result.copy())
+    return result
+
+
 def get_cache_stats() -> dict:
     """
     캐시 통계를 반환합니다.
@@ -504,8 +1636,8 @@ def get_cache_stats() -> dict:
     Returns
     -------
     dict
-        hits, misses, delta_updates, errors, hit_rate, db_size_mb,
-        cached_tickers, total_rows
+        hits, misses, delta_updates, batch_downloads, errors, quote_hits,
+        quote_batches, coalesced, evictions, evicted_rows, htf_hits, htf_resampled, hit_rate, db_size_mb, cached_tickers, total_rows, backend
     """
     conn = _ensure_conn()
 
@@ -522,12 +1654,8 @@ def get_cache_stats() -> dict:
         stats["db_size_mb"] = 0.0
 
     # 캐시된 종목 수 및 총 행 수
-    with _db_lock:
-        cursor = conn.execute(
-            "SELECT COUNT(DISTINCT ticker) FROM price_cache")
-        stats["cached_tickers"] = cursor.fetchone()[0]
-
-        cursor = conn.execute("SELECT COUNT(*) FROM price_cache")
-        stats["total_rows"] = cursor.fetchone()[0]
+    store = _get_store()
+    stats["cached_tickers"], stats["total_rows"] = store.stats(conn)
+    stats["backend"] = store.name
 
     return stats
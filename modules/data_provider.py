@@ -0,0 +1,704 @@
+"""
+시장 데이터 공급자 (DataProvider) 추상화.
+
+모든 모듈은 yfinance를 직접 호출하지 않고 get_provider()를 거쳐 조회합니다.
+config.json "data_provider": {"name": "yfinance" | "replay" | "synthetic", ...}
+
+- YFinanceProvider: 실제 yfinance (기본값)
+- ReplayProvider: record_replay()로 저장해 둔 OHLCV/info/뉴스 파일을 그대로 재생
+                  (네트워크 없이 결정적, latency_ms로 응답 지연 흉내)
+- SyntheticProvider: 종목명을 시드로 한 결정적 랜덤워크 시세 (대규모 유니버스 벤치마크용)
+
+공급자는 yf.download()와 같은 형태의 download()와,
+yf.Ticker처럼 info/fast_info/calendar/news/history()를 가진 ticker()를 제공합니다.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+_INTRADAY_INTERVALS = {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"}
+_INTERVAL_MINUTES = {"1m": 1, "2m": 2, "5m": 5, "15m": 15, "30m": 30,
+                     "60m": 60, "90m": 90, "1h": 60}
+_MARKET_TZ = "America/New_York"
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9._^=-]")
+
+
+def _safe_name(name: str) -> str:
+    return _SAFE_NAME.sub("_", name)
+
+
+def _to_utc(value) -> pd.Timestamp:
+    """날짜 문자열/datetime을 UTC Timestamp로 (tz-naive는 UTC로 간주)."""
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tz is None else ts.tz_convert("UTC")
+
+
+def _period_offset(period: str):
+    """yfinance period 문자열을 DateOffset으로. "max"는 None."""
+    if not period or period == "max":
+        return None
+    match = re.fullmatch(r"(\d+)(d|wk|mo|y)", period)
+    if match is None:
+        raise ValueError(f"Invalid period: {period}")
+    n, unit = int(match.group(1)), match.group(2)
+    return {"d": pd.DateOffset(days=n), "wk": pd.DateOffset(weeks=n),
+            "mo": pd.DateOffset(months=n), "y": pd.DateOffset(years=n)}[unit]
+
+
+class DataProvider:
+    """공급자 기본 인터페이스."""
+
+    name = "base"
+
+    def download(self, tickers, period: str = None, interval: str = "1d",
+                 start=None, end=None, group_by: str = "column", **kwargs) -> pd.DataFrame:
+        """yf.download 호환 다운로드."""
+        raise NotImplementedError
+
+    def ticker(self, symbol: str):
+        """yf.Ticker 호환 객체."""
+        return ProviderTicker(self, symbol)
+
+    def history(self, symbol: str, period: str = "1mo", interval: str = "1d",
+                start=None, end=None) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def info(self, symbol: str) -> dict:
+        raise NotImplementedError
+
+    def fast_info(self, symbol: str) -> dict:
+        raise NotImplementedError
+
+    def calendar(self, symbol: str) -> dict:
+        return {}
+
+    def news(self, symbol: str, count: int = 25) -> list:
+        return []
+
+    def quotes(self, symbols, prepost: bool = False) -> dict:
+        """여러 종목 시세를 한 번의 일봉 요청(+ 장외 시간이면 1분봉 요청)으로 조회.
+
+        Returns {symbol: {"lastPrice", "regularMarketPrice", "previousClose",
+                          "changePercent", "volume"}} — 데이터 없는 종목은 빠짐
+        """
+        symbols = list(symbols)
+        if not symbols:
+            return {}
+        daily = self.download(symbols, period="5d", interval="1d", group_by="ticker",
+                              progress=False, threads=True)
+        extended = None
+        if prepost:
+            try:
+                extended = self.download(symbols, period="1d", interval="1m", prepost=True,
+                                         group_by="ticker", progress=False, threads=True)
+            except Exception as e:
+                logger.warning(f"[PROVIDER] Extended-hours quotes failed: {e}")
+
+        result = {}
+        for symbol in symbols:
+            bars = _symbol_frame(daily, symbol)
+            if bars is None or "Close" not in bars:
+                continue
+            bars = bars.dropna(subset=["Close"])
+            if bars.empty:
+                continue
+            regular = float(bars["Close"].iloc[-1])
+            prev = float(bars["Close"].iloc[-2]) if len(bars) > 1 else None
+            last = regular
+            ext_bars = _symbol_frame(extended, symbol)
+            if ext_bars is not None and "Close" in ext_bars:
+                ext_close = ext_bars["Close"].dropna()
+                if not ext_close.empty:
+                    last = float(ext_close.iloc[-1])
+            result[symbol] = {
+                "lastPrice": last,
+                "regularMarketPrice": regular,
+                "previousClose": prev,
+                "changePercent": (regular / prev - 1) * 100 if prev else 0.0,
+                "volume": float(bars["Volume"].iloc[-1]) if "Volume" in bars else None,
+            }
+        return result
+
+
+def _symbol_frame(df: pd.DataFrame, symbol: str):
+    """group_by="ticker" 다운로드 결과에서 한 종목 부분 (없으면 None)."""
+    if df is None or df.empty:
+        return None
+    if isinstance(df.columns, pd.MultiIndex):
+        if symbol not in df.columns.get_level_values(0):
+            return None
+        return df[symbol]
+    return df
+
+
+class ProviderTicker:
+    """yf.Ticker 대용 객체 (stock_score 등이 쓰는 속성만, 조회는 공급자 메서드로 위임)."""
+
+    def __init__(self, provider: DataProvider, symbol: str):
+        self.provider = provider
+        self.ticker = symbol
+
+    @property
+    def info(self) -> dict:
+        return self.provider.info(self.ticker)
+
+    @property
+    def fast_info(self) -> dict:
+        return self.provider.fast_info(self.ticker)
+
+    @property
+    def calendar(self) -> dict:
+        return self.provider.calendar(self.ticker)
+
+    @property
+    def news(self) -> list:
+        return self.provider.news(self.ticker)
+
+    def get_news(self, count: int = 25, **kwargs) -> list:
+        return self.provider.news(self.ticker, count)
+
+    def history(self, period: str = "1mo", interval: str = "1d",
+                start=None, end=None, **kwargs) -> pd.DataFrame:
+        return self.provider.history(self.ticker, period=period, interval=interval,
+                                     start=start, end=end)
+
+
+# ============================================================
+# yfinance
+# ============================================================
+
+class _YFErrorLog(logging.Handler):
+    """with 블록 동안 현재 스레드에서 yfinance 로거로 나온 ERROR 메시지를 모음.
+
+    다른 스레드(동시에 도는 prefetch 일괄 조회 등)의 메시지는 섞이지 않음.
+    """
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.thread = threading.get_ident()
+        self.messages = []
+
+    def emit(self, record):
+        if record.thread == self.thread:
+            self.messages.append(record.getMessage())
+
+    def __enter__(self):
+        logging.getLogger("yfinance").addHandler(self)
+        return self
+
+    def __exit__(self, *exc):
+        logging.getLogger("yfinance").removeHandler(self)
+        return False
+
+
+def _throttled_symbols(messages, symbols) -> list:
+    """레이트 리밋 메시지에 나온 종목 (종목을 알 수 없는 형식이면 요청한 종목 전체)."""
+    from rate_limit import is_rate_limit_error
+    limited = "\n".join(m for m in messages if is_rate_limit_error(Exception(m))).upper()
+    if not limited:
+        return []
+    named = [s for s in symbols
+             if re.search(rf"(?<![\w.^=-]){re.escape(s.upper())}(?![\w.^=-])", limited)]
+    return named or list(symbols)
+
+
+def _missing_symbols(df, symbols) -> list:
+    """결과에 없거나 값이 모두 NaN인 종목 (MultiIndex면 종목이 있는 열 레벨에서 찾음)."""
+    if df is None or df.empty:
+        return list(symbols)
+    if not isinstance(df.columns, pd.MultiIndex):
+        # 단일 종목 형태
+        return [] if df.notna().to_numpy().any() else list(symbols)
+    missing = []
+    for symbol in symbols:
+        for level in range(df.columns.nlevels):
+            mask = df.columns.get_level_values(level).astype(str).str.upper() == symbol.upper()
+            if mask.any():
+                if not df.loc[:, mask].notna().to_numpy().any():
+                    missing.append(symbol)
+                break
+        else:
+            missing.append(symbol)
+    return missing
+
+
+class YFinanceProvider(DataProvider):
+    """실제 yfinance 호출 (기본 공급자).
+
+    모든 요청은 rate_limit.RequestGuard(프로세스 공용 토큰 버킷 + 재시도 + 서킷 브레이커)를
+    거치며, ticker()도 yf.Ticker 대신 ProviderTicker를 돌려줘 속성 조회까지 같은 경로로 보낸다.
+    """
+
+    name = "yfinance"
+
+    def __init__(self, guard=None, yf=None):
+        from rate_limit import get_guard
+        if yf is None:
+            import yfinance as yf
+        self._yf = yf   # yfinance 모듈 (벤치마크에서는 같은 형태의 가짜 모듈)
+        self._guard = guard or get_guard()
+
+    def _guarded(self, func, symbols, cost: float, name: str):
+        """func()를 가드 안에서 호출하고, 이번 호출의 yfinance 오류 로그로 레이트 리밋을 판정.
+
+        yf.download는 종목별 실패를 예외 대신 로그로만 남기고 빈 열을 돌려주며
+        (1.x: 호출별 ctx.errors, 0.2.x: 호출마다 초기화되는 전역 shared._ERRORS),
+        Ticker.history도 설정/버전에 따라 예외를 숨기므로, 호출한 스레드의 로그 중 레이트 리밋
+        메시지에 나온 종목이 결과에서 비어 있으면 RateLimitedError로 바꿔 재시도/백오프/차단에 반영한다.
+        """
+        from rate_limit import RateLimitedError
+
+        def _call():
+            with _YFErrorLog() as log:
+                result = func()
+            throttled = set(_throttled_symbols(log.messages, symbols)) & set(_missing_symbols(result, symbols))
+            if throttled:
+                raise RateLimitedError(f"Rate limited: {', '.join(sorted(throttled)[:5])}")
+            return result
+        return self._guard.call(_call, cost=cost, name=name)
+
+    def download(self, tickers, **kwargs) -> pd.DataFrame:
+        symbols = tickers.split() if isinstance(tickers, str) else list(tickers)
+        return self._guarded(lambda: self._yf.download(tickers, **kwargs), symbols,
+                             cost=max(1, len(symbols)), name=f"download({len(symbols)})")
+
+    def history(self, symbol: str, period: str = "1mo", interval: str = "1d",
+                start=None, end=None) -> pd.DataFrame:
+        return self._guarded(
+            lambda: self._yf.Ticker(symbol).history(period=period, interval=interval,
+                                                    start=start, end=end),
+            [symbol], cost=1, name=f"history({symbol})")
+
+    def info(self, symbol: str) -> dict:
+        return self._guard.call(lambda: self._yf.Ticker(symbol).info, name=f"info({symbol})")
+
+    def fast_info(self, symbol: str) -> dict:
+        return self._guard.call(lambda: dict(self._yf.Ticker(symbol).fast_info),
+                                name=f"fast_info({symbol})")
+
+    def calendar(self, symbol: str) -> dict:
+        return self._guard.call(lambda: self._yf.Ticker(symbol).calendar, name=f"calendar({symbol})")
+
+    def news(self, symbol: str, count: int = 25) -> list:
+        return self._guard.call(lambda: self._yf.Ticker(symbol).get_news(count=count) or [],
+                                name=f"news({symbol})")
+
+
+# ============================================================
+# 오프라인 공급자 공통 (기간 해석 / yfinance 형태 변환 / 지연)
+# ============================================================
+
+class _OfflineProvider(DataProvider):
+    """전체 시세를 _bars()로 받아 기간을 자르고 yfinance 형태로 돌려주는 공통부."""
+
+    def __init__(self, latency_ms: float = 0):
+        self.latency_ms = latency_ms
+
+    def _sleep(self):
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+
+    def _anchor(self, symbol: str, interval: str) -> pd.Timestamp:
+        """period 기준 시각 (기본: 현재)."""
+        return pd.Timestamp.now(tz="UTC")
+
+    def _bars(self, symbol: str, interval: str, start: pd.Timestamp,
+              end: pd.Timestamp) -> pd.DataFrame:
+        """[start, end) 구간 UTC 인덱스 OHLCV (start None = 처음부터)."""
+        raise NotImplementedError
+
+    def _range(self, symbol: str, period, interval: str, start, end):
+        end_ts = _to_utc(end) if end is not None else None
+        if start is not None:
+            return _to_utc(start), end_ts
+        anchor = self._anchor(symbol, interval)
+        if period == "ytd":
+            return anchor.normalize().replace(month=1, day=1), end_ts
+        offset = _period_offset(period or "1mo")
+        return (anchor - offset if offset is not None else None), end_ts
+
+    def _frame(self, symbol: str, period, interval: str, start, end) -> pd.DataFrame:
+        start_ts, end_ts = self._range(symbol, period, interval, start, end)
+        df = self._bars(symbol, interval, start_ts, end_ts)
+        if df.empty:
+            return df
+        if start_ts is not None:
+            df = df[df.index >= start_ts]
+        if end_ts is not None:
+            df = df[df.index < end_ts]
+        return df
+
+    def download(self, tickers, period: str = None, interval: str = "1d",
+                 start=None, end=None, group_by: str = "column", **kwargs) -> pd.DataFrame:
+        self._sleep()
+        single = isinstance(tickers, str)
+        symbols = [tickers] if single else list(tickers)
+        frames = {}
+        for symbol in symbols:
+            df = self._frame(symbol, period, interval, start, end)
+            # yf.download: 일봉은 tz-naive 날짜, 인트라데이는 거래소 시간대
+            if not df.empty:
+                if interval in _INTRADAY_INTERVALS:
+                    df.index = df.index.tz_convert(_MARKET_TZ)
+                else:
+                    df.index = df.index.tz_localize(None)
+                df.index.name = "Datetime" if interval in _INTRADAY_INTERVALS else "Date"
+            frames[symbol] = df
+        if single:
+            return frames[tickers]
+        frames = {s: df for s, df in frames.items() if not df.empty}
+        if not frames:
+            return pd.DataFrame()
+        merged = pd.concat(frames, axis=1)
+        if group_by != "ticker":
+            merged = merged.swaplevel(0, 1, axis=1).sort_index(axis=1, level=0)
+        return merged
+
+    def history(self, symbol: str, period: str = "1mo", interval: str = "1d",
+                start=None, end=None) -> pd.DataFrame:
+        self._sleep()
+        df = self._frame(symbol, period, interval, start, end)
+        if not df.empty:
+            # Ticker.history: 인트라데이는 거래소 시각, 일봉 이상은 거래소 자정
+            if interval in _INTRADAY_INTERVALS:
+                df.index = df.index.tz_convert(_MARKET_TZ)
+            else:
+                df.index = df.index.tz_localize(None).tz_localize(_MARKET_TZ)
+        return df
+
+    def fast_info(self, symbol: str) -> dict:
+        daily = self._frame(symbol, "1y", "1d", None, None)
+        if daily.empty:
+            return {}
+        close = daily["Close"]
+        return {
+            "lastPrice": float(close.iloc[-1]),
+            "previousClose": float(close.iloc[-2]) if len(close) > 1 else float(close.iloc[-1]),
+            "open": float(daily["Open"].iloc[-1]),
+            "dayHigh": float(daily["High"].iloc[-1]),
+            "dayLow": float(daily["Low"].iloc[-1]),
+            "lastVolume": float(daily["Volume"].iloc[-1]),
+            "yearHigh": float(daily["High"].max()),
+            "yearLow": float(daily["Low"].min()),
+        }
+
+
+# ============================================================
+# 재생 (녹화 파일)
+# ============================================================
+
+class ReplayProvider(_OfflineProvider):
+    """record_replay()로 저장한 파일 재생.
+
+    root/ohlcv/<interval>/<TICKER>.csv  — UTC 인덱스 OHLCV
+    root/info/<TICKER>.json             — {"info", "calendar", "news"}
+
+    period는 현재 시각이 아니라 녹화된 마지막 봉을 기준으로 잘라 항상 같은 결과를 낸다.
+    """
+
+    name = "replay"
+
+    def __init__(self, root: str, latency_ms: float = 0):
+        super().__init__(latency_ms)
+        self.root = root
+        self._frames = {}
+        self._lock = threading.Lock()
+
+    def _load(self, symbol: str, interval: str) -> pd.DataFrame:
+        key = (symbol, interval)
+        with self._lock:
+            if key not in self._frames:
+                path = os.path.join(self.root, "ohlcv", _safe_name(interval),
+                                    _safe_name(symbol) + ".csv")
+                try:
+                    df = pd.read_csv(path, index_col=0)
+                    df.index = pd.to_datetime(df.index, utc=True)
+                    df = df[[c for c in OHLCV_COLUMNS if c in df.columns]].sort_index()
+                except FileNotFoundError:
+                    logger.debug(f"[REPLAY] No recording for {symbol} ({interval})")
+                    df = pd.DataFrame(columns=OHLCV_COLUMNS,
+                                      index=pd.DatetimeIndex([], tz="UTC"))
+                self._frames[key] = df
+            return self._frames[key]
+
+    def _anchor(self, symbol: str, interval: str) -> pd.Timestamp:
+        df = self._load(symbol, interval)
+        return df.index[-1] if not df.empty else pd.Timestamp.now(tz="UTC")
+
+    def _bars(self, symbol, interval, start, end) -> pd.DataFrame:
+        return self._load(symbol, interval).copy()
+
+    def _meta(self, symbol: str) -> dict:
+        path = os.path.join(self.root, "info", _safe_name(symbol) + ".json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def info(self, symbol: str) -> dict:
+        self._sleep()
+        return dict(self._meta(symbol).get("info", {}))
+
+    def calendar(self, symbol: str) -> dict:
+        return self._meta(symbol).get("calendar", {})
+
+    def news(self, symbol: str, count: int = 25) -> list:
+        self._sleep()
+        return self._meta(symbol).get("news", [])[:count]
+
+
+def record_replay(root: str, tickers, period: str = "2y", intervals=("1d",),
+                  provider: DataProvider = None):
+    """ReplayProvider가 읽을 수 있도록 시세/info/캘린더/뉴스를 파일로 저장.
+
+    intervals의 인트라데이 항목은 yfinance 조회 가능 기간 안에서 period를 줄여 쓴다.
+    """
+    provider = provider or YFinanceProvider()
+    for interval in intervals:
+        os.makedirs(os.path.join(root, "ohlcv", _safe_name(interval)), exist_ok=True)
+    os.makedirs(os.path.join(root, "info"), exist_ok=True)
+
+    for symbol in tickers:
+        for interval in intervals:
+            p = period if interval not in _INTRADAY_INTERVALS else "30d"
+            df = provider.history(symbol, period=p, interval=interval)
+            if df is None or df.empty:
+                logger.warning(f"[REPLAY] No data to record for {symbol} ({interval})")
+                continue
+            df = df[[c for c in OHLCV_COLUMNS if c in df.columns]]
+            df.index = pd.DatetimeIndex(df.index).tz_convert("UTC")
+            df.to_csv(os.path.join(root, "ohlcv", _safe_name(interval),
+                                   _safe_name(symbol) + ".csv"))
+
+        meta = {}
+        for key, fetch in (("info", provider.info), ("calendar", provider.calendar),
+                           ("news", provider.news)):
+            try:
+                meta[key] = fetch(symbol) or ({} if key != "news" else [])
+            except Exception as e:
+                logger.warning(f"[REPLAY] Failed to record {key} for {symbol}: {e}")
+        with open(os.path.join(root, "info", _safe_name(symbol) + ".json"),
+                  "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, default=str)
+        logger.info(f"[REPLAY] Recorded {symbol}")
+
+
+# ============================================================
+# 합성 시세
+# ============================================================
+
+_SYNTHETIC_SECTORS = ["Technology", "Healthcare", "Financial Services", "Energy",
+                      "Consumer Cyclical", "Industrials", "Utilities", "Real Estate"]
+
+
+class SyntheticProvider(_OfflineProvider):
+    """종목명 시드 기반 결정적 랜덤워크.
+
+    일봉은 고정 기준일(2000-01-03)부터 생성하므로 같은 종목은 언제 조회해도 같은 값이고,
+    인트라데이 봉은 날짜별 시드로 그날 시가(=전일 종가)부터 생성한다.
+    """
+
+    name = "synthetic"
+    _ORIGIN = pd.Timestamp("2000-01-03", tz="UTC")
+
+    def __init__(self, seed: int = 0, latency_ms: float = 0):
+        super().__init__(latency_ms)
+        self.seed = seed
+        self._daily = {}
+        self._calendar = (None, None)
+        self._lock = threading.Lock()
+
+    def _seed(self, *parts) -> int:
+        return zlib.crc32("|".join(map(str, (self.seed,) + parts)).encode())
+
+    def _daily_bars(self, symbol: str) -> pd.DataFrame:
+        """기준일부터 오늘까지의 일봉 (종목별 메모리 캐시)."""
+        today = pd.Timestamp.now(tz="UTC").normalize()
+        with self._lock:
+            cached = self._daily.get(symbol)
+            if cached is not None and cached.index[-1] >= today - pd.Timedelta(days=3):
+                return cached
+        index = self._business_days(today)
+        rng = np.random.default_rng(self._seed(symbol, "1d"))
+        n = len(index)
+        drift = rng.uniform(-0.0002, 0.0006)
+        vol = rng.uniform(0.01, 0.03)
+        close = rng.uniform(20, 300) * np.exp(np.cumsum(rng.normal(drift, vol, n)))
+        open_ = np.concatenate([[close[0]], close[:-1]]) * (1 + rng.normal(0, vol / 4, n))
+        spread = np.abs(rng.normal(0, vol / 2, n))
+        high = np.maximum(open_, close) * (1 + spread)
+        low = np.minimum(open_, close) * (1 - spread)
+        volume = rng.lognormal(np.log(rng.uniform(2e5, 5e7)), 0.4, n).round()
+        df = pd.DataFrame({"Open": open_, "High": high, "Low": low, "Close": close,
+                           "Volume": volume}, index=index)
+        with self._lock:
+            self._daily[symbol] = df
+        return df
+
+    def _business_days(self, today) -> pd.DatetimeIndex:
+        """기준일부터 today까지의 영업일 인덱스 (모든 종목이 공유, 생성 비용이 커서 하루 단위로 캐시)."""
+        with self._lock:
+            day, index = self._calendar
+            if day == today:
+                return index
+        index = pd.bdate_range(self._ORIGIN, today, name="Date")
+        with self._lock:
+            self._calendar = (today, index)
+        return index
+
+    def _intraday_bars(self, symbol: str, interval: str, start, end) -> pd.DataFrame:
+        daily = self._daily_bars(symbol)
+        minutes = _INTERVAL_MINUTES[interval]
+        days = daily.index
+        if start is not None:
+            days = days[days >= start.normalize()]
+        if end is not None:
+            days = days[days < end]
+        now = pd.Timestamp.now(tz="UTC")
+        frames = []
+        for day in days:
+            session_open = pd.Timestamp(day.date()).tz_localize(_MARKET_TZ) + pd.Timedelta(hours=9, minutes=30)
+            bars = pd.date_range(session_open, periods=390 // minutes, freq=f"{minutes}min")
+            bars = bars[bars <= now]
+            if len(bars) == 0:
+                continue
+            rng = np.random.default_rng(self._seed(symbol, interval, day.date()))
+            prev_close = daily["Open"].loc[day]
+            step_vol = 0.02 * np.sqrt(minutes / 390)
+            close = prev_close * np.exp(np.cumsum(rng.normal(0, step_vol, len(bars))))
+            open_ = np.concatenate([[prev_close], close[:-1]])
+            spread = np.abs(rng.normal(0, step_vol / 2, len(bars)))
+            frames.append(pd.DataFrame({
+                "Open": open_,
+                "High": np.maximum(open_, close) * (1 + spread),
+                "Low": np.minimum(open_, close) * (1 - spread),
+                "Close": close,
+                "Volume": rng.lognormal(10, 0.5, len(bars)).round(),
+            }, index=bars.tz_convert("UTC")))
+        if not frames:
+            return pd.DataFrame(columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([], tz="UTC"))
+        return pd.concat(frames)
+
+    def _bars(self, symbol, interval, start, end) -> pd.DataFrame:
+        if interval in _INTRADAY_INTERVALS:
+            return self._intraday_bars(symbol, interval, start, end)
+        daily = self._daily_bars(symbol)
+        if interval in ("1d", "5d"):
+            return daily.copy()
+        # yfinance처럼 주봉은 월요일, 월/분기봉은 첫날 기준
+        rule = {"1mo": "MS", "3mo": "QS"}.get(interval, "W-MON")
+        return daily.resample(rule, label="left", closed="left").agg({"Open": "first", "High": "max", "Low": "min",
+                                         "Close": "last", "Volume": "sum"}).dropna()
+
+    def info(self, symbol: str) -> dict:
+        self._sleep()
+        rng = np.random.default_rng(self._seed(symbol, "info"))
+        daily = self._daily_bars(symbol)
+        last = daily.iloc[-252:]
+        price = float(last["Close"].iloc[-1])
+        eps = price / rng.uniform(8, 45)
+        return {
+            "symbol": symbol,
+            "shortName": f"{symbol} Synthetic Inc.",
+            "longName": f"{symbol} Synthetic Incorporated",
+            "sector": _SYNTHETIC_SECTORS[self._seed(symbol) % len(_SYNTHETIC_SECTORS)],
+            "quoteType": "EQUITY",
+            "currency": "USD",
+            "currentPrice": price,
+            "regularMarketPrice": price,
+            "previousClose": float(last["Close"].iloc[-2]),
+            "marketCap": float(price * rng.uniform(5e7, 5e9)),
+            "trailingPE": price / eps,
+            "forwardPE": price / (eps * rng.uniform(0.9, 1.3)),
+            "trailingEps": eps,
+            "priceToBook": float(rng.uniform(0.8, 12)),
+            "returnOnEquity": float(rng.uniform(-0.1, 0.45)),
+            "debtToEquity": float(rng.uniform(5, 250)),
+            "revenueGrowth": float(rng.uniform(-0.1, 0.4)),
+            "earningsGrowth": float(rng.uniform(-0.2, 0.5)),
+            "profitMargins": float(rng.uniform(-0.05, 0.35)),
+            "dividendYield": float(rng.uniform(0, 4)),
+            "beta": float(rng.uniform(0.5, 1.8)),
+            "fiftyTwoWeekHigh": float(last["High"].max()),
+            "fiftyTwoWeekLow": float(last["Low"].min()),
+            "averageVolume": float(last["Volume"].mean()),
+            "shortPercentOfFloat": float(rng.uniform(0, 0.15)),
+            "heldPercentInsiders": float(rng.uniform(0, 0.3)),
+            "targetMeanPrice": price * float(rng.uniform(0.85, 1.3)),
+            "recommendationKey": ["strong_buy", "buy", "hold", "sell"][int(rng.integers(0, 4))],
+        }
+
+    def calendar(self, symbol: str) -> dict:
+        # 분기마다 종목별로 같은 요일 오프셋에 실적 발표
+        today = pd.Timestamp.now().normalize()
+        quarter_start = today.to_period("Q").start_time
+        earn = quarter_start + pd.Timedelta(days=20 + self._seed(symbol, "earn") % 40)
+        if earn < today:
+            earn = (quarter_start + pd.offsets.QuarterBegin(startingMonth=1)
+                    + pd.Timedelta(days=20 + self._seed(symbol, "earn") % 40))
+        return {"Earnings Date": [earn.date()]}
+
+    def news(self, symbol: str, count: int = 25) -> list:
+        self._sleep()
+        now = int(time.time())
+        return [{"content": {"title": f"{symbol} synthetic headline #{i + 1}",
+                             "provider": {"displayName": "Synthetic Wire"},
+                             "canonicalUrl": {"url": f"https://example.com/{symbol}/{i}"},
+                             "pubDate": pd.Timestamp(now - i * 3600, unit="s",
+                                                     tz="UTC").strftime("%Y-%m-%dT%H:%M:%SZ")}}
+                for i in range(min(count, 10))]
+
+
+# ============================================================
+# 공급자 선택 (config.json "data_provider")
+# ============================================================
+
+_provider = None
+_provider_lock = threading.Lock()
+
+
+def create_provider(name: str = "yfinance", **options) -> DataProvider:
+    """이름으로 공급자 생성. 알 수 없는 이름이면 yfinance."""
+    if name == "replay":
+        return ReplayProvider(options.get("replay_dir") or "replay_data",
+                              latency_ms=options.get("latency_ms", 0))
+    if name == "synthetic":
+        return SyntheticProvider(seed=options.get("seed", 0),
+                                 latency_ms=options.get("latency_ms", 0))
+    return YFinanceProvider()
+
+
+def get_provider() -> DataProvider:
+    """설정에 따른 공급자 (lazy init)."""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                try:
+                    import config
+                    options = dict(config.config.get("data_provider", {}) or {})
+                except Exception:
+                    options = {}
+                _provider = create_provider(options.pop("name", "yfinance"), **options)
+                logger.info(f"[PROVIDER] Market data provider: {_provider.name}")
+    return _provider
+
+
+def set_provider(provider: DataProvider):
+    """공급자 교체 (벤치마크/부하 테스트용)."""
+    global _provider
+    with _provider_lock:
+        _provider = provider
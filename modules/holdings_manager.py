@@ -10,7 +10,8 @@ from datetime import datetime, timedelta
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
+
+from data_provider import get_provider
 
 HOLDINGS_FILE = "holdings.json"
 _holdings_lock = threading.Lock()
@@ -266,7 +267,7 @@ def compute_portfolio_value_history(holdings, start_date, end_date):
         return pd.Series(dtype=float)
 
     try:
-        data = yf.download(tickers, start=start_date, end=end_date, interval="1d")
+        data = get_provider().download(tickers, start=start_date, end=end_date, interval="1d")
         if data.empty:
             return pd.Series(dtype=float)
 
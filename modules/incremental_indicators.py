@@ -0,0 +1,541 @@
+"""
+증분 지표 엔진.
+
+종목(ticker, interval)마다 지표 계산 상태를 유지하여, 새 봉이 들어오면 전체 히스토리를
+다시 계산하지 않고 새 봉만 반영합니다 (봉 하나당 히스토리 길이와 무관한 O(1)).
+stock_score의 일괄 계산 함수와 같은 정의를 따릅니다.
+
+- 이동평균/RSI/ATR/ADX/%D: 링 버퍼 + 누적 합 (일괄 계산과 같은 단순 이동평균)
+- MACD: EMA 점화식 (ewm(adjust=False)와 동일)
+- 볼린저 밴드: 링 버퍼 (표준편차는 창 안에서 직접 계산)
+- 스토캐스틱/일목균형표: 단조 덱으로 구간 최고/최저
+- OBV/VWAP: 누적 합 (조회 구간 시작이 밀리면 빠진 봉만큼 차감)
+
+장중에는 마지막 봉이 계속 바뀌므로 상태에는 확정 봉(마지막 직전까지)만 반영하고,
+조회 시 상태를 복사해 마지막 봉을 얹어 계산합니다 (복사 비용은 지표 창 크기에만 비례).
+구간 시작이 밀린 뒤의 EMA는 더 앞선 봉에서 시작한 값이라 일괄 계산과 미세하게 다를 수 있습니다
+(수십 봉 이후 기여분은 부동소수점 오차 수준).
+"""
+
+import logging
+import math
+import threading
+from collections import OrderedDict, deque
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NAN = float("nan")
+
+# 누적 합 오차가 쌓이지 않도록 이 횟수마다 창 전체 합을 다시 계산
+_RESYNC_EVERY = 1024
+
+# 구간 길이가 이보다 짧으면 증분 대신 다시 구축 (첫 봉 경계 효과가 창 안에 남는 경우)
+_MIN_INCREMENTAL_BARS = 160
+
+DEFAULT_PARAMS = {
+    "rsi_period": 14,
+    "ma_short": 5,
+    "ma_long": 20,
+    "macd": (12, 26, 9),
+    "bb_period": 20,
+    "bb_std": 2.0,
+    "atr_period": 14,
+    "adx_period": 14,
+    "stoch": (14, 3),
+    "ichimoku": (9, 26, 52),
+    "obv_window": 10,
+}
+
+
+class _Window:
+    """고정 길이 링 버퍼 + 누적 합 (NaN은 개수로 따로 셈)."""
+
+    __slots__ = ("size", "values", "total", "nans", "_pushes")
+
+    def __init__(self, size):
+        self.size = size
+        self.values = deque()
+        self.total = 0.0
+        self.nans = 0
+        self._pushes = 0
+
+    def copy(self):
+        other = _Window.__new__(_Window)
+        other.size = self.size
+        other.values = deque(self.values)
+        other.total = self.total
+        other.nans = self.nans
+        other._pushes = self._pushes
+        return other
+
+    def push(self, x):
+        if len(self.values) == self.size:
+            old = self.values.popleft()
+            if math.isfinite(old):
+                self.total -= old
+            else:
+                self.nans -= 1
+        self.values.append(x)
+        if math.isfinite(x):
+            self.total += x
+        else:
+            self.nans += 1
+        self._pushes += 1
+        if self._pushes >= _RESYNC_EVERY:
+            self._pushes = 0
+            self.total = math.fsum(v for v in self.values if math.isfinite(v))
+
+    def mean(self):
+        """rolling(window=size).mean()의 마지막 값 (창이 덜 찼거나 NaN이 있으면 NaN)."""
+        if len(self.values) < self.size or self.nans:
+            return NAN
+        return self.total / self.size
+
+    def partial_mean(self):
+        """iloc[-size:].mean()과 같은 값 (봉이 모자라면 있는 만큼, NaN 제외)."""
+        count = len(self.values) - self.nans
+        return self.total / count if count else NAN
+
+
+class _Extreme:
+    """단조 덱으로 최근 size개 봉의 최고(또는 최저)값 유지."""
+
+    __slots__ = ("size", "is_max", "items")
+
+    def __init__(self, size, is_max):
+        self.size = size
+        self.is_max = is_max
+        self.items = deque()
+
+    def copy(self):
+        other = _Extreme.__new__(_Extreme)
+        other.size = self.size
+        other.is_max = self.is_max
+        other.items = deque(self.items)
+        return other
+
+    def push(self, i, x):
+        items = self.items
+        if self.is_max:
+            while items and items[-1][1] <= x:
+                items.pop()
+        else:
+            while items and items[-1][1] >= x:
+                items.pop()
+        items.append((i, x))
+        while items[0][0] <= i - self.size:
+            items.popleft()
+
+    def value(self, count):
+        """rolling(window=size).max()/min()의 마지막 값 (봉이 모자라면 NaN)."""
+        return self.items[0][1] if count >= self.size and self.items else NAN
+
+
+class _Ema:
+    """ewm(span, adjust=False).mean()과 같은 점화식."""
+
+    __slots__ = ("alpha", "value")
+
+    def __init__(self, span):
+        self.alpha = 2.0 / (span + 1)
+        self.value = None
+
+    def copy(self):
+        other = _Ema.__new__(_Ema)
+        other.alpha = self.alpha
+        other.value = self.value
+        return other
+
+    def push(self, x):
+        self.value = x if self.value is None else self.value + self.alpha * (x - self.value)
+        return self.value
+
+
+class IndicatorState:
+    """한 종목·인터벌의 지표 상태. push()로 봉을 하나씩 반영하고 values()로 최신값 조회."""
+
+    def __init__(self, params: dict):
+        self.params = params
+        p = params
+        self.count = 0            # 구간 안의 봉 수
+        self.index = 0            # 지금까지 반영한 봉 번호 (단조 덱 만료 판단용)
+        self.frame = deque()      # 구간 시작이 밀릴 때 차감할 봉별 기록 [ts, 방향, obv, tp*vol, vol]
+        self.first_ts = None
+        self.last_ts = None
+        self.last_close = NAN
+        self.prev_high = self.prev_low = None
+
+        self.gain = _Window(p["rsi_period"])
+        self.loss = _Window(p["rsi_period"])
+        self.ups = 0              # 구간 안의 상승/하락 봉 수 (RSI 중립 판정)
+        self.downs = 0
+
+        self.ma_short = _Window(p["ma_short"])
+        self.ma_long = _Window(p["ma_long"])
+
+        short, long_, signal = p["macd"]
+        self.ema_short = _Ema(short)
+        self.ema_long = _Ema(long_)
+        self.ema_signal = _Ema(signal)
+        self.macd = NAN
+        self.macd_signal = NAN
+
+        self.bb_closes = deque(maxlen=p["bb_period"])
+        self.bb_recent = deque(maxlen=3)  # (upper, lower, middle) 최근 3봉 (반등 확인용)
+
+        self.tr = _Window(p["atr_period"])
+        self.adx_tr = self.tr if p["adx_period"] == p["atr_period"] else _Window(p["adx_period"])
+        self.plus_dm = _Window(p["adx_period"])
+        self.minus_dm = _Window(p["adx_period"])
+        self.dx = _Window(p["adx_period"])
+
+        k_period, d_period = p["stoch"]
+        self.stoch_low = _Extreme(k_period, is_max=False)
+        self.stoch_high = _Extreme(k_period, is_max=True)
+        self.stoch_k = _Window(d_period)
+
+        tenkan, kijun, senkou_b = p["ichimoku"]
+        self.ichi = {n: (_Extreme(n, True), _Extreme(n, False)) for n in {tenkan, kijun, senkou_b}}
+        self.ichi_a = deque(maxlen=kijun + 1)  # (전환선+기준선)/2 이력 → kijun봉 전 값이 선행스팬A
+        self.ichi_b = deque(maxlen=kijun + 1)
+        self.tenkan = self.kijun = NAN
+
+        self.obv = 0.0            # 절대 누적 OBV (구간 기준값은 obv_base)
+        self.obv_base = 0.0
+        self.obv_window = _Window(p["obv_window"])
+        self.closes = deque(maxlen=p["obv_window"])
+
+        self.tpv_sum = 0.0
+        self.vol_sum = 0.0
+
+    def copy(self) -> "IndicatorState":
+        """마지막 봉을 임시로 얹기 위한 복사 (frame은 공유하며 record=False로만 push)."""
+        other = IndicatorState.__new__(IndicatorState)
+        for name, value in self.__dict__.items():
+            if isinstance(value, (_Window, _Extreme, _Ema)):
+                value = value.copy()
+            elif isinstance(value, deque) and name != "frame":
+                value = deque(value, maxlen=value.maxlen)
+            elif name == "ichi":
+                value = {n: (hi.copy(), lo.copy()) for n, (hi, lo) in value.items()}
+            other.__dict__[name] = value
+        if self.adx_tr is self.tr:
+            other.adx_tr = other.tr
+        return other
+
+    def push(self, ts, o, h, l, c, v, record=True):
+        """봉 하나 반영. record=False면 구간 기록(frame)을 남기지 않음 (임시 봉)."""
+        p = self.params
+        first = self.count == 0
+        prev_close = self.last_close
+
+        # RSI: 변화량의 양/음 부분 (첫 봉은 0)
+        delta = 0.0 if first else c - prev_close
+        direction = (delta > 0) - (delta < 0)
+        self.gain.push(delta if delta > 0 else 0.0)
+        self.loss.push(-delta if delta < 0 else 0.0)
+        if direction > 0:
+            self.ups += 1
+        elif direction < 0:
+            self.downs += 1
+
+        self.ma_short.push(c)
+        self.ma_long.push(c)
+
+        s = self.ema_short.push(c)
+        lg = self.ema_long.push(c)
+        self.macd = s - lg
+        self.macd_signal = self.ema_signal.push(self.macd)
+
+        self.bb_closes.append(c)
+        if len(self.bb_closes) == self.bb_closes.maxlen and len(self.bb_closes) > 1:
+            arr = np.fromiter(self.bb_closes, dtype=np.float64, count=len(self.bb_closes))
+            mid = float(arr.mean())
+            std = float(arr.std(ddof=1))
+            self.bb_recent.append((mid + std * p["bb_std"], mid - std * p["bb_std"], mid))
+        else:
+            self.bb_recent.append((NAN, NAN, NAN))
+
+        # True Range (첫 봉은 고가-저가)
+        if first:
+            tr = h - l
+        else:
+            tr = max(h - l, abs(h - prev_close), abs(l - prev_close))
+        self.tr.push(tr)
+        if self.adx_tr is not self.tr:
+            self.adx_tr.push(tr)
+
+        # ADX: +DM/-DM → DI → DX의 단순 이동평균
+        if first:
+            plus_dm = minus_dm = 0.0
+        else:
+            up = h - self.prev_high
+            down = self.prev_low - l
+            plus_dm = up if (up > down and up > 0) else 0.0
+            minus_dm = down if (down > up and down > 0) else 0.0
+        self.plus_dm.push(plus_dm)
+        self.minus_dm.push(minus_dm)
+        atr = self.adx_tr.mean()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            plus_di = 100 * np.float64(self.plus_dm.mean()) / np.float64(atr)
+            minus_di = 100 * np.float64(self.minus_dm.mean()) / np.float64(atr)
+            dx = float(abs(plus_di - minus_di) / (plus_di + minus_di) * 100)
+        self.dx.push(dx)
+
+        self.index += 1
+        self.count += 1
+        i = self.index
+
+        # 스토캐스틱 %K / %D
+        self.stoch_low.push(i, l)
+        self.stoch_high.push(i, h)
+        low_min = self.stoch_low.value(self.count)
+        high_max = self.stoch_high.value(self.count)
+        denom = high_max - low_min
+        if denom == 0:
+            denom = 1e-10
+        self.stoch_k.push((c - low_min) / denom * 100)
+
+        # 일목균형표
+        tenkan, kijun, senkou_b = p["ichimoku"]
+        for hi, lo in self.ichi.values():
+            hi.push(i, h)
+            lo.push(i, l)
+
+        def _mid(n):
+            hi, lo = self.ichi[n]
+            return (hi.value(self.count) + lo.value(self.count)) / 2
+
+        self.tenkan = _mid(tenkan)
+        self.kijun = _mid(kijun)
+        self.ichi_a.append((self.tenkan + self.kijun) / 2)
+        self.ichi_b.append(_mid(senkou_b))
+
+        # OBV (절대 누적값), VWAP 누적 합
+        if direction > 0:
+            self.obv += v
+        elif direction < 0:
+            self.obv -= v
+        if first:
+            self.obv_base = self.obv
+        self.obv_window.push(self.obv)
+        self.closes.append(c)
+        tpv = (h + l + c) / 3 * v
+        self.tpv_sum += tpv
+        self.vol_sum += v
+
+        if record:
+            self.frame.append([ts, direction, self.obv, tpv, v])
+            if first:
+                self.first_ts = ts
+            self.last_ts = ts
+        self.last_close = c
+        self.prev_high, self.prev_low = h, l
+
+    def evict_before(self, ts) -> int:
+        """구간 시작이 ts로 밀렸을 때 그 이전 봉을 누적 값에서 차감, 제거한 봉 수 반환."""
+        removed = 0
+        while self.frame and self.frame[0][0] < ts:
+            _, direction, _, tpv, v = self.frame.popleft()
+            self.tpv_sum -= tpv
+            self.vol_sum -= v
+            self.count -= 1
+            removed += 1
+            if direction > 0:
+                self.ups -= 1
+            elif direction < 0:
+                self.downs -= 1
+            # 새 첫 봉의 변화량은 일괄 계산에서 NaN이므로 방향 집계에서 제외
+            if self.frame:
+                head = self.frame[0]
+                if head[1] > 0:
+                    self.ups -= 1
+                elif head[1] < 0:
+                    self.downs -= 1
+                head[1] = 0
+                self.obv_base = head[2]
+        if removed:
+            self.first_ts = self.frame[0][0] if self.frame else None
+        return removed
+
+    def values(self) -> dict:
+        """최신 지표 값. 일괄 계산이 None/NaN을 내는 조건도 같게 맞춘다."""
+        p = self.params
+        n = self.count
+
+        # RSI (calculate_rsi와 같은 중립/0 나눗셈 처리)
+        rsi_period = p["rsi_period"]
+        if n < rsi_period or self.ups == 0 or self.downs == 0:
+            rsi = 50
+        else:
+            gain, loss = self.gain.mean(), self.loss.mean()
+            rsi = 100.0 if loss == 0 else 100 - (100 / (1 + gain / loss))
+
+        adx_period = p["adx_period"]
+        adx = self.dx.mean() if n >= adx_period * 2 else NAN
+
+        k_period, d_period = p["stoch"]
+        if n >= k_period + d_period:
+            stoch_k, stoch_d = self.stoch_k.values[-1], self.stoch_k.mean()
+        else:
+            stoch_k = stoch_d = NAN
+
+        tenkan, kijun, senkou_b = p["ichimoku"]
+        ichimoku = None
+        if n >= senkou_b + kijun:
+            senkou_a = self.ichi_a[0] if len(self.ichi_a) > kijun else NAN
+            senkou_b_val = self.ichi_b[0] if len(self.ichi_b) > kijun else NAN
+            ichimoku = {"tenkan": self.tenkan, "kijun": self.kijun,
+                        "senkou_a": senkou_a, "senkou_b": senkou_b_val}
+
+        obv = None
+        window = p["obv_window"]
+        if n >= window:
+            obv = {"obv": self.obv - self.obv_base,
+                   "obv_ma": self.obv_window.mean() - self.obv_base,
+                   "price_up": self.closes[-1] > self.closes[0]}
+
+        vwap = self.tpv_sum / self.vol_sum if self.vol_sum else NAN
+
+        return {
+            "bars": n,
+            "close": self.last_close,
+            "rsi": rsi,
+            "ma_short": self.ma_short.partial_mean(),
+            "ma_long": self.ma_long.partial_mean(),
+            "macd": self.macd,
+            "macd_signal": self.macd_signal,
+            "bb_upper": [b[0] for b in self.bb_recent],
+            "bb_lower": [b[1] for b in self.bb_recent],
+            "atr": self.tr.mean(),
+            "adx": adx,
+            "stoch_k": stoch_k,
+            "stoch_d": stoch_d,
+            "ichimoku": ichimoku,
+            "obv": obv,
+            "vwap": vwap,
+            "volume_sum": self.vol_sum,
+        }
+
+
+def _bars(df):
+    """DataFrame → (ts int64, OHLCV float64 n×5). 값이 비정상이면 None."""
+    if df is None or df.empty:
+        return None
+    if not {"Open", "High", "Low", "Close", "Volume"}.issubset(df.columns):
+        return None
+    values = df[["Open", "High", "Low", "Close", "Volume"]].to_numpy(dtype=np.float64, copy=True)
+    if not np.isfinite(values[:, :4]).all():
+        return None
+    values[:, 4] = np.nan_to_num(values[:, 4], nan=0.0)
+    ts = df.index.asi8 if hasattr(df.index, "asi8") else np.arange(len(df), dtype=np.int64)
+    return ts, values
+
+
+def build_state(df, params: dict = None):
+    """df 전체로 상태를 새로 구축 (일괄 계산과 비교하거나 처음 조회할 때)."""
+    bars = _bars(df)
+    if bars is None:
+        return None
+    state = IndicatorState(params or DEFAULT_PARAMS)
+    ts, values = bars
+    for t, row in zip(ts.tolist(), values.tolist()):
+        state.push(t, *row)
+    return state
+
+
+class _Entry:
+    __slots__ = ("lock", "state")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.state = None
+
+
+class IndicatorEngine:
+    """(ticker, interval)별 증분 상태 보관소. evaluate()는 새 확정 봉만 반영한다."""
+
+    def __init__(self, max_states: int = 512):
+        self.max_states = max_states
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"incremental": 0, "rebuilds": 0, "pushed": 0, "fallbacks": 0}
+
+    def _entry(self, key) -> _Entry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+                while len(self._entries) > self.max_states:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+            return entry
+
+    def evaluate(self, key, df, params: dict = None):
+        """df(시간순 OHLCV)의 마지막 봉 기준 지표 값 dict. 지원하지 않는 데이터면 None (일괄 계산 사용)."""
+        params = params or DEFAULT_PARAMS
+        bars = _bars(df)
+        if bars is None:
+            self.stats["fallbacks"] += 1
+            return None
+        ts, values = bars
+        n = len(ts)
+        entry = self._entry(key)
+        with entry.lock:
+            state = entry.state
+            start = self._resume_position(state, ts, values, params)
+            if start is None:
+                # 처음이거나 이어 붙일 수 없음 → 확정 봉(마지막 직전까지)으로 재구축
+                state = IndicatorState(params)
+                start = 0
+                self.stats["rebuilds"] += 1
+            else:
+                state.evict_before(int(ts[0]))
+                self.stats["incremental"] += 1
+            for j in range(start, n - 1):
+                state.push(int(ts[j]), *values[j].tolist())
+            self.stats["pushed"] += max(0, n - 1 - start)
+            entry.state = state
+
+            snapshot = state.copy()
+        snapshot.push(int(ts[-1]), *values[-1].tolist(), record=False)
+        return snapshot.values()
+
+    @staticmethod
+    def _resume_position(state, ts, values, params):
+        """state를 이어서 쓸 수 있으면 다음에 반영할 봉 위치, 아니면 None."""
+        if state is None or state.params != params or state.last_ts is None:
+            return None
+        if ts[0] < state.first_ts:
+            return None
+        pos = int(np.searchsorted(ts, state.last_ts))
+        # 확정 봉이 사라졌거나 값이 바뀌었으면 (수정 주가 등) 재구축
+        if pos >= len(ts) - 1 or ts[pos] != state.last_ts or values[pos, 3] != state.last_close:
+            return None
+        # 구간에서 빠질 봉을 빼고 남는 봉 수가 현재 위치와 맞아야 함 (빠질 봉만 훑음)
+        evicted = 0
+        for rec in state.frame:
+            if rec[0] >= ts[0]:
+                break
+            evicted += 1
+        remaining = state.count - evicted
+        if remaining != pos + 1 or remaining < _MIN_INCREMENTAL_BARS:
+            return None
+        return pos + 1
+
+    def discard(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+_engine = IndicatorEngine()
+
+
+def get_engine() -> IndicatorEngine:
+    return _engine
@@ -0,0 +1,166 @@
+"""
+공용 지표 라이브러리.
+
+실시간 테이블(stock_score)과 백테스트(backtest_popup)가 같은 정의의 지표 시리즈를 쓰도록
+이동평균/EMA/MACD/RSI/볼린저 밴드/ATR 계산을 한곳에 모았습니다.
+
+계산 결과는 (지표, 파라미터, 입력 데이터 지문) 키로 메모이제이션합니다.
+- 지문은 입력 열의 값 바이트 해시 + 길이 + 첫/끝 인덱스 + 이름이라, 같은 데이터의 복사본
+  (전략 비교의 data.copy() 등)도 같은 결과를 공유하고 값이 바뀌면 자동으로 미스
+- 상위 지표는 하위 지표를 다시 캐시에서 꺼내 씀 (MACD → EMA, 볼린저 → 이동평균/표준편차,
+  RSI 변형들 → 평균 상승/하락폭)
+- 최근 사용 순 LRU로 항목 수를 제한
+- 2차원 패널(DataFrame, universe_backtest)은 캐시하지 않음: 항목 하나가 수십 MB라 항목 수 제한으로는
+  프로세스 전역 캐시의 메모리가 묶이지 않고, 패널 한 번 실행 안에서는 재사용도 거의 없음
+
+반환된 Series는 여러 호출자가 공유하므로 제자리 수정하지 말 것 (필요하면 copy()).
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+_MAX_ENTRIES = 512
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def _fingerprint(series: pd.Series) -> tuple:
+    """입력 열의 내용 지문 (값 바이트 해시 + 길이 + 첫/끝 인덱스 + 이름).
+
+    이름을 넣어야 값이 같은 다른 열('High'/'Close' 등)에서 나온 결과가 서로의 이름으로 반환되지 않음.
+    """
+    values = np.ascontiguousarray(series.to_numpy(dtype=np.float64))
+    index = series.index
+    bounds = (index[0], index[-1]) if len(index) else (None, None)
+    return len(values), hash(values.tobytes()), bounds, series.name
+
+
+def _memoize(name: str, params: tuple, sources: tuple, compute):
+    """(지표, 파라미터, 입력 지문) 키로 compute() 결과를 캐시 (DataFrame 입력은 캐시하지 않고 바로 계산)."""
+    if any(isinstance(s, pd.DataFrame) for s in sources):
+        return compute()
+    key = (name, params) + tuple(_fingerprint(s) for s in sources)
+    with _cache_lock:
+        result = _cache.get(key)
+        if result is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return result
+        _stats["misses"] += 1
+
+    # 계산은 락 밖에서 (동시에 같은 키를 계산하면 나중 결과로 덮어씀)
+    result = compute()
+    with _cache_lock:
+        _cache[key] = result
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return result
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+        _stats["hits"] = _stats["misses"] = 0
+
+
+def cache_stats() -> dict:
+    with _cache_lock:
+        return {"entries": len(_cache), **_stats}
+
+
+# ============================================================
+# 이동평균 계열
+# ============================================================
+
+def sma(series: pd.Series, window: int, min_periods: int = None) -> pd.Series:
+    """단순 이동평균 (rolling(window).mean())."""
+    return _memoize("sma", (window, min_periods), (series,),
+                    lambda: series.rolling(window=window, min_periods=min_periods).mean())
+
+
+def rolling_std(series: pd.Series, window: int) -> pd.Series:
+    """이동 표준편차 (표본 표준편차, ddof=1)."""
+    return _memoize("std", (window,), (series,),
+                    lambda: series.rolling(window=window).std())
+
+
+def ema(series: pd.Series, span: int) -> pd.Series:
+    """지수 이동평균 (ewm(span, adjust=False))."""
+    return _memoize("ema", (span,), (series,),
+                    lambda: series.ewm(span=span, adjust=False).mean())
+
+
+def macd(close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9):
+    """MACD 선, 시그널 선, 히스토그램."""
+    def _compute():
+        macd_line = ema(close, fast) - ema(close, slow)
+        signal_line = ema(macd_line, signal)
+        return macd_line, signal_line, macd_line - signal_line
+    return _memoize("macd", (fast, slow, signal), (close,), _compute)
+
+
+def bollinger(close: pd.Series, period: int = 20, num_std: float = 2.0):
+    """볼린저 밴드 (상단, 하단, 중심선)."""
+    def _compute():
+        mean = sma(close, period)
+        std = rolling_std(close, period)
+        return mean + (std * num_std), mean - (std * num_std), mean
+    return _memoize("bollinger", (period, num_std), (close,), _compute)
+
+
+# ============================================================
+# RSI
+# ============================================================
+
+def avg_gain_loss(close: pd.Series, period: int = 14, min_periods: int = None):
+    """평균 상승폭/하락폭 (단순 이동평균, 첫 봉과 결측 변화량은 0으로 취급)."""
+    def _compute():
+        delta = close.diff()
+        gain = delta.where(delta > 0, 0).rolling(window=period, min_periods=min_periods).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=period, min_periods=min_periods).mean()
+        return gain, loss
+    return _memoize("gain_loss", (period, min_periods), (close,), _compute)
+
+
+def rsi(close: pd.Series, period: int = 14, min_periods: int = None,
+        zero_loss: float = None) -> pd.Series:
+    """RSI 시리즈 (단순 이동평균 방식).
+
+    min_periods: 처음 period개 미만 구간도 계산하려면 1 (백테스트)
+    zero_loss: 평균 하락폭 0을 이 값으로 바꿔 0 나눗셈을 피함 (None이면 그대로 → 100 또는 NaN)
+    """
+    def _compute():
+        gain, loss = avg_gain_loss(close, period, min_periods)
+        if zero_loss is not None:
+            loss = loss.replace(0, zero_loss)
+        rs = gain / loss
+        return 100 - (100 / (1 + rs))
+    return _memoize("rsi", (period, min_periods, zero_loss), (close,), _compute)
+
+
+# ============================================================
+# 변동성
+# ============================================================
+
+def true_range(data: pd.DataFrame) -> pd.Series:
+    """True Range (고가-저가, 전일 종가 대비 고가/저가 차이 중 최대)."""
+    high, low, close = data['High'], data['Low'], data['Close']
+
+    def _compute():
+        prev_close = close.shift(1)
+        tr1 = high - low
+        tr2 = (high - prev_close).abs()
+        tr3 = (low - prev_close).abs()
+        return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    return _memoize("true_range", (), (high, low, close), _compute)
+
+
+def atr(data: pd.DataFrame, period: int = 14) -> pd.Series:
+    """ATR (True Range의 단순 이동평균)."""
+    return sma(true_range(data), period)
@@ -5,7 +5,8 @@ from datetime import datetime, time as dt_time
 
 import holidays
 import pytz
-import yfinance as yf
+
+from data_provider import get_provider
 
 # Momentum weight constants (Phase 8-4)
 MACD_WEIGHT = 2
@@ -33,7 +34,7 @@ class MarketTrendManager:
 
     def detect_market_trend(self):
         try:
-            data = yf.Ticker(self.index_ticker).history(period="3mo", interval="1d")
+            data = get_provider().ticker(self.index_ticker).history(period="3mo", interval="1d")
             if data.empty:
                 return "Unknown"
 
@@ -63,7 +64,7 @@ class MarketTrendManager:
 
     def guess_market_source(self, ticker):
         try:
-            info = yf.Ticker(ticker).info
+            info = get_provider().ticker(ticker).info
             exchange = info.get('exchange', '')
             sector = info.get('sector', '')
 
@@ -116,7 +117,7 @@ class VolatilityRegimeManager:
 
     def detect_regime(self):
         try:
-            data = yf.Ticker("^VIX").history(period="5d")
+            data = get_provider().ticker("^VIX").history(period="5d")
             if not data.empty:
                 vix = float(data['Close'].iloc[-1])
                 self.vix_value = vix
@@ -130,7 +131,7 @@ class VolatilityRegimeManager:
             logging.warning(f"[VIX] Failed to fetch VIX: {e}")
         # fallback: SPY 20일 실현변동성
         try:
-            spy = yf.Ticker("SPY").history(period="1mo")
+            spy = get_provider().ticker("SPY").history(period="1mo")
             if not spy.empty and len(spy) >= 20:
                 vol = spy['Close'].pct_change().rolling(20).std().iloc[-1] * (252 ** 0.5)
                 self.vix_value = round(vol * 100, 1)
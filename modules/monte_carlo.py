@@ -0,0 +1,120 @@
+"""
+거래 수익률 부트스트랩 몬테카를로.
+
+거래 수익률을 복원추출해 (시뮬레이션 수 × 거래 수) 행렬로 한 번에 누적 수익률과 MDD를 계산합니다.
+- 블록 부트스트랩: block_size > 1이면 연속된 거래 block_size개를 한 덩어리로 뽑아
+  (원형: 끝에서 처음으로 이어짐) 연승/연패 같은 거래 간 의존성을 보존
+- 메모리: 행렬을 묶음(chunk) 단위로 만들어 묶음당 max_bytes 이내 (1e6회도 수십 MB)
+- 재현성: 묶음마다 SeedSequence.spawn으로 만든 Generator를 써서 같은 seed면
+  작업 프로세스 수와 관계없이 같은 결과
+- 큰 실행 (시뮬레이션 수 × 거래 수가 PARALLEL_MIN_ELEMENTS 이상)은 묶음을 ProcessPoolExecutor로 나눠 실행
+
+    mc = monte_carlo.bootstrap(profits, n_sims=1_000_000, seed=42, block_size=5)
+    stats = monte_carlo.summarize(mc)
+"""
+
+import logging
+import math
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MIN_SIMULATIONS = 100
+MAX_SIMULATIONS = 1_000_000
+MAX_CHUNK_BYTES = 64 * 1024 * 1024   # 묶음 하나의 작업 행렬 크기 상한 (float64 두 개)
+PARALLEL_MIN_ELEMENTS = 50_000_000   # 이보다 작으면 프로세스 시작 비용이 더 커서 현재 스레드에서 실행
+MAX_AUTO_WORKERS = 8
+
+# total_returns / mdds: 시뮬레이션별 누적 수익률과 MDD (비율), seed: 실제 사용한 시드 (재현용)
+MonteCarloResult = namedtuple('MonteCarloResult', ['total_returns', 'mdds', 'block_size', 'seed'])
+
+
+def _chunk_rows(n_trades: int, max_bytes: int = MAX_CHUNK_BYTES) -> int:
+    """묶음당 시뮬레이션 수 (자산 곡선 + 고점 행렬 두 개가 max_bytes 이내)."""
+    return max(1, max_bytes // (2 * 8 * max(n_trades, 1)))
+
+
+def sample_indices(rng: np.random.Generator, n_trades: int, rows: int, block_size: int = 1) -> np.ndarray:
+    """(rows × n_trades) 복원추출 위치. block_size > 1이면 원형 블록 부트스트랩."""
+    if block_size <= 1:
+        return rng.integers(0, n_trades, size=(rows, n_trades))
+    n_blocks = math.ceil(n_trades / block_size)
+    starts = rng.integers(0, n_trades, size=(rows, n_blocks, 1))
+    idx = (starts + np.arange(block_size)) % n_trades
+    return idx.reshape(rows, n_blocks * block_size)[:, :n_trades]
+
+
+def simulate_chunk(profits: np.ndarray, rows: int, seed_seq, block_size: int = 1):
+    """한 묶음: rows개 시뮬레이션의 (누적 수익률, MDD).
+
+    MDD는 첫 거래 후 자산부터의 고점 대비 최대 하락 (기존 루프와 같은 정의).
+    """
+    rng = np.random.default_rng(seed_seq)
+    equity = profits[sample_indices(rng, len(profits), rows, block_size)]
+    np.add(equity, 1.0, out=equity)
+    np.cumprod(equity, axis=1, out=equity)
+    total = equity[:, -1] - 1.0
+    peak = np.maximum.accumulate(equity, axis=1)
+    np.divide(equity, peak, out=peak)
+    mdd = peak.min(axis=1) - 1.0
+    return total, mdd
+
+
+def _auto_workers() -> int:
+    return max(1, min(os.cpu_count() or 1, MAX_AUTO_WORKERS))
+
+
+def bootstrap(profits, n_sims: int = 10_000, seed=None, block_size: int = 1, workers: int = 0,
+              max_bytes: int = MAX_CHUNK_BYTES) -> MonteCarloResult:
+    """거래 수익률 부트스트랩 (n_sims는 MIN_SIMULATIONS ~ MAX_SIMULATIONS로 제한).
+
+    seed: None이면 새 엔트로피 (결과의 seed로 재현 가능)
+    workers: 프로세스 수 (0 = 자동, 1 = 현재 스레드에서 실행)
+    """
+    profits = np.asarray(profits, dtype=np.float64)
+    profits = profits[~np.isnan(profits)]
+    if len(profits) == 0:
+        raise ValueError("부트스트랩할 거래 수익률이 없습니다.")
+    n_sims = int(min(max(n_sims, MIN_SIMULATIONS), MAX_SIMULATIONS))
+    block_size = int(min(max(block_size, 1), len(profits)))
+    seed_seq = np.random.SeedSequence(seed)
+
+    rows = _chunk_rows(len(profits), max_bytes)
+    sizes = [min(rows, n_sims - start) for start in range(0, n_sims, rows)]
+    children = seed_seq.spawn(len(sizes))
+    workers = workers or _auto_workers()
+
+    parts = None
+    if workers > 1 and len(sizes) > 1 and n_sims * len(profits) >= PARALLEL_MIN_ELEMENTS:
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(sizes)), mp_context=get_context("spawn")) as pool:
+                parts = list(pool.map(simulate_chunk, [profits] * len(sizes), sizes, children,
+                                      [block_size] * len(sizes)))
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"[MONTECARLO] Process pool unavailable, running in-thread: {e}")
+    if parts is None:
+        parts = [simulate_chunk(profits, size, child, block_size) for size, child in zip(sizes, children)]
+
+    return MonteCarloResult(np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts]),
+                            block_size, seed_seq.entropy)
+
+
+def summarize(result: MonteCarloResult) -> dict:
+    """분포 요약 (수익률/MDD는 비율, prob_loss는 %)."""
+    returns, mdds = result.total_returns, result.mdds
+    p5, p25, p50, p75, p95 = np.percentile(returns, [5, 25, 50, 75, 95])
+    return {
+        "n_sims": len(returns),
+        "mean_return": float(np.mean(returns)),
+        "median_return": float(p50),
+        "ci_5": float(p5), "ci_25": float(p25), "ci_75": float(p75), "ci_95": float(p95),
+        "prob_loss": float(np.mean(returns < 0) * 100),
+        "avg_mdd": float(np.mean(mdds)),
+        "mdd_5": float(np.percentile(mdds, 5)),
+    }
@@ -210,8 +210,8 @@ def fetch_ticker_news(ticker_symbol, count=25):
             current_price: float 또는 None
     """
     try:
-        import yfinance as yf
-        t = yf.Ticker(ticker_symbol)
+        from data_provider import get_provider
+        t = get_provider().ticker(ticker_symbol)
 
         # 현재가 조회
         current_price = None
@@ -346,8 +346,8 @@ class NewsPanel(tk.LabelFrame):
         """티커 클릭 시 백테스트 팝업 열기 (종목명 포함)."""
         from backtest_popup import open_backtest_popup
         try:
-            import yfinance as yf
-            name = yf.Ticker(ticker_symbol).info.get('shortName', '')
+            from data_provider import get_provider
+            name = get_provider().ticker(ticker_symbol).info.get('shortName', '')
             stock = f"{name} ({ticker_symbol})" if name else ticker_symbol
         except Exception:
             stock = ticker_symbol
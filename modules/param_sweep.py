@@ -0,0 +1,263 @@
+"""
+전략 파라미터 스윕 엔진 (민감도 분석).
+
+축은 "섹션.키" → 후보 값 목록 dict입니다 (섹션은 strategies 파라미터의 config "current" 섹션):
+    {"ma_cross.short": range(5, 55, 5), "ma_cross.long": range(20, 210, 10)}
+- grid(): 모든 축의 데카르트 곱 (차원 수 제한 없음)
+- random_samples(): 같은 공간에서 중복 없이 n개 무작위 추출 (곱 전체를 만들지 않음)
+
+조합은 params 복사본에 적용해 strategies.run으로 실행하므로 config 전역을 건드리지 않습니다.
+조합이 충분히 많으면 ProcessPoolExecutor로 나눠 실행합니다.
+- OHLCV 값은 공유 메모리 한 블록에 올리고, 작업 프로세스는 시작할 때 한 번 붙어서 DataFrame을 만듦
+  (작업 단위로는 조합 튜플만 오감)
+- 각 프로세스 안에서는 같은 프레임을 계속 쓰므로 indicators 캐시가 조합 사이에 재사용됨
+- iter_sweep()은 끝난 조합 묶음(SweepChunk)을 완료 순서대로 내보내 팝업이 히트맵을 점진적으로 그림
+- 프로세스 풀을 쓸 수 없으면 (작업 프로세스 비정상 종료 등) 남은 조합을 현재 스레드에서 계속 실행
+
+    combos = param_sweep.grid(param_sweep.DEFAULT_GRIDS["ma_cross"])
+    result = param_sweep.sweep("ma_cross", data, params, list(axes), combos)
+"""
+
+import itertools
+import logging
+import math
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+import pandas as pd
+
+import strategies
+
+logger = logging.getLogger(__name__)
+
+# 전략별 기본 스윕 공간 (첫 두 축이 히트맵의 세로/가로축, 나머지 축은 칸마다 최댓값)
+DEFAULT_GRIDS = {
+    "macd_rsi": {"rsi.lower": [15, 20, 25, 30, 35, 40], "rsi.upper": [60, 65, 70, 75, 80, 85],
+                 "rsi.period": [9, 14, 21], "macd.signal": [7, 9, 12]},
+    "ma_cross": {"ma_cross.short": list(range(5, 55, 5)), "ma_cross.long": list(range(20, 210, 10))},
+    "bollinger": {"bollinger.period": list(range(10, 42, 2)),
+                  "bollinger.std_dev_multiplier": [1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
+                  "bollinger.use_rebound": [False, True]},
+    "momentum_signal": {"rsi.lower": [15, 20, 25, 30, 35, 40], "rsi.upper": [60, 65, 70, 75, 80, 85],
+                        "bollinger.use_rebound": [False, True], "rsi.period": [9, 14, 21]},
+    "momentum_return_ma": {"ma_cross.short": list(range(5, 55, 5)), "ma_cross.long": list(range(20, 210, 20)),
+                           "momentum_return.return_window": [20, 40, 60, 120],
+                           "momentum_return.threshold": [0.0, 0.05, 0.1, 0.2]},
+}
+
+# (섹션, 작은 값 키, 큰 값 키): 작은 값 >= 큰 값인 조합은 실행하지 않고 NaN
+CONSTRAINTS = (("ma_cross", "short", "long"), ("rsi", "lower", "upper"), ("macd", "short", "long"))
+
+MAX_AUTO_WORKERS = 8
+MIN_PARALLEL_COMBOS = 64   # 이보다 적으면 프로세스 시작 비용이 더 커서 현재 스레드에서 실행
+MAX_CHUNK = 64
+
+# start: 조합 목록에서의 시작 위치, returns: 누적 수익률 (%), trades: 거래 수 (실행 안 한 조합은 NaN / 0)
+SweepChunk = namedtuple('SweepChunk', ['start', 'returns', 'trades'])
+SweepResult = namedtuple('SweepResult', ['names', 'combos', 'returns', 'trades'])
+
+
+# ============================================================
+# 스윕 공간
+# ============================================================
+
+def grid(axes: dict) -> list:
+    """축 dict → 모든 조합 (축 순서의 튜플 목록)."""
+    return list(itertools.product(*(list(values) for values in axes.values())))
+
+
+def grid_size(axes: dict) -> int:
+    return math.prod(len(list(values)) for values in axes.values())
+
+
+def random_samples(axes: dict, n: int, seed=None) -> list:
+    """축 공간에서 중복 없이 n개 무작위 조합 (n이 공간보다 크면 전체 격자)."""
+    values = [list(v) for v in axes.values()]
+    shape = tuple(len(v) for v in values)
+    total = math.prod(shape)
+    if n >= total:
+        return grid(axes)
+    rng = np.random.default_rng(seed)
+    flat = np.sort(rng.choice(total, size=n, replace=False))
+    positions = np.unravel_index(flat, shape)
+    return [tuple(values[axis][pos[k]] for axis, pos in enumerate(positions)) for k in range(n)]
+
+
+def apply_combo(base_params: dict, names, combo) -> dict:
+    """base_params 복사본에 조합 적용 (바뀌는 섹션만 복사)."""
+    params = dict(base_params)
+    for name, value in zip(names, combo):
+        section, key = name.split(".", 1)
+        if params.get(section) is base_params.get(section):
+            params[section] = dict(base_params.get(section) or {})
+        params[section][key] = value.item() if isinstance(value, np.generic) else value
+    return params
+
+
+def is_valid(params: dict) -> bool:
+    for section, low, high in CONSTRAINTS:
+        conf = params.get(section) or {}
+        if low in conf and high in conf and conf[low] >= conf[high]:
+            return False
+    return True
+
+
+def evaluate(method: str, ohlcv, base_params: dict, names, combos):
+    """조합 목록을 현재 스레드에서 실행 → (수익률 % 배열, 거래 수 배열).
+
+    거래가 없으면 0%, 제약 위반이나 계산 실패는 NaN.
+    """
+    returns = np.full(len(combos), np.nan)
+    trades = np.zeros(len(combos), dtype=np.int64)
+    for k, combo in enumerate(combos):
+        params = apply_combo(base_params, names, combo)
+        if not is_valid(params):
+            continue
+        try:
+            profits = strategies.run(method, ohlcv, params).profits
+        except Exception:
+            continue
+        returns[k] = strategies.total_return(profits) * 100
+        trades[k] = len(profits)
+    return returns, trades
+
+
+# ============================================================
+# 공유 메모리 / 작업 프로세스
+# ============================================================
+
+class _SharedFrame:
+    """OHLCV 숫자 열을 공유 메모리 한 블록에 올림 (인덱스/열 이름은 작업 프로세스 시작 인자로 한 번 전달)."""
+
+    def __init__(self, frame: pd.DataFrame):
+        values = np.ascontiguousarray(frame.to_numpy(dtype=np.float64))
+        self._shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=np.float64, buffer=self._shm.buf)[:] = values
+        self.spec = (self._shm.name, values.shape, frame.index, list(frame.columns))
+
+    def close(self):
+        try:
+            self._shm.close()
+            self._shm.unlink()
+        except Exception as e:
+            logger.debug(f"[SWEEP] Shared memory cleanup: {e}")
+
+
+# 작업 프로세스 전역 (initializer에서 한 번 설정)
+_worker = {}
+
+
+def _init_worker(spec, method, base_params, names):
+    name, shape, index, columns = spec
+    shm = shared_memory.SharedMemory(name=name)
+    values = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    _worker.update(shm=shm, frame=pd.DataFrame(values, index=index, columns=columns, copy=False),
+                   method=method, base_params=base_params, names=names)
+
+
+def _run_chunk(start, combos):
+    returns, trades = evaluate(_worker["method"], _worker["frame"], _worker["base_params"],
+                               _worker["names"], combos)
+    return SweepChunk(start, returns, trades)
+
+
+def _auto_workers() -> int:
+    return max(1, min(os.cpu_count() or 1, MAX_AUTO_WORKERS))
+
+
+def iter_sweep(method: str, ohlcv, base_params: dict, names, combos, workers: int = 0,
+               chunk_size: int = 0, cancel: threading.Event = None):
+    """조합을 실행하며 끝난 묶음(SweepChunk)을 완료 순서대로 내보냄.
+
+    workers: 프로세스 수 (0 = 자동, 코어 수 최대 8 / 1 = 현재 스레드에서 실행)
+    cancel: set되면 대기 중인 묶음을 취소하고 멈춤
+    """
+    names = list(names)
+    combos = list(combos)
+    n = len(combos)
+    workers = workers or _auto_workers()
+    if not chunk_size:
+        chunk_size = max(1, min(MAX_CHUNK, math.ceil(n / (max(workers, 1) * 8))))
+    starts = list(range(0, n, chunk_size))
+
+    def _serial(pending):
+        for start in pending:
+            if cancel is not None and cancel.is_set():
+                return
+            returns, trades = evaluate(method, ohlcv, base_params, names, combos[start:start + chunk_size])
+            yield SweepChunk(start, returns, trades)
+
+    if workers <= 1 or n < MIN_PARALLEL_COMBOS:
+        yield from _serial(starts)
+        return
+
+    remaining = set(starts)
+    shared = pool = None
+    try:
+        shared = _SharedFrame(ohlcv)
+        # Tk 스레드가 있는 프로세스에서 fork하지 않도록 spawn (Windows와 같은 방식)
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                                   initializer=_init_worker, initargs=(shared.spec, method, base_params, names))
+        futures = {pool.submit(_run_chunk, start, combos[start:start + chunk_size]) for start in starts}
+        while futures:
+            if cancel is not None and cancel.is_set():
+                return
+            done, futures = wait(futures, timeout=0.25, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = future.result()
+                remaining.discard(chunk.start)
+                yield chunk
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning(f"[SWEEP] Process pool unavailable, continuing in-thread ({len(remaining)} chunks): {e}")
+        yield from _serial(sorted(remaining))
+    finally:
+        # 취소되었거나 호출자가 중간에 멈추면 대기 중인 묶음은 버림 (공유 메모리 해제 전에 작업 프로세스 종료)
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        if shared is not None:
+            shared.close()
+
+
+def sweep(method: str, ohlcv, base_params: dict, names, combos, workers: int = 0,
+          on_chunk=None, cancel: threading.Event = None) -> SweepResult:
+    """iter_sweep 결과를 조합 순서의 배열로 모음 (on_chunk(chunk, done, total)로 진행 알림)."""
+    combos = list(combos)
+    returns = np.full(len(combos), np.nan)
+    trades = np.zeros(len(combos), dtype=np.int64)
+    done = 0
+    for chunk in iter_sweep(method, ohlcv, base_params, names, combos, workers=workers, cancel=cancel):
+        stop = chunk.start + len(chunk.returns)
+        returns[chunk.start:stop] = chunk.returns
+        trades[chunk.start:stop] = chunk.trades
+        done += len(chunk.returns)
+        if on_chunk is not None:
+            on_chunk(chunk, done, len(combos))
+    return SweepResult(list(names), combos, returns, trades)
+
+
+# ============================================================
+# 히트맵
+# ============================================================
+
+def heatmap(names, combos, values, row: int = 0, col: int = 1):
+    """두 축(row, col)으로 투영한 행렬 → (행 값 목록, 열 값 목록, 행렬).
+
+    나머지 축은 칸마다 최댓값 (가장 좋은 조합), 값이 없는 칸은 NaN.
+    """
+    rows = sorted({combo[row] for combo in combos})
+    cols = sorted({combo[col] for combo in combos})
+    row_pos = {v: i for i, v in enumerate(rows)}
+    col_pos = {v: j for j, v in enumerate(cols)}
+    r = np.fromiter((row_pos[combo[row]] for combo in combos), dtype=np.intp, count=len(combos))
+    c = np.fromiter((col_pos[combo[col]] for combo in combos), dtype=np.intp, count=len(combos))
+    values = np.asarray(values, dtype=np.float64)
+    matrix = np.full((len(rows), len(cols)), -np.inf)
+    finite = ~np.isnan(values)
+    np.maximum.at(matrix, (r[finite], c[finite]), values[finite])
+    matrix[np.isneginf(matrix)] = np.nan
+    return rows, cols, matrix
@@ -9,10 +9,10 @@ from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import yfinance as yf
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 import config as config_module
+from data_provider import get_provider
 
 plt.rcParams['axes.unicode_minus'] = False
 plt.rcParams['font.family'] = 'Malgun Gothic'
@@ -65,7 +65,7 @@ def _download_returns(tickers, period="1y"):
     if not tickers:
         return pd.DataFrame()
     try:
-        data = yf.download(tickers, period=period, interval="1d", group_by='ticker')
+        data = get_provider().download(tickers, period=period, interval="1d", group_by='ticker')
         if data.empty:
             return pd.DataFrame()
 
@@ -282,7 +282,7 @@ def open_portfolio_popup(watchlist, holdings=None):
                     _update_progress(20 + 50 * (i + 1) // len(tickers),
                                      f"종목 정보 수집 중... {t} ({i+1}/{len(tickers)})")
                     try:
-                        info = yf.Ticker(t).info
+                        info = get_provider().ticker(t).info
                         sector_map[t] = info.get('sector', '기타')
                         beta_map[t] = info.get('beta', None)
                         name_map[t] = info.get('shortName', t)
@@ -841,7 +841,7 @@ def open_portfolio_evaluation_popup(watchlist, holdings):
             _update_eval_progress(10 + 30 * (i + 1) // len(tickers),
                                   f"현재가 수집 중... {t} ({i+1}/{len(tickers)})")
             try:
-                info = yf.Ticker(t).info
+                info = get_provider().ticker(t).info
                 price = info.get('currentPrice') or info.get('regularMarketPrice') or info.get('previousClose')
                 if price:
                     current_prices[t] = float(price)
@@ -1062,7 +1062,7 @@ def open_portfolio_evaluation_popup(watchlist, holdings):
                 for pos in positions:
                     t = pos["ticker"]
                     try:
-                        beta = yf.Ticker(t).info.get("beta", 1.0) or 1.0
+                        beta = get_provider().ticker(t).info.get("beta", 1.0) or 1.0
                     except Exception:
                         beta = 1.0
                     port_beta += beta * (pos["weight"] / 100)
@@ -1339,7 +1339,7 @@ def _download_fama_french_factors(period="1y", n_factors=3):
         etf_tickers = ["SPY", "IWM", "IWD", "IWF"]
 
     try:
-        data = yf.download(etf_tickers, period=period, interval="1d", group_by='ticker')
+        data = get_provider().download(etf_tickers, period=period, interval="1d", group_by='ticker')
         if data.empty:
             return pd.DataFrame()
 
@@ -1608,7 +1608,7 @@ def open_fama_french_popup(watchlist, holdings=None):
                     h = holdings_manager.get_holding(holdings, t)
                     if h and h.get("quantity", 0) > 0:
                         try:
-                            info = yf.Ticker(t).info
+                            info = get_provider().ticker(t).info
                             price = info.get('currentPrice') or info.get('regularMarketPrice') or info.get('previousClose', 0)
                             val = float(price) * h["quantity"]
                             port_weights[t] = val
@@ -2054,7 +2054,7 @@ def open_black_litterman_popup(watchlist, holdings=None):
                     except tk.TclError:
                         pass
                     try:
-                        info = yf.Ticker(t).info
+                        info = get_provider().ticker(t).info
                         mc = info.get('marketCap', None)
                         market_caps[t] = float(mc) if mc else 1e9
                         name_map[t] = info.get('shortName', t)
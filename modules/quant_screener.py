@@ -7,8 +7,7 @@ import threading
 from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import yfinance as yf
-
+from data_provider import get_provider
 from fundamental_score import (
     safe_get_float, calculate_valuation_score,
     calculate_factor_score, calculate_piotroski_fscore,
@@ -660,7 +659,7 @@ def _fetch_info_cached(ticker: str) -> dict:
 
     # 폴백: 직접 yfinance 호출
     try:
-        return yf.Ticker(ticker).info
+        return get_provider().ticker(ticker).info
     except Exception as e:
         logger.warning(f"[SCREENER] Failed to fetch {ticker}: {e}")
         return {}
@@ -0,0 +1,280 @@
+"""
+외부 시세 요청 제한 + 재시도 미들웨어.
+
+모든 yfinance 호출(YFinanceProvider)은 프로세스 공용 RequestGuard를 거칩니다.
+새로고침, 스크리너, 백테스트, 뉴스 등 여러 스레드 풀이 동시에 요청해도 한도는 하나입니다.
+- 토큰 버킷: 초당 요청 수 + 버스트 한도 (다중 종목 다운로드는 종목 수만큼 소비)
+- 재시도: 레이트 리밋/네트워크 오류는 지터를 섞은 지수 백오프로 재시도하고,
+  레이트 리밋 응답을 받으면 버킷 전체를 같은 시간 동안 멈춰 다른 스레드도 함께 물러남
+- 서킷 브레이커: 연속 실패가 한도를 넘으면 일정 시간 요청을 바로 거절 (CircuitOpenError),
+  이후 한 건만 시험 삼아 보내 성공하면 다시 닫음
+
+config.json "rate_limit" 섹션으로 조정하며, get_request_stats()로 대기/제한/재시도 횟수를 봅니다.
+"""
+
+import importlib
+import logging
+import random
+import re
+import socket
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "requests_per_sec": 8.0,    # 토큰 보충 속도
+    "burst": 32,                # 버킷 크기 (한 번에 보낼 수 있는 최대 요청 수)
+    "max_retries": 3,           # 재시도 횟수 (첫 시도 제외)
+    "base_delay_sec": 1.0,      # 백오프 기본 지연 (시도마다 두 배, 0~지연 사이 무작위)
+    "max_delay_sec": 30.0,      # 백오프 상한
+    "breaker_failures": 8,      # 연속 실패가 이 수에 이르면 차단
+    "breaker_reset_sec": 60.0,  # 차단 유지 시간
+}
+
+
+_HTTP_429 = re.compile(r"\b429\b")
+
+
+class RateLimitedError(ConnectionError):
+    """공급자가 요청 과다로 거절함 (HTTP 429 등)."""
+
+
+class CircuitOpenError(ConnectionError):
+    """서킷 브레이커가 열려 요청을 보내지 않음."""
+
+
+def is_rate_limit_error(error) -> bool:
+    """yfinance YFRateLimitError 또는 429 응답으로 보이는 예외."""
+    if isinstance(error, RateLimitedError):
+        return True
+    text = f"{type(error).__name__} {error}"
+    return "RateLimit" in text or "Too Many Requests" in text or _HTTP_429.search(text) is not None
+
+
+def _network_errors() -> tuple:
+    """재시도할 네트워크 오류 타입.
+
+    requests/curl_cffi 예외는 OSError를 상속하지만 OSError 전체를 잡으면 로컬 오류
+    (tz/쿠키 캐시·SQLite의 FileNotFoundError/PermissionError 등)까지 재시도되고 브레이커 실패로 세어지므로,
+    연결/타임아웃 계열만 설치된 라이브러리에서 골라 씀.
+    """
+    types = [ConnectionError, TimeoutError, socket.timeout]
+    for module_name in ("requests.exceptions", "curl_cffi.requests.exceptions"):
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        types += [getattr(module, name) for name in ("ConnectionError", "Timeout", "ChunkedEncodingError")
+                  if hasattr(module, name)]
+    return tuple(types)
+
+
+_NETWORK_ERRORS = _network_errors()
+
+
+def _is_retryable(error) -> bool:
+    if isinstance(error, CircuitOpenError):
+        return False
+    return is_rate_limit_error(error) or isinstance(error, _NETWORK_ERRORS)
+
+
+class TokenBucket:
+    """초당 rate개씩 차는 크기 capacity의 토큰 버킷 (스레드 안전, 대기형)."""
+
+    def __init__(self, rate: float, capacity: float, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, cost: float = 1.0) -> float:
+        """토큰 cost개를 얻을 때까지 대기하고 대기한 시간(초)을 반환.
+
+        cost가 버킷보다 크면 빚을 지고 통과 (이후 요청이 그만큼 기다림).
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= min(cost, self.capacity):
+                        self._tokens -= cost
+                        return waited
+                    wait = (min(cost, self.capacity) - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float):
+        """모든 요청을 seconds 동안 멈춤 (레이트 리밋 응답 후 전체 후퇴)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class CircuitBreaker:
+    """연속 실패 failures회 → reset_sec 동안 open → half-open 시험 1건 → closed."""
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failures: int, reset_sec: float, clock=time.monotonic):
+        self.failures = failures
+        self.reset_sec = reset_sec
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self._consecutive = 0
+        self._opened_at = 0.0
+        self._trial = False
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self._clock() - self._opened_at >= self.reset_sec:
+                self.state = self.HALF_OPEN
+                self._trial = False
+            if self.state == self.HALF_OPEN and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive = 0
+            self.state = self.CLOSED
+
+    def record_failure(self) -> bool:
+        """실패 기록. 이번 실패로 차단이 시작되면 True."""
+        with self._lock:
+            self._consecutive += 1
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED
+                                                and self._consecutive >= self.failures):
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+                return True
+            return False
+
+
+class RequestGuard:
+    """토큰 버킷 + 지터 지수 백오프 재시도 + 서킷 브레이커를 묶은 호출 래퍼."""
+
+    def __init__(self, requests_per_sec: float = None, burst: float = None, max_retries: int = None,
+                 base_delay_sec: float = None, max_delay_sec: float = None,
+                 breaker_failures: int = None, breaker_reset_sec: float = None,
+                 clock=time.monotonic, sleep=time.sleep):
+        opts = dict(DEFAULTS)
+        opts.update({k: v for k, v in dict(
+            requests_per_sec=requests_per_sec, burst=burst, max_retries=max_retries,
+            base_delay_sec=base_delay_sec, max_delay_sec=max_delay_sec,
+            breaker_failures=breaker_failures, breaker_reset_sec=breaker_reset_sec).items()
+            if v is not None})
+        self.max_retries = int(opts["max_retries"])
+        self.base_delay = float(opts["base_delay_sec"])
+        self.max_delay = float(opts["max_delay_sec"])
+        self.bucket = TokenBucket(opts["requests_per_sec"], opts["burst"], clock=clock, sleep=sleep)
+        self.breaker = CircuitBreaker(int(opts["breaker_failures"]), float(opts["breaker_reset_sec"]),
+                                      clock=clock)
+        self._sleep = sleep
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "requests": 0,       # 실제로 보낸 요청 수 (재시도 포함)
+            "delayed": 0,        # 토큰을 기다린 요청 수
+            "delay_sec": 0.0,    # 토큰 대기 + 백오프로 기다린 총 시간
+            "throttled": 0,      # 레이트 리밋 응답 수
+            "retries": 0,
+            "failures": 0,       # 재시도 후에도 실패한 호출 수
+            "rejected": 0,       # 서킷 브레이커가 막은 호출 수
+            "breaker_trips": 0,
+        }
+
+    def _count(self, key: str, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _backoff(self, attempt: int) -> float:
+        """full jitter: 0 ~ min(상한, 기본 * 2^attempt) 사이 무작위."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def call(self, func, *args, cost: float = 1.0, name: str = "", **kwargs):
+        """func(*args, **kwargs)를 한도 안에서 호출하고, 일시적 오류면 재시도."""
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                self._count("rejected")
+                raise CircuitOpenError(f"[LIMIT] Circuit open, request skipped: {name}")
+
+            waited = self.bucket.acquire(cost)
+            if waited > 0:
+                self._count("delayed")
+                self._count("delay_sec", waited)
+            self._count("requests")
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not _is_retryable(e):
+                    # 응답 자체는 받았으므로 (데이터 오류 등) 브레이커에는 성공으로 기록
+                    self.breaker.record_success()
+                    raise
+                throttled = is_rate_limit_error(e)
+                if throttled:
+                    self._count("throttled")
+                if self.breaker.record_failure():
+                    self._count("breaker_trips")
+                    logger.warning(f"[LIMIT] Circuit opened for {self.breaker.reset_sec:g}s after "
+                                   f"{self.breaker.failures} consecutive failures ({name}: {e})")
+                if attempt >= self.max_retries or self.breaker.state == CircuitBreaker.OPEN:
+                    self._count("failures")
+                    raise
+                delay = self._backoff(attempt)
+                if throttled:
+                    # 다른 스레드도 같이 물러나도록 버킷 전체를 멈춤
+                    self.bucket.pause(delay)
+                logger.warning(f"[LIMIT] {name} attempt {attempt + 1} failed ({e}), retrying in {delay:.1f}s")
+                self._count("retries")
+                self._count("delay_sec", delay)
+                self._sleep(delay)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+
+_guard = None
+_guard_lock = threading.Lock()
+
+
+def _limit_config() -> dict:
+    try:
+        import config
+        return config.config.get("rate_limit", {}) or {}
+    except Exception:
+        return {}
+
+
+def get_guard() -> RequestGuard:
+    """프로세스 공용 RequestGuard (config "rate_limit", 최초 호출 시 생성)."""
+    global _guard
+    with _guard_lock:
+        if _guard is None:
+            cfg = _limit_config()
+            _guard = RequestGuard(**{k: cfg[k] for k in DEFAULTS if k in cfg})
+        return _guard
+
+
+def get_request_stats() -> dict:
+    """공용 RequestGuard 통계 + 서킷 브레이커 상태."""
+    guard = get_guard()
+    with guard._stats_lock:
+        stats = dict(guard.stats)
+    stats["breaker_state"] = guard.breaker.state
+    return stats
@@ -0,0 +1,186 @@
+"""
+워치리스트 새로고침 파이프라인.
+
+한 번의 새로고침을 명시적인 단계로 나눕니다.
+- prefetch: 만료된 히스토리/시세/실적일을 다중 종목 요청으로 일괄 조회
+- fetch:    종목별 캐시/네트워크 I/O (stock_score.load_stock_inputs) — async_fetch 코어
+            (이벤트 루프 하나가 동시성 제한 안에서 수백 개 종목을 동시에 진행)
+- compute:  지표/신호 계산 (stock_score.compute_stock_data) — 계산 스레드 풀
+- ui:       계산이 끝난 종목부터 바로 테이블에 반영 (dispatch로 Tk 메인 스레드에 전달)
+
+종목 하나가 fetch를 마치면 곧바로 compute로, compute를 마치면 곧바로 ui로 넘어가므로
+전체 워치리스트가 끝날 때까지 기다리지 않고 결과가 순차적으로 표시됩니다.
+단계별 소요 시간은 last_timings에 남고 [PIPELINE] 로그로도 기록됩니다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+from async_fetch import get_core
+from stock_score import (load_stock_inputs, compute_stock_data,
+                         prefetch_history, prefetch_quotes, prefetch_earnings)
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("prefetch", "fetch", "compute", "ui")
+
+
+def _pipeline_config() -> dict:
+    try:
+        return config.config.get("refresh", {}) or {}
+    except Exception:
+        return {}
+
+
+def _default_compute_workers() -> int:
+    # 지표 계산은 GIL 영향을 받으므로 코어 수 이상으로 늘려도 이득이 없음
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+class RefreshPipeline:
+    """async 조회 코어(fetch)와 계산 스레드 풀(compute)을 가진 새로고침 엔진.
+
+    run()은 이벤트 루프에서 단계를 조율하며 호출한 스레드는 완료까지 대기하고,
+    ui 단계 콜백은 dispatch를 통해 실행한다.
+    """
+
+    def __init__(self, core=None, compute_workers: int = None):
+        cfg = _pipeline_config()
+        compute_workers = compute_workers or cfg.get("compute_workers") or _default_compute_workers()
+        self._core = core
+        self.compute_workers = compute_workers
+        self._compute_pool = ThreadPoolExecutor(max_workers=compute_workers,
+                                                thread_name_prefix="refresh-compute")
+        self._lock = threading.Lock()
+        self.last_timings = {}
+
+    @property
+    def core(self):
+        if self._core is None:
+            self._core = get_core()
+        return self._core
+
+    def shutdown(self, wait: bool = False):
+        self._compute_pool.shutdown(wait=wait, cancel_futures=True)
+
+    def run(self, tickers, on_result=None, on_done=None, dispatch=None,
+            on_progress=None, timeout: float = None) -> list:
+        """tickers를 단계별로 처리하고 성공한 StockData 목록을 tickers 순서로 반환.
+
+        on_result(record): 종목별 계산이 끝나는 즉시 dispatch로 전달 (ui 단계)
+        on_done(results, timings): 모든 on_result 이후 dispatch로 한 번 호출
+        dispatch(func): ui 단계 실행기 (기본값: 현재 스레드에서 즉시 실행)
+        on_progress(done, total): 종목 하나가 끝날 때마다 호출 (이벤트 루프 스레드)
+        timeout: 종목별 fetch 단계 제한 시간 (초과 시 이번 주기에서 제외)
+        """
+        dispatch = dispatch or (lambda func: func())
+        timeout = timeout or _pipeline_config().get("fetch_timeout_sec", 30)
+        prefetch_timeout = _pipeline_config().get("prefetch_timeout_sec", 120)
+        core = self.core
+        tickers = list(tickers)
+        total = len(tickers)
+        timings = {stage: 0.0 for stage in STAGES}
+        timings.update(tickers=total, ok=0)
+        results = {}
+        done = [0]
+        started = time.perf_counter()
+
+        def _add_time(stage, elapsed):
+            with self._lock:
+                timings[stage] += elapsed
+
+        def _ui(record):
+            t0 = time.perf_counter()
+            try:
+                on_result(record)
+            except Exception as e:
+                logger.error(f"[PIPELINE] UI stage error for {record.ticker}: {e}")
+            _add_time("ui", time.perf_counter() - t0)
+
+        def _fetch(ticker):
+            t0 = time.perf_counter()
+            try:
+                return load_stock_inputs(ticker)
+            finally:
+                _add_time("fetch", time.perf_counter() - t0)
+
+        def _compute(inputs):
+            t0 = time.perf_counter()
+            try:
+                record = compute_stock_data(inputs)
+            finally:
+                _add_time("compute", time.perf_counter() - t0)
+            if record:
+                results[inputs.ticker] = record
+                if on_result:
+                    dispatch(lambda r=record: _ui(r))
+            return record
+
+        def _finish():
+            with self._lock:
+                done[0] += 1
+                count = done[0]
+            if on_progress:
+                try:
+                    on_progress(count, total)
+                except Exception:
+                    pass
+
+        async def _one(ticker):
+            try:
+                inputs = await core.call(_fetch, ticker, timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"[PIPELINE] fetch stage timed out after {timeout}s for {ticker}")
+                inputs = None
+            except Exception as e:
+                logger.error(f"[PIPELINE] fetch stage error for {ticker}: {e}")
+                inputs = None
+            if inputs is not None:
+                try:
+                    await core.loop.run_in_executor(self._compute_pool, _compute, inputs)
+                except Exception as e:
+                    logger.error(f"[PIPELINE] compute stage error for {ticker}: {e}")
+            _finish()
+
+        async def _pipeline():
+            # 1) prefetch: 히스토리/시세/실적일 일괄 조회를 동시에 진행
+            #    (이후 fetch 단계는 대부분 캐시 히트)
+            #    제한 시간을 넘긴 일괄 조회는 기다리지 않고 fetch 단계의 종목별 조회로 넘어감
+            t0 = time.perf_counter()
+            stages = (prefetch_history, prefetch_quotes, prefetch_earnings)
+            outcomes = await asyncio.gather(*(core.call(func, tickers, timeout=prefetch_timeout)
+                                              for func in stages),
+                                            return_exceptions=True)
+            for func, outcome in zip(stages, outcomes):
+                if isinstance(outcome, asyncio.TimeoutError):
+                    logger.warning(f"[PIPELINE] {func.__name__} timed out after {prefetch_timeout}s")
+            timings["prefetch"] = time.perf_counter() - t0
+
+            # 2) fetch → 3) compute: 종목마다 코루틴 하나, fetch가 끝나면 바로 계산 풀로
+            await asyncio.gather(*(_one(t) for t in tickers))
+
+        core.run(_pipeline())
+
+        ordered = [results[t] for t in tickers if t in results]
+        timings["ok"] = len(ordered)
+
+        # 4) ui: on_done은 앞서 dispatch된 종목별 반영 뒤에 실행됨
+        def _done():
+            timings["total"] = time.perf_counter() - started
+            self.last_timings = dict(timings)
+            logger.info(
+                f"[PIPELINE] {timings['ok']}/{total} tickers in {timings['total']:.2f}s "
+                f"(prefetch {timings['prefetch']:.2f}s, fetch {timings['fetch']:.2f}s, "
+                f"compute {timings['compute']:.2f}s, ui {timings['ui']:.3f}s; "
+                f"concurrency {core.max_concurrency}/{self.compute_workers})"
+            )
+            if on_done:
+                on_done(ordered, dict(timings))
+
+        dispatch(_done)
+        return ordered
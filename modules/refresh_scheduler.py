@@ -0,0 +1,222 @@
+"""
+종목별 적응형 새로고침 스케줄러.
+
+모든 종목을 같은 주기로 다시 읽는 대신 종목마다 다음 갱신 시각을 둡니다.
+- 기본 주기: 시장 세션별 (정규장 / 프리장 / 애프터장 / 장 종료) — 장 종료 후에도 멈추지 않음
+- 보유 종목, 매수/매도 신호 중이거나 RSI가 경계값 근처인 종목은 더 자주,
+  등락이 작고 신호가 없는 조용한 종목은 더 드물게
+- 전체 요청 예산 (분당 종목 갱신 수 토큰 버킷): 예산을 넘는 종목은 다음 기회로 밀리며,
+  늦어진 정도(지연 / 주기)가 큰 종목부터 처리해 조용한 종목도 결국 갱신됨
+- 주기 안에서 실패가 많으면 (레이트 리밋 등) 주기와 예산을 함께 늘렸다가 정상화되면 천천히 복구
+
+워치리스트 크기가 커지면 주기가 예산에 맞춰 늘어나므로 요청량은 예산을 넘지 않습니다.
+Tk와 무관하며, 모니터 스레드가 due()로 받은 종목을 새로고침한 뒤 record_results()로 알려 줍니다.
+"""
+
+import logging
+import threading
+import time
+
+import config
+from market_trend_manager import guess_market_session
+
+logger = logging.getLogger(__name__)
+
+# guess_market_session() 값 → 설정 키
+_SESSION_KEYS = {"정규장": "regular", "프리장": "pre", "애프터장": "after", "주식장 종료": "closed"}
+
+DEFAULT_SESSION_INTERVALS = {"regular": 60, "pre": 120, "after": 120, "closed": 1800}
+
+# 종목 상태별 주기 배수
+HELD_FACTOR = 0.5       # 보유 종목
+ACTIVE_FACTOR = 0.5     # 매수/매도 신호 중이거나 RSI가 경계값 근처
+QUIET_FACTOR = 2.0      # 등락 작고 신호 없음
+RSI_MARGIN = 5.0        # RSI 경계값 ± 이 범위면 "근처"
+QUIET_RATE_PCT = 0.5    # |등락률| 이 값 미만이면 조용한 종목 후보
+
+MAX_BACKOFF = 8.0
+_BACKOFF_FAILURE_RATIO = 0.5   # 한 주기에서 이 비율 이상 실패하면 백오프 두 배
+_BACKOFF_RECOVERY = 0.75       # 실패 없는 주기마다 백오프에 곱함
+
+
+def _scheduler_config() -> dict:
+    try:
+        return config.config.get("refresh", {}) or {}
+    except Exception:
+        return {}
+
+
+def _parse_number(text):
+    """'45.12%', '매수 (0.12)' 같은 표시 문자열의 숫자 (없으면 None)."""
+    try:
+        return float(str(text).rstrip('%'))
+    except (TypeError, ValueError):
+        return None
+
+
+def activity_factor(record, held: bool = False) -> float:
+    """StockData → 주기 배수 (작을수록 자주 갱신)."""
+    if held:
+        return HELD_FACTOR
+    if record is None:
+        return 1.0
+    try:
+        rsi_conf = config.config["current"]["rsi"]
+        lower, upper = rsi_conf["lower"], rsi_conf["upper"]
+    except Exception:
+        lower, upper = 30, 70
+
+    momentum = str(getattr(record, 'momentum_signal', ''))
+    rsi = _parse_number(getattr(record, 'rsi_signal', None))
+    rate = _parse_number(getattr(record, 'rate', None))
+
+    if "매수" in momentum or "매도" in momentum:
+        return ACTIVE_FACTOR
+    if rsi is not None and (rsi <= lower + RSI_MARGIN or rsi >= upper - RSI_MARGIN):
+        return ACTIVE_FACTOR
+    if rate is not None and abs(rate) < QUIET_RATE_PCT:
+        return QUIET_FACTOR
+    return 1.0
+
+
+class RefreshScheduler:
+    """종목별 다음 갱신 시각 + 분당 요청 예산 + 실패 백오프."""
+
+    def __init__(self, requests_per_minute: float = None, session_intervals: dict = None,
+                 min_interval: float = None, max_interval: float = None, adaptive: bool = None,
+                 session_func=guess_market_session, clock=time.monotonic):
+        cfg = _scheduler_config()
+        self.adaptive = cfg.get("adaptive", True) if adaptive is None else adaptive
+        rpm = cfg.get("requests_per_minute", 120) if requests_per_minute is None else requests_per_minute
+        self.requests_per_minute = rpm or 0   # 0 = 무제한
+        self.session_intervals = dict(DEFAULT_SESSION_INTERVALS)
+        self.session_intervals.update(session_intervals or cfg.get("session_interval_sec", {}))
+        self.min_interval = min_interval or cfg.get("min_interval_sec", 15)
+        self.max_interval = max_interval or cfg.get("max_interval_sec", 3600)
+        self._session_func = session_func
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next_due = {}     # ticker -> 다음 갱신 시각
+        self._intervals = {}    # ticker -> 마지막으로 정한 주기
+        self._factors = {}      # ticker -> 마지막 activity_factor
+        self._session = None
+        self.backoff = 1.0
+        self._tokens = float(self.requests_per_minute)
+        self._tokens_at = clock()
+        # waiting: 마지막 due() 때 예산이 모자라 다음으로 밀린 종목 수
+        self.stats = {"scheduled": 0, "waiting": 0, "failures": 0, "backoffs": 0}
+
+    # ---------------- 상태 ----------------
+
+    def _session_key(self) -> str:
+        try:
+            return _SESSION_KEYS.get(self._session_func(), "closed")
+        except Exception:
+            return "regular"
+
+    def base_interval(self) -> float:
+        return float(self.session_intervals.get(self._session_key(), 60))
+
+    def _refill(self, now: float):
+        if not self.requests_per_minute:
+            return
+        # 백오프 중에는 예산도 같은 비율로 줄임
+        rate = self.requests_per_minute / 60.0 / self.backoff
+        self._tokens = min(float(self.requests_per_minute),
+                           self._tokens + max(0.0, now - self._tokens_at) * rate)
+        self._tokens_at = now
+
+    def sync(self, tickers):
+        """워치리스트와 맞춤: 새 종목은 바로 갱신 대상, 빠진 종목은 제거."""
+        now = self._clock()
+        with self._lock:
+            current = set(tickers)
+            for t in list(self._next_due):
+                if t not in current:
+                    self._next_due.pop(t, None)
+                    self._intervals.pop(t, None)
+                    self._factors.pop(t, None)
+            for t in tickers:
+                self._next_due.setdefault(t, now)
+
+    def _check_session(self, now: float):
+        """세션이 바뀌면 (예: 장 종료 → 프리장) 모든 종목을 새 주기 기준으로 바로 갱신."""
+        session = self._session_key()
+        if session != self._session:
+            if self._session is not None:
+                logger.info(f"[SCHEDULER] Session {self._session} -> {session}, rescheduling all tickers")
+                for t in self._next_due:
+                    self._next_due[t] = now
+            self._session = session
+
+    def due(self) -> list:
+        """지금 갱신할 종목 (예산 안에서, 늦어진 정도가 큰 순)."""
+        now = self._clock()
+        with self._lock:
+            self._check_session(now)
+            base = self.base_interval()
+            # 아직 한 번도 갱신하지 않은 종목이 가장 먼저
+            lateness = {t: (now - due_at) / self._intervals[t] if t in self._intervals else float("inf")
+                        for t, due_at in self._next_due.items() if due_at <= now}
+            ranked = sorted(lateness, key=lateness.get, reverse=True)
+            if not self.requests_per_minute:
+                batch = ranked
+            else:
+                self._refill(now)
+                batch = ranked[:max(0, int(self._tokens))]
+                self._tokens -= len(batch)
+            self.stats["scheduled"] += len(batch)
+            self.stats["waiting"] = len(ranked) - len(batch)
+            # 응답을 받을 때까지 다시 뽑히지 않도록 잠시 미룸 (record_results가 다시 정함)
+            for t in batch:
+                self._next_due[t] = now + base * self.backoff
+            return batch
+
+    def next_wakeup(self) -> float:
+        """다음 갱신 대상이 생길 때까지 남은 시간 (초, 1초 이상)."""
+        now = self._clock()
+        with self._lock:
+            if not self._next_due:
+                return self.base_interval()
+            wait = min(self._next_due.values()) - now
+            if self.requests_per_minute and self._tokens < 1:
+                rate = self.requests_per_minute / 60.0 / self.backoff
+                wait = max(wait, (1 - self._tokens) / rate)
+            return max(1.0, wait)
+
+    def record_results(self, tickers, results, held=()):
+        """새로고침 결과 반영: 성공한 종목은 상태별 주기로, 실패한 종목은 백오프 주기로 예약."""
+        now = self._clock()
+        by_ticker = {getattr(r, 'ticker', None): r for r in results if r}
+        held = set(held)
+        with self._lock:
+            base = self.base_interval()
+            failed = [t for t in tickers if t not in by_ticker]
+            self.stats["failures"] += len(failed)
+            if tickers and len(failed) / len(tickers) >= _BACKOFF_FAILURE_RATIO:
+                if self.backoff < MAX_BACKOFF:
+                    self.backoff = min(MAX_BACKOFF, self.backoff * 2)
+                    self.stats["backoffs"] += 1
+                    logger.warning(f"[SCHEDULER] {len(failed)}/{len(tickers)} refreshes failed, "
+                                   f"backoff x{self.backoff:g}")
+            elif not failed:
+                self.backoff = max(1.0, self.backoff * _BACKOFF_RECOVERY)
+
+            for t in tickers:
+                if t not in self._next_due:
+                    continue  # 새로고침 중 워치리스트에서 빠짐
+                if t in by_ticker:
+                    factor = activity_factor(by_ticker[t], t in held) if self.adaptive else 1.0
+                    self._factors[t] = factor
+                else:
+                    factor = self._factors.get(t, 1.0)
+                interval = min(self.max_interval, max(self.min_interval, base * factor)) * self.backoff
+                self._intervals[t] = interval
+                self._next_due[t] = now + interval
+
+    def snapshot(self) -> dict:
+        """ticker → (다음 갱신까지 남은 초, 주기) — 상태 표시/디버깅용."""
+        now = self._clock()
+        with self._lock:
+            return {t: (max(0.0, due_at - now), self._intervals.get(t))
+                    for t, due_at in self._next_due.items()}
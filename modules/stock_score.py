@@ -1,12 +1,14 @@
 import logging
-import time
 from collections import namedtuple
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
 
 import config
+import indicators
+from data_provider import get_provider
 from fundamental_score import calculate_valuation_score
+from incremental_indicators import get_engine
 from market_trend_manager import guess_market_session, is_market_open, adjust_momentum_based_on_market
 
 # Phase 3-2: Removed unused RSI_confidence, MACD_confidence, MA_confidence, BB_confidence
@@ -23,25 +25,10 @@ StockData = namedtuple('StockData', [
     'ichimoku_signal', 'pattern_signal'
 ])
 
-# Phase 7-2: API retry with exponential backoff
-MAX_RETRIES = 3
-RETRY_BASE_DELAY = 1  # seconds
-
-
-def _retry_api_call(func, *args, **kwargs):
-    """Retry API call with exponential backoff for network errors."""
-    last_error = None
-    for attempt in range(MAX_RETRIES):
-        try:
-            return func(*args, **kwargs)
-        except (ConnectionError, TimeoutError, OSError) as e:
-            last_error = e
-            if attempt < MAX_RETRIES - 1:
-                delay = RETRY_BASE_DELAY * (2 ** attempt)
-                logging.warning(f"[RETRY] Attempt {attempt + 1} failed: {e}, retrying in {delay}s")
-                time.sleep(delay)
-    raise last_error
-
+# 새로고침 파이프라인의 조회 단계 결과 (I/O) → 계산 단계 (CPU) 입력
+StockInputs = namedtuple('StockInputs', [
+    'ticker', 'interval', 'historical_data', 'ticker_info', 'quote', 'earnings_dday', 'htf_data'
+])
 
 def update_period_interval(period, interval):
     config.config["current"]["period"] = period
@@ -59,9 +46,7 @@ def calculate_moving_average(historical_data, days=5):
 
 # RSI 계산 함수
 def calculate_rsi(historical_data, period=14):
-    delta = historical_data['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    gain, loss = indicators.avg_gain_loss(historical_data['Close'], period)
 
     if gain.isna().any() or loss.isna().any():
         gain = gain.fillna(0)
@@ -75,35 +60,17 @@ def calculate_rsi(historical_data, period=14):
     if last_loss == 0:
         return 100.0
 
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi.iloc[-1]
+    return indicators.rsi(historical_data['Close'], period).iloc[-1]
 
 
 # MACD 계산 함수
 def calculate_macd(historical_data, period=(12, 26, 9)):
-    short_ema = historical_data['Close'].ewm(span=period[0], adjust=False).mean()
-    long_ema = historical_data['Close'].ewm(span=period[1], adjust=False).mean()
-    macd = short_ema - long_ema
-    signal_line = macd.ewm(span=period[2], adjust=False).mean()
-    macd_histogram = macd - signal_line
-    return macd, signal_line, macd_histogram
+    return indicators.macd(historical_data['Close'], *period)
 
 
 def calculate_atr(historical_data, period=14):
     """ATR (Average True Range) 계산 — 변동성 측정."""
-    high = historical_data['High']
-    low = historical_data['Low']
-    close = historical_data['Close']
-    prev_close = close.shift(1)
-
-    tr1 = high - low
-    tr2 = (high - prev_close).abs()
-    tr3 = (low - prev_close).abs()
-
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    atr = true_range.rolling(window=period).mean()
-    return atr
+    return indicators.atr(historical_data, period)
 
 
 def detect_divergence(historical_data, rsi_values=None, lookback=20):
@@ -116,13 +83,8 @@ def detect_divergence(historical_data, rsi_values=None, lookback=20):
     try:
         close = historical_data['Close']
 
-        # RSI 시리즈 계산
-        delta = close.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        loss_safe = loss.replace(0, 1e-10)
-        rs = gain / loss_safe
-        rsi_series = 100 - (100 / (1 + rs))
+        # RSI 시리즈 (평균 상승/하락폭은 calculate_rsi와 공유, 0 나눗셈만 작은 값으로 회피)
+        rsi_series = indicators.rsi(close, 14, zero_loss=1e-10)
 
         # 여러 lookback 구간으로 다이버전스 탐색 (짧은→긴 순서)
         for lb in [10, 20, 30]:
@@ -183,23 +145,26 @@ def calculate_vwap(historical_data):
         cum_tp_vol = (typical_price * historical_data['Volume']).cumsum()
         cum_vol = historical_data['Volume'].cumsum()
         vwap = cum_tp_vol / cum_vol
-        last_vwap = vwap.iloc[-1]
-        last_close = historical_data['Close'].iloc[-1]
-        if pd.isna(last_vwap) or last_vwap == 0:
-            return None, ""
-        pct_diff = (last_close - last_vwap) / last_vwap * 100
-        if pct_diff > 1:
-            signal = f"강세 +{pct_diff:.1f}%"
-        elif pct_diff < -1:
-            signal = f"약세 {pct_diff:.1f}%"
-        else:
-            signal = f"중립 {pct_diff:+.1f}%"
-        return round(float(last_vwap), 2), signal
+        return _vwap_signal(historical_data['Close'].iloc[-1], vwap.iloc[-1])
     except Exception as e:
         logging.warning(f"[VWAP] Calculation error: {e}")
         return None, ""
 
 
+def _vwap_signal(last_close, last_vwap):
+    """마지막 종가와 VWAP → (vwap_value, signal_text)."""
+    if pd.isna(last_vwap) or last_vwap == 0:
+        return None, ""
+    pct_diff = (last_close - last_vwap) / last_vwap * 100
+    if pct_diff > 1:
+        signal = f"강세 +{pct_diff:.1f}%"
+    elif pct_diff < -1:
+        signal = f"약세 {pct_diff:.1f}%"
+    else:
+        signal = f"중립 {pct_diff:+.1f}%"
+    return round(float(last_vwap), 2), signal
+
+
 def calculate_obv(historical_data):
     """OBV (On-Balance Volume) 계산 및 추세 판단.
     Returns: signal_text — OBV 10일MA 대비 변화율(%) + 추세 신호
@@ -208,42 +173,40 @@ def calculate_obv(historical_data):
         if 'Volume' not in historical_data.columns or len(historical_data) < 10:
             return ""
         close = historical_data['Close']
-        volume = historical_data['Volume']
-        obv = pd.Series(0.0, index=close.index)
-        for i in range(1, len(close)):
-            if close.iloc[i] > close.iloc[i - 1]:
-                obv.iloc[i] = obv.iloc[i - 1] + volume.iloc[i]
-            elif close.iloc[i] < close.iloc[i - 1]:
-                obv.iloc[i] = obv.iloc[i - 1] - volume.iloc[i]
-            else:
-                obv.iloc[i] = obv.iloc[i - 1]
+        volume = historical_data['Volume'].to_numpy(dtype=np.float64)
+        # 전일 대비 상승 +1 / 하락 -1 / 보합·결측 0 → 부호 × 거래량 누적 합
+        direction = np.nan_to_num(np.sign(np.diff(close.to_numpy(dtype=np.float64), prepend=np.nan)))
+        step = np.where(direction != 0, direction * volume, 0.0)
+        obv = pd.Series(np.cumsum(step), index=close.index)
         # OBV 10일 이동평균 추세 비교
         obv_ma = obv.rolling(10).mean()
         if pd.isna(obv_ma.iloc[-1]):
             return ""
-        # OBV vs MA 변화율
-        obv_last = obv.iloc[-1]
-        ma_last = obv_ma.iloc[-1]
-        if abs(ma_last) > 0:
-            obv_pct = (obv_last - ma_last) / abs(ma_last) * 100
-        else:
-            obv_pct = 0.0
-        price_up = close.iloc[-1] > close.iloc[-10]
-        obv_up = obv_last > ma_last
-        if price_up and obv_up:
-            label = "확인↑"
-        elif price_up and not obv_up:
-            label = "괴리↓"
-        elif not price_up and obv_up:
-            label = "반전↑"
-        else:
-            label = "확인↓"
-        return f"{obv_pct:+.1f}% {label}"
+        return _obv_signal(obv.iloc[-1], obv_ma.iloc[-1], close.iloc[-1] > close.iloc[-10])
     except Exception as e:
         logging.warning(f"[OBV] Calculation error: {e}")
         return ""
 
 
+def _obv_signal(obv_last, ma_last, price_up):
+    """OBV 마지막 값, 10일 MA, 가격 상승 여부 → signal_text."""
+    # OBV vs MA 변화율
+    if abs(ma_last) > 0:
+        obv_pct = (obv_last - ma_last) / abs(ma_last) * 100
+    else:
+        obv_pct = 0.0
+    obv_up = obv_last > ma_last
+    if price_up and obv_up:
+        label = "확인↑"
+    elif price_up and not obv_up:
+        label = "괴리↓"
+    elif not price_up and obv_up:
+        label = "반전↑"
+    else:
+        label = "확인↓"
+    return f"{obv_pct:+.1f}% {label}"
+
+
 def calculate_stochastic(historical_data, k_period=14, d_period=3):
     """Stochastic Oscillator (%K, %D) 계산.
     Returns: (k_value, d_value, signal_text)
@@ -257,29 +220,32 @@ def calculate_stochastic(historical_data, k_period=14, d_period=3):
         denom = denom.replace(0, 1e-10)
         k = (historical_data['Close'] - low_min) / denom * 100
         d = k.rolling(window=d_period).mean()
-        last_k = k.iloc[-1]
-        last_d = d.iloc[-1]
-        if pd.isna(last_k) or pd.isna(last_d):
-            return None, None, ""
-        k_val = round(float(last_k), 1)
-        d_val = round(float(last_d), 1)
-        kd_text = f"{k_val:.0f}/{d_val:.0f}"
-        if k_val > 80 and k_val < d_val:
-            signal = f"{kd_text} 과매수↓"
-        elif k_val < 20 and k_val > d_val:
-            signal = f"{kd_text} 과매도↑"
-        elif k_val > 80:
-            signal = f"{kd_text} 과매수"
-        elif k_val < 20:
-            signal = f"{kd_text} 과매도"
-        else:
-            signal = kd_text
-        return k_val, d_val, signal
+        return _stochastic_signal(k.iloc[-1], d.iloc[-1])
     except Exception as e:
         logging.warning(f"[STOCH] Calculation error: {e}")
         return None, None, ""
 
 
+def _stochastic_signal(last_k, last_d):
+    """%K, %D 마지막 값 → (k_value, d_value, signal_text)."""
+    if pd.isna(last_k) or pd.isna(last_d):
+        return None, None, ""
+    k_val = round(float(last_k), 1)
+    d_val = round(float(last_d), 1)
+    kd_text = f"{k_val:.0f}/{d_val:.0f}"
+    if k_val > 80 and k_val < d_val:
+        signal = f"{kd_text} 과매수↓"
+    elif k_val < 20 and k_val > d_val:
+        signal = f"{kd_text} 과매도↑"
+    elif k_val > 80:
+        signal = f"{kd_text} 과매수"
+    elif k_val < 20:
+        signal = f"{kd_text} 과매도"
+    else:
+        signal = kd_text
+    return k_val, d_val, signal
+
+
 def calculate_ichimoku(historical_data, tenkan=9, kijun=26, senkou_b=52):
     """Ichimoku Cloud (일목균형표) 계산.
     Returns: dict with keys: tenkan_sen, kijun_sen, senkou_a, senkou_b, chikou, signal
@@ -304,27 +270,8 @@ def calculate_ichimoku(historical_data, tenkan=9, kijun=26, senkou_b=52):
         chikou = close.shift(-kijun)
 
         # Signal generation
-        last_close = close.iloc[-1]
-        last_tenkan = tenkan_sen.iloc[-1]
-        last_kijun = kijun_sen.iloc[-1]
-        # Use current (non-shifted) cloud for signal
-        cur_senkou_a = senkou_a.iloc[-1] if not pd.isna(senkou_a.iloc[-1]) else 0
-        cur_senkou_b = senkou_b_line.iloc[-1] if not pd.isna(senkou_b_line.iloc[-1]) else 0
-        cloud_top = max(cur_senkou_a, cur_senkou_b)
-        cloud_bottom = min(cur_senkou_a, cur_senkou_b)
-
-        if pd.isna(last_tenkan) or pd.isna(last_kijun):
-            signal = ""
-        elif last_close > cloud_top and last_tenkan > last_kijun:
-            signal = "강세↑"
-        elif last_close < cloud_bottom and last_tenkan < last_kijun:
-            signal = "약세↓"
-        elif last_close > cloud_top:
-            signal = "구름위"
-        elif last_close < cloud_bottom:
-            signal = "구름아래"
-        else:
-            signal = "구름내"
+        signal = _ichimoku_signal(close.iloc[-1], tenkan_sen.iloc[-1], kijun_sen.iloc[-1],
+                                  senkou_a.iloc[-1], senkou_b_line.iloc[-1])
 
         return {
             'tenkan_sen': tenkan_sen,
@@ -339,35 +286,39 @@ def calculate_ichimoku(historical_data, tenkan=9, kijun=26, senkou_b=52):
         return None
 
 
-def fetch_earnings_dday(ticker_data):
-    """다음 실적 발표일까지 남은 일수 조회.
+def _ichimoku_signal(last_close, last_tenkan, last_kijun, senkou_a, senkou_b):
+    """마지막 종가/전환선/기준선/선행스팬 → signal_text."""
+    # Use current (non-shifted) cloud for signal
+    cur_senkou_a = senkou_a if not pd.isna(senkou_a) else 0
+    cur_senkou_b = senkou_b if not pd.isna(senkou_b) else 0
+    cloud_top = max(cur_senkou_a, cur_senkou_b)
+    cloud_bottom = min(cur_senkou_a, cur_senkou_b)
+
+    if pd.isna(last_tenkan) or pd.isna(last_kijun):
+        return ""
+    elif last_close > cloud_top and last_tenkan > last_kijun:
+        return "강세↑"
+    elif last_close < cloud_bottom and last_tenkan < last_kijun:
+        return "약세↓"
+    elif last_close > cloud_top:
+        return "구름위"
+    elif last_close < cloud_bottom:
+        return "구름아래"
+    else:
+        return "구름내"
+
+
+def fetch_earnings_dday(ticker):
+    """다음 실적 발표일까지 남은 일수 (실적 발표일 캐시 조회, 하루 한 번만 네트워크).
     Returns: 'D-N' 형태 문자열 또는 ''
     """
     try:
         from datetime import datetime
-        cal = ticker_data.calendar
-        if cal is None:
+        from data_cache import get_earnings_date
+        earn_date = get_earnings_date(ticker)
+        if not earn_date:
             return ""
-        # yfinance calendar: dict or DataFrame
-        if isinstance(cal, dict):
-            earn_date = cal.get('Earnings Date', [None])[0] if 'Earnings Date' in cal else None
-        elif hasattr(cal, 'columns'):
-            if 'Earnings Date' in cal.columns:
-                earn_date = cal['Earnings Date'].iloc[0]
-            elif len(cal) > 0:
-                earn_date = cal.iloc[0, 0] if cal.shape[1] > 0 else None
-            else:
-                earn_date = None
-        else:
-            return ""
-        if earn_date is None:
-            return ""
-        if hasattr(earn_date, 'date'):
-            earn_date = earn_date.date()
-        elif isinstance(earn_date, str):
-            earn_date = datetime.strptime(earn_date, '%Y-%m-%d').date()
-        today = datetime.now().date()
-        days_left = (earn_date - today).days
+        days_left = (datetime.strptime(earn_date, '%Y-%m-%d').date() - datetime.now().date()).days
         if days_left < 0:
             return ""
         return f"D-{days_left}"
@@ -382,26 +333,16 @@ def calculate_adx(historical_data, period=14):
     try:
         high = historical_data['High']
         low = historical_data['Low']
-        close = historical_data['Close']
 
         if len(historical_data) < period * 2:
             return None, ""
 
-        # +DM / -DM 계산
-        plus_dm = high.diff()
-        minus_dm = low.diff().abs() * -1  # 하락폭을 양수로
-
-        # 실제 방향 움직임 결정
-        plus_dm_final = pd.Series(0.0, index=high.index)
-        minus_dm_final = pd.Series(0.0, index=high.index)
-
-        for i in range(1, len(high)):
-            up = high.iloc[i] - high.iloc[i-1]
-            down = low.iloc[i-1] - low.iloc[i]
-            if up > down and up > 0:
-                plus_dm_final.iloc[i] = up
-            if down > up and down > 0:
-                minus_dm_final.iloc[i] = down
+        # +DM / -DM: 상승폭·하락폭 중 큰 쪽만 인정 (첫 봉/결측은 비교가 False라 0)
+        up = np.diff(high.to_numpy(dtype=np.float64), prepend=np.nan)
+        down = -np.diff(low.to_numpy(dtype=np.float64), prepend=np.nan)
+        with np.errstate(invalid="ignore"):
+            plus_dm_final = pd.Series(np.where((up > down) & (up > 0), up, 0.0), index=high.index)
+            minus_dm_final = pd.Series(np.where((down > up) & (down > 0), down, 0.0), index=high.index)
 
         # ATR
         atr = calculate_atr(historical_data, period)
@@ -414,67 +355,165 @@ def calculate_adx(historical_data, period=14):
         dx = (abs(plus_di - minus_di) / (plus_di + minus_di)) * 100
         adx = dx.rolling(window=period).mean()
 
-        last_adx = adx.iloc[-1]
-        if pd.isna(last_adx):
-            return None, ""
-
-        adx_val = round(float(last_adx), 1)
-        if adx_val > 25:
-            signal = "강추세"
-        elif adx_val < 20:
-            signal = "약추세"
-        else:
-            signal = "보통"
-
-        return adx_val, signal
+        return _adx_signal(adx.iloc[-1])
     except Exception as e:
         logging.warning(f"[ADX] Calculation error: {e}")
         return None, ""
 
 
-def fetch_higher_timeframe_trend(ticker_symbol, current_interval):
-    """상위 타임프레임 MA 교차 방향을 확인하여 추세 반환.
-    Returns: 'UP', 'DOWN', '' (빈 문자열 = 판단 불가)
+def _adx_signal(last_adx):
+    """ADX 마지막 값 → (adx_value, adx_signal)."""
+    if pd.isna(last_adx):
+        return None, ""
+
+    adx_val = round(float(last_adx), 1)
+    if adx_val > 25:
+        signal = "강추세"
+    elif adx_val < 20:
+        signal = "약추세"
+    else:
+        signal = "보통"
+
+    return adx_val, signal
+
+
+# 타임프레임 매핑: 현재 인터벌 → (상위 TF, 조회 기간)
+_HTF_MAP = {
+    "1m": ("1d", "3mo"), "5m": ("1d", "3mo"), "15m": ("1d", "3mo"),
+    "30m": ("1d", "3mo"), "1h": ("1d", "6mo"),
+    "1d": ("1wk", "2y"), "5d": ("1wk", "2y"),
+}
+
+
+def fetch_higher_timeframe_history(ticker_symbol, current_interval, base_data=None, base_interval=None):
+    """상위 타임프레임 히스토리 조회. 매핑이 없거나 실패하면 None.
+
+    캐시를 쓸 수 있으면 이미 조회한 base_data나 캐시된 일봉을 리샘플하고 (상위 TF 전용 TTL),
+    없으면 공급자에서 직접 조회한다.
     """
-    # 타임프레임 매핑: 현재 인터벌 → 상위 TF
-    htf_map = {
-        "1m": ("1d", "3mo"), "5m": ("1d", "3mo"), "15m": ("1d", "3mo"),
-        "30m": ("1d", "3mo"), "1h": ("1d", "6mo"),
-        "1d": ("1wk", "2y"), "5d": ("1wk", "2y"),
-    }
-    htf_interval, htf_period = htf_map.get(current_interval, (None, None))
+    htf_interval, htf_period = _HTF_MAP.get(current_interval, (None, None))
     if not htf_interval:
+        return None
+    try:
+        try:
+            from data_cache import get_higher_timeframe_history
+        except ImportError:
+            return get_provider().ticker(ticker_symbol).history(period=htf_period, interval=htf_interval)
+        return get_higher_timeframe_history(ticker_symbol, htf_interval, htf_period,
+                                            base=base_data, base_interval=base_interval)
+    except Exception as e:
+        logging.warning(f"[HTF] Error for {ticker_symbol}: {e}")
+        return None
+
+
+def higher_timeframe_trend(data):
+    """상위 타임프레임 히스토리의 MA 교차 방향.
+    Returns: 'UP', 'DOWN', '' (빈 문자열 = 판단 불가)
+    """
+    if data is None or data.empty or len(data) < 20:
         return ""
 
-    try:
-        data = yf.Ticker(ticker_symbol).history(period=htf_period, interval=htf_interval)
-        if data.empty or len(data) < 20:
-            return ""
+    ma_short = indicators.sma(data['Close'], 5)
+    ma_long = indicators.sma(data['Close'], 20)
 
-        ma_short = data['Close'].rolling(window=5).mean()
-        ma_long = data['Close'].rolling(window=20).mean()
+    if pd.isna(ma_short.iloc[-1]) or pd.isna(ma_long.iloc[-1]):
+        return ""
 
-        if pd.isna(ma_short.iloc[-1]) or pd.isna(ma_long.iloc[-1]):
-            return ""
+    if ma_short.iloc[-1] > ma_long.iloc[-1]:
+        return "UP"
+    else:
+        return "DOWN"
 
-        if ma_short.iloc[-1] > ma_long.iloc[-1]:
-            return "UP"
-        else:
-            return "DOWN"
+
+def fetch_higher_timeframe_trend(ticker_symbol, current_interval):
+    """상위 타임프레임 MA 교차 방향을 확인하여 추세 반환.
+    Returns: 'UP', 'DOWN', '' (빈 문자열 = 판단 불가)
+    """
+    try:
+        return higher_timeframe_trend(fetch_higher_timeframe_history(ticker_symbol, current_interval))
     except Exception as e:
         logging.warning(f"[HTF] Error for {ticker_symbol}: {e}")
         return ""
 
 
-# Bollinger Bands 계산 함수
 def calculate_bollinger_bands(historical_data):
     bb_period = config.config["current"]["bollinger"]["period"]
     std_mult = config.config["current"]["bollinger"]["std_dev_multiplier"]
-    rolling_mean = historical_data['Close'].rolling(window=bb_period).mean()
-    rolling_std = historical_data['Close'].rolling(window=bb_period).std()
-    upper_band = rolling_mean + (rolling_std * std_mult)
-    lower_band = rolling_mean - (rolling_std * std_mult)
-    return upper_band, lower_band, rolling_mean
+    return indicators.bollinger(historical_data['Close'], bb_period, std_mult)
+
+
+def indicator_params():
+    """현재 설정의 지표 파라미터 (증분 지표 상태는 파라미터가 바뀌면 다시 구축)."""
+    current = config.config["current"]
+    macd = current["macd"]
+    return {
+        "rsi_period": current["rsi"]["period"],
+        "ma_short": current["ma_cross"]["short"],
+        "ma_long": current["ma_cross"]["long"],
+        "macd": (macd["short"], macd["long"], macd["signal"]),
+        "bb_period": current["bollinger"]["period"],
+        "bb_std": current["bollinger"]["std_dev_multiplier"],
+        "atr_period": 14,
+        "adx_period": current.get("adx_period", 14),
+        "stoch": (14, 3),
+        "ichimoku": (9, 26, 52),
+        "obv_window": 10,
+    }
+
+
+def calculate_indicators(historical_data, key=None):
+    """compute_stock_data가 쓰는 지표 최신값과 신호.
+
+    key=(ticker, interval)가 주어지면 종목별 증분 상태에 새 봉만 반영하고,
+    증분 계산을 쓸 수 없는 데이터(결측 OHLC 등)는 전체 히스토리로 일괄 계산한다.
+    """
+    params = indicator_params()
+    values = None
+    if key is not None:
+        try:
+            values = get_engine().evaluate(key, historical_data, params)
+        except Exception as e:
+            logging.warning(f"[INDICATOR] Incremental update failed for {key}: {e}")
+            get_engine().discard(key)
+
+    if values is not None:
+        ichimoku = values["ichimoku"]
+        obv = values["obv"]
+        return {
+            "rsi": values["rsi"],
+            "ma_short": values["ma_short"],
+            "ma_long": values["ma_long"],
+            "macd": values["macd"],
+            "macd_signal": values["macd_signal"],
+            "bb_upper": values["bb_upper"],
+            "bb_lower": values["bb_lower"],
+            "atr": values["atr"],
+            "adx": _adx_signal(values["adx"]),
+            "vwap": _vwap_signal(values["close"], values["vwap"]) if values["volume_sum"] else (None, ""),
+            "obv": _obv_signal(obv["obv"], obv["obv_ma"], obv["price_up"]) if obv else "",
+            "stochastic": _stochastic_signal(values["stoch_k"], values["stoch_d"]),
+            "ichimoku": _ichimoku_signal(values["close"], ichimoku["tenkan"], ichimoku["kijun"],
+                                         ichimoku["senkou_a"], ichimoku["senkou_b"]) if ichimoku else "",
+        }
+
+    macd, signal_line, _ = calculate_macd(historical_data, params["macd"])
+    upper_band, lower_band, _ = calculate_bollinger_bands(historical_data)
+    ichimoku_result = calculate_ichimoku(historical_data)
+    return {
+        "rsi": calculate_rsi(historical_data, params["rsi_period"]),
+        "ma_short": calculate_moving_average(historical_data, days=params["ma_short"]),
+        "ma_long": calculate_moving_average(historical_data, days=params["ma_long"]),
+        "macd": macd.iloc[-1],
+        "macd_signal": signal_line.iloc[-1],
+        "bb_upper": upper_band.iloc[-3:].tolist(),
+        "bb_lower": lower_band.iloc[-3:].tolist(),
+        "atr": calculate_atr(historical_data).iloc[-1],
+        "adx": calculate_adx(historical_data, period=params["adx_period"]),
+        "vwap": calculate_vwap(historical_data),
+        "obv": calculate_obv(historical_data),
+        "stochastic": calculate_stochastic(historical_data),
+        "ichimoku": ichimoku_result['signal'] if ichimoku_result else "",
+    }
 
 
 def _days_between(start_str, end_str):
@@ -537,11 +576,63 @@ def auto_set_interval_by_period():
     config.save_config(config.get_config())
 
 
-# 종목 데이터 가져오기
-def fetch_stock_data(ticker):
+def prefetch_history(tickers):
+    """워치리스트 히스토리를 다중 종목 다운로드로 미리 캐시에 채운다.
+
+    fetch_stock_data와 같은 period/interval 규칙을 사용하므로
+    이후 종목별 조회는 캐시 히트로 처리된다.
+    """
+    if not tickers:
+        return
+    try:
+        from data_cache import get_cached_history_batch
+    except ImportError:
+        return
+
+    auto_set_interval_by_period()
+    current = config.config["current"]
+    # custom_mode는 start/end 범위 조회라 종목별 경로를 그대로 사용
+    if current.get("custom_mode"):
+        return
+    try:
+        if is_market_open():
+            get_cached_history_batch(tickers, period=current["period"],
+                                     interval=current["interval"])
+        else:
+            get_cached_history_batch(tickers, period=current["period"])
+    except Exception as e:
+        logging.warning(f"[PREFETCH] Batch history failed: {e}")
+
+
+def prefetch_earnings(tickers):
+    """워치리스트 실적 발표일을 미리 캐시에 채운다 (하루 TTL, 시작 시 1회)."""
+    if not tickers:
+        return
+    try:
+        from data_cache import prefetch_earnings as _prefetch_earnings
+        _prefetch_earnings(tickers)
+    except Exception as e:
+        logging.warning(f"[PREFETCH] Earnings calendar failed: {e}")
+
+
+def prefetch_quotes(tickers):
+    """워치리스트 시세(현재가/등락률/거래량)를 한 번의 일괄 요청으로 미리 캐시에 채운다."""
+    if not tickers:
+        return
+    try:
+        from data_cache import get_quotes
+        get_quotes(tickers, prepost=guess_market_session() in ("프리장", "애프터장"))
+    except Exception as e:
+        logging.warning(f"[PREFETCH] Batch quotes failed: {e}")
+
+
+# 조회 단계: 네트워크/캐시 I/O만 수행
+def load_stock_inputs(ticker):
+    """종목 히스토리·펀더멘털·시세·실적일·상위 TF 히스토리를 모아 StockInputs로 반환."""
     try:
-        ticker_data = yf.Ticker(ticker)
+        ticker_data = get_provider().ticker(ticker)
         auto_set_interval_by_period()
+        interval = config.config["current"]["interval"]
 
         # SQLite 캐시 사용 시도
         try:
@@ -577,49 +668,79 @@ def fetch_stock_data(ticker):
                 historical_data = _cached_hist(ticker, period=config.config["current"]["period"])
             else:
                 historical_data = ticker_data.history(period=config.config["current"]["period"])
+            interval = "1d"
 
         if historical_data.empty:
             logging.warning(f"[FETCH] No historical data for {ticker}")
             return None
 
-        # Phase 7-1: Single .info call, reuse result
-        ticker_info = ticker_data.info
-        company_name = ticker_info.get('shortName', 'Unknown Company')
+        # 회사명/펀더멘털은 24시간 캐시, 가격/등락률/거래량은 짧은 TTL 시세 캐시
+        try:
+            from data_cache import get_cached_fundamental_or_fetch, get_quote
+            ticker_info = get_cached_fundamental_or_fetch(ticker)
+            session = guess_market_session()
+            quote = get_quote(ticker, prepost=session in ("프리장", "애프터장"))
+        except ImportError:
+            ticker_info = ticker_data.info
+            quote = {}
 
-        session = guess_market_session()
-        if session == "정규장":
-            current_price = ticker_info.get('regularMarketPrice', 0)
-        elif session == "프리장":
-            current_price = ticker_info.get('preMarketPrice', ticker_info.get('regularMarketPrice', 0))
-        elif session == "애프터장":
-            current_price = ticker_info.get('postMarketPrice', ticker_info.get('regularMarketPrice', 0))
-        else:
-            current_price = ticker_info.get('regularMarketPrice', 0)
+        # 실적 발표일 (하루 TTL 캐시)
+        earnings_dday = fetch_earnings_dday(ticker)
+
+        # 멀티 타임프레임 확인용 상위 TF 히스토리 (최근 구간이면 위 히스토리를 리샘플)
+        htf_data = None
+        if config.config["current"].get("multi_timeframe_enabled", False):
+            base = None if config.config["current"].get("custom_mode") else historical_data
+            htf_data = fetch_higher_timeframe_history(ticker, config.config["current"]["interval"],
+                                                      base_data=base, base_interval=interval)
+
+        return StockInputs(ticker, interval, historical_data, ticker_info, quote, earnings_dday, htf_data)
+
+    except (ConnectionError, TimeoutError) as e:
+        logging.error(f"[FETCH] Network error for {ticker}: {e}")
+        return None
+    except KeyError as e:
+        logging.error(f"[FETCH] Missing data key for {ticker}: {e}")
+        return None
+    except Exception as e:
+        logging.error(f"[FETCH] Error fetching data for {ticker}: {e}")
+        return None
+
+
+# 계산 단계: 이미 조회한 입력으로 지표/신호만 계산 (네트워크 없음)
+def compute_stock_data(inputs):
+    """StockInputs로 지표와 신호를 계산하여 StockData 반환."""
+    ticker = inputs.ticker
+    historical_data = inputs.historical_data
+    ticker_info = inputs.ticker_info
+    quote = inputs.quote
+    try:
+        company_name = ticker_info.get('shortName', 'Unknown Company')
 
+        # 시세 조회 실패 시 (오래된) info 값으로 대체
+        current_price = quote.get('lastPrice', ticker_info.get('regularMarketPrice', 0))
         if current_price is None or isinstance(current_price, str):
             current_price = 0
 
-        rsi = calculate_rsi(historical_data, config.config["current"]["rsi"]['period'])
-        ma5 = calculate_moving_average(historical_data, days=config.config["current"]["ma_cross"]["short"])
-        ma20 = calculate_moving_average(historical_data, days=config.config["current"]["ma_cross"]["long"])
-
-        macd_period = config.config["current"]["macd"]
-        macd, signal_line, macd_histogram = calculate_macd(
-            historical_data, (macd_period["short"], macd_period["long"], macd_period["signal"])
-        )
-        upper_band, lower_band, middle_band = calculate_bollinger_bands(historical_data)
+        # 종목별 증분 지표 상태 (새 봉만 반영, 불가 시 일괄 계산)
+        ind = calculate_indicators(historical_data, key=(ticker, inputs.interval))
+        rsi = ind["rsi"]
+        ma5 = ind["ma_short"]
+        ma20 = ind["ma_long"]
+        last_macd, last_signal = ind["macd"], ind["macd_signal"]
+        upper_band, lower_band = ind["bb_upper"], ind["bb_lower"]
 
         macd_simple_signal = '관망'
-        if macd.iloc[-1] > signal_line.iloc[-1]:
-            macd_signal = f"매수 ({macd.iloc[-1]:.2f})"
+        if last_macd > last_signal:
+            macd_signal = f"매수 ({last_macd:.2f})"
             macd_simple_signal = '매수'
-        elif macd.iloc[-1] < signal_line.iloc[-1]:
-            macd_signal = f"매도 ({macd.iloc[-1]:.2f})"
+        elif last_macd < last_signal:
+            macd_signal = f"매도 ({last_macd:.2f})"
             macd_simple_signal = '매도'
         else:
-            macd_signal = f"관망 ({macd.iloc[-1]:.2f})"
+            macd_signal = f"관망 ({last_macd:.2f})"
 
-        rate = ticker_info.get('regularMarketChangePercent', 0)
+        rate = quote.get('changePercent', ticker_info.get('regularMarketChangePercent', 0))
         if rate is None:
             rate = 0
         rate_color = "black"
@@ -646,21 +767,21 @@ def fetch_stock_data(ticker):
         if use_rebound_confirmation:
             # Phase 3-4: Fixed Bollinger rebound logic — same-timeframe check
             if len(historical_data) >= 3:
-                recent_close = historical_data['Close'].iloc[-3:]
-                lower_band_recent = lower_band.iloc[-3:]
-                upper_band_recent = upper_band.iloc[-3:]
+                recent_close = historical_data['Close'].iloc[-3:].to_numpy()
+                lower_band_recent = np.asarray(lower_band[-3:])
+                upper_band_recent = np.asarray(upper_band[-3:])
                 touched_lower = (recent_close <= lower_band_recent).any()
                 touched_upper = (recent_close >= upper_band_recent).any()
-                rebounded = recent_close.iloc[-1] > recent_close.iloc[-2]
-                declined = recent_close.iloc[-1] < recent_close.iloc[-2]
+                rebounded = recent_close[-1] > recent_close[-2]
+                declined = recent_close[-1] < recent_close[-2]
                 if touched_lower and rebounded:
                     bb_signal = "매수 (반등확인)"
                 elif touched_upper and declined:
                     bb_signal = "매도 (반락확인)"
         else:
-            if current_price > upper_band.iloc[-1]:
+            if current_price > upper_band[-1]:
                 bb_signal = "매도"
-            elif current_price < lower_band.iloc[-1]:
+            elif current_price < lower_band[-1]:
                 bb_signal = "매수"
 
         rsi_signal = "관망"
@@ -674,7 +795,7 @@ def fetch_stock_data(ticker):
         )
 
         # 거래량 비율 (현재 거래량 / 평균 거래량)
-        current_volume = ticker_info.get('volume', None)
+        current_volume = quote.get('volume', ticker_info.get('volume', None))
         avg_volume = ticker_info.get('averageVolume', None)
         if current_volume and avg_volume and avg_volume > 0:
             volume_ratio = current_volume / avg_volume
@@ -688,8 +809,7 @@ def fetch_stock_data(ticker):
 
         # ATR (변동성) 계산 — 현재가 대비 % 표시
         try:
-            atr = calculate_atr(historical_data)
-            last_atr = atr.iloc[-1]
+            last_atr = ind["atr"]
             atr_pct = (last_atr / current_price * 100) if current_price > 0 else None
         except Exception:
             atr_pct = None
@@ -698,8 +818,7 @@ def fetch_stock_data(ticker):
         divergence = detect_divergence(historical_data, rsi)
 
         # ADX 지표
-        adx_period = config.config["current"].get("adx_period", 14)
-        adx_value, adx_signal = calculate_adx(historical_data, period=adx_period)
+        adx_value, adx_signal = ind["adx"]
 
         # ADX 필터: ADX < 20일 때 모멘텀 신호 다운그레이드
         if config.config["current"].get("adx_filter_enabled", False):
@@ -712,8 +831,7 @@ def fetch_stock_data(ticker):
         # 멀티 타임프레임 확인
         htf_trend = ""
         if config.config["current"].get("multi_timeframe_enabled", False):
-            current_interval = config.config["current"]["interval"]
-            htf_trend = fetch_higher_timeframe_trend(ticker, current_interval)
+            htf_trend = higher_timeframe_trend(inputs.htf_data)
             # 상위 TF와 불일치 시 모멘텀 다운그레이드
             if htf_trend:
                 if ("매수" in momentum_signal and htf_trend == "DOWN") or \
@@ -721,24 +839,23 @@ def fetch_stock_data(ticker):
                     momentum_signal = "관망"
 
         # VWAP
-        _, vwap_signal = calculate_vwap(historical_data)
+        _, vwap_signal = ind["vwap"]
 
         # OBV
-        obv_signal = calculate_obv(historical_data)
+        obv_signal = ind["obv"]
 
         # Stochastic Oscillator
-        _, _, stoch_signal = calculate_stochastic(historical_data)
+        _, _, stoch_signal = ind["stochastic"]
 
         # 실적 발표일
-        earnings_dday = fetch_earnings_dday(ticker_data)
+        earnings_dday = inputs.earnings_dday
 
         # 공매도 비율 + 내부자 보유
         short_float = ticker_info.get('shortPercentOfFloat', None)
         insider_held = ticker_info.get('heldPercentInsiders', None)
 
         # 일목균형표
-        ichimoku_result = calculate_ichimoku(historical_data)
-        ichimoku_signal = ichimoku_result['signal'] if ichimoku_result else ""
+        ichimoku_signal = ind["ichimoku"]
 
         # 차트 패턴 인식
         try:
@@ -786,12 +903,17 @@ def fetch_stock_data(ticker):
             pattern_signal=pattern_signal
         )
 
-    except (ConnectionError, TimeoutError) as e:
-        logging.error(f"[FETCH] Network error for {ticker}: {e}")
-        return None
     except KeyError as e:
-        logging.error(f"[FETCH] Missing data key for {ticker}: {e}")
+        logging.error(f"[COMPUTE] Missing data key for {ticker}: {e}")
         return None
     except Exception as e:
-        logging.error(f"[FETCH] Error fetching data for {ticker}: {e}")
+        logging.error(f"[COMPUTE] Error computing indicators for {ticker}: {e}")
+        return None
+
+
+# 종목 데이터 가져오기
+def fetch_stock_data(ticker):
+    inputs = load_stock_inputs(ticker)
+    if inputs is None:
         return None
+    return compute_stock_data(inputs)
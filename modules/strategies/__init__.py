@@ -0,0 +1,46 @@
+"""
+헤드리스 백테스트 전략 패키지.
+
+각 전략은 (ohlcv, params) -> StrategyResult 순수 함수입니다.
+- ohlcv: 'Close' (일목균형표는 'High'/'Low'도) 열이 있는 DataFrame — 수정하지 않음
+- params: make_params(config "current", config "backtest")로 만든 dict
+Tk와 config 전역을 읽지 않으므로 백테스트 팝업 밖(벤치마크, 작업 스레드/프로세스)에서도
+그대로 실행할 수 있습니다. 백테스트 팝업은 결과를 받아 차트와 요약만 그립니다.
+
+    import strategies
+    params = strategies.make_params(config.config["current"], config.config["backtest"])
+    result = strategies.run("ma_cross", data, params)
+"""
+
+from .base import (PARAM_SECTIONS, InsufficientDataError, StrategyResult, make_params,
+                   total_return, trades_result)
+from .composite import momentum_signal
+from .oscillator import bollinger, macd_rsi, rsi
+from .trend import ichimoku, ma_cross, macd, momentum_return_ma
+
+# 백테스트 팝업 전략 선택 순서
+STRATEGIES = {
+    "ma_cross": ma_cross,
+    "macd": macd,
+    "rsi": rsi,
+    "macd_rsi": macd_rsi,
+    "bollinger": bollinger,
+    "momentum_signal": momentum_signal,
+    "momentum_return_ma": momentum_return_ma,
+    "ichimoku": ichimoku,
+}
+
+# 거래를 만드는 전략 (macd, rsi는 신호 시각화 전용)
+TRADING_STRATEGIES = ["macd_rsi", "bollinger", "ma_cross", "momentum_signal", "momentum_return_ma", "ichimoku"]
+
+
+def run(name: str, ohlcv, params: dict) -> StrategyResult:
+    """이름으로 전략 실행 (알 수 없는 이름이면 KeyError)."""
+    return STRATEGIES[name](ohlcv, params)
+
+
+__all__ = [
+    "PARAM_SECTIONS", "InsufficientDataError", "StrategyResult", "make_params", "total_return",
+    "trades_result", "STRATEGIES", "TRADING_STRATEGIES", "run",
+    "ma_cross", "macd", "rsi", "macd_rsi", "bollinger", "momentum_signal", "momentum_return_ma", "ichimoku",
+]
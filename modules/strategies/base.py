@@ -0,0 +1,48 @@
+"""
+전략 공통 타입과 파라미터.
+
+params는 config "current" 섹션과 같은 모양의 dict입니다 (make_params로 생성):
+    {"rsi": {...}, "macd": {...}, "bollinger": {...}, "ma_cross": {...},
+     "momentum_return": {...}, "commission_rate": 0.001, "slippage_pct": 0.0005}
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+import backtest_engine
+
+# 전략이 읽는 config "current" 섹션
+PARAM_SECTIONS = ("rsi", "macd", "bollinger", "ma_cross", "momentum_return")
+
+# buy_dates/sell_dates/profits: 팝업 결과 표시 형식 (미청산 포지션은 수익률만 있고 매도일 없음)
+# frame: 입력 OHLCV + 차트용 지표 열 (볼린저는 밴드 결측 봉을 뺀 프레임)
+# signals: 시각화 전용 전략(macd, rsi)의 (매수 신호 위치, 매도 신호 위치), 나머지는 None
+StrategyResult = namedtuple('StrategyResult', ['buy_dates', 'sell_dates', 'profits', 'frame', 'signals'])
+
+
+class InsufficientDataError(ValueError):
+    """지표를 계산할 만큼 봉이 없음."""
+
+
+def make_params(current: dict, backtest: dict = None) -> dict:
+    """config "current" / "backtest" 섹션 → 전략 파라미터 (섹션은 복사하므로 원본과 분리)."""
+    params = {key: dict(current[key]) for key in PARAM_SECTIONS if key in current}
+    backtest = backtest or {}
+    params["commission_rate"] = backtest.get("commission_rate", 0.001)
+    params["slippage_pct"] = backtest.get("slippage_pct", 0.0005)
+    return params
+
+
+def total_return(profits) -> float:
+    """거래별 수익률의 복리 누적 수익률 (결측 수익률은 건너뜀, pandas prod()와 같음)."""
+    return float(np.nanprod(1 + np.asarray(profits, dtype=np.float64)) - 1) if len(profits) else 0.0
+
+
+def trades_result(frame, entries, exits, params: dict, fill_offset: int = 0) -> StrategyResult:
+    """신호 배열 → StrategyResult (수수료/슬리피지는 params, 없으면 0)."""
+    trades = backtest_engine.run_trades(frame['Close'], entries, exits,
+                                        params.get("commission_rate", 0.0), params.get("slippage_pct", 0.0),
+                                        fill_offset=fill_offset)
+    buy_dates, sell_dates, profits = backtest_engine.trade_lists(frame.index, trades)
+    return StrategyResult(buy_dates, sell_dates, profits, frame, None)
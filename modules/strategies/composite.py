@@ -0,0 +1,31 @@
+"""
+종합 모멘텀 전략: MACD / 이동평균 / 볼린저 / RSI 신호를 실시간 테이블과 같은 가중치로 합산.
+"""
+
+import backtest_engine
+import indicators
+
+from .base import StrategyResult, trades_result
+
+
+def momentum_signal(ohlcv, params: dict) -> StrategyResult:
+    """종합 점수가 매수 기준 이상이면 매수, 매도 기준 이하면 매도."""
+    from market_trend_manager import MACD_WEIGHT, MA_WEIGHT, BB_WEIGHT, RSI_WEIGHT
+    from market_trend_manager import STRONG_BUY_THRESHOLD, BUY_THRESHOLD, SELL_THRESHOLD, STRONG_SELL_THRESHOLD
+
+    macd_conf, rsi_conf, bb_conf = params["macd"], params["rsi"], params["bollinger"]
+    close = ohlcv['Close']
+    rsi_line = indicators.rsi(close, rsi_conf["period"], min_periods=1)
+    upper_band, lower_band, _ = indicators.bollinger(close, bb_conf["period"], bb_conf["std_dev_multiplier"])
+    macd_line, signal_line, _ = indicators.macd(close, macd_conf["short"], macd_conf["long"], macd_conf["signal"])
+    short_ma = indicators.sma(close, params["ma_cross"]["short"])
+    long_ma = indicators.sma(close, params["ma_cross"]["long"])
+    frame = ohlcv.assign(RSI=rsi_line, UpperBand=upper_band, LowerBand=lower_band, MACD=macd_line,
+                         Signal=signal_line, Short_MA=short_ma, Long_MA=long_ma)
+
+    entries, exits = backtest_engine.momentum_scores(
+        close, rsi_line, upper_band, lower_band, macd_line, signal_line, short_ma, long_ma,
+        rsi_conf["lower"], rsi_conf["upper"], bb_conf["use_rebound"],
+        weights=(MACD_WEIGHT, MA_WEIGHT, BB_WEIGHT, RSI_WEIGHT),
+        thresholds=(STRONG_BUY_THRESHOLD, BUY_THRESHOLD, SELL_THRESHOLD, STRONG_SELL_THRESHOLD))
+    return trades_result(frame, entries, exits, params)
@@ -0,0 +1,48 @@
+"""
+과매수/과매도 전략: RSI, MACD + RSI, 볼린저 밴드.
+"""
+
+import numpy as np
+
+import backtest_engine
+import indicators
+
+from .base import StrategyResult, trades_result
+
+
+def rsi(ohlcv, params: dict) -> StrategyResult:
+    """RSI 과매수/과매도 (시각화 전용: 신호 위치만 돌려주고 거래는 만들지 않음)."""
+    conf = params["rsi"]
+    rsi_line = indicators.rsi(ohlcv['Close'], conf["period"], min_periods=1)
+    buy, sell = backtest_engine.threshold_signals(rsi_line, conf["lower"], conf["upper"])
+    frame = ohlcv.assign(RSI=rsi_line)
+    return StrategyResult([], [], [], frame, (np.flatnonzero(buy).tolist(), np.flatnonzero(sell).tolist()))
+
+
+def macd_rsi(ohlcv, params: dict) -> StrategyResult:
+    """MACD 상향 돌파 + RSI < lower면 매수, MACD < 시그널 또는 RSI > upper면 매도."""
+    macd_conf, rsi_conf = params["macd"], params["rsi"]
+    close = ohlcv['Close']
+    macd_line, signal_line, _ = indicators.macd(close, macd_conf["short"], macd_conf["long"], macd_conf["signal"])
+    rsi_line = indicators.rsi(close, rsi_conf["period"])
+    frame = ohlcv.assign(MACD=macd_line, Signal=signal_line, RSI=rsi_line)
+    entries, exits = backtest_engine.macd_rsi_signals(macd_line, signal_line, rsi_line,
+                                                      rsi_conf["lower"], rsi_conf["upper"])
+    return trades_result(frame, entries, exits, params)
+
+
+def bollinger(ohlcv, params: dict) -> StrategyResult:
+    """볼린저 밴드 터치 (하단 아래 매수, 상단 위 매도) 또는 반등 확인 후 다음 봉 체결.
+
+    밴드가 계산되지 않은 처음 period-1개 봉은 제외한 프레임에서 거래.
+    """
+    conf = params["bollinger"]
+    close = ohlcv['Close']
+    upper_band, lower_band, ma = indicators.bollinger(close, conf["period"], conf["std_dev_multiplier"])
+    frame = ohlcv.assign(MA=ma, STD=indicators.rolling_std(close, conf["period"]),
+                         UpperBand=upper_band, LowerBand=lower_band)
+    frame = frame.dropna(subset=['LowerBand', 'UpperBand'])
+    use_rebound = conf["use_rebound"]
+    entries, exits = backtest_engine.bollinger_signals(frame['Close'], frame['UpperBand'],
+                                                       frame['LowerBand'], use_rebound)
+    return trades_result(frame, entries, exits, params, fill_offset=1 if use_rebound else 0)
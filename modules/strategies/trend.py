@@ -0,0 +1,56 @@
+"""
+추세 추종 전략: MACD 교차, 이동평균 교차, 수익률 + 이동평균, 일목균형표.
+"""
+
+import numpy as np
+
+import backtest_engine
+import indicators
+
+from .base import InsufficientDataError, StrategyResult, trades_result
+
+
+def macd(ohlcv, params: dict) -> StrategyResult:
+    """MACD 교차 (시각화 전용: 신호 위치만 돌려주고 거래는 만들지 않음)."""
+    conf = params["macd"]
+    macd_line, signal_line, _ = indicators.macd(ohlcv['Close'], conf["short"], conf["long"], conf["signal"])
+    buy, sell = backtest_engine.macd_cross_signals(macd_line, signal_line)
+    frame = ohlcv.assign(MACD=macd_line, Signal=signal_line)
+    return StrategyResult([], [], [], frame, (np.flatnonzero(buy).tolist(), np.flatnonzero(sell).tolist()))
+
+
+def ma_cross(ohlcv, params: dict) -> StrategyResult:
+    """단기 이동평균이 장기 위면 매수, 아래면 매도."""
+    conf = params["ma_cross"]
+    short_ma = indicators.sma(ohlcv['Close'], conf["short"])
+    long_ma = indicators.sma(ohlcv['Close'], conf["long"])
+    frame = ohlcv.assign(Short_MA=short_ma, Long_MA=long_ma)
+    entries, exits = backtest_engine.ma_cross_signals(short_ma, long_ma)
+    return trades_result(frame, entries, exits, params)
+
+
+def momentum_return_ma(ohlcv, params: dict) -> StrategyResult:
+    """return_window 수익률이 threshold 이상이고 단기 MA > 장기면 매수, MA 역전 또는 수익률 < 0이면 매도."""
+    ma_conf = params["ma_cross"]
+    window = params["momentum_return"]["return_window"]
+    close = ohlcv['Close']
+    frame = ohlcv.assign(Short_MA=indicators.sma(close, ma_conf["short"]),
+                         Long_MA=indicators.sma(close, ma_conf["long"]),
+                         Return=close / close.shift(window) - 1)
+    entries, exits = backtest_engine.momentum_return_signals(
+        frame['Return'], frame['Short_MA'], frame['Long_MA'], params["momentum_return"]["threshold"],
+        start=window)
+    return trades_result(frame, entries, exits, params)
+
+
+def ichimoku(ohlcv, params: dict) -> StrategyResult:
+    """전환선이 기준선을 상향 돌파 + 종가가 구름 위면 매수, 하향 돌파면 매도 (9/26/52)."""
+    from stock_score import calculate_ichimoku
+    result = calculate_ichimoku(ohlcv, tenkan=9, kijun=26, senkou_b=52)
+    if result is None:
+        raise InsufficientDataError("일목균형표 계산에 충분한 데이터가 없습니다.")
+    frame = ohlcv.assign(Tenkan=result['tenkan_sen'], Kijun=result['kijun_sen'],
+                         Senkou_A=result['senkou_a'], Senkou_B=result['senkou_b'])
+    entries, exits = backtest_engine.ichimoku_signals(frame['Close'], frame['Tenkan'], frame['Kijun'],
+                                                      frame['Senkou_A'], frame['Senkou_B'])
+    return trades_result(frame, entries, exits, params)
@@ -1,5 +1,8 @@
 # ui_components.py — 재사용 가능한 UI 컴포넌트
 
+import logging
+import queue
+import time
 import tkinter as tk
 
 
@@ -60,3 +63,39 @@ class HelpTooltip(Tooltip):
             self.widget.after_cancel(self._after_id)
             self._after_id = None
         super().hide()
+
+
+class TkBridge:
+    """다른 스레드에서 Tk 메인 스레드로 콜백을 넘기는 스레드 안전 브리지.
+
+    post()는 어느 스레드에서나 호출할 수 있고 큐에 넣기만 한다. 메인 루프가
+    poll_ms마다 큐를 비우되 한 번에 budget_ms까지만 실행하여 결과가 몰려도 UI가 멈추지 않는다.
+    """
+    def __init__(self, root, poll_ms=15, budget_ms=8):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.budget_ms = budget_ms
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self.root.after(self.poll_ms, self._drain)
+
+    def post(self, func):
+        if not self._closed:
+            self._queue.put(func)
+
+    def close(self):
+        self._closed = True
+
+    def _drain(self):
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        while time.perf_counter() < deadline:
+            try:
+                func = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func()
+            except Exception as e:
+                logging.error(f"[UI] Bridge callback error: {e}")
+        if not self._closed:
+            self.root.after(self.poll_ms, self._drain)
@@ -0,0 +1,284 @@
+"""
+횡단면 백테스트: 한 전략/파라미터를 유니버스(또는 워치리스트) 전체 종목에 실행.
+
+- 모든 종목의 일봉을 data_cache 일괄 조회로 한 번 읽어 (봉 × 종목) 패널로 정렬
+- 종목마다 첫 유효 봉이 0행이 되도록 열을 위로 당겨(left-align) 상장일이 달라도
+  종목 하나만 백테스트할 때와 같은 지표/신호가 나오게 함
+- 지표(indicators)와 신호(backtest_engine)는 2차원 DataFrame/배열로 모든 종목을 한 번에 계산하고,
+  상태 기계와 거래별 수익률도 backtest_engine의 2차원 함수로 한 번에 구함
+- 결과는 종목별 누적 수익률, 샤프, MDD, 승률, 거래 수, 보유 수익률 표 (누적 수익률 순위)
+  샤프/MDD는 "모든 전략 비교"와 같은 거래 단위 정의
+
+Tk와 config 전역에 의존하지 않습니다 (params는 strategies.make_params 형식).
+
+    panel = universe_backtest.load_panel(stock_universe.get_universe("S&P 500"), start, end)
+    table = universe_backtest.run("ma_cross", panel, params)
+"""
+
+import logging
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import backtest_engine
+import indicators
+
+logger = logging.getLogger(__name__)
+
+LOAD_CHUNK = 100      # 일괄 조회 한 번에 묶는 종목 수 (진행 표시 단위)
+ICHIMOKU_MIN_BARS = 52 + 26
+
+# close/high/low: (봉 × 종목) DataFrame, 열마다 첫 유효 봉이 0행 (RangeIndex)
+# dates: (봉 × 종목) 날짜 배열 (유효 봉 밖은 NaT), bars: 종목별 유효 봉 수
+Panel = namedtuple('Panel', ['close', 'high', 'low', 'dates', 'bars'])
+
+RESULT_COLUMNS = ["total_return", "sharpe", "mdd", "win_rate", "trades", "buy_hold", "bars"]
+
+
+# ============================================================
+# 패널 로드
+# ============================================================
+
+def covering_period(start) -> str:
+    """start부터 오늘까지를 덮는 가장 짧은 yfinance period."""
+    days = (datetime.now() - pd.Timestamp(start).to_pydatetime().replace(tzinfo=None)).days
+    for period, span in (("1y", 365), ("2y", 730), ("5y", 1826), ("10y", 3652)):
+        if days <= span - 7:
+            return period
+    return "max"
+
+
+def _left_align(values: np.ndarray, first: np.ndarray) -> np.ndarray:
+    """열마다 first[j]행부터 위로 당긴 배열 (빈 아래쪽은 NaN)."""
+    n = values.shape[0]
+    rows = np.arange(n)[:, None] + first[None, :]
+    aligned = np.take_along_axis(values, np.minimum(rows, n - 1), axis=0)
+    return np.where(rows < n, aligned, np.nan)
+
+
+def build_panel(histories: dict, start=None, end=None) -> Panel:
+    """{티커: OHLCV DataFrame} → Panel (데이터가 없는 종목은 제외)."""
+    frames = {t: df for t, df in histories.items() if df is not None and not df.empty and 'Close' in df}
+    if not frames:
+        empty = pd.DataFrame()
+        return Panel(empty, empty, empty, np.empty((0, 0), dtype='datetime64[ns]'), np.empty(0, dtype=np.intp))
+
+    fields = {}
+    for field in ('Close', 'High', 'Low'):
+        wide = pd.concat({t: df[field] if field in df else df['Close'] for t, df in frames.items()}, axis=1)
+        fields[field] = wide.sort_index()
+    close = fields['Close']
+    if start is not None or end is not None:
+        dates = close.index.tz_localize(None) if close.index.tz is not None else close.index
+        keep = np.ones(len(dates), dtype=bool)
+        if start is not None:
+            keep &= dates >= pd.Timestamp(start)
+        if end is not None:
+            keep &= dates < pd.Timestamp(end)
+        fields = {k: v.loc[keep] for k, v in fields.items()}
+        close = fields['Close']
+
+    values = close.to_numpy(dtype=np.float64)
+    valid = ~np.isnan(values)
+    has_data = valid.any(axis=0)
+    tickers = close.columns[has_data]
+    valid = valid[:, has_data]
+    first = np.argmax(valid, axis=0)
+    last = values.shape[0] - 1 - np.argmax(valid[::-1], axis=0)
+    bars = last - first + 1
+
+    def _aligned(frame):
+        return pd.DataFrame(_left_align(frame.to_numpy(dtype=np.float64)[:, has_data], first), columns=tickers)
+
+    index = close.index.tz_localize(None) if close.index.tz is not None else close.index
+    date_values = np.broadcast_to(index.to_numpy(dtype='datetime64[ns]')[:, None], values.shape)[:, has_data]
+    dates = _left_align(date_values.view(np.int64).astype(np.float64), first)
+    dates = np.where(np.isnan(dates), np.iinfo(np.int64).min, dates).astype(np.int64).view('datetime64[ns]')
+    return Panel(_aligned(close), _aligned(fields['High']), _aligned(fields['Low']), dates, bars)
+
+
+def load_panel(tickers, start=None, end=None, on_progress=None) -> Panel:
+    """유니버스 일봉을 data_cache 일괄 조회로 한 번에 읽어 Panel 생성.
+
+    on_progress(done, total): LOAD_CHUNK 종목마다 호출
+    """
+    from data_cache import get_cached_history_batch
+    tickers = list(dict.fromkeys(tickers))
+    period = covering_period(start) if start is not None else "10y"
+    histories = {}
+    for k in range(0, len(tickers), LOAD_CHUNK):
+        chunk = tickers[k:k + LOAD_CHUNK]
+        try:
+            histories.update(get_cached_history_batch(chunk, period=period, interval="1d"))
+        except Exception as e:
+            logger.warning(f"[UNIVERSE] Batch load failed ({chunk[0]}..{chunk[-1]}): {e}")
+        if on_progress is not None:
+            on_progress(min(k + LOAD_CHUNK, len(tickers)), len(tickers))
+    return build_panel(histories, start, end)
+
+
+# ============================================================
+# 전략별 2차원 신호 (strategies 패키지의 단일 종목 전략과 같은 정의)
+# ============================================================
+
+def _ma_cross(panel, params):
+    conf = params["ma_cross"]
+    return backtest_engine.ma_cross_signals(indicators.sma(panel.close, conf["short"]),
+                                            indicators.sma(panel.close, conf["long"])) + (0,)
+
+
+def _macd_rsi(panel, params):
+    macd_conf, rsi_conf = params["macd"], params["rsi"]
+    macd_line, signal_line, _ = indicators.macd(panel.close, macd_conf["short"], macd_conf["long"],
+                                                macd_conf["signal"])
+    rsi_line = indicators.rsi(panel.close, rsi_conf["period"])
+    return backtest_engine.macd_rsi_signals(macd_line, signal_line, rsi_line,
+                                            rsi_conf["lower"], rsi_conf["upper"]) + (0,)
+
+
+def _bollinger(panel, params):
+    conf = params["bollinger"]
+    upper_band, lower_band, _ = indicators.bollinger(panel.close, conf["period"], conf["std_dev_multiplier"])
+    use_rebound = conf["use_rebound"]
+    entries, exits = backtest_engine.bollinger_signals(panel.close, upper_band, lower_band, use_rebound)
+    return entries, exits, 1 if use_rebound else 0
+
+
+def _momentum_signal(panel, params):
+    from market_trend_manager import MACD_WEIGHT, MA_WEIGHT, BB_WEIGHT, RSI_WEIGHT
+    from market_trend_manager import STRONG_BUY_THRESHOLD, BUY_THRESHOLD, SELL_THRESHOLD, STRONG_SELL_THRESHOLD
+
+    macd_conf, rsi_conf, bb_conf = params["macd"], params["rsi"], params["bollinger"]
+    close = panel.close
+    rsi_line = indicators.rsi(close, rsi_conf["period"], min_periods=1)
+    upper_band, lower_band, _ = indicators.bollinger(close, bb_conf["period"], bb_conf["std_dev_multiplier"])
+    macd_line, signal_line, _ = indicators.macd(close, macd_conf["short"], macd_conf["long"], macd_conf["signal"])
+    entries, exits = backtest_engine.momentum_scores(
+        close, rsi_line, upper_band, lower_band, macd_line, signal_line,
+        indicators.sma(close, params["ma_cross"]["short"]), indicators.sma(close, params["ma_cross"]["long"]),
+        rsi_conf["lower"], rsi_conf["upper"], bb_conf["use_rebound"],
+        weights=(MACD_WEIGHT, MA_WEIGHT, BB_WEIGHT, RSI_WEIGHT),
+        thresholds=(STRONG_BUY_THRESHOLD, BUY_THRESHOLD, SELL_THRESHOLD, STRONG_SELL_THRESHOLD))
+    return entries, exits, 0
+
+
+def _momentum_return_ma(panel, params):
+    ma_conf = params["ma_cross"]
+    window = params["momentum_return"]["return_window"]
+    close = panel.close
+    entries, exits = backtest_engine.momentum_return_signals(
+        close / close.shift(window) - 1, indicators.sma(close, ma_conf["short"]),
+        indicators.sma(close, ma_conf["long"]), params["momentum_return"]["threshold"], start=window)
+    return entries, exits, 0
+
+
+def _ichimoku(panel, params):
+    """stock_score.calculate_ichimoku (9/26/52)와 같은 선을 2차원으로 계산."""
+    high, low = panel.high, panel.low
+
+    def _mid(window):
+        return (high.rolling(window=window).max() + low.rolling(window=window).min()) / 2
+
+    tenkan, kijun = _mid(9), _mid(26)
+    senkou_a = ((tenkan + kijun) / 2).shift(26)
+    senkou_b = _mid(52).shift(26)
+    entries, exits = backtest_engine.ichimoku_signals(panel.close, tenkan, kijun, senkou_a, senkou_b)
+    # 단일 종목 전략은 봉이 부족하면 실행하지 않음
+    short = panel.bars < ICHIMOKU_MIN_BARS
+    entries[:, short] = exits[:, short] = False
+    return entries, exits, 0
+
+
+PANEL_SIGNALS = {
+    "ma_cross": _ma_cross,
+    "macd_rsi": _macd_rsi,
+    "bollinger": _bollinger,
+    "momentum_signal": _momentum_signal,
+    "momentum_return_ma": _momentum_return_ma,
+    "ichimoku": _ichimoku,
+}
+
+
+# ============================================================
+# 실행 / 지표
+# ============================================================
+
+def _group_stats(col, profits, n_cols, risk_free):
+    """거래 수익률 → 종목별 (누적 수익률, 샤프, MDD, 승률, 거래 수) — 결측 수익률은 건너뜀."""
+    trades = np.bincount(col, minlength=n_cols)
+    finite = ~np.isnan(profits)
+    p = np.where(finite, profits, 0.0)
+    count = np.bincount(col, weights=finite, minlength=n_cols)
+    total = np.ones(n_cols)
+    np.multiply.at(total, col, 1 + p)
+    total -= 1
+    wins = np.bincount(col, weights=p > 0, minlength=n_cols)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.bincount(col, weights=p, minlength=n_cols) / count
+        var = (np.bincount(col, weights=p * p, minlength=n_cols) - count * mean ** 2) / (count - 1)
+        std = np.sqrt(np.maximum(var, 0))
+        sharpe = np.where((count >= 2) & (std > 1e-12), (mean - risk_free / 252) / std * np.sqrt(252), 0.0)
+        win_rate = np.where(trades > 0, wins / trades, 0.0)
+
+    # MDD: 종목별 누적 로그 자산을 구간 오프셋으로 띄워 한 번의 누적 최댓값으로 계산 (시작 자산 1.0 포함)
+    log_eq = np.log(np.maximum(1 + p, 1e-300))
+    starts = np.concatenate([[0], np.cumsum(trades)[:-1]])
+    csum = np.cumsum(log_eq)
+    base = np.concatenate([[0.0], csum])[starts]
+    curve = csum - base[col]
+    offset = col * (2 * (np.abs(curve).max() if len(curve) else 0.0) + 1)
+    peak = np.maximum(np.maximum.accumulate(curve + offset) - offset, 0.0)
+    mdd = np.zeros(n_cols)
+    np.minimum.at(mdd, col, np.expm1(curve - peak))
+    return total, sharpe, mdd, win_rate, trades
+
+
+def _panel_signals(name: str, panel: Panel, params: dict):
+    """2차원 진입/청산 + 체결 봉 오프셋 (종목의 유효 봉 밖은 신호 없음)."""
+    entries, exits, fill_offset = PANEL_SIGNALS[name](panel, params)
+    entries = np.array(entries, dtype=bool)
+    exits = np.array(exits, dtype=bool)
+    # 당겨서 생긴 빈 행, 다음 봉 체결 전략은 종목의 마지막 두 봉도 제외 (bollinger_signals와 같음)
+    tail = np.arange(len(entries))[:, None] >= (panel.bars - 2 * fill_offset)[None, :]
+    entries[tail] = exits[tail] = False
+    return entries, exits, fill_offset
+
+
+def run(name: str, panel: Panel, params: dict, risk_free: float = 0.0) -> pd.DataFrame:
+    """모든 종목에 전략 실행 → 누적 수익률 순 결과 표 (인덱스: 티커, 열: RESULT_COLUMNS).
+
+    수익률/MDD/승률은 비율 (0.12 = 12%), buy_hold는 기간 첫 종가 → 마지막 종가 수익률.
+    """
+    close = panel.close
+    n_cols = close.shape[1]
+    if n_cols == 0:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+    entries, exits, fill_offset = _panel_signals(name, panel, params)
+    state = backtest_engine.signals_to_state(entries, exits)
+    trades = backtest_engine.panel_trades(close, state, panel.bars - 1,
+                                          params.get("commission_rate", 0.0), params.get("slippage_pct", 0.0),
+                                          fill_offset=fill_offset)
+    total, sharpe, mdd, win_rate, count = _group_stats(trades.col, trades.profits, n_cols, risk_free)
+
+    values = close.to_numpy()
+    buy_hold = values[panel.bars - 1, np.arange(n_cols)] / values[0] - 1
+    table = pd.DataFrame({"total_return": total, "sharpe": sharpe, "mdd": mdd, "win_rate": win_rate,
+                          "trades": count, "buy_hold": buy_hold, "bars": panel.bars}, index=close.columns)
+    table.index.name = "ticker"
+    return table.sort_values("total_return", ascending=False, kind="stable")
+
+
+def trades_for(name: str, panel: Panel, params: dict, ticker: str):
+    """한 종목의 (매수일, 매도일, 수익률) 목록 — strategies.run 결과와 같은 형식."""
+    j = panel.close.columns.get_loc(ticker)
+    entries, exits, fill_offset = _panel_signals(name, panel, params)
+    state = backtest_engine.signals_to_state(entries[:, j:j + 1], exits[:, j:j + 1])
+    trades = backtest_engine.panel_trades(panel.close.iloc[:, j:j + 1], state, panel.bars[j:j + 1] - 1,
+                                          params.get("commission_rate", 0.0), params.get("slippage_pct", 0.0),
+                                          fill_offset=fill_offset)
+    dates = pd.DatetimeIndex(panel.dates[:, j])
+    return (list(dates[trades.buy_row]), list(dates[trades.sell_row[trades.sell_row >= 0]]),
+            trades.profits.tolist())
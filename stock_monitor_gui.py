@@ -5,11 +5,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mod
 import glob
 import json
 import logging
+import multiprocessing
 import re
 import threading
 import time
 import tkinter as tk
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from logging.handlers import RotatingFileHandler
 from tkinter import simpledialog, messagebox, ttk
@@ -21,8 +21,12 @@ import config
 from backtest_popup import open_backtest_popup
 from help_texts import COLUMN_HELP, SIGNAL_HELP, QUANT_GUIDE
 from market_trend_manager import guess_market_session, get_volatility_regime
-from stock_score import fetch_stock_data
-from ui_components import Tooltip, HelpTooltip
+from refresh_pipeline import RefreshPipeline
+from refresh_scheduler import RefreshScheduler
+from rate_limit import get_request_stats
+from async_fetch import shutdown_core
+from data_cache import start_maintenance, stop_maintenance
+from ui_components import Tooltip, HelpTooltip, TkBridge
 from news_panel import NewsPanel, start_news_refresh
 import holdings_manager
 
@@ -62,7 +66,6 @@ BACKUP_COUNT = 5
 RETENTION_DAYS = 30
 SAVE_FILE = "watchlist.json"
 
-os.makedirs(LOG_DIR, exist_ok=True)
 
 # Phase 7-4: Log cleanup in background thread
 def _cleanup_old_logs():
@@ -78,15 +81,22 @@ def _cleanup_old_logs():
             except Exception as e:
                 logging.error(f"[CLEANUP] Failed to delete {log_file}: {e}")
 
-threading.Thread(target=_cleanup_old_logs, daemon=True).start()
 
-# Logging handlers
-logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
-handler = RotatingFileHandler(LOG_FILE, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8")
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-logger.addHandler(handler)
+def setup_logging():
+    """로그 폴더/회전 파일 핸들러 설정 후 오래된 로그 정리 스레드 시작 (main()에서 한 번).
+
+    모듈 수준에서 하지 않는 이유: 프로세스 풀 작업 프로세스(spawn)가 이 스크립트를 __mp_main__으로
+    import할 때 같은 app.log에 핸들러를 또 열거나 정리 스레드를 띄우면 안 됨.
+    """
+    os.makedirs(LOG_DIR, exist_ok=True)
+    threading.Thread(target=_cleanup_old_logs, daemon=True).start()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.DEBUG)
+    handler = RotatingFileHandler(LOG_FILE, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8")
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
 
 
 # ============================================================
@@ -98,7 +108,9 @@ class AppState:
         self.watchlist_lock = threading.Lock()  # Phase 2-1
         self.shutdown_event = threading.Event()  # Phase 2-4
         self.monitor_thread = None
-        self.executor = ThreadPoolExecutor(max_workers=10)  # Phase 4-2: Reuse executor
+        self.refresh_pipeline = RefreshPipeline()  # async fetch 코어 + compute 풀 재사용
+        self.refresh_scheduler = RefreshScheduler()  # 종목별 갱신 주기 + 요청 예산
+        self.ui_bridge = None  # 작업 스레드 → Tk 메인 스레드 콜백 큐
         self.root = None
         self.table = None
         self.market_status_label = None
@@ -106,7 +118,11 @@ class AppState:
         self.radio_var = None
         self.period_info_label = None
         self.last_refresh_time = None
+        self.refresh_lock = threading.Lock()  # 전체 새로고침 중복 실행 방지 (refresh_table)
+        self.refresh_running = False
+        self.refresh_pending = False
         self.previous_data = {}  # Phase 11-6: Track previous prices
+        self.rendered_rows = {}  # ticker -> (values, tags) 마지막으로 테이블에 반영한 행 (셀 단위 diff용)
         self.undo_ticker = None  # Phase 11-5: Undo delete
         self.undo_timer = None
         self._sort_col = None
@@ -119,7 +135,7 @@ class AppState:
         self.holdings_lock = threading.Lock()
 
 
-app = AppState()
+app = None  # main()에서 생성 (import만으로는 갱신 파이프라인/스케줄러를 만들지 않음)
 
 
 # ============================================================
@@ -258,10 +274,27 @@ def on_radio_select():
 
 
 def refresh_table():
-    """Clear and refresh the table."""
-    for row in app.table.get_children():
-        app.table.delete(row)
-    refresh_table_once()
+    """Refresh the table (rows are kept and overwritten in place to avoid flicker).
+
+    Tk 스레드에서 호출하며 조회/계산은 작업 스레드에서 실행 (행과 진행 상황은 ui_bridge로 들어옴).
+    이미 새로고침 중이면 끝난 뒤 한 번 더 실행 (설정 변경 직후의 요청이 버려지지 않도록).
+    """
+    with app.refresh_lock:
+        if app.refresh_running:
+            app.refresh_pending = True
+            return
+        app.refresh_running = True
+
+    def _work():
+        while True:
+            refresh_table_once()
+            with app.refresh_lock:
+                if not app.refresh_pending or app.shutdown_event.is_set():
+                    app.refresh_running = app.refresh_pending = False
+                    return
+                app.refresh_pending = False
+
+    threading.Thread(target=_work, daemon=True).start()
 
 
 def split_period_string(period_str):
@@ -307,8 +340,8 @@ def add_ticker():
 
     def _do_add():
         try:
-            import yfinance as yf
-            ticker_info = yf.Ticker(name_or_ticker).info
+            from data_provider import get_provider
+            ticker_info = get_provider().ticker(name_or_ticker).info
             company_name = ticker_info.get('shortName')
 
             def _on_result():
@@ -319,7 +352,7 @@ def add_ticker():
                             save_watchlist()
                             logging.info(f"[STOCK] {company_name} ({name_or_ticker}) added")
                             messagebox.showinfo("추가 완료", f"{company_name} ({name_or_ticker}) 추가되었습니다.")
-                            threading.Thread(target=refresh_table_once, daemon=True).start()
+                            refresh_table()
                             if messagebox.askyesno("보유 정보", f"{company_name}의 보유 정보를 입력하시겠습니까?"):
                                 open_holdings_edit_dialog(name_or_ticker, company_name)
                         else:
@@ -375,7 +408,7 @@ def remove_ticker():
                     messagebox.showwarning("없음", f"{ticker_to_remove}은 감시 리스트에 없습니다.")
             if removed:
                 update_status_bar(f"{ticker_to_remove} 삭제됨", undo=True)
-                refresh_table_once()
+                refresh_table()
         else:
             messagebox.showwarning("형식 오류", f"티커를 추출할 수 없습니다: {company_name_with_ticker}")
 
@@ -392,7 +425,7 @@ def undo_delete():
                 should_refresh = True
         if should_refresh:
             update_status_bar(f"{app.undo_ticker} 복원됨")
-            refresh_table_once()
+            refresh_table()
         app.undo_ticker = None
 
 
@@ -656,7 +689,7 @@ def open_holdings_edit_dialog(ticker, company_name=""):
 
     def _on_close():
         popup.destroy()
-        refresh_table_once()
+        refresh_table()
 
     tk.Button(btn_frame, text="메모 수정", command=_edit_selected_notes,
               font=FONTS["body"]).pack(side=tk.LEFT, padx=3)
@@ -696,8 +729,9 @@ def load_watchlist():
 # ============================================================
 # Data refresh
 # ============================================================
-def refresh_table_once():
-    """Fetch data for all tickers and update table."""
+def refresh_table_once(tickers=None):
+    """Fetch data for all tickers (or the given subset) and update table."""
+    partial = tickers is not None
     try:
         def _status(msg=None, **kwargs):
             """Thread-safe status bar update with forced UI refresh."""
@@ -712,11 +746,15 @@ def refresh_table_once():
             else:
                 app.root.after(0, _update)
 
-        results = []
         completed = [0]  # mutable counter for closure
 
         with app.watchlist_lock:
-            tickers = list(app.watchlist)
+            watchlist = list(app.watchlist)
+        if partial:
+            # 스케줄러가 고른 종목만 (그사이 워치리스트에서 빠진 종목 제외)
+            tickers = [t for t in tickers if t in watchlist]
+        else:
+            tickers = watchlist
         total = len(tickers)
 
         def _combined_status():
@@ -727,54 +765,61 @@ def refresh_table_once():
 
         _combined_status() if total else _status("워치리스트가 비어 있습니다")
 
-        def fetch_and_collect(t):
-            result = fetch_stock_data(t)
-            if result:
-                results.append(result)
+        progress_pending = [False]
 
-        # Phase 4-2: Reuse executor
-        futures = [app.executor.submit(fetch_and_collect, t) for t in tickers]
-        for f in futures:
-            try:
-                f.result(timeout=30)
-            except Exception as e:
-                logging.error(f"[FETCH] Thread error: {e}")
-            completed[0] += 1
+        def _flush_progress():
+            progress_pending[0] = False
             _combined_status()
 
-        def _do_ui_update():
-            update_table(results)
+        def _progress(done, _total):
+            # 종목마다 상태 표시줄을 다시 그리지 않도록 반영 대기 중인 갱신이 있으면 합침
+            completed[0] = done
+            if not progress_pending[0]:
+                progress_pending[0] = True
+                app.ui_bridge.post(_flush_progress)
+
+        def _do_ui_update(results, timings):
+            if partial:
+                # 이번에 갱신하지 않은 종목의 행은 유지
+                finalize_table(results, keep=[t for t in watchlist if app.table.exists(t)])
+            else:
+                finalize_table(results)
             app.last_refresh_time = datetime.now()
             update_status_bar()
 
-        if threading.current_thread() is threading.main_thread():
-            _do_ui_update()
-        else:
-            app.root.after(0, _do_ui_update)
+        # prefetch(일괄 조회) → fetch → compute → ui: 계산이 끝난 종목부터 바로 표시
+        results = app.refresh_pipeline.run(tickers, on_result=upsert_table_row, on_done=_do_ui_update,
+                                           dispatch=app.ui_bridge.post,
+                                           on_progress=_progress)
+        with app.holdings_lock:
+            held = [t for t in tickers
+                    if (holdings_manager.get_holding(app.holdings, t) or {}).get("quantity", 0) > 0]
+        app.refresh_scheduler.sync(watchlist)
+        app.refresh_scheduler.record_results(tickers, results, held=held)
     except Exception as e:
         logging.error(f"[REFRESH] refresh_table_once error: {e}")
         _status(f"갱신 오류: {e}")
 
 
 def monitor_stocks():
-    """Phase 2-4: Monitor thread with shutdown event."""
-    time.sleep(60)
-    while not app.shutdown_event.is_set():
+    """Phase 2-4: Monitor thread with shutdown event.
+
+    종목별 주기는 RefreshScheduler가 정함 (세션/보유/신호/요청 예산/실패 백오프),
+    장 종료 후에도 긴 주기로 계속 실행.
+    """
+    scheduler = app.refresh_scheduler
+    while not app.shutdown_event.wait(timeout=scheduler.next_wakeup()):
         try:
-            refresh_table_once()
+            with app.watchlist_lock:
+                scheduler.sync(list(app.watchlist))
+            batch = scheduler.due()
+            if batch:
+                logging.info(f'[MONITOR] {guess_market_session()} - refreshing {len(batch)} tickers '
+                             f'(backoff x{scheduler.backoff:g})')
+                refresh_table_once(batch)
         except Exception as e:
             logging.error(f"[MONITOR] Error: {e}")
 
-        session = guess_market_session()
-        if session != "주식장 종료":
-            logging.info(f'[MONITOR] {session} - refreshing...')
-            # Wait with shutdown check
-            if app.shutdown_event.wait(timeout=60):
-                break
-        else:
-            logging.info("[MONITOR] Market closed, stopping refresh")
-            break
-
 
 # ============================================================
 # Market status
@@ -821,277 +866,353 @@ def on_item_double_click(event):
 # ============================================================
 # Table update with all UI improvements
 # ============================================================
-def update_table(data):
-    try:
-        # 사용자가 조절한 컬럼 너비 보존
-        saved_widths = {}
-        for col in app.table["columns"]:
-            saved_widths[col] = app.table.column(col, "width")
+def _format_table_row(record):
+    """StockData(또는 구 tuple) → (ticker, price, 표시 값 tuple, 신호 태그, 보유 여부)."""
+    # Phase 8-3: Works with both NamedTuple and tuple
+    if hasattr(record, 'company_name'):
+        name = record.company_name
+        t = record.ticker
+        price = record.price
+        trend = record.trend_signal
+        rsi = record.rsi_signal
+        rate = record.rate
+        rate_color = record.rate_color
+        macd_signal = record.macd_signal
+        bb_signal = record.bb_signal
+        momentum_signal = record.momentum_signal
+        value_score = getattr(record, 'value_score', 'N/A')
+        value_judgment = getattr(record, 'value_judgment', 'N/A')
+        per_value = getattr(record, 'per_value', None)
+        roe_value = getattr(record, 'roe_value', None)
+        week52_pct = getattr(record, 'week52_pct', None)
+        volume_ratio = getattr(record, 'volume_ratio', None)
+        atr_pct = getattr(record, 'atr_pct', None)
+        divergence_signal = getattr(record, 'divergence_signal', '')
+        liquidity_warning = getattr(record, 'liquidity_warning', '')
+        adx_value = getattr(record, 'adx_value', None)
+        adx_signal = getattr(record, 'adx_signal', '')
+        vwap_signal = getattr(record, 'vwap_signal', '')
+        obv_signal = getattr(record, 'obv_signal', '')
+        stoch_signal = getattr(record, 'stoch_signal', '')
+        earnings_dday = getattr(record, 'earnings_dday', '')
+        short_float = getattr(record, 'short_float', None)
+        insider_held = getattr(record, 'insider_held', None)
+        ichimoku_signal = getattr(record, 'ichimoku_signal', '')
+        pattern_signal = getattr(record, 'pattern_signal', '-')
+    else:
+        (name, t, price, trend, rsi, rate, rate_color, macd_signal, bb_signal, momentum_signal) = record[:10]
+        value_score = 'N/A'
+        value_judgment = 'N/A'
+        per_value = None
+        roe_value = None
+        week52_pct = None
+        volume_ratio = None
+        atr_pct = None
+        divergence_signal = ''
+        liquidity_warning = ''
+        adx_value = None
+        adx_signal = ''
+        vwap_signal = ''
+        obv_signal = ''
+        stoch_signal = ''
+        earnings_dday = ''
+        short_float = None
+        insider_held = None
+        ichimoku_signal = ''
+        pattern_signal = '-'
+
+    rsi_value = float(rsi.replace('%', ''))
+    if rsi_value > config.config['current']['rsi']['upper']:
+        rsi_display = f"{rsi} (과매수)"
+    elif rsi_value < config.config['current']['rsi']['lower']:
+        rsi_display = f"{rsi} (과매도)"
+    else:
+        rsi_display = f"{rsi} (중립)"
 
-        for row in app.table.get_children():
-            app.table.delete(row)
+    # 가치 점수 표시 문자열
+    if value_judgment and value_judgment != 'N/A':
+        value_display = f"{value_judgment} ({value_score})"
+    else:
+        value_display = "N/A"
+
+    per_display = f"{per_value:.1f}" if per_value is not None else "N/A"
+    roe_display = f"{roe_value:.1f}%" if roe_value is not None else "N/A"
+    week52_display = f"{week52_pct:.0f}%" if week52_pct is not None else "N/A"
+
+    # 거래량 비율 표시: 평균 대비 배수 + 상태
+    if volume_ratio is not None:
+        if volume_ratio >= 2.0:
+            vol_display = f"×{volume_ratio:.1f} 폭증"
+        elif volume_ratio >= 1.5:
+            vol_display = f"×{volume_ratio:.1f} 증가"
+        elif volume_ratio <= 0.5:
+            vol_display = f"×{volume_ratio:.1f} 부족"
+        else:
+            vol_display = f"×{volume_ratio:.1f}"
+    else:
+        vol_display = "N/A"
+
+    # ATR 변동성 표시
+    if atr_pct is not None:
+        if atr_pct >= 5:
+            atr_display = f"{atr_pct:.1f}% 고"
+        elif atr_pct >= 3:
+            atr_display = f"{atr_pct:.1f}% 중"
+        else:
+            atr_display = f"{atr_pct:.1f}% 저"
+    else:
+        atr_display = "N/A"
 
-        # Phase 11-4: Empty watchlist hint
-        if not data:
-            with app.watchlist_lock:
-                if not app.watchlist:
-                    update_status_bar("종목을 추가하세요 (Ctrl+A)")
-            return
+    # 유동성 경고 표시
+    if liquidity_warning:
+        vol_display = f"{vol_display} [{liquidity_warning}]"
 
-        for record in data:
-            if not record:
-                continue
+    div_display = divergence_signal if divergence_signal else "-"
 
-            # Phase 8-3: Works with both NamedTuple and tuple
-            if hasattr(record, 'company_name'):
-                name = record.company_name
-                t = record.ticker
-                price = record.price
-                trend = record.trend_signal
-                rsi = record.rsi_signal
-                rate = record.rate
-                rate_color = record.rate_color
-                macd_signal = record.macd_signal
-                bb_signal = record.bb_signal
-                momentum_signal = record.momentum_signal
-                value_score = getattr(record, 'value_score', 'N/A')
-                value_judgment = getattr(record, 'value_judgment', 'N/A')
-                per_value = getattr(record, 'per_value', None)
-                roe_value = getattr(record, 'roe_value', None)
-                week52_pct = getattr(record, 'week52_pct', None)
-                volume_ratio = getattr(record, 'volume_ratio', None)
-                atr_pct = getattr(record, 'atr_pct', None)
-                divergence_signal = getattr(record, 'divergence_signal', '')
-                liquidity_warning = getattr(record, 'liquidity_warning', '')
-                adx_value = getattr(record, 'adx_value', None)
-                adx_signal = getattr(record, 'adx_signal', '')
-                vwap_signal = getattr(record, 'vwap_signal', '')
-                obv_signal = getattr(record, 'obv_signal', '')
-                stoch_signal = getattr(record, 'stoch_signal', '')
-                earnings_dday = getattr(record, 'earnings_dday', '')
-                short_float = getattr(record, 'short_float', None)
-                insider_held = getattr(record, 'insider_held', None)
-                ichimoku_signal = getattr(record, 'ichimoku_signal', '')
-                pattern_signal = getattr(record, 'pattern_signal', '-')
-            else:
-                (name, t, price, trend, rsi, rate, rate_color, macd_signal, bb_signal, momentum_signal) = record[:10]
-                value_score = 'N/A'
-                value_judgment = 'N/A'
-                per_value = None
-                roe_value = None
-                week52_pct = None
-                volume_ratio = None
-                atr_pct = None
-                divergence_signal = ''
-                liquidity_warning = ''
-                adx_value = None
-                adx_signal = ''
-                vwap_signal = ''
-                obv_signal = ''
-                stoch_signal = ''
-                earnings_dday = ''
-                short_float = None
-                insider_held = None
-                ichimoku_signal = ''
-                pattern_signal = '-'
-
-            rsi_value = float(rsi.replace('%', ''))
-            if rsi_value > config.config['current']['rsi']['upper']:
-                rsi_display = f"{rsi} (과매수)"
-            elif rsi_value < config.config['current']['rsi']['lower']:
-                rsi_display = f"{rsi} (과매도)"
-            else:
-                rsi_display = f"{rsi} (중립)"
+    # VWAP 표시
+    vwap_display = vwap_signal if vwap_signal else "-"
 
-            # 가치 점수 표시 문자열
-            if value_judgment and value_judgment != 'N/A':
-                value_display = f"{value_judgment} ({value_score})"
-            else:
-                value_display = "N/A"
-
-            per_display = f"{per_value:.1f}" if per_value is not None else "N/A"
-            roe_display = f"{roe_value:.1f}%" if roe_value is not None else "N/A"
-            week52_display = f"{week52_pct:.0f}%" if week52_pct is not None else "N/A"
-
-            # 거래량 비율 표시: 평균 대비 배수 + 상태
-            if volume_ratio is not None:
-                if volume_ratio >= 2.0:
-                    vol_display = f"×{volume_ratio:.1f} 폭증"
-                elif volume_ratio >= 1.5:
-                    vol_display = f"×{volume_ratio:.1f} 증가"
-                elif volume_ratio <= 0.5:
-                    vol_display = f"×{volume_ratio:.1f} 부족"
-                else:
-                    vol_display = f"×{volume_ratio:.1f}"
-            else:
-                vol_display = "N/A"
-
-            # ATR 변동성 표시
-            if atr_pct is not None:
-                if atr_pct >= 5:
-                    atr_display = f"{atr_pct:.1f}% 고"
-                elif atr_pct >= 3:
-                    atr_display = f"{atr_pct:.1f}% 중"
-                else:
-                    atr_display = f"{atr_pct:.1f}% 저"
-            else:
-                atr_display = "N/A"
+    # OBV 표시
+    obv_display = obv_signal if obv_signal else "-"
 
-            # 유동성 경고 표시
-            if liquidity_warning:
-                vol_display = f"{vol_display} [{liquidity_warning}]"
+    # Stochastic 표시
+    stoch_display = stoch_signal if stoch_signal else "-"
 
-            div_display = divergence_signal if divergence_signal else "-"
+    # 실적발표 표시
+    earnings_display = earnings_dday if earnings_dday else "-"
 
-            # VWAP 표시
-            vwap_display = vwap_signal if vwap_signal else "-"
+    # 공매도 비율 표시
+    if short_float is not None:
+        sf_pct = short_float * 100 if short_float < 1 else short_float
+        short_display = f"{sf_pct:.1f}%"
+    else:
+        short_display = "-"
 
-            # OBV 표시
-            obv_display = obv_signal if obv_signal else "-"
+    # 내부자 보유 비율 표시
+    if insider_held is not None:
+        ih_pct = insider_held * 100 if insider_held < 1 else insider_held
+        insider_display = f"{ih_pct:.1f}%"
+    else:
+        insider_display = "-"
 
-            # Stochastic 표시
-            stoch_display = stoch_signal if stoch_signal else "-"
+    # ADX 표시
+    if adx_value is not None:
+        adx_display = f"{adx_value} {adx_signal}"
+    else:
+        adx_display = "N/A"
+
+    # 일목균형표 표시
+    ichimoku_display = ichimoku_signal if ichimoku_signal else "-"
+
+    # 차트 패턴 표시
+    pattern_display = pattern_signal if pattern_signal else "-"
+
+    # 보유 정보 표시
+    holding = holdings_manager.get_holding(app.holdings, t)
+    is_held = holding is not None and holding.get("quantity", 0) > 0
+    if is_held:
+        h_qty = holding["quantity"]
+        h_avg = holding["avg_price"]
+        qty_display = f"{h_qty:g}"
+        avg_display = f"${h_avg:,.2f}"
+        try:
+            current_price_num = float(str(price).replace('$', '').replace(',', ''))
+            pnl_val = (current_price_num - h_avg) * h_qty
+            pnl_pct = (current_price_num - h_avg) / h_avg * 100 if h_avg > 0 else 0
+            sign = "+" if pnl_val >= 0 else ""
+            pnl_display = f"{sign}${pnl_val:,.0f} ({sign}{pnl_pct:.1f}%)"
+        except (ValueError, TypeError):
+            pnl_display = "-"
+    else:
+        qty_display = "-"
+        avg_display = "-"
+        pnl_display = "-"
+
+    # 보유 종목 표시: 종목명 앞에 ★ 추가
+    display_name = f"★ {name} ({t})" if is_held else f"{name} ({t})"
+
+    values = (
+        display_name,
+        price,
+        rate,
+        momentum_signal,
+        adx_display,
+        trend,
+        macd_signal,
+        rsi_display,
+        bb_signal,
+        stoch_display,
+        vwap_display,
+        obv_display,
+        vol_display,
+        div_display,
+        atr_display,
+        value_display,
+        per_display,
+        roe_display,
+        week52_display,
+        earnings_display,
+        short_display,
+        insider_display,
+        ichimoku_display,
+        pattern_display,
+        qty_display,
+        avg_display,
+        pnl_display
+    )
+
+    # Phase 9-3: Row-level color based on momentum signal
+    if "강력 매수" in str(momentum_signal):
+        tag = "strong_buy"
+    elif "매수" in str(momentum_signal):
+        tag = "buy"
+    elif "강력 매도" in str(momentum_signal):
+        tag = "strong_sell"
+    elif "매도" in str(momentum_signal):
+        tag = "sell"
+    else:
+        tag = "hold"
 
-            # 실적발표 표시
-            earnings_display = earnings_dday if earnings_dday else "-"
+    return t, price, values, tag, is_held
 
-            # 공매도 비율 표시
-            if short_float is not None:
-                sf_pct = short_float * 100 if short_float < 1 else short_float
-                short_display = f"{sf_pct:.1f}%"
-            else:
-                short_display = "-"
 
-            # 내부자 보유 비율 표시
-            if insider_held is not None:
-                ih_pct = insider_held * 100 if insider_held < 1 else insider_held
-                insider_display = f"{ih_pct:.1f}%"
-            else:
-                insider_display = "-"
+def _apply_row(t, values, tags):
+    """행 하나를 Treeview에 반영하되 지난번과 달라진 셀/태그만 보냄 (선택/스크롤 유지)."""
+    prev = app.rendered_rows.get(t)
+    if prev is None or not app.table.exists(t):
+        if app.table.exists(t):
+            app.table.item(t, values=values, tags=tags)
+        else:
+            app.table.insert("", "end", iid=t, values=values, tags=tags)
+        app.rendered_rows[t] = (values, tags)
+        return
 
-            # ADX 표시
-            if adx_value is not None:
-                adx_display = f"{adx_value} {adx_signal}"
-            else:
-                adx_display = "N/A"
-
-            # 일목균형표 표시
-            ichimoku_display = ichimoku_signal if ichimoku_signal else "-"
-
-            # 차트 패턴 표시
-            pattern_display = pattern_signal if pattern_signal else "-"
-
-            # 보유 정보 표시
-            holding = holdings_manager.get_holding(app.holdings, t)
-            is_held = holding is not None and holding.get("quantity", 0) > 0
-            if is_held:
-                h_qty = holding["quantity"]
-                h_avg = holding["avg_price"]
-                qty_display = f"{h_qty:g}"
-                avg_display = f"${h_avg:,.2f}"
+    prev_values, prev_tags = prev
+    changed = [i for i, (old, new) in enumerate(zip(prev_values, values)) if old != new]
+    if len(changed) > len(values) // 2:
+        # 대부분 바뀌었으면 셀마다 보내는 것보다 한 번에 교체하는 편이 쌈
+        app.table.item(t, values=values)
+    elif changed:
+        columns = app.table["columns"]
+        for i in changed:
+            app.table.set(t, columns[i], values[i])
+    if tags != prev_tags:
+        app.table.item(t, tags=tags)
+    app.rendered_rows[t] = (values, tags)
+
+
+def _scroll_anchor(children):
+    """현재 맨 위에 보이는 행. 맨 위까지 올려 둔 상태면 None (그대로 두면 됨)."""
+    top = app.table.yview()[0]
+    if not children or top <= 0:
+        return None
+    return children[min(len(children) - 1, int(round(top * len(children))))]
+
+
+def _restore_scroll(anchor):
+    """행 삭제/이동 뒤 anchor 행이 다시 맨 위에 오도록 스크롤."""
+    if anchor is None or not app.table.exists(anchor):
+        return
+    total = len(app.table.get_children())
+    if total:
+        app.table.yview_moveto(app.table.index(anchor) / total)
+
+
+def upsert_table_row(record):
+    """종목 한 줄을 반영 (행 iid = 티커). 있으면 값/태그만 갱신, 없으면 끝에 추가."""
+    if not record:
+        return None
+    t, price, values, tag, is_held = _format_table_row(record)
+
+    # Phase 11-6: Price change highlight
+    tags = [tag]
+    prev_price = app.previous_data.get(t)
+    highlight = bool(prev_price and prev_price != price)
+    if highlight:
+        tags.append("price_changed")
+    # 보유 종목이면 has_holding 태그 병합 (hold 상태일 때만 배경색 적용)
+    if is_held and tag == "hold":
+        tags.append("has_holding")
+
+    _apply_row(t, values, tuple(tags))
+
+    if highlight:
+        # Schedule removal of highlight after 3 seconds
+        app.root.after(3000, lambda rid=t, tg=tag: _remove_highlight(rid, tg))
+
+    app.previous_data[t] = price
+    return t
+
+
+def _alert_on_signals(data):
+    """Phase 11-3: BUY/SELL alert."""
+    if config.config.get("alert_enabled", True):
+        for record in data:
+            if not record:
+                continue
+            ms = record.momentum_signal if hasattr(record, 'momentum_signal') else record[-1]
+            if "매수" in str(ms) or "매도" in str(ms):
                 try:
-                    current_price_num = float(str(price).replace('$', '').replace(',', ''))
-                    pnl_val = (current_price_num - h_avg) * h_qty
-                    pnl_pct = (current_price_num - h_avg) / h_avg * 100 if h_avg > 0 else 0
-                    sign = "+" if pnl_val >= 0 else ""
-                    pnl_display = f"{sign}${pnl_val:,.0f} ({sign}{pnl_pct:.1f}%)"
-                except (ValueError, TypeError):
-                    pnl_display = "-"
-            else:
-                qty_display = "-"
-                avg_display = "-"
-                pnl_display = "-"
-
-            # 보유 종목 표시: 종목명 앞에 ★ 추가
-            display_name = f"★ {name} ({t})" if is_held else f"{name} ({t})"
-
-            row_id = app.table.insert("", "end", values=(
-                display_name,
-                price,
-                rate,
-                momentum_signal,
-                adx_display,
-                trend,
-                macd_signal,
-                rsi_display,
-                bb_signal,
-                stoch_display,
-                vwap_display,
-                obv_display,
-                vol_display,
-                div_display,
-                atr_display,
-                value_display,
-                per_display,
-                roe_display,
-                week52_display,
-                earnings_display,
-                short_display,
-                insider_display,
-                ichimoku_display,
-                pattern_display,
-                qty_display,
-                avg_display,
-                pnl_display
-            ))
-
-            # Phase 9-3: Row-level color based on momentum signal
-            if "강력 매수" in str(momentum_signal):
-                tag = "strong_buy"
-            elif "매수" in str(momentum_signal):
-                tag = "buy"
-            elif "강력 매도" in str(momentum_signal):
-                tag = "strong_sell"
-            elif "매도" in str(momentum_signal):
-                tag = "sell"
-            else:
-                tag = "hold"
+                    import winsound
+                    winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
+                except Exception:
+                    pass
+                break  # One beep per refresh cycle
 
-            # 보유 종목이면 has_holding 태그 병합 (hold 상태일 때만 배경색 적용)
-            if is_held and tag == "hold":
-                app.table.item(row_id, tags=(tag, "has_holding"))
-            else:
-                app.table.item(row_id, tags=(tag,))
-
-            # Phase 11-6: Price change highlight
-            prev_price = app.previous_data.get(t)
-            if prev_price and prev_price != price:
-                tags = [tag, "price_changed"]
-                if is_held and tag == "hold":
-                    tags.append("has_holding")
-                app.table.item(row_id, tags=tuple(tags))
-                # Schedule removal of highlight after 3 seconds
-                app.root.after(3000, lambda rid=row_id, tg=tag: _remove_highlight(rid, tg))
-
-            app.previous_data[t] = price
-
-        # Phase 11-3: BUY/SELL alert
-        if config.config.get("alert_enabled", True):
-            for record in data:
-                if not record:
-                    continue
-                ms = record.momentum_signal if hasattr(record, 'momentum_signal') else record[-1]
-                if "매수" in str(ms) or "매도" in str(ms):
-                    try:
-                        import winsound
-                        winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
-                    except Exception:
-                        pass
-                    break  # One beep per refresh cycle
-
-        # 저장해둔 컬럼 너비 복원
-        for col, w in saved_widths.items():
-            app.table.column(col, width=w)
+
+def finalize_table(data, keep=None):
+    """스트리밍 반영이 끝난 뒤 정리: 빠진 종목 행 제거, 워치리스트 순서로 정렬, 알림.
+
+    keep: 남길 종목 (워치리스트 순서). None이면 이번 결과에 있는 종목만 남김.
+    """
+    try:
+        if keep is None:
+            keep = [record.ticker if hasattr(record, 'ticker') else record[1] for record in data if record]
+        keep_set = set(keep)
+        children = app.table.get_children()
+        anchor = _scroll_anchor(children)
+        stale = [row for row in children if row not in keep_set]
+        if stale:
+            app.table.delete(*stale)
+            for row in stale:
+                app.rendered_rows.pop(row, None)
+
+        # Phase 11-4: Empty watchlist hint
+        if not keep:
+            with app.watchlist_lock:
+                if not app.watchlist:
+                    update_status_bar("종목을 추가하세요 (Ctrl+A)")
+            return
+
+        # 순서가 이미 같으면 (대부분의 갱신) Tk 호출 없이 넘어감
+        current = [row for row in children if row in keep_set]
+        present = set(current)
+        order = [t for t in keep if t in present]
+        reordered = current != order
+        if reordered:
+            for index, t in enumerate(order):
+                if current[index] != t:
+                    app.table.move(t, '', index)
+                    current.remove(t)
+                    current.insert(index, t)
+        if stale or reordered:
+            _restore_scroll(anchor)
+
+        _alert_on_signals(data)
 
     except Exception as e:
-        logging.error(f"[TABLE] update_table error: {e}")
+        logging.error(f"[TABLE] finalize_table error: {e}")
 
 
 def _remove_highlight(row_id, original_tag):
     """Remove price change highlight."""
     try:
         if app.table.exists(row_id):
-            app.table.item(row_id, tags=(original_tag,))
+            tags = [tg for tg in app.table.item(row_id, "tags") if tg != "price_changed"]
+            tags = tuple(tags) or (original_tag,)
+            app.table.item(row_id, tags=tags)
+            if row_id in app.rendered_rows:
+                app.rendered_rows[row_id] = (app.rendered_rows[row_id][0], tags)
     except Exception:
         pass
 
@@ -1140,7 +1261,7 @@ def show_technical_chart(stock_name):
     import matplotlib.pyplot as plt
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
     import matplotlib.font_manager as fm
-    import yfinance as yf
+    from data_provider import get_provider
     import numpy as np
     from stock_score import calculate_ichimoku
     from pattern_recognition import detect_patterns
@@ -1305,7 +1426,7 @@ def show_technical_chart(stock_name):
 
         def _work():
             try:
-                data = yf.download(ticker, **dl_kwargs)
+                data = get_provider().download(ticker, **dl_kwargs)
                 if data is None or len(data) < 30:
                     popup.after(0, lambda: status_label.config(text="데이터 부족 (최소 30일 필요)"))
                     return
@@ -1671,6 +1792,16 @@ def _hide_undo_btn():
     update_status_bar()
 
 
+def _request_limit_text():
+    """요청 제한 상태 (대기/레이트 리밋/차단) — 아무 일도 없으면 빈 문자열."""
+    stats = get_request_stats()
+    if stats["breaker_state"] != "closed":
+        return " | 요청 차단 중 (연속 실패)"
+    if not (stats["delayed"] or stats["throttled"]):
+        return ""
+    return f" | 요청 대기 {stats['delayed']}회 · 제한 {stats['throttled']}회"
+
+
 def update_status_bar(message=None, undo=False):
     """Update the status bar with current state."""
     if not app.status_bar:
@@ -1689,7 +1820,7 @@ def update_status_bar(message=None, undo=False):
                 refresh_str = f" | 마지막 갱신: {elapsed // 60}분 전 (오래됨)"
             else:
                 refresh_str = f" | 마지막 갱신: {app.last_refresh_time.strftime('%H:%M:%S')}"
-        status_text = f"종목: {count}개 | {session}{refresh_str}"
+        status_text = f"종목: {count}개 | {session}{refresh_str}{_request_limit_text()}"
 
     # 종목 더블클릭 안내 (항상 표시)
     status_text += " | 종목 더블클릭: 백테스트/상세 보기"
@@ -1762,8 +1893,13 @@ def on_closing():
     if app.monitor_thread and app.monitor_thread.is_alive():
         app.monitor_thread.join(timeout=5)
 
-    # Phase 4-2: Shutdown executor
-    app.executor.shutdown(wait=False)
+    # 새로고침 파이프라인 풀 / async 조회 코어 종료
+    app.ui_bridge.close()
+    app.refresh_pipeline.shutdown(wait=False)
+    shutdown_core()
+
+    # 캐시 유지보수 스레드 종료
+    stop_maintenance()
 
     # Flush logging handlers
     for h in logging.getLogger().handlers:
@@ -2409,10 +2545,14 @@ def show_quant_guide():
 # Main entry point
 # ============================================================
 def main():
+    global app
+    setup_logging()
+    app = AppState()
     config.ensure_watchlist_file()
 
     root = tk.Tk()
     app.root = root
+    app.ui_bridge = TkBridge(root)
     root.protocol("WM_DELETE_WINDOW", on_closing)
     root.withdraw()
     splash = show_splash(root)
@@ -2789,7 +2929,8 @@ def main():
 
     # 콜백 등록 (backtest_popup에서 사용)
     app.save_watchlist = save_watchlist
-    app.refresh_table_once = refresh_table_once
+    app.refresh_table = refresh_table
+    app.show_technical_chart = show_technical_chart
 
     # Load watchlist & holdings (fast, local file I/O only)
     load_watchlist()
@@ -2815,6 +2956,9 @@ def main():
 
         threading.Thread(target=_fetch_stocks, daemon=True).start()
 
+        # 캐시 보존 정책 (보존 기간/LRU/용량 한도) 주기 적용
+        start_maintenance()
+
         # 2) 뉴스 갱신 시작 (센티먼트 캐시 포함)
         _original_update_news = app.news_panel.update_news
 
@@ -2832,4 +2976,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller 실행 파일에서 민감도 분석 작업 프로세스(spawn)가 GUI를 다시 띄우지 않도록
+    multiprocessing.freeze_support()
     main()
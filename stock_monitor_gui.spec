@@ -16,7 +16,8 @@ a = Analysis(
                     'holdings_manager',
                     'tkcalendar', 'babel', 'babel.numbers',
                     'scipy', 'scipy.optimize', 'scipy.signal',
-                    'data_cache', 'pattern_recognition',
+                    'data_cache', 'columnar_store', 'data_provider', 'refresh_pipeline', 'refresh_scheduler', 'rate_limit', 'async_fetch', 'incremental_indicators', 'indicators', 'backtest_engine', 'strategies', 'strategies.base', 'strategies.trend',
+                    'strategies.oscillator', 'strategies.composite', 'param_sweep', 'universe_backtest', 'monte_carlo', 'pattern_recognition',
                     'quant_screener', 'screener_popup', 'stock_universe',
                     ],
     hookspath=[],